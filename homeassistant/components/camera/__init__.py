@@ -20,7 +20,7 @@ import attr
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.components.http import KEY_AUTHENTICATED, HomeAssistantView
+from homeassistant.components.http import KEY_AUTHENTICATED, KEY_HASS, HomeAssistantView
 from homeassistant.components.media_player import (
     ATTR_MEDIA_CONTENT_ID,
     ATTR_MEDIA_CONTENT_TYPE,
@@ -64,6 +64,7 @@ from .const import (  # noqa: F401
     CONF_LOOKBACK,
     DATA_CAMERA_PREFS,
     DATA_RTSP_TO_WEB_RTC,
+    DATA_STILL_STREAMS,
     DOMAIN,
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
@@ -73,6 +74,7 @@ from .const import (  # noqa: F401
     StreamType,
 )
 from .img_util import scale_jpeg_camera_image
+from .mjpeg import StillStreamHub
 from .prefs import CameraPreferences
 
 _LOGGER = logging.getLogger(__name__)
@@ -116,6 +118,10 @@ _RND: Final = SystemRandom()
 
 MIN_STREAM_INTERVAL: Final = 0.5  # seconds
 
+# Snapshots are reused for this long and cached for this many sizes per camera
+SNAPSHOT_CACHE_TTL: Final = 0.5  # seconds
+SNAPSHOT_CACHE_SIZE: Final = 4
+
 CAMERA_SERVICE_SNAPSHOT: Final = {vol.Required(ATTR_FILENAME): cv.template}
 
 CAMERA_SERVICE_PLAY_STREAM: Final = {
@@ -150,6 +156,91 @@ async def async_request_stream(hass: HomeAssistant, entity_id: str, fmt: str) ->
     return await _async_stream_endpoint_url(hass, camera, fmt)
 
 
+class SnapshotBroker:
+    """Coalesce and cache the snapshots of a camera.
+
+    Concurrent requests for the same size share a single fetch from the
+    camera and the result is reused for a short while. Images are kept
+    in a small LRU keyed by the requested size, so scaled requests can be
+    served from a fresh full size frame, and scaling runs in the executor.
+    """
+
+    def __init__(self, camera: Camera) -> None:
+        """Initialize the snapshot broker."""
+        self._camera = camera
+        self._fetches: dict[
+            tuple[int | None, int | None], asyncio.Task[Image | None]
+        ] = {}
+        self._images: collections.OrderedDict[
+            tuple[int | None, int | None], tuple[float, Image]
+        ] = collections.OrderedDict()
+
+    @callback
+    def _async_get_cached(self, key: tuple[int | None, int | None]) -> Image | None:
+        """Return a cached image if it is still fresh."""
+        if (cached := self._images.get(key)) is None:
+            return None
+        fetched, image = cached
+        if self._camera.hass.loop.time() - fetched >= SNAPSHOT_CACHE_TTL:
+            return None
+        self._images.move_to_end(key)
+        return image
+
+    async def async_get_image(
+        self, width: int | None, height: int | None, timeout: float
+    ) -> Image | None:
+        """Return a snapshot, fetching it from the camera if needed."""
+        key = (width, height)
+        if image := self._async_get_cached(key):
+            return image
+        if (fetch := self._fetches.get(key)) is None:
+            fetch = self._camera.hass.async_create_task(self._async_fetch(key, timeout))
+            self._fetches[key] = fetch
+            fetch.add_done_callback(partial(self._async_fetch_done, key))
+        # A request that times out must not cancel the fetch of the others
+        return await asyncio.shield(fetch)
+
+    @callback
+    def _async_fetch_done(
+        self, key: tuple[int | None, int | None], fetch: asyncio.Task[Image | None]
+    ) -> None:
+        """Forget a finished fetch."""
+        del self._fetches[key]
+        # Retrieve the exception in case all the requests gave up already
+        if not fetch.cancelled():
+            fetch.exception()
+
+    async def _async_fetch(
+        self, key: tuple[int | None, int | None], timeout: float
+    ) -> Image | None:
+        """Fetch a snapshot from the camera and scale it if possible."""
+        camera = self._camera
+        width, height = key
+        scale = width is not None and height is not None
+        if not scale or (image := self._async_get_cached((None, None))) is None:
+            async with async_timeout.timeout(timeout):
+                image_bytes = await camera.async_camera_image(
+                    width=width, height=height
+                )
+            if not image_bytes:
+                return None
+            image = Image(camera.content_type, image_bytes)
+        if scale and ("jpeg" in image.content_type or "jpg" in image.content_type):
+            assert width is not None
+            assert height is not None
+            image = Image(
+                image.content_type,
+                await camera.hass.async_add_executor_job(
+                    scale_jpeg_camera_image, image, width, height
+                ),
+            )
+        self._images[key] = (camera.hass.loop.time(), image)
+        self._images.move_to_end(key)
+        if len(self._images) > SNAPSHOT_CACHE_SIZE:
+            self._images.popitem(last=False)
+        return image
+
+
 async def _async_get_image(
     camera: Camera,
     timeout: int = 10,
@@ -166,22 +257,9 @@ async def _async_get_image(
     """
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
-            if image_bytes := await camera.async_camera_image(
-                width=width, height=height
+            if image := await camera.snapshot_broker.async_get_image(
+                width, height, timeout
             ):
-                content_type = camera.content_type
-                image = Image(content_type, image_bytes)
-                if (
-                    width is not None
-                    and height is not None
-                    and ("jpeg" in content_type or "jpg" in content_type)
-                ):
-                    assert width is not None
-                    assert height is not None
-                    return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
-                    )
-
                 return image
 
     raise HomeAssistantError("Unable to get image")
@@ -233,42 +311,23 @@ async def async_get_still_stream(
 ) -> web.StreamResponse:
     """Generate an HTTP MJPEG stream from camera images.
 
+    Clients streaming the same image_cb with the same interval share a single
+    producer of the stream.
+
     This method must be run in the event loop.
     """
     response = web.StreamResponse()
     response.content_type = CONTENT_TYPE_MULTIPART.format("--frameboundary")
     await response.prepare(request)
 
-    async def write_to_mjpeg_stream(img_bytes: bytes) -> None:
-        """Write image to stream."""
-        await response.write(
-            bytes(
-                "--frameboundary\r\n"
-                "Content-Type: {}\r\n"
-                "Content-Length: {}\r\n\r\n".format(content_type, len(img_bytes)),
-                "utf-8",
-            )
-            + img_bytes
-            + b"\r\n"
+    hass: HomeAssistant = request.app[KEY_HASS]
+    hubs: dict[tuple, StillStreamHub] = hass.data.setdefault(DATA_STILL_STREAMS, {})
+    key = (image_cb, content_type, interval)
+    if (hub := hubs.get(key)) is None:
+        hub = hubs[key] = StillStreamHub(
+            hass, image_cb, content_type, interval, partial(hubs.pop, key)
         )
-
-    last_image = None
-
-    while True:
-        img_bytes = await image_cb()
-        if not img_bytes:
-            break
-
-        if img_bytes != last_image:
-            await write_to_mjpeg_stream(img_bytes)
-
-            # Chrome seems to always ignore first picture,
-            # print it twice.
-            if last_image is None:
-                await write_to_mjpeg_stream(img_bytes)
-            last_image = img_bytes
-
-        await asyncio.sleep(interval)
+    await hub.async_stream(response)
 
     return response
 
@@ -442,6 +501,7 @@ class Camera(Entity):
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
         self._rtsp_to_webrtc = False
+        self.snapshot_broker = SnapshotBroker(self)
 
     @property
     def entity_picture(self) -> str:
@@ -7,6 +7,7 @@ DOMAIN: Final = "camera"
 
 DATA_CAMERA_PREFS: Final = "camera_prefs"
 DATA_RTSP_TO_WEB_RTC: Final = "rtsp_to_web_rtc"
+DATA_STILL_STREAMS: Final = "camera_still_streams"
 
 PREF_PRELOAD_STREAM: Final = "preload_stream"
 PREF_ORIENTATION: Final = "orientation"
@@ -0,0 +1,146 @@
+"""MJPEG streams composed of camera stills, shared by all their viewers."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+
+from aiohttp import web
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def frame_mjpeg_image(content_type: str, img_bytes: bytes) -> bytes:
+    """Return an image framed as a part of a multipart MJPEG stream."""
+    return (
+        bytes(
+            "--frameboundary\r\n"
+            "Content-Type: {}\r\n"
+            "Content-Length: {}\r\n\r\n".format(content_type, len(img_bytes)),
+            "utf-8",
+        )
+        + img_bytes
+        + b"\r\n"
+    )
+
+
+class StillStreamViewer:
+    """A viewer of a still stream that only keeps the newest frame."""
+
+    def __init__(self) -> None:
+        """Initialize the viewer."""
+        self.dropped = 0
+        self._frames: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=1)
+
+    @callback
+    def async_put(self, frame: bytes | None) -> None:
+        """Hand a frame to the viewer, None ends the stream."""
+        if self._frames.full():
+            self._frames.get_nowait()
+            self.dropped += 1
+        self._frames.put_nowait(frame)
+
+    async def async_get(self) -> bytes | None:
+        """Wait for the next frame."""
+        return await self._frames.get()
+
+
+class StillStreamHub:
+    """Produce an MJPEG stream from camera stills once for all its viewers.
+
+    A single producer polls the stills and frames each new image as a
+    multipart chunk, which is handed to every viewer. Viewers only keep the
+    newest chunk, so a slow client drops frames instead of holding back the
+    others. The producer stops when the last viewer leaves or when Home
+    Assistant stops.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        image_cb: Callable[[], Awaitable[bytes | None]],
+        content_type: str,
+        interval: float,
+        on_close: Callable[[], None],
+    ) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self.viewers: set[StillStreamViewer] = set()
+        self._image_cb = image_cb
+        self._content_type = content_type
+        self._interval = interval
+        self._on_close = on_close
+        self._closed = False
+        self._last_frame: bytes | None = None
+        self._producer: asyncio.Task[None] | None = None
+        self._unsub_stop: CALLBACK_TYPE | None = None
+
+    async def async_stream(self, response: web.StreamResponse) -> None:
+        """Write the stream to a prepared response until it ends."""
+        viewer = StillStreamViewer()
+        self.viewers.add(viewer)
+        if self._last_frame is not None:
+            viewer.async_put(self._last_frame)
+        if self._producer is None:
+            # Not tracked by hass as it runs as long as there are viewers,
+            # the hub cancels it when they leave or when hass stops
+            self._producer = self.hass.loop.create_task(self._async_produce())
+            self._unsub_stop = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP, self._async_stop
+            )
+        try:
+            first = True
+            while frame := await viewer.async_get():
+                await response.write(frame)
+                # Chrome seems to always ignore first picture,
+                # print it twice.
+                if first:
+                    await response.write(frame)
+                    first = False
+        finally:
+            self.viewers.discard(viewer)
+            if not self.viewers and not self._closed:
+                self._async_close()
+
+    async def _async_produce(self) -> None:
+        """Poll the stills and hand new images to the viewers."""
+        last_image = None
+        try:
+            while True:
+                if not (img_bytes := await self._image_cb()):
+                    break
+                if img_bytes != last_image:
+                    frame = frame_mjpeg_image(self._content_type, img_bytes)
+                    self._last_frame = frame
+                    for viewer in self.viewers:
+                        viewer.async_put(frame)
+                    last_image = img_bytes
+                await asyncio.sleep(self._interval)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error getting image for MJPEG stream")
+        finally:
+            if not self._closed:
+                self._async_close()
+
+    @callback
+    def _async_stop(self, event: Event) -> None:
+        """End the stream when Home Assistant stops."""
+        self._unsub_stop = None
+        if not self._closed:
+            self._async_close()
+
+    @callback
+    def _async_close(self) -> None:
+        """End the stream for all viewers, new viewers get a new hub."""
+        self._closed = True
+        self._on_close()
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+        if self._producer is not None and self._producer is not asyncio.current_task():
+            self._producer.cancel()
+        for viewer in self.viewers:
+            viewer.async_put(None)
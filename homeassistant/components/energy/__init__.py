@@ -30,6 +30,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     )
     hass.data[DOMAIN] = {
         "cost_sensors": {},
+        "statistics_cache": {},
+        "statistics_cache_generation": 0,
     }
 
     return True
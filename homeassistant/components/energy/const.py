@@ -1,3 +1,6 @@
 """Constants for the Energy integration."""
 
 DOMAIN = "energy"
+
+# Number of energy/statistics results kept until the next hourly compile
+STATISTICS_CACHE_SIZE = 32
@@ -13,14 +13,18 @@ from typing import Any, cast
 import voluptuous as vol
 
 from homeassistant.components import recorder, websocket_api
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.components.recorder.const import (
+    EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
+    EVENT_RECORDER_STATISTICS_UPDATED,
+)
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
 from homeassistant.helpers.singleton import singleton
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import DOMAIN, STATISTICS_CACHE_SIZE
 from .data import (
     DEVICE_CONSUMPTION_SCHEMA,
     ENERGY_SOURCE_SCHEMA,
@@ -50,6 +54,19 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_validate)
     websocket_api.async_register_command(hass, ws_solar_forecast)
     websocket_api.async_register_command(hass, ws_get_fossil_energy_consumption)
+    websocket_api.async_register_command(hass, ws_get_energy_statistics)
+
+    @callback
+    def _async_clear_statistics_cache(_: Event) -> None:
+        """Drop cached statistics when the statistics have changed."""
+        hass.data[DOMAIN]["statistics_cache"].clear()
+        hass.data[DOMAIN]["statistics_cache_generation"] += 1
+
+    for event_type in (
+        EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
+        EVENT_RECORDER_STATISTICS_UPDATED,
+    ):
+        hass.bus.async_listen(event_type, _async_clear_statistics_cache)
 
 
 @singleton("energy_platforms")
@@ -226,6 +243,66 @@ async def ws_solar_forecast(
     connection.send_result(msg["id"], forecasts)
 
 
+def _combine_sum_statistics(
+    stats: dict[str, list[dict[str, Any]]], statistic_ids: list[str]
+) -> dict[datetime, float]:
+    """Combine multiple statistics, returns a dict indexed by start time."""
+    result: defaultdict[datetime, float] = defaultdict(float)
+
+    for statistics_id, stat in stats.items():
+        if statistics_id not in statistic_ids:
+            continue
+        for period in stat:
+            if period["sum"] is None:
+                continue
+            result[period["start"]] += period["sum"]
+
+    return {key: result[key] for key in sorted(result)}
+
+
+def _calculate_deltas(sums: dict[datetime, float]) -> dict[datetime, float]:
+    """Calculate the change between consecutive sums."""
+    prev: float | None = None
+    result: dict[datetime, float] = {}
+    for period, sum_ in sums.items():
+        if prev is not None:
+            result[period] = sum_ - prev
+        prev = sum_
+    return result
+
+
+def _reduce_deltas(
+    stat_list: list[dict[str, Any]],
+    same_period: Callable[[datetime, datetime], bool],
+    period_start_end: Callable[[datetime], tuple[datetime, datetime]],
+    period: timedelta,
+) -> list[dict[str, Any]]:
+    """Reduce hourly deltas to daily or monthly deltas."""
+    result: list[dict[str, Any]] = []
+    deltas: list[float] = []
+    if not stat_list:
+        return result
+    prev_stat: dict[str, Any] = stat_list[0]
+
+    # Loop over the hourly deltas + a fake entry to end the period
+    for statistic in chain(stat_list, ({"start": stat_list[-1]["start"] + period},)):
+        if not same_period(prev_stat["start"], statistic["start"]):
+            start, _ = period_start_end(prev_stat["start"])
+            # The previous statistic was the last entry of the period
+            result.append(
+                {
+                    "start": start.isoformat(),
+                    "delta": sum(deltas),
+                }
+            )
+            deltas = []
+        if statistic.get("delta") is not None:
+            deltas.append(statistic["delta"])
+        prev_stat = statistic
+
+    return result
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "energy/fossil_energy_consumption",
@@ -270,64 +347,6 @@ async def ws_get_fossil_energy_consumption(
         True,
     )
 
-    def _combine_sum_statistics(
-        stats: dict[str, list[dict[str, Any]]], statistic_ids: list[str]
-    ) -> dict[datetime, float]:
-        """Combine multiple statistics, returns a dict indexed by start time."""
-        result: defaultdict[datetime, float] = defaultdict(float)
-
-        for statistics_id, stat in stats.items():
-            if statistics_id not in statistic_ids:
-                continue
-            for period in stat:
-                if period["sum"] is None:
-                    continue
-                result[period["start"]] += period["sum"]
-
-        return {key: result[key] for key in sorted(result)}
-
-    def _calculate_deltas(sums: dict[datetime, float]) -> dict[datetime, float]:
-        prev: float | None = None
-        result: dict[datetime, float] = {}
-        for period, sum_ in sums.items():
-            if prev is not None:
-                result[period] = sum_ - prev
-            prev = sum_
-        return result
-
-    def _reduce_deltas(
-        stat_list: list[dict[str, Any]],
-        same_period: Callable[[datetime, datetime], bool],
-        period_start_end: Callable[[datetime], tuple[datetime, datetime]],
-        period: timedelta,
-    ) -> list[dict[str, Any]]:
-        """Reduce hourly deltas to daily or monthly deltas."""
-        result: list[dict[str, Any]] = []
-        deltas: list[float] = []
-        if not stat_list:
-            return result
-        prev_stat: dict[str, Any] = stat_list[0]
-
-        # Loop over the hourly deltas + a fake entry to end the period
-        for statistic in chain(
-            stat_list, ({"start": stat_list[-1]["start"] + period},)
-        ):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, _ = period_start_end(prev_stat["start"])
-                # The previous statistic was the last entry of the period
-                result.append(
-                    {
-                        "start": start.isoformat(),
-                        "delta": sum(deltas),
-                    }
-                )
-                deltas = []
-            if statistic.get("delta") is not None:
-                deltas.append(statistic["delta"])
-            prev_stat = statistic
-
-        return result
-
     merged_energy_statistics = _combine_sum_statistics(
         statistics, msg["energy_statistic_ids"]
     )
@@ -366,3 +385,212 @@ async def ws_get_fossil_energy_consumption(
 
     result = {period["start"]: period["delta"] for period in reduced_fossil_energy}
     connection.send_result(msg["id"], result)
+
+
+@callback
+def _async_get_energy_statistic_ids(
+    hass: HomeAssistant, manager: EnergyManager
+) -> list[str]:
+    """Return the statistics of all configured sources and their costs."""
+    statistic_ids: list[str] = []
+    if manager.data is None:
+        return statistic_ids
+
+    for source in manager.data["energy_sources"]:
+        flows: list[dict[str, Any]]
+        if source["type"] == "grid":
+            flows = [*source["flow_from"], *source["flow_to"]]
+        else:
+            flows = [cast(dict[str, Any], source)]
+        for flow in flows:
+            for key in (
+                "stat_energy_from",
+                "stat_energy_to",
+                "stat_cost",
+                "stat_compensation",
+            ):
+                if flow.get(key):
+                    statistic_ids.append(flow[key])
+
+    for device in manager.data["device_consumption"]:
+        statistic_ids.append(device["stat_consumption"])
+
+    # Costs calculated by the energy integration itself
+    cost_sensors = hass.data[DOMAIN]["cost_sensors"]
+    statistic_ids.extend(
+        cost_sensors[statistic_id]
+        for statistic_id in list(statistic_ids)
+        if statistic_id in cost_sensors
+    )
+
+    return sorted(set(statistic_ids))
+
+
+def _reduce_hourly_deltas(
+    hourly_deltas: dict[datetime, float], period: str
+) -> dict[str, float]:
+    """Reduce hourly deltas to the requested period, indexed by ISO start time."""
+    if period == "hour":
+        return {start.isoformat(): delta for start, delta in hourly_deltas.items()}
+
+    stat_list = [
+        {"start": start, "delta": delta} for start, delta in hourly_deltas.items()
+    ]
+    if period == "day":
+        reduced = _reduce_deltas(
+            stat_list,
+            recorder.statistics.same_day,
+            recorder.statistics.day_start_end,
+            timedelta(days=1),
+        )
+    else:
+        # Any hour plus 31 days is in a later month, which ends the last period
+        reduced = _reduce_deltas(
+            stat_list,
+            recorder.statistics.same_month,
+            recorder.statistics.month_start_end,
+            timedelta(days=31),
+        )
+    return {stat["start"]: stat["delta"] for stat in reduced}
+
+
+def _compile_energy_statistics(
+    stats: dict[str, list[dict[str, Any]]],
+    statistic_ids: list[str],
+    start_time: datetime,
+    period: str,
+    co2_statistic_id: str | None,
+    fossil_statistic_ids: list[str],
+) -> dict[str, Any]:
+    """Calculate the period deltas of the energy statistics."""
+
+    def _hourly_deltas(sums: dict[datetime, float]) -> dict[datetime, float]:
+        """Calculate hourly deltas, the baseline hour is only used as reference."""
+        return {
+            start: delta
+            for start, delta in _calculate_deltas(sums).items()
+            if start >= start_time
+        }
+
+    result: dict[str, Any] = {
+        "statistics": {
+            statistic_id: _reduce_hourly_deltas(
+                _hourly_deltas(_combine_sum_statistics(stats, [statistic_id])),
+                period,
+            )
+            for statistic_id in statistic_ids
+        }
+    }
+
+    if co2_statistic_id is not None:
+        energy_deltas = _hourly_deltas(
+            _combine_sum_statistics(stats, fossil_statistic_ids)
+        )
+        indexed_co2_statistics = {
+            stat["start"]: stat["mean"] for stat in stats.get(co2_statistic_id, [])
+        }
+        # Calculate amount of fossil based energy, assume 100% fossil if missing
+        fossil_energy = {
+            start: delta * indexed_co2_statistics.get(start, 100) / 100
+            for start, delta in energy_deltas.items()
+        }
+        result["fossil_energy_consumption"] = _reduce_hourly_deltas(
+            fossil_energy, period
+        )
+
+    return result
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "energy/statistics",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("co2_statistic_id"): str,
+        vol.Required("period"): vol.Any("hour", "day", "month"),
+    }
+)
+@_ws_with_manager
+async def ws_get_energy_statistics(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+    manager: EnergyManager,
+) -> None:
+    """Calculate the period deltas of all configured energy statistics.
+
+    The statistics of all sources are fetched in a single query, and results
+    are cached until the recorder compiles the next hour of statistics or
+    statistics are imported or adjusted.
+    """
+    if start_time := dt_util.parse_datetime(msg["start_time"]):
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    end_time: datetime | None = None
+    if "end_time" in msg:
+        if end_time := dt_util.parse_datetime(msg["end_time"]):
+            end_time = dt_util.as_utc(end_time)
+        else:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+
+    statistic_ids = _async_get_energy_statistic_ids(hass, manager)
+    co2_statistic_id: str | None = msg.get("co2_statistic_id")
+    fossil_statistic_ids: list[str] = []
+    if co2_statistic_id is not None and manager.data is not None:
+        fossil_statistic_ids = [
+            flow["stat_energy_from"]
+            for source in manager.data["energy_sources"]
+            if source["type"] == "grid"
+            for flow in source["flow_from"]
+        ]
+
+    cache: dict[tuple, dict[str, Any]] = hass.data[DOMAIN]["statistics_cache"]
+    cache_key = (
+        start_time,
+        end_time,
+        msg["period"],
+        tuple(statistic_ids),
+        co2_statistic_id,
+        tuple(fossil_statistic_ids),
+    )
+    if (result := cache.get(cache_key)) is not None:
+        connection.send_result(msg["id"], result)
+        return
+
+    cache_generation = hass.data[DOMAIN]["statistics_cache_generation"]
+    query_ids = list(statistic_ids)
+    if co2_statistic_id is not None:
+        query_ids.append(co2_statistic_id)
+
+    if query_ids:
+        # Start an hour early, its sum is the baseline for the first delta
+        stats = await recorder.get_instance(hass).async_add_executor_job(
+            recorder.statistics.statistics_during_period,
+            hass,
+            start_time - timedelta(hours=1),
+            end_time,
+            query_ids,
+            "hour",
+            True,
+        )
+    else:
+        stats = {}
+
+    result = _compile_energy_statistics(
+        stats,
+        statistic_ids,
+        start_time,
+        msg["period"],
+        co2_statistic_id,
+        fossil_statistic_ids,
+    )
+    # Don't cache a result read before the statistics changed
+    if cache_generation == hass.data[DOMAIN]["statistics_cache_generation"]:
+        if len(cache) >= STATISTICS_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[cache_key] = result
+    connection.send_result(msg["id"], result)
@@ -1,14 +1,16 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
-from collections.abc import Iterable
+import asyncio
+from collections.abc import Iterable, Iterator
 from datetime import datetime as dt, timedelta
 from http import HTTPStatus
 import logging
 import time
-from typing import cast
+from typing import Any, cast
 
 from aiohttp import web
+import async_timeout
 import voluptuous as vol
 
 from homeassistant.components import frontend, websocket_api
@@ -24,7 +26,7 @@ from homeassistant.components.recorder.filters import (
 )
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.websocket_api import messages
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA
 from homeassistant.helpers.json import JSON_DUMP
@@ -39,6 +41,9 @@ HISTORY_USE_INCLUDE_ORDER = "history_use_include_order"
 
 CONF_ORDER = "use_include_order"
 
+# Give up streaming if the client does not read a message for this long
+STREAM_WRITABLE_TIMEOUT = 60
+
 
 CONFIG_SCHEMA = vol.Schema(
     {
@@ -75,6 +80,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         vol.Optional("end_time"): str,
         vol.Optional("statistic_ids"): [str],
         vol.Required("period"): vol.Any("5minute", "hour", "day", "month"),
+        vol.Optional("compact"): bool,
     }
 )
 @websocket_api.async_response
@@ -150,6 +156,103 @@ def _ws_get_significant_states(
     )
 
 
+def _ws_stream_next_entity_message(
+    msg_id: int, entity_states: Iterator[tuple[str, list[State | dict[str, Any]]]]
+) -> str | None:
+    """Fetch the states of the next entity in the executor.
+
+    Returns the event message with the states of the entity or None when
+    all the entities have been streamed.
+    """
+    if (next_entity := next(entity_states, None)) is None:
+        return None
+    entity_id, states = next_entity
+    return JSON_DUMP(messages.event_message(msg_id, {"states": {entity_id: states}}))
+
+
+@callback
+def _async_send_empty_history(
+    connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Send a response without any states."""
+    if not msg["stream"]:
+        connection.send_result(msg["id"], {})
+        return
+    connection.send_result(msg["id"])
+    connection.send_message(messages.event_message(msg["id"], {"done": True}))
+
+
+async def _async_stream_history_during_period(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+    start_time: dt,
+    end_time: dt | None,
+) -> None:
+    """Stream the history to the client entity by entity.
+
+    The states of each entity are fetched in their own executor job and
+    sent in their own event message. The next entity is only fetched once
+    the client has caught up with reading the pending messages, the wait
+    happens in the event loop so the recorder executor and its database
+    connection are not held while the client is reading.
+    """
+    msg_id = msg["id"]
+    cancelled = False
+    wait_writable: asyncio.Future[None] | None = None
+
+    @callback
+    def _async_cancel_stream() -> None:
+        """Stop streaming and stop waiting for the client to catch up."""
+        nonlocal cancelled
+        cancelled = True
+        if wait_writable:
+            wait_writable.cancel()
+
+    entity_states = history.stream_significant_states(
+        hass,
+        start_time,
+        end_time,
+        msg.get("entity_ids"),
+        hass.data[HISTORY_FILTERS],
+        msg["include_start_time_state"],
+        msg["significant_changes_only"],
+        msg["minimal_response"],
+        msg["no_attributes"],
+        True,
+    )
+    instance = get_instance(hass)
+    connection.subscriptions[msg_id] = _async_cancel_stream
+    connection.send_result(msg_id)
+    try:
+        while message := await instance.async_add_executor_job(
+            _ws_stream_next_entity_message, msg_id, entity_states
+        ):
+            if cancelled:
+                return
+            wait_writable = asyncio.ensure_future(connection.async_wait_writable())
+            try:
+                async with async_timeout.timeout(STREAM_WRITABLE_TIMEOUT):
+                    await wait_writable
+            except asyncio.CancelledError:
+                if cancelled:
+                    return
+                raise
+            finally:
+                wait_writable = None
+            connection.send_message(message)
+    except asyncio.TimeoutError:
+        _LOGGER.debug("Client did not read the streamed history in time")
+        connection.send_error(
+            msg_id, websocket_api.ERR_TIMEOUT, "Timed out streaming the history"
+        )
+        return
+    finally:
+        connection.subscriptions.pop(msg_id, None)
+    if not cancelled:
+        connection.send_message(messages.event_message(msg_id, {"done": True}))
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -160,6 +263,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("stream", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -186,7 +290,7 @@ async def ws_get_history_during_period(
         end_time = None
 
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg)
         return
 
     entity_ids = msg.get("entity_ids")
@@ -197,7 +301,13 @@ async def ws_get_history_during_period(
         and entity_ids
         and not _entities_may_have_state_changes_after(hass, entity_ids, start_time)
     ):
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg)
+        return
+
+    if msg["stream"]:
+        await _async_stream_history_during_period(
+            hass, connection, msg, start_time, end_time
+        )
         return
 
     significant_changes_only = msg["significant_changes_only"]
@@ -2,6 +2,7 @@
 from homeassistant.components import system_health
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import system_info
+from homeassistant.helpers.event import async_get_timer_wheel
 
 
 @callback
@@ -15,6 +16,7 @@ def async_register(
 async def system_health_info(hass):
     """Get info for the info page."""
     info = await system_info.async_get_system_info(hass)
+    timers = async_get_timer_wheel(hass).async_diagnostics()
 
     return {
         "version": f"core-{info.get('version')}",
@@ -30,4 +32,7 @@ async def system_health_info(hass):
         "arch": info.get("arch"),
         "timezone": info.get("timezone"),
         "config_dir": hass.config.config_dir,
+        "timers_scheduled": timers["scheduled"],
+        "timers_coalesced": timers["coalesced"],
+        "timer_lateness_max": round(timers["lateness_max"], 3),
     }
@@ -12,6 +12,7 @@ import time
 from typing import Any
 
 from influxdb import InfluxDBClient, exceptions
+from influxdb.line_protocol import make_lines
 from influxdb_client import InfluxDBClient as InfluxDBClientV2
 from influxdb_client.client.write_api import ASYNCHRONOUS, SYNCHRONOUS
 from influxdb_client.rest import ApiException
@@ -38,10 +39,18 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import ConfigType
 
+from .backlog import Backlog
 from .const import (
     API_VERSION_2,
+    BACKLOG_DIR,
+    BACKLOG_FLUSH_TIMEOUT,
+    BACKLOG_MESSAGE,
+    BACKLOG_RESUMED_MESSAGE,
+    BACKLOG_SEGMENT_AGE,
+    BACKLOG_SEGMENT_LINES,
     BATCH_BUFFER_SIZE,
     BATCH_TIMEOUT,
     CATCHING_UP_MESSAGE,
@@ -54,10 +63,12 @@ from .const import (
     CONF_COMPONENT_CONFIG,
     CONF_COMPONENT_CONFIG_DOMAIN,
     CONF_COMPONENT_CONFIG_GLOB,
+    CONF_CONCURRENT_WRITES,
     CONF_DB_NAME,
     CONF_DEFAULT_MEASUREMENT,
     CONF_HOST,
     CONF_IGNORE_ATTRIBUTES,
+    CONF_MAX_BACKLOG_SIZE,
     CONF_MEASUREMENT_ATTR,
     CONF_ORG,
     CONF_OVERRIDE_MEASUREMENT,
@@ -75,6 +86,7 @@ from .const import (
     CONF_VERIFY_SSL,
     CONNECTION_ERROR,
     DEFAULT_API_VERSION,
+    DEFAULT_CONCURRENT_WRITES,
     DEFAULT_HOST_V2,
     DEFAULT_MEASUREMENT_ATTR,
     DEFAULT_SSL_V2,
@@ -104,6 +116,9 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Precisions of the line protocol serializer for the configured precisions
+LINE_PROTOCOL_PRECISION = {"ms": "ms", "s": "s", "us": "u", "ns": "n"}
+
 
 def create_influx_url(conf: dict) -> dict:
     """Build URL used from config inputs and default when necessary."""
@@ -183,6 +198,11 @@ _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
         vol.Optional(CONF_COMPONENT_CONFIG_DOMAIN, default={}): vol.Schema(
             {cv.string: _CUSTOMIZE_ENTITY_SCHEMA}
         ),
+        # Size in MB of the backlog on disk, 0 keeps the backlog in memory
+        vol.Optional(CONF_MAX_BACKLOG_SIZE, default=0): cv.positive_int,
+        vol.Optional(
+            CONF_CONCURRENT_WRITES, default=DEFAULT_CONCURRENT_WRITES
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=10)),
     }
 )
 
@@ -324,6 +344,7 @@ class InfluxClient:
 
     data_repositories: list[str]
     write: Callable[[str], None]
+    write_lines: Callable[[str], None]
     query: Callable[[str, str], list[Any]]
     close: Callable[[], None]
 
@@ -348,7 +369,9 @@ def get_influx_connection(  # noqa: C901
         bucket = conf.get(CONF_BUCKET)
         influx = InfluxDBClientV2(**kwargs)
         query_api = influx.query_api()
-        initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
+        # The backlog only drops the events once they are written
+        write_mode = SYNCHRONOUS if conf.get(CONF_MAX_BACKLOG_SIZE) else ASYNCHRONOUS
+        initial_write_mode = SYNCHRONOUS if test_write else write_mode
         write_api = influx.write_api(write_options=initial_write_mode)
 
         def write_v2(json):
@@ -388,7 +411,7 @@ def get_influx_connection(  # noqa: C901
             # Then invalid inputs is returned. Anything else is a broken config
             with suppress(ValueError):
                 write_v2(b"")
-            write_api = influx.write_api(write_options=ASYNCHRONOUS)
+            write_api = influx.write_api(write_options=write_mode)
 
         if test_read:
             tables = query_v2(TEST_QUERY_V2)
@@ -397,7 +420,7 @@ def get_influx_connection(  # noqa: C901
             else:
                 buckets = []
 
-        return InfluxClient(buckets, write_v2, query_v2, close_v2)
+        return InfluxClient(buckets, write_v2, write_v2, query_v2, close_v2)
 
     # Else it's a V1 client
     if CONF_SSL_CA_CERT in conf and conf[CONF_VERIFY_SSL]:
@@ -428,10 +451,10 @@ def get_influx_connection(  # noqa: C901
 
     influx = InfluxDBClient(**kwargs)
 
-    def write_v1(json):
+    def write_v1(json, **kwargs):
         """Write data to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.write_points(json, time_precision=precision, **kwargs)
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -443,6 +466,10 @@ def get_influx_connection(  # noqa: C901
                 raise ValueError(WRITE_ERROR % (json, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
+    def write_lines_v1(lines):
+        """Write line protocol data to V1 influx."""
+        write_v1(lines.splitlines(), protocol="line")
+
     def query_v1(query, database=None):
         """Query V1 influx."""
         try:
@@ -469,7 +496,7 @@ def get_influx_connection(  # noqa: C901
     if test_read:
         databases = [db["name"] for db in query_v1(TEST_QUERY_V1)]
 
-    return InfluxClient(databases, write_v1, query_v1, close_v1)
+    return InfluxClient(databases, write_v1, write_lines_v1, query_v1, close_v1)
 
 
 def _retry_setup(hass: HomeAssistant, config: ConfigType) -> None:
@@ -490,7 +517,24 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     event_to_json = _generate_event_to_json(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    backlog = None
+    if max_backlog_size := conf[CONF_MAX_BACKLOG_SIZE]:
+        backlog = Backlog(
+            hass.config.path(STORAGE_DIR, BACKLOG_DIR),
+            max_backlog_size * 1024 * 1024,
+            BACKLOG_SEGMENT_LINES,
+            BACKLOG_SEGMENT_AGE,
+        )
+        backlog.load()
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass,
+        influx,
+        event_to_json,
+        max_tries,
+        backlog,
+        conf[CONF_CONCURRENT_WRITES],
+        conf.get(CONF_PRECISION),
+    )
     instance.start()
 
     def shutdown(event):
@@ -505,16 +549,35 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 
 class InfluxThread(threading.Thread):
-    """A threaded event handler class."""
-
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    """A threaded event handler class.
+
+    Without a backlog the events are written by this thread and dropped once
+    they are too old. With a backlog this thread serializes the events to
+    line protocol and appends them to the backlog on disk, where they are
+    picked up by the writer threads.
+    """
+
+    def __init__(
+        self,
+        hass,
+        influx,
+        event_to_json,
+        max_tries,
+        backlog=None,
+        concurrent_writes=DEFAULT_CONCURRENT_WRITES,
+        precision=None,
+    ):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue = queue.Queue()
         self.influx = influx
         self.event_to_json = event_to_json
         self.max_tries = max_tries
+        self.backlog = backlog
+        self.concurrent_writes = concurrent_writes
+        self.line_precision = LINE_PROTOCOL_PRECISION.get(precision)
         self.write_errors = 0
+        self._write_errors_lock = threading.Lock()
         self.shutdown = False
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
@@ -532,6 +595,9 @@ class InfluxThread(threading.Thread):
     def get_events_json(self):
         """Return a batch of events formatted for writing."""
         queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
+        if self.backlog is not None:
+            # Nothing is dropped here, the backlog limits its size itself
+            queue_seconds = math.inf
 
         count = 0
         json = []
@@ -585,15 +651,67 @@ class InfluxThread(threading.Thread):
                         _LOGGER.error(err)
                     self.write_errors += len(json)
 
+    def write_backlog_to_influxdb(self):
+        """Write the lines in the backlog to influxdb until it is stopped."""
+        assert self.backlog is not None
+        while (claimed := self.backlog.claim()) is not None:
+            segment_id, lines = claimed
+            try:
+                self.influx.write_lines(lines)
+            except ValueError as err:
+                _LOGGER.error(err)
+                # Retrying won't help, drop the lines
+                self.backlog.release(segment_id, True)
+            except ConnectionError as err:
+                self.backlog.release(segment_id, False)
+                with self._write_errors_lock:
+                    if not self.write_errors:
+                        _LOGGER.error(BACKLOG_MESSAGE, err)
+                    self.write_errors += 1
+                self.backlog.wait_stopped(RETRY_DELAY)
+            else:
+                self.backlog.release(segment_id, True)
+                with self._write_errors_lock:
+                    if self.write_errors:
+                        _LOGGER.error(
+                            BACKLOG_RESUMED_MESSAGE, self.backlog.pending_lines
+                        )
+                        self.write_errors = 0
+                _LOGGER.debug(WROTE_MESSAGE, lines.count("\n"))
+
     def run(self):
         """Process incoming events."""
+        writers = []
+        if self.backlog is not None:
+            writers = [
+                threading.Thread(
+                    target=self.write_backlog_to_influxdb, name=f"{DOMAIN}_{idx}"
+                )
+                for idx in range(self.concurrent_writes)
+            ]
+            for writer in writers:
+                writer.start()
+
         while not self.shutdown:
             count, json = self.get_events_json()
             if json:
-                self.write_to_influxdb(json)
+                if self.backlog is not None:
+                    self.backlog.append(
+                        make_lines({"points": json}, self.line_precision), len(json)
+                    )
+                else:
+                    self.write_to_influxdb(json)
             for _ in range(count):
                 self.queue.task_done()
 
+        if self.backlog is not None:
+            # Lines that were not written yet are left on disk for the next run
+            self.backlog.stop()
+            for writer in writers:
+                writer.join()
+
     def block_till_done(self):
         """Block till all events processed."""
         self.queue.join()
+        if self.backlog is not None:
+            self.backlog.wait_empty(BACKLOG_FLUSH_TIMEOUT)
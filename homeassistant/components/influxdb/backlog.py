@@ -0,0 +1,220 @@
+"""Disk backed backlog of the events waiting to be written to InfluxDB."""
+from __future__ import annotations
+
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass
+import logging
+import os
+import threading
+import time
+from typing import TextIO
+
+_LOGGER = logging.getLogger(__name__)
+
+SEGMENT_SUFFIX = ".lp"
+
+
+@dataclass
+class Segment:
+    """A file of line protocol lines in the backlog."""
+
+    segment_id: int
+    size: int
+    lines: int
+
+
+class Backlog:
+    """A bounded queue of line protocol lines stored in segment files.
+
+    Lines are appended to the open segment, which is closed once it is full
+    or older than segment_age seconds. Closed segments are claimed by the
+    writers and only removed once they have been written, so the lines that
+    were not written yet survive connection failures and restarts. When the
+    backlog grows over its maximum size the oldest segments are dropped.
+
+    All methods are thread safe.
+    """
+
+    def __init__(
+        self, path: str, max_size: int, segment_lines: int, segment_age: float
+    ) -> None:
+        """Initialize the backlog."""
+        self.path = path
+        self.max_size = max_size
+        self.segment_lines = segment_lines
+        self.segment_age = segment_age
+        self.dropped = 0
+        self._condition = threading.Condition()
+        self._closed: deque[Segment] = deque()
+        self._claimed: dict[int, Segment] = {}
+        self._size = 0
+        self._next_id = 0
+        self._open: Segment | None = None
+        self._open_file: TextIO | None = None
+        self._open_deadline = 0.0
+        self._stopped = False
+
+    @property
+    def pending_lines(self) -> int:
+        """Return the number of lines that were not written yet."""
+        with self._condition:
+            return (
+                sum(segment.lines for segment in self._closed)
+                + sum(segment.lines for segment in self._claimed.values())
+                + (self._open.lines if self._open else 0)
+            )
+
+    def _segment_path(self, segment_id: int) -> str:
+        """Return the path of a segment file."""
+        return os.path.join(self.path, f"{segment_id:012d}{SEGMENT_SUFFIX}")
+
+    def load(self) -> None:
+        """Load the segments that were left behind by the previous run."""
+        os.makedirs(self.path, exist_ok=True)
+        segment_ids = sorted(
+            int(name[: -len(SEGMENT_SUFFIX)])
+            for name in os.listdir(self.path)
+            if name.endswith(SEGMENT_SUFFIX) and name[: -len(SEGMENT_SUFFIX)].isdigit()
+        )
+        with self._condition:
+            for segment_id in segment_ids:
+                path = self._segment_path(segment_id)
+                with open(path, "r+", encoding="utf-8") as file:
+                    content = file.read()
+                    # Drop a line that was only partly written when we stopped
+                    if content and not content.endswith("\n"):
+                        content = content[: content.rfind("\n") + 1]
+                        file.seek(0)
+                        file.truncate()
+                        file.write(content)
+                if not content:
+                    os.remove(path)
+                    continue
+                segment = Segment(
+                    segment_id, len(content.encode("utf-8")), content.count("\n")
+                )
+                self._closed.append(segment)
+                self._size += segment.size
+            if segment_ids:
+                self._next_id = segment_ids[-1] + 1
+            self._drop_oldest()
+        if self._closed:
+            _LOGGER.debug(
+                "Loaded a backlog of %d events", sum(s.lines for s in self._closed)
+            )
+
+    def append(self, lines: str, count: int) -> None:
+        """Append lines ending with a new line to the backlog."""
+        with self._condition:
+            if self._stopped:
+                return
+            if self._open is None:
+                self._open = Segment(self._next_id, 0, 0)
+                self._next_id += 1
+                self._open_file = open(  # pylint: disable=consider-using-with
+                    self._segment_path(self._open.segment_id), "w", encoding="utf-8"
+                )
+                self._open_deadline = time.monotonic() + self.segment_age
+            assert self._open_file is not None
+            self._open_file.write(lines)
+            self._open_file.flush()
+            size = len(lines.encode("utf-8"))
+            self._open.size += size
+            self._open.lines += count
+            self._size += size
+            if self._open.lines >= self.segment_lines:
+                self._close_open_segment()
+            self._drop_oldest()
+            self._condition.notify()
+
+    def _close_open_segment(self) -> None:
+        """Close the open segment so it can be claimed."""
+        assert self._open is not None and self._open_file is not None
+        os.fsync(self._open_file.fileno())
+        self._open_file.close()
+        self._closed.append(self._open)
+        self._open = None
+        self._open_file = None
+
+    def _drop_oldest(self) -> None:
+        """Drop the oldest closed segments while the backlog is too large."""
+        dropped = 0
+        while self._size > self.max_size and self._closed:
+            segment = self._closed.popleft()
+            self._remove_segment(segment)
+            dropped += segment.lines
+        if dropped:
+            self.dropped += dropped
+            _LOGGER.warning("Backlog is full, dropped %d old events", dropped)
+
+    def _remove_segment(self, segment: Segment) -> None:
+        """Remove the file of a segment."""
+        self._size -= segment.size
+        with suppress(FileNotFoundError):
+            os.remove(self._segment_path(segment.segment_id))
+
+    def claim(self) -> tuple[int, str] | None:
+        """Wait for the oldest unclaimed segment and return its id and lines.
+
+        Returns None once the backlog is stopped.
+        """
+        with self._condition:
+            while not self._stopped:
+                timeout: float | None = None
+                if not self._closed and self._open is not None:
+                    # Don't let the writer wait long for the open segment
+                    # to fill up when only a few events come in
+                    timeout = self._open_deadline - time.monotonic()
+                    if timeout <= 0:
+                        self._close_open_segment()
+                        timeout = None
+                if self._closed:
+                    segment = self._closed.popleft()
+                    self._claimed[segment.segment_id] = segment
+                    break
+                self._condition.wait(timeout)
+            else:
+                return None
+        with open(self._segment_path(segment.segment_id), encoding="utf-8") as file:
+            return segment.segment_id, file.read()
+
+    def release(self, segment_id: int, written: bool) -> None:
+        """Release a claimed segment, it is removed if it was written."""
+        with self._condition:
+            segment = self._claimed.pop(segment_id)
+            if written:
+                self._remove_segment(segment)
+            else:
+                # Retry it before the newer segments
+                self._closed.appendleft(segment)
+            self._condition.notify_all()
+
+    def wait_stopped(self, timeout: float) -> bool:
+        """Wait for the backlog to be stopped, return if it was stopped."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._stopped, timeout)
+
+    def wait_empty(self, timeout: float) -> bool:
+        """Wait until all lines were written or the backlog is stopped.
+
+        Returns False if the lines were not written within the timeout.
+        """
+        with self._condition:
+            # The lines are waited for, so the open segment can be written now
+            if self._open is not None and not self._stopped:
+                self._close_open_segment()
+                self._condition.notify_all()
+            return self._condition.wait_for(
+                lambda: self._stopped
+                or (not self._closed and not self._claimed and self._open is None),
+                timeout,
+            )
+
+    def stop(self) -> None:
+        """Stop the backlog, the lines not written yet are kept on disk."""
+        with self._condition:
+            if self._open is not None:
+                self._close_open_segment()
+            self._stopped = True
+            self._condition.notify_all()
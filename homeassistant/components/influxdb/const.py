@@ -32,6 +32,8 @@ CONF_RETRY_COUNT = "max_retries"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
 CONF_PRECISION = "precision"
 CONF_SSL_CA_CERT = "ssl_ca_cert"
+CONF_MAX_BACKLOG_SIZE = "max_backlog_size"
+CONF_CONCURRENT_WRITES = "concurrent_writes"
 
 CONF_LANGUAGE = "language"
 CONF_QUERIES = "queries"
@@ -59,6 +61,7 @@ DEFAULT_RANGE_START = "-15m"
 DEFAULT_RANGE_STOP = "now()"
 DEFAULT_FUNCTION_FLUX = "|> limit(n: 1)"
 DEFAULT_MEASUREMENT_ATTR = "unit_of_measurement"
+DEFAULT_CONCURRENT_WRITES = 1
 
 INFLUX_CONF_MEASUREMENT = "measurement"
 INFLUX_CONF_TAGS = "tags"
@@ -78,6 +81,12 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+BACKLOG_DIR = "influxdb_backlog"
+BACKLOG_SEGMENT_LINES = 1000
+# Seconds before a segment that is not full is written
+BACKLOG_SEGMENT_AGE = 5
+# Seconds to wait for the backlog to be written in block_till_done
+BACKLOG_FLUSH_TIMEOUT = 60
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -120,6 +129,8 @@ RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
 WROTE_MESSAGE = "Wrote %d events."
+BACKLOG_MESSAGE = "%s Keeping the events in the backlog until it can be written."
+BACKLOG_RESUMED_MESSAGE = "Resumed, writing the %d events in the backlog."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
 QUERY_MULTIPLE_RESULTS_MESSAGE = (
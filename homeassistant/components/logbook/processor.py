@@ -1,18 +1,22 @@
 """Event parser and human readable log generator."""
 from __future__ import annotations
 
-from collections.abc import Callable, Generator
+from collections.abc import Callable, Generator, Iterable
 from contextlib import suppress
 from dataclasses import dataclass
-from datetime import datetime as dt
+from datetime import datetime as dt, timedelta
+from itertools import islice
 from typing import Any
 
+from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
-from sqlalchemy.orm.query import Query
+from sqlalchemy.orm.session import Session
 
+from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import (
     process_datetime_to_timestamp,
+    process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.util import session_scope
@@ -58,6 +62,44 @@ from .models import EventAsRow, LazyEventPartialState, async_event_to_row
 from .queries import statement_for_request
 from .queries.common import PSUEDO_EVENT_STATE_CHANGED
 
+# How many rows to buffer when the result set is expected to be large
+ROW_BUFFER_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class LogbookCursor:
+    """The position of the last entry delivered in a page of the logbook.
+
+    Rows are ordered by time fired. The next page selects the rows fired at
+    the time of the cursor again and skips the ones that were already
+    delivered by their event or state id.
+    """
+
+    time_fired: dt
+    row_ids: frozenset[str]
+
+    def as_string(self) -> str:
+        """Return the cursor as an opaque string."""
+        return f"{self.time_fired.isoformat()}|{','.join(sorted(self.row_ids))}"
+
+    @classmethod
+    def from_string(cls, cursor: str) -> LogbookCursor | None:
+        """Return the cursor from its string, or None if it is invalid."""
+        time_fired_str, _, row_ids_str = cursor.partition("|")
+        if (time_fired := dt_util.parse_datetime(time_fired_str)) is None:
+            return None
+        return cls(
+            dt_util.as_utc(time_fired),
+            frozenset(row_ids_str.split(",")) if row_ids_str else frozenset(),
+        )
+
+
+def _row_id(row: Row) -> str:
+    """Return the id of the event or state a row was selected from."""
+    if (event_id := row.event_id) is not None:
+        return f"e{event_id}"
+    return f"s{row.state_id}"
+
 
 @dataclass
 class LogbookRun:
@@ -132,14 +174,13 @@ class EventProcessor:
         end_day: dt,
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
-
-        def yield_rows(query: Query) -> Generator[Row, None, None]:
-            """Yield rows from the database."""
+        with session_scope(hass=self.hass) as session:
+            result = self._execute(session, start_day, end_day)
             # end_day - start_day intentionally checks .days and not .total_seconds()
             # since we don't want to switch over to buffered if they go
             # over one day by a few hours since the UI makes it so easy to do that.
             if self.limited_select or (end_day - start_day).days <= 1:
-                return query.all()  # type: ignore[no-any-return]
+                return self.humanify(result.all())
             # Only buffer rows to reduce memory pressure
             # if we expect the result set is going to be very large.
             # What is considered very large is going to differ
@@ -149,8 +190,72 @@ class EventProcessor:
             # even and RPi3 that number seems higher in testing
             # so we don't switch over until we request > 1 day+ of data.
             #
-            return query.yield_per(1024)  # type: ignore[no-any-return]
+            return self.humanify(result.yield_per(ROW_BUFFER_SIZE))
 
+    def iter_events(
+        self,
+        start_day: dt,
+        end_day: dt,
+        chunk_size: int,
+    ) -> Generator[list[dict[str, Any]], None, None]:
+        """Get events for a period of time in chunks of at most chunk_size."""
+        with session_scope(hass=self.hass) as session:
+            entries = self._humanify(
+                self._execute(session, start_day, end_day).yield_per(ROW_BUFFER_SIZE)
+            )
+            while chunk := list(islice(entries, chunk_size)):
+                yield chunk
+
+    def get_events_page(
+        self,
+        start_day: dt,
+        end_day: dt,
+        limit: int,
+        cursor: LogbookCursor | None = None,
+    ) -> tuple[list[dict[str, Any]], LogbookCursor | None]:
+        """Get at most limit events after the cursor.
+
+        Returns the events and the cursor of the next page, which is None
+        once the period has been exhausted.
+        """
+        row_ids: set[str] = set()
+        if cursor is not None:
+            # The start of the period is exclusive, select the rows
+            # fired at the time of the cursor again
+            start_day = max(start_day, cursor.time_fired - timedelta(microseconds=1))
+            row_ids.update(cursor.row_ids)
+        last_time_fired = cursor.time_fired if cursor else None
+        last_row: Row | None = None
+
+        def track_rows(rows: Iterable[Row]) -> Generator[Row, None, None]:
+            """Remember the row the next entry is generated from."""
+            nonlocal last_row
+            for row in rows:
+                last_row = row
+                yield row
+
+        entries: list[dict[str, Any]] = []
+        with session_scope(hass=self.hass) as session:
+            rows = self._execute(session, start_day, end_day).yield_per(ROW_BUFFER_SIZE)
+            # Rows that were already delivered are still humanified so their
+            # context is available to the rows that follow them
+            for entry in self._humanify(track_rows(rows)):
+                assert last_row is not None
+                time_fired = process_timestamp(last_row.time_fired)
+                row_id = _row_id(last_row)
+                if time_fired != last_time_fired:
+                    last_time_fired = time_fired
+                    row_ids.clear()
+                elif row_id in row_ids:
+                    continue
+                row_ids.add(row_id)
+                entries.append(entry)
+                if len(entries) == limit:
+                    return entries, LogbookCursor(time_fired, frozenset(row_ids))
+        return entries, None
+
+    def _execute(self, session: Session, start_day: dt, end_day: dt) -> Result:
+        """Select the rows for a period of time."""
         stmt = statement_for_request(
             start_day,
             end_day,
@@ -159,26 +264,30 @@ class EventProcessor:
             self.device_ids,
             self.filters,
             self.context_id,
+            get_instance(self.hass).normalized_ids_active,
         )
-        with session_scope(hass=self.hass) as session:
-            return self.humanify(yield_rows(session.execute(stmt)))
+        return session.execute(stmt)
 
     def humanify(
-        self, row_generator: Generator[Row | EventAsRow, None, None]
+        self, row_generator: Iterable[Row | EventAsRow]
     ) -> list[dict[str, str]]:
         """Humanify rows."""
-        return list(
-            _humanify(
-                row_generator,
-                self.ent_reg,
-                self.logbook_run,
-                self.context_augmenter,
-            )
+        return list(self._humanify(row_generator))
+
+    def _humanify(
+        self, row_generator: Iterable[Row | EventAsRow]
+    ) -> Generator[dict[str, Any], None, None]:
+        """Humanify rows as they are consumed."""
+        return _humanify(
+            row_generator,
+            self.ent_reg,
+            self.logbook_run,
+            self.context_augmenter,
         )
 
 
 def _humanify(
-    rows: Generator[Row | EventAsRow, None, None],
+    rows: Iterable[Row | EventAsRow],
     ent_reg: er.EntityRegistry,
     logbook_run: LogbookRun,
     context_augmenter: ContextAugmenter,
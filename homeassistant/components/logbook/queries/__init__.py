@@ -22,13 +22,16 @@ def statement_for_request(
     device_ids: list[str] | None = None,
     filters: Filters | None = None,
     context_id: str | None = None,
+    normalized_ids: bool = False,
 ) -> StatementLambdaElement:
     """Generate the logbook statement for a logbook request."""
 
     # No entities: logbook sends everything for the timeframe
     # limited by the context_id and the yaml configured filter
     if not entity_ids and not device_ids:
-        states_entity_filter = filters.states_entity_filter() if filters else None
+        states_entity_filter = (
+            filters.states_entity_filter(normalized_ids) if filters else None
+        )
         events_entity_filter = filters.events_entity_filter() if filters else None
         return all_stmt(
             start_day,
@@ -37,6 +40,7 @@ def statement_for_request(
             states_entity_filter,
             events_entity_filter,
             context_id,
+            normalized_ids,
         )
 
     # sqlalchemy caches object quoting, the
@@ -55,6 +59,7 @@ def statement_for_request(
             entity_ids,
             json_quoted_entity_ids,
             json_quoted_device_ids,
+            normalized_ids,
         )
 
     # entities: logbook sends everything for the timeframe for the entities
@@ -66,6 +71,7 @@ def statement_for_request(
             event_types,
             entity_ids,
             json_quoted_entity_ids,
+            normalized_ids,
         )
 
     # devices: logbook sends everything for the timeframe for the devices
@@ -76,4 +82,5 @@ def statement_for_request(
         end_day,
         event_types,
         json_quoted_device_ids,
+        normalized_ids,
     )
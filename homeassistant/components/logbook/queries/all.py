@@ -13,12 +13,16 @@ from homeassistant.components.recorder.db_schema import (
     Events,
     States,
 )
+from homeassistant.components.recorder.models import context_id_to_bytes
 
 from .common import (
     apply_states_filters,
+    events_context_id_bin_matcher,
     legacy_select_events_context_id,
+    legacy_select_events_context_id_bin,
     select_events_without_states,
     select_states,
+    states_context_id_bin_matcher,
 )
 
 
@@ -29,8 +33,18 @@ def all_stmt(
     states_entity_filter: ClauseList | None = None,
     events_entity_filter: ClauseList | None = None,
     context_id: str | None = None,
+    normalized_ids: bool = False,
 ) -> StatementLambdaElement:
     """Generate a logbook query for all entities."""
+    if normalized_ids:
+        return _normalized_all_stmt(
+            start_day,
+            end_day,
+            event_types,
+            states_entity_filter,
+            events_entity_filter,
+            context_id,
+        )
     stmt = lambda_stmt(
         lambda: select_events_without_states(start_day, end_day, event_types)
     )
@@ -57,8 +71,54 @@ def all_stmt(
     return stmt
 
 
-def _states_query_for_all(start_day: dt, end_day: dt) -> Query:
-    return apply_states_filters(_apply_all_hints(select_states()), start_day, end_day)
+def _normalized_all_stmt(
+    start_day: dt,
+    end_day: dt,
+    event_types: tuple[str, ...],
+    states_entity_filter: ClauseList | None,
+    events_entity_filter: ClauseList | None,
+    context_id: str | None,
+) -> StatementLambdaElement:
+    """Generate a logbook query for all entities once the ids are normalized."""
+    stmt = lambda_stmt(
+        lambda: select_events_without_states(start_day, end_day, event_types, True)
+    )
+    if context_id is not None:
+        context_id_bin = context_id_to_bytes(context_id)
+        stmt += lambda s: s.where(
+            events_context_id_bin_matcher(context_id_bin)
+        ).union_all(
+            _states_query_for_context_id_bin(start_day, end_day, context_id_bin),
+            legacy_select_events_context_id_bin(start_day, end_day, context_id_bin),
+        )
+    else:
+        if events_entity_filter is not None:
+            stmt += lambda s: s.where(events_entity_filter)
+
+        if states_entity_filter is not None:
+            stmt += lambda s: s.union_all(
+                _states_query_for_all(start_day, end_day, True).where(
+                    states_entity_filter
+                )
+            )
+        else:
+            stmt += lambda s: s.union_all(
+                _states_query_for_all(start_day, end_day, True)
+            )
+
+    stmt += lambda s: s.order_by(Events.time_fired)
+    return stmt
+
+
+def _states_query_for_all(
+    start_day: dt, end_day: dt, normalized_ids: bool = False
+) -> Query:
+    return apply_states_filters(
+        _apply_all_hints(select_states(normalized_ids)),
+        start_day,
+        end_day,
+        normalized_ids,
+    )
 
 
 def _apply_all_hints(query: Query) -> Query:
@@ -72,3 +132,11 @@ def _states_query_for_context_id(start_day: dt, end_day: dt, context_id: str) ->
     return apply_states_filters(select_states(), start_day, end_day).where(
         States.context_id == context_id
     )
+
+
+def _states_query_for_context_id_bin(
+    start_day: dt, end_day: dt, context_id_bin: bytes
+) -> Query:
+    return apply_states_filters(select_states(True), start_day, end_day, True).where(
+        states_context_id_bin_matcher(context_id_bin)
+    )
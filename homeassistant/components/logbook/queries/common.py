@@ -4,22 +4,26 @@ from __future__ import annotations
 from datetime import datetime as dt
 
 import sqlalchemy
-from sqlalchemy import select
+from sqlalchemy import Column, LargeBinary, select, type_coerce
 from sqlalchemy.orm import Query
-from sqlalchemy.sql.elements import ClauseList
+from sqlalchemy.sql.elements import ClauseList, ColumnElement
 from sqlalchemy.sql.expression import literal
-from sqlalchemy.sql.selectable import Select
+from sqlalchemy.sql.selectable import CTE, Select
 
 from homeassistant.components.recorder.db_schema import (
+    EVENTS_CONTEXT_ID_BIN_INDEX,
     EVENTS_CONTEXT_ID_INDEX,
     OLD_FORMAT_ATTRS_JSON,
     OLD_STATE,
     SHARED_ATTRS_JSON,
+    STATES_CONTEXT_ID_BIN_INDEX,
     STATES_CONTEXT_ID_INDEX,
     EventData,
     Events,
+    EventTypes,
     StateAttributes,
     States,
+    StatesMeta,
 )
 from homeassistant.components.recorder.filters import like_domain_matchers
 
@@ -53,6 +57,19 @@ EVENT_COLUMNS = (
     Events.context_parent_id.label("context_parent_id"),
 )
 
+# Once the event_type and context ids have been migrated
+# they are only available from the event_types table and
+# the binary context columns
+NORMALIZED_EVENT_COLUMNS = (
+    Events.event_id.label("event_id"),
+    EventTypes.event_type.label("event_type"),
+    Events.event_data.label("event_data"),
+    Events.time_fired.label("time_fired"),
+    Events.context_id_bin.label("context_id"),
+    Events.context_user_id_bin.label("context_user_id"),
+    Events.context_parent_id_bin.label("context_parent_id"),
+)
+
 STATE_COLUMNS = (
     States.state_id.label("state_id"),
     States.state.label("state"),
@@ -61,6 +78,14 @@ STATE_COLUMNS = (
     OLD_FORMAT_ATTRS_JSON["icon"].as_string().label("old_format_icon"),
 )
 
+NORMALIZED_STATE_COLUMNS = (
+    States.state_id.label("state_id"),
+    States.state.label("state"),
+    StatesMeta.entity_id.label("entity_id"),
+    SHARED_ATTRS_JSON["icon"].as_string().label("icon"),
+    OLD_FORMAT_ATTRS_JSON["icon"].as_string().label("old_format_icon"),
+)
+
 STATE_CONTEXT_ONLY_COLUMNS = (
     States.state_id.label("state_id"),
     States.state.label("state"),
@@ -69,6 +94,14 @@ STATE_CONTEXT_ONLY_COLUMNS = (
     literal(value=None, type_=sqlalchemy.String).label("old_format_icon"),
 )
 
+NORMALIZED_STATE_CONTEXT_ONLY_COLUMNS = (
+    States.state_id.label("state_id"),
+    States.state.label("state"),
+    StatesMeta.entity_id.label("entity_id"),
+    literal(value=None, type_=sqlalchemy.String).label("icon"),
+    literal(value=None, type_=sqlalchemy.String).label("old_format_icon"),
+)
+
 EVENT_COLUMNS_FOR_STATE_SELECT = [
     literal(value=None, type_=sqlalchemy.Text).label("event_id"),
     # We use PSUEDO_EVENT_STATE_CHANGED aka None for
@@ -86,6 +119,19 @@ EVENT_COLUMNS_FOR_STATE_SELECT = [
     literal(value=None, type_=sqlalchemy.Text).label("shared_data"),
 ]
 
+NORMALIZED_EVENT_COLUMNS_FOR_STATE_SELECT = [
+    literal(value=None, type_=sqlalchemy.Text).label("event_id"),
+    literal(value=PSUEDO_EVENT_STATE_CHANGED, type_=sqlalchemy.String).label(
+        "event_type"
+    ),
+    literal(value=None, type_=sqlalchemy.Text).label("event_data"),
+    States.last_updated.label("time_fired"),
+    States.context_id_bin.label("context_id"),
+    States.context_user_id_bin.label("context_user_id"),
+    States.context_parent_id_bin.label("context_parent_id"),
+    literal(value=None, type_=sqlalchemy.Text).label("shared_data"),
+]
+
 EMPTY_STATE_COLUMNS = (
     literal(value=0, type_=sqlalchemy.Integer).label("state_id"),
     literal(value=None, type_=sqlalchemy.String).label("state"),
@@ -101,18 +147,43 @@ EVENT_ROWS_NO_STATES = (
     *EMPTY_STATE_COLUMNS,
 )
 
+NORMALIZED_EVENT_ROWS_NO_STATES = (
+    *NORMALIZED_EVENT_COLUMNS,
+    EventData.shared_data.label("shared_data"),
+    *EMPTY_STATE_COLUMNS,
+)
+
 # Virtual column to tell logbook if it should avoid processing
 # the event as its only used to link contexts
 CONTEXT_ONLY = literal("1").label("context_only")
 NOT_CONTEXT_ONLY = literal(None).label("context_only")
 
 
+def events_context_id_column(normalized_ids: bool) -> Column:
+    """Return the column events are linked by context with."""
+    return Events.context_id_bin if normalized_ids else Events.context_id
+
+
+def states_context_id_column(normalized_ids: bool) -> Column:
+    """Return the column states are linked by context with."""
+    return States.context_id_bin if normalized_ids else States.context_id
+
+
 def select_events_context_id_subquery(
     start_day: dt,
     end_day: dt,
     event_types: tuple[str, ...],
+    normalized_ids: bool = False,
 ) -> Select:
     """Generate the select for a context_id subquery."""
+    if normalized_ids:
+        return (
+            select(Events.context_id_bin.label("context_id"))
+            .where((Events.time_fired > start_day) & (Events.time_fired < end_day))
+            .join(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
+            .where(EventTypes.event_type.in_(event_types))
+            .outerjoin(EventData, (Events.data_id == EventData.data_id))
+        )
     return (
         select(Events.context_id)
         .where((Events.time_fired > start_day) & (Events.time_fired < end_day))
@@ -121,30 +192,49 @@ def select_events_context_id_subquery(
     )
 
 
-def select_events_context_only() -> Select:
+def select_events_context_only(normalized_ids: bool = False) -> Select:
     """Generate an events query that mark them as for context_only.
 
     By marking them as context_only we know they are only for
     linking context ids and we can avoid processing them.
     """
+    if normalized_ids:
+        return select(*NORMALIZED_EVENT_ROWS_NO_STATES, CONTEXT_ONLY)
     return select(*EVENT_ROWS_NO_STATES, CONTEXT_ONLY)
 
 
-def select_states_context_only() -> Select:
+def select_states_context_only(normalized_ids: bool = False) -> Select:
     """Generate an states query that mark them as for context_only.
 
     By marking them as context_only we know they are only for
     linking context ids and we can avoid processing them.
     """
+    if normalized_ids:
+        return select(
+            *NORMALIZED_EVENT_COLUMNS_FOR_STATE_SELECT,
+            *NORMALIZED_STATE_CONTEXT_ONLY_COLUMNS,
+            CONTEXT_ONLY,
+        )
     return select(
         *EVENT_COLUMNS_FOR_STATE_SELECT, *STATE_CONTEXT_ONLY_COLUMNS, CONTEXT_ONLY
     )
 
 
 def select_events_without_states(
-    start_day: dt, end_day: dt, event_types: tuple[str, ...]
+    start_day: dt,
+    end_day: dt,
+    event_types: tuple[str, ...],
+    normalized_ids: bool = False,
 ) -> Select:
     """Generate an events select that does not join states."""
+    if normalized_ids:
+        return (
+            select(*NORMALIZED_EVENT_ROWS_NO_STATES, NOT_CONTEXT_ONLY)
+            .where((Events.time_fired > start_day) & (Events.time_fired < end_day))
+            .join(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
+            .where(EventTypes.event_type.in_(event_types))
+            .outerjoin(EventData, (Events.data_id == EventData.data_id))
+        )
     return (
         select(*EVENT_ROWS_NO_STATES, NOT_CONTEXT_ONLY)
         .where((Events.time_fired > start_day) & (Events.time_fired < end_day))
@@ -153,8 +243,14 @@ def select_events_without_states(
     )
 
 
-def select_states() -> Select:
+def select_states(normalized_ids: bool = False) -> Select:
     """Generate a states select that formats the states table as event rows."""
+    if normalized_ids:
+        return select(
+            *NORMALIZED_EVENT_COLUMNS_FOR_STATE_SELECT,
+            *NORMALIZED_STATE_COLUMNS,
+            NOT_CONTEXT_ONLY,
+        )
     return select(
         *EVENT_COLUMNS_FOR_STATE_SELECT,
         *STATE_COLUMNS,
@@ -187,20 +283,71 @@ def legacy_select_events_context_id(
     )
 
 
-def apply_states_filters(query: Query, start_day: dt, end_day: dt) -> Query:
+def legacy_select_events_context_id_bin(
+    start_day: dt, end_day: dt, context_id_bin: bytes
+) -> Select:
+    """Generate a legacy events context id select that also joins states."""
+    # This can be removed once we no longer have event_ids in the states table
+    return (
+        select(
+            *NORMALIZED_EVENT_COLUMNS,
+            literal(value=None, type_=sqlalchemy.String).label("shared_data"),
+            *NORMALIZED_STATE_COLUMNS,
+            NOT_CONTEXT_ONLY,
+        )
+        .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
+        .outerjoin(States, (Events.event_id == States.event_id))
+        .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
+        .where(
+            (States.last_updated == States.last_changed) | States.last_changed.is_(None)
+        )
+        .where(_not_continuous_entity_matcher(True))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
+        .where((Events.time_fired > start_day) & (Events.time_fired < end_day))
+        .where(events_context_id_bin_matcher(context_id_bin))
+    )
+
+
+def events_context_id_bin_matcher(context_id_bin: bytes) -> ColumnElement:
+    """Match events by an encoded context id.
+
+    The context id must already be encoded since values bound
+    inside a lambda_stmt do not pick up the column type.
+    """
+    return type_coerce(Events.context_id_bin, LargeBinary) == context_id_bin
+
+
+def states_context_id_bin_matcher(context_id_bin: bytes) -> ColumnElement:
+    """Match states by an encoded context id.
+
+    The context id must already be encoded since values bound
+    inside a lambda_stmt do not pick up the column type.
+    """
+    return type_coerce(States.context_id_bin, LargeBinary) == context_id_bin
+
+
+def apply_states_filters(
+    query: Query, start_day: dt, end_day: dt, normalized_ids: bool = False
+) -> Query:
     """Filter states by time range.
 
     Filters states that do not have an old state or new state (added / removed)
     Filters states that are in a continuous domain with a UOM.
     Filters states that do not have matching last_updated and last_changed.
     """
+    if normalized_ids:
+        query = query.outerjoin(
+            StatesMeta, (States.metadata_id == StatesMeta.metadata_id)
+        )
     return (
         query.filter(
             (States.last_updated > start_day) & (States.last_updated < end_day)
         )
         .outerjoin(OLD_STATE, (States.old_state_id == OLD_STATE.state_id))
         .where(_missing_state_matcher())
-        .where(_not_continuous_entity_matcher())
+        .where(_not_continuous_entity_matcher(normalized_ids))
         .where(
             (States.last_updated == States.last_changed) | States.last_changed.is_(None)
         )
@@ -221,20 +368,24 @@ def _missing_state_matcher() -> sqlalchemy.and_:
     )
 
 
-def _not_continuous_entity_matcher() -> sqlalchemy.or_:
+def _not_continuous_entity_matcher(normalized_ids: bool = False) -> sqlalchemy.or_:
     """Match non continuous entities."""
+    entity_id_column = StatesMeta.entity_id if normalized_ids else States.entity_id
     return sqlalchemy.or_(
         # First exclude domains that may be continuous
-        _not_possible_continuous_domain_matcher(),
+        _not_possible_continuous_domain_matcher(entity_id_column),
         # But let in the entities in the possible continuous domains
         # that are not actually continuous sensors because they lack a UOM
         sqlalchemy.and_(
-            _conditionally_continuous_domain_matcher, _not_uom_attributes_matcher()
+            _conditionally_continuous_domain_matcher(entity_id_column),
+            _not_uom_attributes_matcher(),
         ).self_group(),
     )
 
 
-def _not_possible_continuous_domain_matcher() -> sqlalchemy.and_:
+def _not_possible_continuous_domain_matcher(
+    entity_id_column: Column,
+) -> sqlalchemy.and_:
     """Match not continuous domains.
 
     This matches domain that are always considered continuous
@@ -243,7 +394,7 @@ def _not_possible_continuous_domain_matcher() -> sqlalchemy.and_:
     """
     return sqlalchemy.and_(
         *[
-            ~States.entity_id.like(entity_domain)
+            ~entity_id_column.like(entity_domain)
             for entity_domain in (
                 *ALWAYS_CONTINUOUS_ENTITY_ID_LIKE,
                 *CONDITIONALLY_CONTINUOUS_ENTITY_ID_LIKE,
@@ -252,7 +403,9 @@ def _not_possible_continuous_domain_matcher() -> sqlalchemy.and_:
     ).self_group()
 
 
-def _conditionally_continuous_domain_matcher() -> sqlalchemy.or_:
+def _conditionally_continuous_domain_matcher(
+    entity_id_column: Column,
+) -> sqlalchemy.or_:
     """Match conditionally continuous domains.
 
     This matches domain that are only considered
@@ -260,7 +413,7 @@ def _conditionally_continuous_domain_matcher() -> sqlalchemy.or_:
     """
     return sqlalchemy.or_(
         *[
-            States.entity_id.like(entity_domain)
+            entity_id_column.like(entity_domain)
             for entity_domain in CONDITIONALLY_CONTINUOUS_ENTITY_ID_LIKE
         ],
     ).self_group()
@@ -273,15 +426,41 @@ def _not_uom_attributes_matcher() -> ClauseList:
     ) | ~States.attributes.like(UNIT_OF_MEASUREMENT_JSON_LIKE)
 
 
-def apply_states_context_hints(query: Query) -> Query:
+def apply_states_context_hints(query: Query, normalized_ids: bool = False) -> Query:
     """Force mysql to use the right index on large context_id selects."""
-    return query.with_hint(
-        States, f"FORCE INDEX ({STATES_CONTEXT_ID_INDEX})", dialect_name="mysql"
-    )
+    index = STATES_CONTEXT_ID_BIN_INDEX if normalized_ids else STATES_CONTEXT_ID_INDEX
+    return query.with_hint(States, f"FORCE INDEX ({index})", dialect_name="mysql")
 
 
-def apply_events_context_hints(query: Query) -> Query:
+def apply_events_context_hints(query: Query, normalized_ids: bool = False) -> Query:
     """Force mysql to use the right index on large context_id selects."""
-    return query.with_hint(
-        Events, f"FORCE INDEX ({EVENTS_CONTEXT_ID_INDEX})", dialect_name="mysql"
+    index = EVENTS_CONTEXT_ID_BIN_INDEX if normalized_ids else EVENTS_CONTEXT_ID_INDEX
+    return query.with_hint(Events, f"FORCE INDEX ({index})", dialect_name="mysql")
+
+
+def select_events_context_only_for_cte(cte: CTE, normalized_ids: bool) -> Query:
+    """Generate a select for events linked by context to the context ids in the cte."""
+    query = select_events_context_only(normalized_ids).select_from(cte)
+    query = query.outerjoin(
+        Events, cte.c.context_id == events_context_id_column(normalized_ids)
+    )
+    if normalized_ids:
+        query = query.outerjoin(
+            EventTypes, (Events.event_type_id == EventTypes.event_type_id)
+        )
+    return apply_events_context_hints(query, normalized_ids).outerjoin(
+        EventData, (Events.data_id == EventData.data_id)
     )
+
+
+def select_states_context_only_for_cte(cte: CTE, normalized_ids: bool) -> Query:
+    """Generate a select for states linked by context to the context ids in the cte."""
+    query = select_states_context_only(normalized_ids).select_from(cte)
+    query = query.outerjoin(
+        States, cte.c.context_id == states_context_id_column(normalized_ids)
+    )
+    if normalized_ids:
+        query = query.outerjoin(
+            StatesMeta, (States.metadata_id == StatesMeta.metadata_id)
+        )
+    return apply_states_context_hints(query, normalized_ids)
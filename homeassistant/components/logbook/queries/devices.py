@@ -11,20 +11,13 @@ from sqlalchemy.sql.elements import ClauseList
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import CTE, CompoundSelect
 
-from homeassistant.components.recorder.db_schema import (
-    DEVICE_ID_IN_EVENT,
-    EventData,
-    Events,
-    States,
-)
+from homeassistant.components.recorder.db_schema import DEVICE_ID_IN_EVENT, Events
 
 from .common import (
-    apply_events_context_hints,
-    apply_states_context_hints,
     select_events_context_id_subquery,
-    select_events_context_only,
+    select_events_context_only_for_cte,
     select_events_without_states,
-    select_states_context_only,
+    select_states_context_only_for_cte,
 )
 
 
@@ -33,11 +26,12 @@ def _select_device_id_context_ids_sub_query(
     end_day: dt,
     event_types: tuple[str, ...],
     json_quotable_device_ids: list[str],
+    normalized_ids: bool,
 ) -> CompoundSelect:
     """Generate a subquery to find context ids for multiple devices."""
-    inner = select_events_context_id_subquery(start_day, end_day, event_types).where(
-        apply_event_device_id_matchers(json_quotable_device_ids)
-    )
+    inner = select_events_context_id_subquery(
+        start_day, end_day, event_types, normalized_ids
+    ).where(apply_event_device_id_matchers(json_quotable_device_ids))
     return select(inner.c.context_id).group_by(inner.c.context_id)
 
 
@@ -47,6 +41,7 @@ def _apply_devices_context_union(
     end_day: dt,
     event_types: tuple[str, ...],
     json_quotable_device_ids: list[str],
+    normalized_ids: bool,
 ) -> CompoundSelect:
     """Generate a CTE to find the device context ids and a query to find linked row."""
     devices_cte: CTE = _select_device_id_context_ids_sub_query(
@@ -54,18 +49,11 @@ def _apply_devices_context_union(
         end_day,
         event_types,
         json_quotable_device_ids,
+        normalized_ids,
     ).cte()
     return query.union_all(
-        apply_events_context_hints(
-            select_events_context_only()
-            .select_from(devices_cte)
-            .outerjoin(Events, devices_cte.c.context_id == Events.context_id)
-        ).outerjoin(EventData, (Events.data_id == EventData.data_id)),
-        apply_states_context_hints(
-            select_states_context_only()
-            .select_from(devices_cte)
-            .outerjoin(States, devices_cte.c.context_id == States.context_id)
-        ),
+        select_events_context_only_for_cte(devices_cte, normalized_ids),
+        select_states_context_only_for_cte(devices_cte, normalized_ids),
     )
 
 
@@ -74,17 +62,34 @@ def devices_stmt(
     end_day: dt,
     event_types: tuple[str, ...],
     json_quotable_device_ids: list[str],
+    normalized_ids: bool = False,
 ) -> StatementLambdaElement:
     """Generate a logbook query for multiple devices."""
+    # The flag is passed as a literal since sqlalchemy
+    # can not track a bool closure variable in the cache key
+    if normalized_ids:
+        return lambda_stmt(
+            lambda: _apply_devices_context_union(
+                select_events_without_states(
+                    start_day, end_day, event_types, True
+                ).where(apply_event_device_id_matchers(json_quotable_device_ids)),
+                start_day,
+                end_day,
+                event_types,
+                json_quotable_device_ids,
+                True,
+            ).order_by(Events.time_fired)
+        )
     stmt = lambda_stmt(
         lambda: _apply_devices_context_union(
-            select_events_without_states(start_day, end_day, event_types).where(
+            select_events_without_states(start_day, end_day, event_types, False).where(
                 apply_event_device_id_matchers(json_quotable_device_ids)
             ),
             start_day,
             end_day,
             event_types,
             json_quotable_device_ids,
+            False,
         ).order_by(Events.time_fired)
     )
     return stmt
@@ -13,21 +13,21 @@ from sqlalchemy.sql.selectable import CTE, CompoundSelect
 from homeassistant.components.recorder.db_schema import (
     ENTITY_ID_IN_EVENT,
     ENTITY_ID_LAST_UPDATED_INDEX,
+    METADATA_ID_LAST_UPDATED_INDEX,
     OLD_ENTITY_ID_IN_EVENT,
-    EventData,
     Events,
     States,
+    StatesMeta,
 )
 
 from .common import (
-    apply_events_context_hints,
-    apply_states_context_hints,
     apply_states_filters,
     select_events_context_id_subquery,
-    select_events_context_only,
+    select_events_context_only_for_cte,
     select_events_without_states,
     select_states,
-    select_states_context_only,
+    select_states_context_only_for_cte,
+    states_context_id_column,
 )
 
 
@@ -37,15 +37,16 @@ def _select_entities_context_ids_sub_query(
     event_types: tuple[str, ...],
     entity_ids: list[str],
     json_quoted_entity_ids: list[str],
+    normalized_ids: bool,
 ) -> CompoundSelect:
     """Generate a subquery to find context ids for multiple entities."""
     union = union_all(
-        select_events_context_id_subquery(start_day, end_day, event_types).where(
-            apply_event_entity_id_matchers(json_quoted_entity_ids)
+        select_events_context_id_subquery(
+            start_day, end_day, event_types, normalized_ids
+        ).where(apply_event_entity_id_matchers(json_quoted_entity_ids)),
+        select_states_context_ids_for_entity_ids(
+            start_day, end_day, entity_ids, normalized_ids
         ),
-        apply_entities_hints(select(States.context_id))
-        .filter((States.last_updated > start_day) & (States.last_updated < end_day))
-        .where(States.entity_id.in_(entity_ids)),
     )
     return select(union.c.context_id).group_by(union.c.context_id)
 
@@ -57,6 +58,7 @@ def _apply_entities_context_union(
     event_types: tuple[str, ...],
     entity_ids: list[str],
     json_quoted_entity_ids: list[str],
+    normalized_ids: bool,
 ) -> CompoundSelect:
     """Generate a CTE to find the entity and device context ids and a query to find linked row."""
     entities_cte: CTE = _select_entities_context_ids_sub_query(
@@ -65,6 +67,7 @@ def _apply_entities_context_union(
         event_types,
         entity_ids,
         json_quoted_entity_ids,
+        normalized_ids,
     ).cte()
     # We used to optimize this to exclude rows we already in the union with
     # a States.entity_id.not_in(entity_ids) but that made the
@@ -72,17 +75,9 @@ def _apply_entities_context_union(
     # in the python code anyways since they will have context_only
     # set on them the impact is minimal.
     return query.union_all(
-        states_query_for_entity_ids(start_day, end_day, entity_ids),
-        apply_events_context_hints(
-            select_events_context_only()
-            .select_from(entities_cte)
-            .outerjoin(Events, entities_cte.c.context_id == Events.context_id)
-        ).outerjoin(EventData, (Events.data_id == EventData.data_id)),
-        apply_states_context_hints(
-            select_states_context_only()
-            .select_from(entities_cte)
-            .outerjoin(States, entities_cte.c.context_id == States.context_id)
-        ),
+        states_query_for_entity_ids(start_day, end_day, entity_ids, normalized_ids),
+        select_events_context_only_for_cte(entities_cte, normalized_ids),
+        select_states_context_only_for_cte(entities_cte, normalized_ids),
     )
 
 
@@ -92,11 +87,28 @@ def entities_stmt(
     event_types: tuple[str, ...],
     entity_ids: list[str],
     json_quoted_entity_ids: list[str],
+    normalized_ids: bool = False,
 ) -> StatementLambdaElement:
     """Generate a logbook query for multiple entities."""
+    # The flag is passed as a literal since sqlalchemy
+    # can not track a bool closure variable in the cache key
+    if normalized_ids:
+        return lambda_stmt(
+            lambda: _apply_entities_context_union(
+                select_events_without_states(
+                    start_day, end_day, event_types, True
+                ).where(apply_event_entity_id_matchers(json_quoted_entity_ids)),
+                start_day,
+                end_day,
+                event_types,
+                entity_ids,
+                json_quoted_entity_ids,
+                True,
+            ).order_by(Events.time_fired)
+        )
     return lambda_stmt(
         lambda: _apply_entities_context_union(
-            select_events_without_states(start_day, end_day, event_types).where(
+            select_events_without_states(start_day, end_day, event_types, False).where(
                 apply_event_entity_id_matchers(json_quoted_entity_ids)
             ),
             start_day,
@@ -104,17 +116,46 @@ def entities_stmt(
             event_types,
             entity_ids,
             json_quoted_entity_ids,
+            False,
         ).order_by(Events.time_fired)
     )
 
 
 def states_query_for_entity_ids(
-    start_day: dt, end_day: dt, entity_ids: list[str]
+    start_day: dt, end_day: dt, entity_ids: list[str], normalized_ids: bool = False
 ) -> Query:
     """Generate a select for states from the States table for specific entities."""
     return apply_states_filters(
-        apply_entities_hints(select_states()), start_day, end_day
-    ).where(States.entity_id.in_(entity_ids))
+        apply_entities_hints(select_states(normalized_ids), normalized_ids),
+        start_day,
+        end_day,
+        normalized_ids,
+    ).where(_states_entity_ids_matcher(entity_ids, normalized_ids))
+
+
+def select_states_context_ids_for_entity_ids(
+    start_day: dt, end_day: dt, entity_ids: list[str], normalized_ids: bool = False
+) -> Query:
+    """Generate a select for the context ids of states for specific entities."""
+    return (
+        apply_entities_hints(
+            select(states_context_id_column(normalized_ids).label("context_id")),
+            normalized_ids,
+        )
+        .filter((States.last_updated > start_day) & (States.last_updated < end_day))
+        .where(_states_entity_ids_matcher(entity_ids, normalized_ids))
+    )
+
+
+def _states_entity_ids_matcher(
+    entity_ids: list[str], normalized_ids: bool
+) -> sqlalchemy.ColumnElement:
+    """Create a matcher for the entity_ids of states."""
+    if normalized_ids:
+        return States.metadata_id.in_(
+            select(StatesMeta.metadata_id).where(StatesMeta.entity_id.in_(entity_ids))
+        )
+    return States.entity_id.in_(entity_ids)
 
 
 def apply_event_entity_id_matchers(
@@ -133,8 +174,11 @@ def apply_event_entity_id_matchers(
     )
 
 
-def apply_entities_hints(query: Query) -> Query:
+def apply_entities_hints(query: Query, normalized_ids: bool = False) -> Query:
     """Force mysql to use the right index on large selects."""
-    return query.with_hint(
-        States, f"FORCE INDEX ({ENTITY_ID_LAST_UPDATED_INDEX})", dialect_name="mysql"
+    index = (
+        METADATA_ID_LAST_UPDATED_INDEX
+        if normalized_ids
+        else ENTITY_ID_LAST_UPDATED_INDEX
     )
+    return query.with_hint(States, f"FORCE INDEX ({index})", dialect_name="mysql")
@@ -10,20 +10,18 @@ from sqlalchemy.orm import Query
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import CTE, CompoundSelect
 
-from homeassistant.components.recorder.db_schema import EventData, Events, States
+from homeassistant.components.recorder.db_schema import Events
 
 from .common import (
-    apply_events_context_hints,
-    apply_states_context_hints,
     select_events_context_id_subquery,
-    select_events_context_only,
+    select_events_context_only_for_cte,
     select_events_without_states,
-    select_states_context_only,
+    select_states_context_only_for_cte,
 )
 from .devices import apply_event_device_id_matchers
 from .entities import (
-    apply_entities_hints,
     apply_event_entity_id_matchers,
+    select_states_context_ids_for_entity_ids,
     states_query_for_entity_ids,
 )
 
@@ -35,17 +33,20 @@ def _select_entities_device_id_context_ids_sub_query(
     entity_ids: list[str],
     json_quoted_entity_ids: list[str],
     json_quoted_device_ids: list[str],
+    normalized_ids: bool,
 ) -> CompoundSelect:
     """Generate a subquery to find context ids for multiple entities and multiple devices."""
     union = union_all(
-        select_events_context_id_subquery(start_day, end_day, event_types).where(
+        select_events_context_id_subquery(
+            start_day, end_day, event_types, normalized_ids
+        ).where(
             _apply_event_entity_id_device_id_matchers(
                 json_quoted_entity_ids, json_quoted_device_ids
             )
         ),
-        apply_entities_hints(select(States.context_id))
-        .filter((States.last_updated > start_day) & (States.last_updated < end_day))
-        .where(States.entity_id.in_(entity_ids)),
+        select_states_context_ids_for_entity_ids(
+            start_day, end_day, entity_ids, normalized_ids
+        ),
     )
     return select(union.c.context_id).group_by(union.c.context_id)
 
@@ -58,6 +59,7 @@ def _apply_entities_devices_context_union(
     entity_ids: list[str],
     json_quoted_entity_ids: list[str],
     json_quoted_device_ids: list[str],
+    normalized_ids: bool,
 ) -> CompoundSelect:
     devices_entities_cte: CTE = _select_entities_device_id_context_ids_sub_query(
         start_day,
@@ -66,6 +68,7 @@ def _apply_entities_devices_context_union(
         entity_ids,
         json_quoted_entity_ids,
         json_quoted_device_ids,
+        normalized_ids,
     ).cte()
     # We used to optimize this to exclude rows we already in the union with
     # a States.entity_id.not_in(entity_ids) but that made the
@@ -73,17 +76,9 @@ def _apply_entities_devices_context_union(
     # in the python code anyways since they will have context_only
     # set on them the impact is minimal.
     return query.union_all(
-        states_query_for_entity_ids(start_day, end_day, entity_ids),
-        apply_events_context_hints(
-            select_events_context_only()
-            .select_from(devices_entities_cte)
-            .outerjoin(Events, devices_entities_cte.c.context_id == Events.context_id)
-        ).outerjoin(EventData, (Events.data_id == EventData.data_id)),
-        apply_states_context_hints(
-            select_states_context_only()
-            .select_from(devices_entities_cte)
-            .outerjoin(States, devices_entities_cte.c.context_id == States.context_id)
-        ),
+        states_query_for_entity_ids(start_day, end_day, entity_ids, normalized_ids),
+        select_events_context_only_for_cte(devices_entities_cte, normalized_ids),
+        select_states_context_only_for_cte(devices_entities_cte, normalized_ids),
     )
 
 
@@ -94,11 +89,33 @@ def entities_devices_stmt(
     entity_ids: list[str],
     json_quoted_entity_ids: list[str],
     json_quoted_device_ids: list[str],
+    normalized_ids: bool = False,
 ) -> StatementLambdaElement:
     """Generate a logbook query for multiple entities."""
+    # The flag is passed as a literal since sqlalchemy
+    # can not track a bool closure variable in the cache key
+    if normalized_ids:
+        return lambda_stmt(
+            lambda: _apply_entities_devices_context_union(
+                select_events_without_states(
+                    start_day, end_day, event_types, True
+                ).where(
+                    _apply_event_entity_id_device_id_matchers(
+                        json_quoted_entity_ids, json_quoted_device_ids
+                    )
+                ),
+                start_day,
+                end_day,
+                event_types,
+                entity_ids,
+                json_quoted_entity_ids,
+                json_quoted_device_ids,
+                True,
+            ).order_by(Events.time_fired)
+        )
     stmt = lambda_stmt(
         lambda: _apply_entities_devices_context_union(
-            select_events_without_states(start_day, end_day, event_types).where(
+            select_events_without_states(start_day, end_day, event_types, False).where(
                 _apply_event_entity_id_device_id_matchers(
                     json_quoted_entity_ids, json_quoted_device_ids
                 )
@@ -109,6 +126,7 @@ def entities_devices_stmt(
             entity_ids,
             json_quoted_entity_ids,
             json_quoted_device_ids,
+            False,
         ).order_by(Events.time_fired)
     )
     return stmt
@@ -27,7 +27,7 @@ from .helpers import (
     async_subscribe_events,
 )
 from .models import async_event_to_row
-from .processor import EventProcessor
+from .processor import EventProcessor, LogbookCursor
 
 MAX_PENDING_LOGBOOK_EVENTS = 2048
 EVENT_COALESCE_TIME = 0.35
@@ -35,6 +35,8 @@ EVENT_COALESCE_TIME = 0.35
 BIG_QUERY_HOURS = 25
 # how many hours to deliver in the first chunk when we split the query
 BIG_QUERY_RECENT_HOURS = 24
+# how many historical events to deliver in a single stream message
+STREAM_CHUNK_SIZE = 1024
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -104,6 +106,7 @@ async def _async_send_historical_events(
     if not is_big_query:
         message, last_event_time = await _async_get_ws_stream_events(
             hass,
+            connection,
             msg_id,
             start_time,
             end_time,
@@ -126,6 +129,7 @@ async def _async_send_historical_events(
     recent_query_start = end_time - timedelta(hours=BIG_QUERY_RECENT_HOURS)
     recent_message, recent_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         recent_query_start,
         end_time,
@@ -138,6 +142,7 @@ async def _async_send_historical_events(
 
     older_message, older_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         start_time,
         recent_query_start,
@@ -159,6 +164,7 @@ async def _async_send_historical_events(
 
 async def _async_get_ws_stream_events(
     hass: HomeAssistant,
+    connection: ActiveConnection,
     msg_id: int,
     start_time: dt,
     end_time: dt,
@@ -166,9 +172,15 @@ async def _async_get_ws_stream_events(
     event_processor: EventProcessor,
     partial: bool,
 ) -> tuple[str, dt | None]:
-    """Async wrapper around _ws_formatted_get_events."""
+    """Async wrapper around _ws_stream_get_events."""
+
+    def send_chunk(message: str) -> None:
+        """Send a chunk of events from the executor."""
+        hass.loop.call_soon_threadsafe(connection.send_message, message)
+
     return await get_instance(hass).async_add_executor_job(
         _ws_stream_get_events,
+        send_chunk,
         msg_id,
         start_time,
         end_time,
@@ -190,6 +202,7 @@ def _generate_stream_message(
 
 
 def _ws_stream_get_events(
+    send_chunk: Callable[[str], None],
     msg_id: int,
     start_day: dt,
     end_day: dt,
@@ -197,8 +210,19 @@ def _ws_stream_get_events(
     event_processor: EventProcessor,
     partial: bool,
 ) -> tuple[str, dt | None]:
-    """Fetch events and convert them to json in the executor."""
-    events = event_processor.get_events(start_day, end_day)
+    """Fetch events and convert them to json in the executor.
+
+    Events are delivered in chunks as they are read from the database,
+    every chunk but the last one is sent as a partial message. The last
+    message is returned together with the time of the last event.
+    """
+    events: list[dict[str, Any]] = []
+    for chunk in event_processor.iter_events(start_day, end_day, STREAM_CHUNK_SIZE):
+        if events:
+            message = _generate_stream_message(events, start_day, end_day)
+            message["partial"] = True
+            send_chunk(JSON_DUMP(formatter(msg_id, message)))
+        events = chunk
     last_time = None
     if events:
         last_time = dt_util.utc_from_timestamp(events[-1]["when"])
@@ -425,6 +449,17 @@ async def ws_event_stream(
     )
 
 
+@callback
+def _async_send_empty_result(
+    connection: ActiveConnection, msg_id: int, limit: int | None
+) -> None:
+    """Send a result without events, as a page if a limit was passed."""
+    if limit is None:
+        connection.send_result(msg_id, [])
+    else:
+        connection.send_result(msg_id, {"events": [], "cursor": None})
+
+
 def _ws_formatted_get_events(
     msg_id: int,
     start_time: dt,
@@ -439,6 +474,29 @@ def _ws_formatted_get_events(
     )
 
 
+def _ws_formatted_get_events_page(
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    event_processor: EventProcessor,
+    limit: int,
+    cursor: LogbookCursor | None,
+) -> str:
+    """Fetch a page of events and convert it to json in the executor."""
+    events, next_cursor = event_processor.get_events_page(
+        start_time, end_time, limit, cursor
+    )
+    return JSON_DUMP(
+        messages.result_message(
+            msg_id,
+            {
+                "events": events,
+                "cursor": next_cursor.as_string() if next_cursor else None,
+            },
+        )
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "logbook/get_events",
@@ -447,16 +505,24 @@ def _ws_formatted_get_events(
         vol.Optional("entity_ids"): [str],
         vol.Optional("device_ids"): [str],
         vol.Optional("context_id"): str,
+        vol.Optional("limit"): vol.All(int, vol.Range(min=1)),
+        vol.Optional("cursor"): str,
     }
 )
 @websocket_api.async_response
 async def ws_get_events(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
-    """Handle logbook get events websocket command."""
+    """Handle logbook get events websocket command.
+
+    If a limit is passed, a page of at most limit events is returned
+    together with the cursor to pass to get the next page.
+    """
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
     utc_now = dt_util.utcnow()
+    limit: int | None = msg.get("limit")
+    cursor: LogbookCursor | None = None
 
     if start_time := dt_util.parse_datetime(start_time_str):
         start_time = dt_util.as_utc(start_time)
@@ -472,8 +538,13 @@ async def ws_get_events(
         connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
         return
 
+    if (cursor_str := msg.get("cursor")) is not None:
+        if limit is None or (cursor := LogbookCursor.from_string(cursor_str)) is None:
+            connection.send_error(msg["id"], "invalid_cursor", "Invalid cursor")
+            return
+
     if start_time > utc_now:
-        connection.send_result(msg["id"], [])
+        _async_send_empty_result(connection, msg["id"], limit)
         return
 
     device_ids = msg.get("device_ids")
@@ -483,7 +554,7 @@ async def ws_get_events(
         entity_ids = async_filter_entities(hass, entity_ids)
         if not entity_ids and not device_ids:
             # Everything has been filtered away
-            connection.send_result(msg["id"], [])
+            _async_send_empty_result(connection, msg["id"], limit)
             return
 
     event_types = async_determine_event_types(hass, entity_ids, device_ids)
@@ -498,6 +569,20 @@ async def ws_get_events(
         include_entity_name=False,
     )
 
+    if limit is not None:
+        connection.send_message(
+            await get_instance(hass).async_add_executor_job(
+                _ws_formatted_get_events_page,
+                msg["id"],
+                start_time,
+                end_time,
+                event_processor,
+                limit,
+                cursor,
+            )
+        )
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_formatted_get_events,
@@ -2,13 +2,15 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine, Iterable
-from functools import lru_cache, partial, wraps
+from collections import deque
+from collections.abc import Callable, Coroutine, Iterable, Iterator
+from functools import partial, wraps
 import inspect
 from itertools import groupby
 import logging
 from operator import attrgetter
 import ssl
+import threading
 import time
 from typing import TYPE_CHECKING, Any, Union, cast
 import uuid
@@ -43,11 +45,15 @@ from .const import (
     CONF_CERTIFICATE,
     CONF_CLIENT_CERT,
     CONF_CLIENT_KEY,
+    CONF_INBOUND_BATCH_SIZE,
+    CONF_INBOUND_LATENCY,
     CONF_KEEPALIVE,
     CONF_TLS_INSECURE,
     CONF_WILL_MESSAGE,
     DATA_MQTT,
     DEFAULT_ENCODING,
+    DEFAULT_INBOUND_BATCH_SIZE,
+    DEFAULT_INBOUND_LATENCY,
     DEFAULT_QOS,
     MQTT_CONNECTED,
     MQTT_DISCONNECTED,
@@ -260,12 +266,127 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None] = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
 
 
+class _SubscriptionTrieNode:
+    """A topic level in the subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _SubscriptionTrieNode] = {}
+        # Subscriptions on the topic filter ending at this level,
+        # with the order in which they were added
+        self.subscriptions: dict[Subscription, int] = {}
+
+
+class SubscriptionTrie:
+    """Subscriptions indexed by the levels of their topic filter.
+
+    Finding the subscriptions matching a topic walks the levels of the topic
+    and the wildcards, instead of testing every subscription. Subscriptions
+    are added and removed in place.
+    """
+
+    def __init__(self, subscriptions: Iterable[Subscription] = ()) -> None:
+        """Initialize the subscription trie."""
+        self._root = _SubscriptionTrieNode()
+        self._subscriptions: dict[Subscription, None] = {}
+        self._next_order = 0
+        for subscription in subscriptions:
+            self.add(subscription)
+
+    def __contains__(self, subscription: object) -> bool:
+        """Return if the subscription was added."""
+        return subscription in self._subscriptions
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over the subscriptions in the order they were added."""
+        return iter(self._subscriptions)
+
+    def __len__(self) -> int:
+        """Return the number of subscriptions."""
+        return len(self._subscriptions)
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _SubscriptionTrieNode()
+            node = child
+        node.subscriptions[subscription] = self._next_order
+        self._next_order += 1
+        self._subscriptions[subscription] = None
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription."""
+        del self._subscriptions[subscription]
+        path: list[tuple[_SubscriptionTrieNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        del node.subscriptions[subscription]
+        # Prune the levels that are no longer used
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.children or child.subscriptions:
+                break
+            del parent.children[level]
+
+    def has_topic(self, topic: str) -> bool:
+        """Return if there are subscriptions on the topic filter."""
+        node = self._root
+        for level in topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def matching(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic, in the order they were added."""
+        levels = topic.split("/")
+        last = len(levels)
+        # Wildcards don't match topics starting with $ on the first level
+        wildcard_first = not topic.startswith("$")
+        matches: list[dict[Subscription, int]] = []
+        stack = [(self._root, 0)]
+        while stack:
+            node, index = stack.pop()
+            children = node.children
+            wildcards = index > 0 or wildcard_first
+            if index == last:
+                if node.subscriptions:
+                    matches.append(node.subscriptions)
+            else:
+                if (child := children.get(levels[index])) is not None:
+                    stack.append((child, index + 1))
+                if wildcards and (child := children.get("+")) is not None:
+                    stack.append((child, index + 1))
+            # The multi level wildcard also matches the parent level
+            if wildcards and (child := children.get("#")) is not None:
+                if child.subscriptions:
+                    matches.append(child.subscriptions)
+
+        if not matches:
+            return []
+        if len(matches) == 1:
+            return list(matches[0])
+        return [
+            subscription
+            for _, subscription in sorted(
+                (order, subscription)
+                for subscriptions in matches
+                for subscription, order in subscriptions.items()
+            )
+        ]
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -337,7 +458,7 @@ class MQTT:
         self.hass = hass
         self.config_entry = config_entry
         self.conf = conf
-        self.subscriptions: list[Subscription] = []
+        self.subscriptions = SubscriptionTrie()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -348,6 +469,22 @@ class MQTT:
         self._pending_operations: dict[int, asyncio.Event] = {}
         self._pending_operations_condition = asyncio.Condition()
 
+        # Messages received by the paho thread, waiting to be handled
+        self._inbound: deque[MQTTMessage] = deque()
+        self._inbound_lock = threading.Lock()
+        self._inbound_drain_scheduled = False
+        self._inbound_batch_size: int = conf.get(
+            CONF_INBOUND_BATCH_SIZE, DEFAULT_INBOUND_BATCH_SIZE
+        )
+        self._inbound_latency: float = conf.get(
+            CONF_INBOUND_LATENCY, DEFAULT_INBOUND_LATENCY
+        )
+        self._inbound_max_depth = 0
+        self._inbound_batches = 0
+        self._inbound_messages = 0
+        self._inbound_last_drain_time = 0.0
+        self._inbound_max_drain_time = 0.0
+
         if self.hass.state == CoreState.running:
             self._ha_started.set()
         else:
@@ -474,11 +611,8 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
-        self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
+        self.subscriptions.add(subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -491,7 +625,6 @@ class MQTT:
             if subscription not in self.subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
 
             # Only unsubscribe if currently connected
             if self.connected:
@@ -512,7 +645,7 @@ class MQTT:
             _raise_on_error(result)
             return mid
 
-        if any(other.topic == topic for other in self.subscriptions):
+        if self.subscriptions.has_topic(topic):
             # Other subscriptions on topic remaining - don't unsubscribe.
             return
 
@@ -613,16 +746,63 @@ class MQTT:
             )
 
     def _mqtt_on_message(self, _mqttc, _userdata, msg) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
 
-    @lru_cache(2048)
-    def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+        The messages are queued and handled in batches by the event loop, to
+        wake up the event loop once per batch instead of once per message.
+        """
+        with self._inbound_lock:
+            self._inbound.append(msg)
+            if self._inbound_drain_scheduled:
+                return
+            self._inbound_drain_scheduled = True
+        self.hass.loop.call_soon_threadsafe(self._async_schedule_inbound_drain)
+
+    @callback
+    def _async_schedule_inbound_drain(self) -> None:
+        """Schedule handling the queued messages after the latency."""
+        if self._inbound_latency:
+            self.hass.loop.call_later(self._inbound_latency, self._async_drain_inbound)
+        else:
+            self._async_drain_inbound()
+
+    @callback
+    def _async_drain_inbound(self) -> None:
+        """Handle a batch of queued messages."""
+        inbound = self._inbound
+        depth = len(inbound)
+        count = min(depth, self._inbound_batch_size)
+        start = time.monotonic()
+        try:
+            for _ in range(count):
+                self._mqtt_handle_message(inbound.popleft())
+        finally:
+            drain_time = time.monotonic() - start
+            self._inbound_max_depth = max(self._inbound_max_depth, depth)
+            self._inbound_batches += 1
+            self._inbound_messages += count
+            self._inbound_last_drain_time = drain_time
+            self._inbound_max_drain_time = max(self._inbound_max_drain_time, drain_time)
+            with self._inbound_lock:
+                if not (pending := bool(inbound)):
+                    self._inbound_drain_scheduled = False
+            if pending:
+                # Let other callbacks and tasks run before the next batch
+                self.hass.loop.call_soon(self._async_drain_inbound)
+
+    @callback
+    def async_inbound_diagnostics(self) -> dict[str, Any]:
+        """Return diagnostics of the received messages queue."""
+        return {
+            "depth": len(self._inbound),
+            "max_depth": self._inbound_max_depth,
+            "batch_size": self._inbound_batch_size,
+            "latency": self._inbound_latency,
+            "batches": self._inbound_batches,
+            "messages": self._inbound_messages,
+            "last_drain_time": self._inbound_last_drain_time,
+            "max_drain_time": self._inbound_max_drain_time,
+        }
 
     @callback
     def _mqtt_handle_message(self, msg: MQTTMessage) -> None:
@@ -634,7 +814,7 @@ class MQTT:
         )
         timestamp = dt_util.utcnow()
 
-        subscriptions = self._matching_subscriptions(msg.topic)
+        subscriptions = self.subscriptions.matching(msg.topic)
 
         for subscription in subscriptions:
 
@@ -744,13 +924,3 @@ def _raise_on_errors(result_codes: Iterable[int | None]) -> None:
 def _raise_on_error(result_code: int | None) -> None:
     """Raise error if error result."""
     _raise_on_errors((result_code,))
-
-
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
@@ -45,6 +45,8 @@ from .const import (
     CONF_CLIENT_CERT,
     CONF_CLIENT_KEY,
     CONF_DISCOVERY_PREFIX,
+    CONF_INBOUND_BATCH_SIZE,
+    CONF_INBOUND_LATENCY,
     CONF_KEEPALIVE,
     CONF_TLS_INSECURE,
     CONF_TLS_VERSION,
@@ -154,6 +156,14 @@ CONFIG_SCHEMA_BASE = PLATFORM_CONFIG_SCHEMA_BASE.extend(
         vol.Optional(CONF_KEEPALIVE, default=DEFAULT_KEEPALIVE): vol.All(
             vol.Coerce(int), vol.Range(min=15)
         ),
+        # Received messages are handled in batches of at most this size,
+        # after waiting the latency in seconds for more messages
+        vol.Optional(CONF_INBOUND_BATCH_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_INBOUND_LATENCY): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=1)
+        ),
         vol.Optional(CONF_BROKER): cv.string,
         vol.Optional(CONF_PORT): cv.port,
         vol.Optional(CONF_USERNAME): cv.string,
@@ -50,6 +50,7 @@ def _async_get_diagnostics(
     data = {
         "connected": is_connected(hass),
         "mqtt_config": redacted_config,
+        "inbound_queue": mqtt_instance.async_inbound_diagnostics(),
     }
 
     if device:
@@ -67,6 +67,7 @@ SUPPORTED_COMPONENTS = [
 ]
 
 ALREADY_DISCOVERED = "mqtt_discovered_components"
+DISCOVERED_PAYLOADS = "mqtt_discovered_payloads"
 PENDING_DISCOVERED = "mqtt_pending_components"
 DATA_CONFIG_FLOW_LOCK = "mqtt_discovery_config_flow_lock"
 DISCOVERY_UNSUBSCRIBE = "mqtt_discovery_unsubscribe"
@@ -87,6 +88,7 @@ class MQTTConfig(dict):
 def clear_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]) -> None:
     """Clear entry in ALREADY_DISCOVERED list."""
     del hass.data[ALREADY_DISCOVERED][discovery_hash]
+    hass.data[DISCOVERED_PAYLOADS].pop(discovery_hash, None)
 
 
 def set_discovery_hash(hass: HomeAssistant, discovery_hash: tuple[str, str]):
@@ -124,6 +126,27 @@ async def async_start(  # noqa: C901
             _LOGGER.warning("Integration %s is not supported", component)
             return
 
+        # If present, the node_id will be included in the discovered object id
+        discovery_id = " ".join((node_id, object_id)) if node_id else object_id
+        discovery_hash = (component, discovery_id)
+
+        # Skip parsing and validating a payload that was already applied,
+        # for example when the retained payloads are received on reconnect
+        discovered_payloads = hass.data[DISCOVERED_PAYLOADS]
+        raw_payload = payload
+        if (
+            payload
+            and discovered_payloads.get(discovery_hash) == raw_payload
+            and discovery_hash in hass.data[ALREADY_DISCOVERED]
+            and discovery_hash not in hass.data[PENDING_DISCOVERED]
+        ):
+            _LOGGER.debug(
+                "Ignoring unchanged discovery payload for %s %s",
+                component,
+                discovery_id,
+            )
+            return
+
         if payload:
             try:
                 payload = json_loads(payload)
@@ -163,11 +186,8 @@ async def async_start(  # noqa: C901
                         if topic[-1] == TOPIC_BASE:
                             availability_conf[CONF_TOPIC] = f"{topic[:-1]}{base}"
 
-        # If present, the node_id will be included in the discovered object id
-        discovery_id = " ".join((node_id, object_id)) if node_id else object_id
-        discovery_hash = (component, discovery_id)
-
         if payload:
+            discovered_payloads[discovery_hash] = raw_payload
             # Attach MQTT topic to the payload, used for debug prints
             setattr(payload, "__configuration_source__", f"MQTT (topic: '{topic}')")
             discovery_data = {
@@ -178,6 +198,8 @@ async def async_start(  # noqa: C901
             setattr(payload, "discovery_data", discovery_data)
 
             payload[CONF_PLATFORM] = "mqtt"
+        else:
+            discovered_payloads.pop(discovery_hash, None)
 
         if discovery_hash in hass.data[PENDING_DISCOVERED]:
             pending = hass.data[PENDING_DISCOVERED][discovery_hash]["pending"]
@@ -245,6 +267,7 @@ async def async_start(  # noqa: C901
 
     hass.data.setdefault(DATA_CONFIG_FLOW_LOCK, asyncio.Lock())
     hass.data[ALREADY_DISCOVERED] = {}
+    hass.data[DISCOVERED_PAYLOADS] = {}
     hass.data[PENDING_DISCOVERED] = {}
 
     discovery_topics = [
@@ -60,7 +60,7 @@ from homeassistant.helpers.json import json_loads
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from . import debug_info, subscription
-from .client import MQTT, Subscription, async_publish
+from .client import MQTT, SubscriptionTrie, async_publish
 from .const import (
     ATTR_DISCOVERY_HASH,
     ATTR_DISCOVERY_PAYLOAD,
@@ -289,7 +289,7 @@ class MqttData:
         default_factory=dict
     )
     reload_needed: bool = False
-    subscriptions_to_restore: list[Subscription] = field(default_factory=list)
+    subscriptions_to_restore: SubscriptionTrie | None = None
     updated_config: ConfigType = field(default_factory=dict)
 
 
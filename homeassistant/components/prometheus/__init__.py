@@ -5,6 +5,7 @@ import string
 
 from aiohttp import web
 import prometheus_client
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
 import voluptuous as vol
 
 from homeassistant import core as hacore
@@ -34,7 +35,7 @@ from homeassistant.const import (
     TEMP_CELSIUS,
     TEMP_FAHRENHEIT,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entityfilter, state as state_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
@@ -54,6 +55,7 @@ CONF_COMPONENT_CONFIG_GLOB = "component_config_glob"
 CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_DEFAULT_METRIC = "default_metric"
 CONF_OVERRIDE_METRIC = "override_metric"
+CONF_COLLECT_ON_SCRAPE = "collect_on_scrape"
 COMPONENT_CONFIG_SCHEMA_ENTRY = vol.Schema(
     {vol.Optional(CONF_OVERRIDE_METRIC): cv.string}
 )
@@ -77,6 +79,7 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Optional(CONF_COMPONENT_CONFIG_DOMAIN, default={}): vol.Schema(
                     {cv.string: COMPONENT_CONFIG_SCHEMA_ENTRY}
                 ),
+                vol.Optional(CONF_COLLECT_ON_SCRAPE, default=False): cv.boolean,
             }
         )
     },
@@ -100,7 +103,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         conf[CONF_COMPONENT_CONFIG_GLOB],
     )
 
-    metrics = PrometheusMetrics(
+    metrics_args = (
         prometheus_client,
         entity_filter,
         namespace,
@@ -109,6 +112,11 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         override_metric,
         default_metric,
     )
+    if conf[CONF_COLLECT_ON_SCRAPE]:
+        metrics = PrometheusCollector(hass, *metrics_args)
+        prometheus_client.REGISTRY.register(metrics)
+    else:
+        metrics = PrometheusMetrics(*metrics_args)
 
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed)
     hass.bus.listen(
@@ -598,6 +606,219 @@ class PrometheusMetrics:
         metric.labels(**self._labels(state)).set(self.state_as_number(state))
 
 
+class _ScrapedMetric:
+    """A metric of which the samples are collected during a scrape."""
+
+    def __init__(self, name, documentation, labelnames, family_type):
+        """Initialize the scraped metric."""
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.family_type = family_type
+        self.samples = {}
+
+    def labels(self, **labels):
+        """Return the sample with the given labels, like the client metrics."""
+        return _ScrapedSample(
+            self.samples, tuple(str(labels[name]) for name in self.labelnames)
+        )
+
+    def family(self):
+        """Return the metric family with the collected samples."""
+        family = self.family_type(self.name, self.documentation, labels=self.labelnames)
+        for labelvalues, value in self.samples.items():
+            family.add_metric(labelvalues, value)
+        return family
+
+
+class _ScrapedSample:
+    """A sample of a scraped metric."""
+
+    __slots__ = ("_samples", "_labelvalues")
+
+    def __init__(self, samples, labelvalues):
+        """Initialize the scraped sample."""
+        self._samples = samples
+        self._labelvalues = labelvalues
+
+    def set(self, value):
+        """Set the value of the sample."""
+        self._samples[self._labelvalues] = float(value)
+
+    def inc(self, amount=1):
+        """Increment the value of the sample."""
+        self._samples[self._labelvalues] = (
+            self._samples.get(self._labelvalues, 0.0) + amount
+        )
+
+
+class PrometheusCollector(PrometheusMetrics):
+    """Collect the metrics from the state machine when Prometheus scrapes.
+
+    The metrics are derived from the current states on every scrape, instead
+    of updating them on every state change. Only the counters are kept up to
+    date on state changes. The filter and the component config of an entity
+    are cached until its registry entry is updated.
+    """
+
+    def __init__(self, hass, *args):
+        """Initialize the Prometheus collector."""
+        super().__init__(*args)
+        self._hass = hass
+        self._domain_handlers = {}
+        self._included = {}
+        self._override_component_metrics = {}
+        # Entities removed from the registry, until they change state again
+        self._removed_entities = set()
+        # Counters by entity id and friendly name
+        self._state_changes = {}
+        self._automation_triggers = {}
+
+    def describe(self):
+        """Return no metrics so the registry doesn't collect on registration."""
+        return []
+
+    def _included_entity(self, entity_id):
+        """Return if the entity passes the filter."""
+        if (included := self._included.get(entity_id)) is None:
+            included = self._included[entity_id] = self._filter(entity_id)
+        return included
+
+    def _domain_handler(self, domain):
+        """Return the handler for the states of a domain."""
+        try:
+            return self._domain_handlers[domain]
+        except KeyError:
+            handler = self._domain_handlers[domain] = getattr(
+                self, f"_handle_{domain}", None
+            )
+            return handler
+
+    @callback
+    def handle_state_changed(self, event):
+        """Count the state changes, the states are collected on scrape."""
+        if (state := event.data.get("new_state")) is None:
+            return
+
+        entity_id = state.entity_id
+        if not self._included_entity(entity_id):
+            return
+        self._removed_entities.discard(entity_id)
+
+        friendly_name = state.attributes.get(ATTR_FRIENDLY_NAME)
+        if (old_state := event.data.get("old_state")) is not None and (
+            old_friendly_name := old_state.attributes.get(ATTR_FRIENDLY_NAME)
+        ) != friendly_name:
+            self._state_changes.pop((entity_id, old_friendly_name), None)
+            self._automation_triggers.pop((entity_id, old_friendly_name), None)
+
+        key = (entity_id, friendly_name)
+        self._state_changes[key] = self._state_changes.get(key, 0) + 1
+        if state.domain == "automation" and state.state not in (
+            STATE_UNAVAILABLE,
+            STATE_UNKNOWN,
+        ):
+            self._automation_triggers[key] = self._automation_triggers.get(key, 0) + 1
+
+    def _remove_labelsets(self, entity_id, friendly_name=None):
+        """Forget the entity until it changes state again."""
+        self._included.pop(entity_id, None)
+        self._override_component_metrics.pop(entity_id, None)
+        self._removed_entities.add(entity_id)
+        for counts in (self._state_changes, self._automation_triggers):
+            for key in [key for key in counts if key[0] == entity_id]:
+                del counts[key]
+
+    def _metric(self, metric, factory, documentation, extra_labels=None):
+        try:
+            return self._metrics[metric]
+        except KeyError:
+            labels = ["entity", "friendly_name", "domain"]
+            if extra_labels is not None:
+                labels.extend(extra_labels)
+            family_type = (
+                CounterMetricFamily
+                if factory is self.prometheus_cli.Counter
+                else GaugeMetricFamily
+            )
+            self._metrics[metric] = _ScrapedMetric(
+                self._sanitize_metric_name(f"{self.metrics_prefix}{metric}"),
+                documentation,
+                labels,
+                family_type,
+            )
+            return self._metrics[metric]
+
+    def _sensor_override_component_metric(self, state, unit):
+        """Get metric from override in component configuration."""
+        try:
+            return self._override_component_metrics[state.entity_id]
+        except KeyError:
+            metric = self._override_component_metrics[
+                state.entity_id
+            ] = super()._sensor_override_component_metric(state, unit)
+            return metric
+
+    def _handle_automation(self, state):
+        """Handle automations with the counters, not the current state."""
+
+    def collect(self):
+        """Collect the metrics of the current states."""
+        self._metrics = {}
+        ignored_states = (STATE_UNAVAILABLE, STATE_UNKNOWN)
+        entity_available = self._metric(
+            "entity_available",
+            self.prometheus_cli.Gauge,
+            "Entity is available (not in the unavailable or unknown state)",
+        )
+        last_updated_time_seconds = self._metric(
+            "last_updated_time_seconds",
+            self.prometheus_cli.Gauge,
+            "The last_updated timestamp",
+        )
+
+        for state in self._hass.states.async_all():
+            entity_id = state.entity_id
+            if (
+                not self._included_entity(entity_id)
+                or entity_id in self._removed_entities
+            ):
+                continue
+            handler = self._domain_handler(state.domain)
+            if handler is not None and state.state not in ignored_states:
+                handler(state)
+            labels = self._labels(state)
+            entity_available.labels(**labels).set(
+                float(state.state not in ignored_states)
+            )
+            last_updated_time_seconds.labels(**labels).set(
+                state.last_updated.timestamp()
+            )
+
+        for metric, documentation, counts in (
+            ("state_change", "The number of state changes", self._state_changes),
+            (
+                "automation_triggered_count",
+                "Count of times an automation has been triggered",
+                self._automation_triggers,
+            ),
+        ):
+            if not counts:
+                continue
+            counter = self._metric(metric, self.prometheus_cli.Counter, documentation)
+            for (entity_id, friendly_name), count in counts.items():
+                counter.labels(
+                    entity=entity_id,
+                    friendly_name=friendly_name,
+                    domain=hacore.split_entity_id(entity_id)[0],
+                ).inc(count)
+
+        metrics = self._metrics
+        self._metrics = {}
+        for metric in metrics.values():
+            yield metric.family()
+
+
 class PrometheusView(HomeAssistantView):
     """Handle Prometheus requests."""
 
@@ -0,0 +1,125 @@
+"""Batched inserts of the events and states written by the recorder."""
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
+from .db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from .queries import (
+    find_entity_ids_inserted_after,
+    find_max_state_id,
+    find_metadata_ids_inserted_after,
+)
+
+
+class PendingEvent:
+    """An events row waiting to be inserted on the next commit."""
+
+    __slots__ = ("row", "event_data", "event_type")
+
+    def __init__(self, row: dict[str, Any]) -> None:
+        """Initialize the pending event."""
+        self.row = row
+        # Set when the event data or event type is added in the same
+        # commit since the id is not known until the session is flushed
+        self.event_data: EventData | None = None
+        self.event_type: EventTypes | None = None
+
+
+class PendingState:
+    """A states row waiting to be inserted on the next commit."""
+
+    __slots__ = (
+        "row",
+        "state_attributes",
+        "states_meta",
+        "old_state",
+        "removed",
+        "generation",
+        "state_id",
+    )
+
+    def __init__(
+        self, row: dict[str, Any], previous: PendingState | None, removed: bool
+    ) -> None:
+        """Initialize the pending state."""
+        self.row = row
+        # Set when the attributes or states meta is added in the same
+        # commit since the id is not known until the session is flushed
+        self.state_attributes: StateAttributes | None = None
+        self.states_meta: StatesMeta | None = None
+        # The previous state of the entity when it is in the same commit,
+        # a removed state is not the old state of the next one
+        self.old_state = previous if previous and not previous.removed else None
+        self.removed = removed
+        if removed:
+            row["state"] = None
+        # A state is inserted one generation after the previous state of
+        # the entity so the old_state_id is known when it is inserted and
+        # an entity has at most one state per generation
+        self.generation = previous.generation + 1 if previous else 0
+        self.state_id: int | None = None
+
+
+def insert_pending_events(session: Session, pending_events: list[PendingEvent]) -> None:
+    """Insert the pending events with a single executemany."""
+    rows: list[dict[str, Any]] = []
+    for pending in pending_events:
+        row = pending.row
+        if pending.event_data:
+            row["data_id"] = pending.event_data.data_id
+        if pending.event_type:
+            row["event_type_id"] = pending.event_type.event_type_id
+        rows.append(row)
+    session.execute(insert(Events), rows)
+
+
+def insert_pending_states(
+    session: Session, pending_states: list[PendingState], normalized_ids: bool
+) -> None:
+    """Insert the pending states and set their state_id.
+
+    Each generation is inserted with a single executemany. Since
+    executemany can not return the new ids on all databases they are
+    read back by the state_id range, which only the recorder writes to.
+    An entity has at most one state per generation so the entity
+    identifies the row.
+    """
+    generations: list[list[PendingState]] = []
+    for pending in pending_states:
+        if pending.generation == len(generations):
+            generations.append([])
+        generations[pending.generation].append(pending)
+
+    key = "metadata_id" if normalized_ids else "entity_id"
+    max_state_id: int = session.execute(find_max_state_id()).scalar() or 0
+    for generation in generations:
+        rows: list[dict[str, Any]] = []
+        for pending in generation:
+            row = pending.row
+            if pending.state_attributes:
+                row["attributes_id"] = pending.state_attributes.attributes_id
+            if pending.states_meta:
+                row["metadata_id"] = pending.states_meta.metadata_id
+            if pending.old_state:
+                row["old_state_id"] = pending.old_state.state_id
+            rows.append(row)
+        session.execute(insert(States), rows)
+        stmt = (
+            find_metadata_ids_inserted_after(max_state_id)
+            if normalized_ids
+            else find_entity_ids_inserted_after(max_state_id)
+        )
+        state_ids: dict[Any, int] = dict(session.execute(stmt).all())
+        for pending in generation:
+            pending.state_id = state_ids[pending.row[key]]
+        max_state_id = max(state_ids.values())
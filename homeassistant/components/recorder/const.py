@@ -11,6 +11,9 @@ SQLITE_URL_PREFIX = "sqlite://"
 MYSQLDB_URL_PREFIX = "mysql://"
 DOMAIN = "recorder"
 
+EVENT_RECORDER_HOURLY_STATISTICS_GENERATED = "recorder_hourly_statistics_generated"
+EVENT_RECORDER_STATISTICS_UPDATED = "recorder_statistics_updated"
+
 CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 
 MAX_QUEUE_BACKLOG = 40000
@@ -23,6 +26,12 @@ MAX_QUEUE_BACKLOG = 40000
 # have upgraded their sqlite version
 MAX_ROWS_TO_PURGE = 998
 
+# The maximum number of rows we migrate to the normalized ids in one batch
+MAX_ROWS_TO_MIGRATE = MAX_ROWS_TO_PURGE
+
+# The schema version that added the event_types and states_meta tables
+NORMALIZED_IDS_SCHEMA_VERSION = 31
+
 DB_WORKER_PREFIX = "DbWorker"
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
@@ -25,6 +25,7 @@ from sqlalchemy.orm.session import Session
 from homeassistant.components import persistent_notification
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    EVENT_CORE_CONFIG_UPDATE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
@@ -42,12 +43,19 @@ from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
 
 from . import migration, statistics
+from .bulk_insert import (
+    PendingEvent,
+    PendingState,
+    insert_pending_events,
+    insert_pending_states,
+)
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
     KEEPALIVE_TIME,
     MAX_QUEUE_BACKLOG,
     MYSQLDB_URL_PREFIX,
+    NORMALIZED_IDS_SCHEMA_VERSION,
     SQLITE_URL_PREFIX,
     SupportedDialect,
 )
@@ -56,11 +64,19 @@ from .db_schema import (
     Base,
     EventData,
     Events,
+    EventTypes,
     StateAttributes,
     States,
+    StatesMeta,
     StatisticsRuns,
 )
 from .executor import DBInterruptibleThreadPoolExecutor
+from .id_cache import (
+    HashBloomFilter,
+    IDCacheStats,
+    load_hash_bloom_filter,
+    seed_id_cache,
+)
 from .models import (
     StatisticData,
     StatisticMetaData,
@@ -68,7 +84,20 @@ from .models import (
     process_timestamp,
 )
 from .pool import POOL_SIZE, MutexPool, RecorderPool
-from .queries import find_shared_attributes_id, find_shared_data_id
+from .queries import (
+    find_event_data_hashes,
+    find_event_type_id,
+    find_max_attributes_id,
+    find_max_data_id,
+    find_recent_attributes_ids,
+    find_recent_data_ids,
+    find_shared_attributes_by_ids,
+    find_shared_attributes_id,
+    find_shared_data_by_ids,
+    find_shared_data_id,
+    find_state_attributes_hashes,
+    find_states_metadata_id,
+)
 from .run_history import RunHistory
 from .tasks import (
     AdjustStatisticsTask,
@@ -78,6 +107,9 @@ from .tasks import (
     EventTask,
     ImportStatisticsTask,
     KeepAliveTask,
+    LegacyIDColumnsCleanupTask,
+    NormalizedIDsMigrationTask,
+    PeriodStatisticsBackfillTask,
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
@@ -86,6 +118,7 @@ from .tasks import (
     SynchronizeTask,
     UpdateStatisticsMetadataTask,
     WaitTask,
+    WarmUpIDCachesTask,
 )
 from .util import (
     build_mysqldb_conv,
@@ -105,18 +138,16 @@ T = TypeVar("T")
 
 DEFAULT_URL = "sqlite:///{hass_config_path}"
 
-# Controls how often we clean up
-# States and Events objects
+# Controls how often we clean up the
+# objects kept in the event session
 EXPIRE_AFTER_COMMITS = 120
 
-# The number of attribute ids to cache in memory
-#
-# Based on:
-# - The number of overlapping attributes
-# - How frequently states with overlapping attributes will change
-# - How much memory our low end hardware has
-STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
-EVENT_DATA_ID_CACHE_SIZE = 2048
+# The number of recent states or events scanned per cached
+# id when warming up the attribute and event data id caches
+WARM_UP_ROWS_PER_CACHED_ID = 8
+
+EVENT_TYPE_ID_CACHE_SIZE = 2048
+STATES_META_ID_CACHE_SIZE = 8192
 
 SHUTDOWN_TASK = object()
 
@@ -153,6 +184,7 @@ class Recorder(threading.Thread):
         entity_filter: Callable[[str], bool],
         exclude_t: list[str],
         exclude_attributes_by_domain: dict[str, set[str]],
+        attributes_cache_size: int,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -184,12 +216,34 @@ class Recorder(threading.Thread):
 
         self.schema_version = 0
         self._commits_without_expire = 0
-        self._old_states: dict[str, States] = {}
-        self._state_attributes_ids: LRU = LRU(STATE_ATTRIBUTES_ID_CACHE_SIZE)
-        self._event_data_ids: LRU = LRU(EVENT_DATA_ID_CACHE_SIZE)
+        self._old_states: dict[str, int] = {}
+        self.attributes_cache_size = attributes_cache_size
+        self._state_attributes_ids: LRU = LRU(attributes_cache_size)
+        self._event_data_ids: LRU = LRU(attributes_cache_size)
+        self.state_attributes_cache_stats = IDCacheStats()
+        self.event_data_cache_stats = IDCacheStats()
+        # Set once the caches are warmed up, a hash that is not
+        # in the filter is not in the database
+        self._state_attributes_hashes: HashBloomFilter | None = None
+        self._event_data_hashes: HashBloomFilter | None = None
+        self._event_type_ids: LRU = LRU(EVENT_TYPE_ID_CACHE_SIZE)
+        self._states_meta_ids: LRU = LRU(STATES_META_ID_CACHE_SIZE)
         self._pending_state_attributes: dict[str, StateAttributes] = {}
         self._pending_event_data: dict[str, EventData] = {}
-        self._pending_expunge: list[States] = []
+        self._pending_event_types: dict[str, EventTypes] = {}
+        self._pending_states_meta: dict[str, StatesMeta] = {}
+        # Events and states are written with executemany on commit
+        # instead of being added to the session one by one
+        self._pending_events: list[PendingEvent] = []
+        self._pending_states: list[PendingState] = []
+        self._pending_old_states: dict[str, PendingState] = {}
+        # Once all rows have been migrated to the normalized ids the
+        # legacy entity_id, event_type and context columns are no
+        # longer written or read
+        self.normalized_ids_active = False
+        # The daily and monthly statistics are only read once they
+        # have been backfilled for the configured time zone
+        self.period_statistics_active = False
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
@@ -206,6 +260,7 @@ class Recorder(threading.Thread):
         self._commit_listener: CALLBACK_TYPE | None = None
         self._periodic_listener: CALLBACK_TYPE | None = None
         self._nightly_listener: CALLBACK_TYPE | None = None
+        self._core_config_listener: CALLBACK_TYPE | None = None
         self.enabled = True
 
     @property
@@ -347,6 +402,9 @@ class Recorder(threading.Thread):
         if self._periodic_listener:
             self._periodic_listener()
             self._periodic_listener = None
+        if self._core_config_listener:
+            self._core_config_listener()
+            self._core_config_listener = None
 
     @callback
     def _async_event_filter(self, event: Event) -> bool:
@@ -478,6 +536,14 @@ class Recorder(threading.Thread):
         start = statistics.get_start_time()
         self.queue_task(StatisticsTask(start))
 
+    @callback
+    def _async_core_config_updated(self, event: Event) -> None:
+        """Compile the daily and monthly statistics again if the time zone changed."""
+        if "time_zone" not in event.data:
+            return
+        self.period_statistics_active = False
+        self.queue_task(PeriodStatisticsBackfillTask())
+
     @callback
     def async_adjust_statistics(
         self, statistic_id: str, start_time: datetime, sum_adjustment: float
@@ -542,6 +608,11 @@ class Recorder(threading.Thread):
             self.hass, self.async_periodic_statistics, minute=range(0, 60, 5), second=10
         )
 
+        # Days and months start at midnight in the configured time zone
+        self._core_config_listener = self.hass.bus.async_listen(
+            EVENT_CORE_CONFIG_UPDATE, self._async_core_config_updated
+        )
+
     async def _async_wait_for_started(self) -> object | None:
         """Wait for the hass started future."""
         return await self._hass_started
@@ -619,6 +690,10 @@ class Recorder(threading.Thread):
         # Catch up with missed statistics
         with session_scope(session=self.get_session()) as session:
             self._schedule_compile_missing_statistics(session)
+            self.queue_task(PeriodStatisticsBackfillTask())
+            if self.schema_version >= NORMALIZED_IDS_SCHEMA_VERSION:
+                self._activate_normalized_ids_or_schedule_migration(session)
+        self.queue_task(WarmUpIDCachesTask())
 
         _LOGGER.debug("Recorder processing the queue")
         self.hass.add_job(self._async_set_recorder_ready_migration_done)
@@ -760,6 +835,12 @@ class Recorder(threading.Thread):
         # or going to be written in the next commit so there is no
         # need to flush before checking the database.
         #
+        if (
+            self._state_attributes_hashes is not None
+            and attr_hash not in self._state_attributes_hashes
+        ):
+            self.state_attributes_cache_stats.skipped_db_lookups += 1
+            return None
         assert self.event_session is not None
         with self.event_session.no_autoflush:
             if attributes_id := self.event_session.execute(
@@ -778,6 +859,12 @@ class Recorder(threading.Thread):
         # or going to be written in the next commit so there is no
         # need to flush before checking the database.
         #
+        if (
+            self._event_data_hashes is not None
+            and data_hash not in self._event_data_hashes
+        ):
+            self.event_data_cache_stats.skipped_db_lookups += 1
+            return None
         assert self.event_session is not None
         with self.event_session.no_autoflush:
             if data_id := self.event_session.execute(
@@ -786,12 +873,123 @@ class Recorder(threading.Thread):
                 return cast(int, data_id[0])
         return None
 
+    def _warm_up_id_caches(self) -> None:
+        """Warm up the attribute and event data id caches.
+
+        The caches start empty after a restart so nearly every write
+        would need a lookup in the database until they fill up again.
+        They are seeded with the ids most recently referenced by states
+        and events, and the hashes already in the database are loaded
+        into bloom filters so the lookup can be skipped for new ones.
+        """
+        limit = self.attributes_cache_size * WARM_UP_ROWS_PER_CACHED_ID
+        with session_scope(session=self.get_session()) as session:
+            seed_id_cache(
+                session,
+                self._state_attributes_ids,
+                self.attributes_cache_size,
+                session.execute(find_recent_attributes_ids(limit)).scalars(),
+                find_shared_attributes_by_ids,
+            )
+            seed_id_cache(
+                session,
+                self._event_data_ids,
+                self.attributes_cache_size,
+                session.execute(find_recent_data_ids(limit)).scalars(),
+                find_shared_data_by_ids,
+            )
+            self._state_attributes_hashes = load_hash_bloom_filter(
+                session, find_max_attributes_id(), find_state_attributes_hashes()
+            )
+            self._event_data_hashes = load_hash_bloom_filter(
+                session, find_max_data_id(), find_event_data_hashes()
+            )
+        _LOGGER.debug(
+            "Warmed up the id caches with %s attributes and %s event data",
+            len(self._state_attributes_ids),
+            len(self._event_data_ids),
+        )
+
+    def _find_event_type_in_db(self, event_type: str) -> int | None:
+        """Find the event_type_id of an event_type in the db."""
+        assert self.event_session is not None
+        with self.event_session.no_autoflush:
+            if event_type_id := self.event_session.execute(
+                find_event_type_id(event_type)
+            ).first():
+                return cast(int, event_type_id[0])
+        return None
+
+    def _find_states_meta_in_db(self, entity_id: str) -> int | None:
+        """Find the metadata_id of an entity_id in the db."""
+        assert self.event_session is not None
+        with self.event_session.no_autoflush:
+            if metadata_id := self.event_session.execute(
+                find_states_metadata_id(entity_id)
+            ).first():
+                return cast(int, metadata_id[0])
+        return None
+
+    def _set_event_type_id(self, pending_event: PendingEvent, event_type: str) -> None:
+        """Set the event_type_id or pending event type of a pending event."""
+        assert self.event_session is not None
+        # Matching event type found in the pending commit
+        if pending_event_type := self._pending_event_types.get(event_type):
+            pending_event.event_type = pending_event_type
+        # Matching event_type_id found in the cache
+        elif event_type_id := self._event_type_ids.get(event_type):
+            pending_event.row["event_type_id"] = event_type_id
+        # Matching event_type_id found in the database
+        elif event_type_id := self._find_event_type_in_db(event_type):
+            self._event_type_ids[event_type] = pending_event.row[
+                "event_type_id"
+            ] = event_type_id
+        # No matching event type found, save it in the DB
+        else:
+            dbevent_type = EventTypes(event_type=event_type)
+            pending_event.event_type = self._pending_event_types[
+                event_type
+            ] = dbevent_type
+            self.event_session.add(dbevent_type)
+
+    def _set_states_metadata_id(
+        self, pending_state: PendingState, entity_id: str
+    ) -> None:
+        """Set the metadata_id or pending states meta of a pending state."""
+        assert self.event_session is not None
+        # Matching states meta found in the pending commit
+        if pending_states_meta := self._pending_states_meta.get(entity_id):
+            pending_state.states_meta = pending_states_meta
+        # Matching metadata_id found in the cache
+        elif metadata_id := self._states_meta_ids.get(entity_id):
+            pending_state.row["metadata_id"] = metadata_id
+        # Matching metadata_id found in the database
+        elif metadata_id := self._find_states_meta_in_db(entity_id):
+            self._states_meta_ids[entity_id] = pending_state.row[
+                "metadata_id"
+            ] = metadata_id
+        # No matching states meta found, save it in the DB
+        else:
+            dbstates_meta = StatesMeta(entity_id=entity_id)
+            pending_state.states_meta = self._pending_states_meta[
+                entity_id
+            ] = dbstates_meta
+            self.event_session.add(dbstates_meta)
+
     def _process_non_state_changed_event_into_session(self, event: Event) -> None:
         """Process any event into the session except state changed."""
         assert self.event_session is not None
-        dbevent = Events.from_event(event)
+        pending_event = PendingEvent(Events.row_from_event(event))
+        if self.schema_version >= NORMALIZED_IDS_SCHEMA_VERSION:
+            self._set_event_type_id(pending_event, event.event_type)
+        if self.normalized_ids_active:
+            row = pending_event.row
+            row["event_type"] = None
+            row["context_id"] = None
+            row["context_user_id"] = None
+            row["context_parent_id"] = None
         if not event.data:
-            self.event_session.add(dbevent)
+            self._pending_events.append(pending_event)
             return
 
         try:
@@ -801,32 +999,38 @@ class Recorder(threading.Thread):
             return
 
         shared_data = shared_data_bytes.decode("utf-8")
+        stats = self.event_data_cache_stats
         # Matching attributes found in the pending commit
         if pending_event_data := self._pending_event_data.get(shared_data):
-            dbevent.event_data_rel = pending_event_data
+            stats.hits += 1
+            pending_event.event_data = pending_event_data
         # Matching attributes id found in the cache
         elif data_id := self._event_data_ids.get(shared_data):
-            dbevent.data_id = data_id
+            stats.hits += 1
+            pending_event.row["data_id"] = data_id
         else:
+            stats.misses += 1
             data_hash = EventData.hash_shared_data_bytes(shared_data_bytes)
             # Matching attributes found in the database
             if data_id := self._find_shared_data_in_db(data_hash, shared_data):
-                self._event_data_ids[shared_data] = dbevent.data_id = data_id
+                self._event_data_ids[shared_data] = pending_event.row[
+                    "data_id"
+                ] = data_id
             # No matching attributes found, save them in the DB
             else:
                 dbevent_data = EventData(shared_data=shared_data, hash=data_hash)
-                dbevent.event_data_rel = self._pending_event_data[
+                pending_event.event_data = self._pending_event_data[
                     shared_data
                 ] = dbevent_data
                 self.event_session.add(dbevent_data)
 
-        self.event_session.add(dbevent)
+        self._pending_events.append(pending_event)
 
     def _process_state_changed_event_into_session(self, event: Event) -> None:
         """Process a state_changed event into the session."""
         assert self.event_session is not None
         try:
-            dbstate = States.from_event(event)
+            row = States.row_from_event(event)
             shared_attrs_bytes = StateAttributes.shared_attrs_bytes_from_event(
                 event, self._exclude_attributes_by_domain
             )
@@ -838,40 +1042,54 @@ class Recorder(threading.Thread):
             )
             return
 
+        entity_id: str = event.data["entity_id"]
+        # The old state is either waiting in the pending commit
+        # or was written by a previous commit
+        pending_state = PendingState(
+            row,
+            self._pending_old_states.get(entity_id),
+            not event.data.get("new_state"),
+        )
+        if old_state_id := self._old_states.pop(entity_id, None):
+            row["old_state_id"] = old_state_id
+        if self.schema_version >= NORMALIZED_IDS_SCHEMA_VERSION:
+            self._set_states_metadata_id(pending_state, entity_id)
+        if self.normalized_ids_active:
+            row["entity_id"] = None
+            row["context_id"] = None
+            row["context_user_id"] = None
+            row["context_parent_id"] = None
+
         shared_attrs = shared_attrs_bytes.decode("utf-8")
-        dbstate.attributes = None
+        stats = self.state_attributes_cache_stats
         # Matching attributes found in the pending commit
         if pending_attributes := self._pending_state_attributes.get(shared_attrs):
-            dbstate.state_attributes = pending_attributes
+            stats.hits += 1
+            pending_state.state_attributes = pending_attributes
         # Matching attributes id found in the cache
         elif attributes_id := self._state_attributes_ids.get(shared_attrs):
-            dbstate.attributes_id = attributes_id
+            stats.hits += 1
+            row["attributes_id"] = attributes_id
         else:
+            stats.misses += 1
             attr_hash = StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes)
             # Matching attributes found in the database
             if attributes_id := self._find_shared_attr_in_db(attr_hash, shared_attrs):
-                dbstate.attributes_id = attributes_id
+                row["attributes_id"] = attributes_id
                 self._state_attributes_ids[shared_attrs] = attributes_id
             # No matching attributes found, save them in the DB
             else:
                 dbstate_attributes = StateAttributes(
                     shared_attrs=shared_attrs, hash=attr_hash
                 )
-                dbstate.state_attributes = dbstate_attributes
+                pending_state.state_attributes = dbstate_attributes
                 self._pending_state_attributes[shared_attrs] = dbstate_attributes
                 self.event_session.add(dbstate_attributes)
 
-        if old_state := self._old_states.pop(dbstate.entity_id, None):
-            if old_state.state_id:
-                dbstate.old_state_id = old_state.state_id
-            else:
-                dbstate.old_state = old_state
-        if event.data.get("new_state"):
-            self._old_states[dbstate.entity_id] = dbstate
-            self._pending_expunge.append(dbstate)
-        else:
-            dbstate.state = None
-        self.event_session.add(dbstate)
+        # Removed states are kept as well so the next state
+        # of the entity goes in the following generation
+        self._pending_old_states[entity_id] = pending_state
+        self._pending_states.append(pending_state)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -885,7 +1103,13 @@ class Recorder(threading.Thread):
 
     def _event_session_has_pending_writes(self) -> bool:
         return bool(
-            self.event_session and (self.event_session.new or self.event_session.dirty)
+            self.event_session
+            and (
+                self._pending_events
+                or self._pending_states
+                or self.event_session.new
+                or self.event_session.dirty
+            )
         )
 
     def _commit_event_session_or_retry(self) -> None:
@@ -914,14 +1138,28 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         self._commits_without_expire += 1
 
+        if self._pending_events or self._pending_states:
+            # Flush the new event data, event types, state attributes
+            # and states meta first so their ids are known when the
+            # events and states are inserted
+            self.event_session.flush()
+            if self._pending_events:
+                insert_pending_events(self.event_session, self._pending_events)
+            if self._pending_states:
+                insert_pending_states(
+                    self.event_session,
+                    self._pending_states,
+                    self.normalized_ids_active,
+                )
         self.event_session.commit()
-        if self._pending_expunge:
-            for dbstate in self._pending_expunge:
-                # Expunge the state so its not expired
-                # until we use it later for dbstate.old_state
-                if dbstate in self.event_session:
-                    self.event_session.expunge(dbstate)
-            self._pending_expunge = []
+        self._pending_events = []
+        self._pending_states = []
+        # The states are now in the database and the
+        # state_id can be used as the old_state_id
+        for entity_id, pending_state in self._pending_old_states.items():
+            if not pending_state.removed:
+                self._old_states[entity_id] = cast(int, pending_state.state_id)
+        self._pending_old_states = {}
 
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
@@ -931,10 +1169,20 @@ class Recorder(threading.Thread):
             self._state_attributes_ids[
                 state_attr.shared_attrs
             ] = state_attr.attributes_id
+            if self._state_attributes_hashes is not None:
+                self._state_attributes_hashes.add(state_attr.hash)
         self._pending_state_attributes = {}
         for event_data in self._pending_event_data.values():
             self._event_data_ids[event_data.shared_data] = event_data.data_id
+            if self._event_data_hashes is not None:
+                self._event_data_hashes.add(event_data.hash)
         self._pending_event_data = {}
+        for event_type in self._pending_event_types.values():
+            self._event_type_ids[event_type.event_type] = event_type.event_type_id
+        self._pending_event_types = {}
+        for states_meta in self._pending_states_meta.values():
+            self._states_meta_ids[states_meta.entity_id] = states_meta.metadata_id
+        self._pending_states_meta = {}
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -955,10 +1203,17 @@ class Recorder(threading.Thread):
     def _close_event_session(self) -> None:
         """Close the event session."""
         self._old_states = {}
-        self._state_attributes_ids = {}
-        self._event_data_ids = {}
+        self._state_attributes_ids.clear()
+        self._event_data_ids.clear()
+        self._event_type_ids = {}
+        self._states_meta_ids = {}
         self._pending_state_attributes = {}
         self._pending_event_data = {}
+        self._pending_event_types = {}
+        self._pending_states_meta = {}
+        self._pending_events = []
+        self._pending_states = []
+        self._pending_old_states = {}
 
         if not self.event_session:
             return
@@ -1146,6 +1401,19 @@ class Recorder(threading.Thread):
             self.queue_task(StatisticsTask(start))
             start = end
 
+    def _activate_normalized_ids_or_schedule_migration(self, session: Session) -> None:
+        """Use the normalized ids if all rows have them or schedule the migration.
+
+        A migration that was interrupted while clearing the legacy columns
+        is resumed, the legacy indexes are only dropped once it is done.
+        """
+        if migration.normalized_ids_need_migration(session):
+            self.queue_task(NormalizedIDsMigrationTask())
+            return
+        self.normalized_ids_active = True
+        if migration.legacy_id_indexes_exist(session):
+            self.queue_task(LegacyIDColumnsCleanupTask())
+
     def _end_session(self) -> None:
         """End the recorder session."""
         if self.event_session is None:
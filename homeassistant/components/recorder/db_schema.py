@@ -19,16 +19,20 @@ from sqlalchemy import (
     Identity,
     Index,
     Integer,
+    LargeBinary,
     SmallInteger,
     String,
     Text,
-    distinct,
+    TypeDecorator,
+    func,
     type_coerce,
 )
 from sqlalchemy.dialects import mysql, oracle, postgresql, sqlite
+from sqlalchemy.engine import Dialect
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import aliased, declarative_base, relationship
 from sqlalchemy.orm.session import Session
+from sqlalchemy.types import TypeEngine
 
 from homeassistant.const import (
     MAX_LENGTH_EVENT_CONTEXT_ID,
@@ -47,13 +51,21 @@ from homeassistant.helpers.json import (
 import homeassistant.util.dt as dt_util
 
 from .const import ALL_DOMAIN_EXCLUDE_ATTRS
-from .models import StatisticData, StatisticMetaData, process_timestamp
+from .models import (
+    StatisticData,
+    StatisticMetaData,
+    bytes_to_context_id,
+    bytes_to_user_id,
+    context_id_to_bytes,
+    process_timestamp,
+    user_id_to_bytes,
+)
 
 # SQLAlchemy Schema
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 30
+SCHEMA_VERSION = 32
 
 _StatisticsBaseSelfT = TypeVar("_StatisticsBaseSelfT", bound="StatisticsBase")
 
@@ -61,26 +73,34 @@ _LOGGER = logging.getLogger(__name__)
 
 TABLE_EVENTS = "events"
 TABLE_EVENT_DATA = "event_data"
+TABLE_EVENT_TYPES = "event_types"
 TABLE_STATES = "states"
 TABLE_STATE_ATTRIBUTES = "state_attributes"
+TABLE_STATES_META = "states_meta"
 TABLE_RECORDER_RUNS = "recorder_runs"
 TABLE_SCHEMA_CHANGES = "schema_changes"
 TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_DAILY = "statistics_daily"
+TABLE_STATISTICS_MONTHLY = "statistics_monthly"
 
 ALL_TABLES = [
     TABLE_STATES,
     TABLE_STATE_ATTRIBUTES,
+    TABLE_STATES_META,
     TABLE_EVENTS,
     TABLE_EVENT_DATA,
+    TABLE_EVENT_TYPES,
     TABLE_RECORDER_RUNS,
     TABLE_SCHEMA_CHANGES,
     TABLE_STATISTICS,
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_DAILY,
+    TABLE_STATISTICS_MONTHLY,
 ]
 
 TABLES_TO_CHECK = [
@@ -91,9 +111,25 @@ TABLES_TO_CHECK = [
 ]
 
 LAST_UPDATED_INDEX = "ix_states_last_updated"
+METADATA_ID_LAST_UPDATED_INDEX = "ix_states_metadata_id_last_updated"
+EVENT_TYPE_ID_TIME_FIRED_INDEX = "ix_events_event_type_id_time_fired"
+EVENTS_CONTEXT_ID_BIN_INDEX = "ix_events_context_id_bin"
+STATES_CONTEXT_ID_BIN_INDEX = "ix_states_context_id_bin"
+
+# The indexes on the legacy columns are no longer part of the schema,
+# databases created before schema 31 keep them until the normalized ids
+# migration is complete
 ENTITY_ID_LAST_UPDATED_INDEX = "ix_states_entity_id_last_updated"
+EVENT_TYPE_TIME_FIRED_INDEX = "ix_events_event_type_time_fired"
 EVENTS_CONTEXT_ID_INDEX = "ix_events_context_id"
 STATES_CONTEXT_ID_INDEX = "ix_states_context_id"
+LEGACY_ID_INDEXES = {
+    TABLE_EVENTS: (EVENT_TYPE_TIME_FIRED_INDEX, EVENTS_CONTEXT_ID_INDEX),
+    TABLE_STATES: (ENTITY_ID_LAST_UPDATED_INDEX, STATES_CONTEXT_ID_INDEX),
+}
+
+# The legacy context id columns hold up to 36 utf8mb4 characters
+CONTEXT_ID_BIN_MAX_LENGTH = MAX_LENGTH_EVENT_CONTEXT_ID * 4
 
 
 class FAST_PYSQLITE_DATETIME(sqlite.DATETIME):  # type: ignore[misc]
@@ -123,6 +159,41 @@ DOUBLE_TYPE = (
 )
 
 
+class ContextIDBinary(TypeDecorator):  # type: ignore[misc]
+    """Store context ids as bytes, ulids only take 16 bytes this way."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine:
+        """Use VARBINARY on MySQL since BLOB columns can not be fully indexed."""
+        if dialect.name == "mysql":
+            return dialect.type_descriptor(mysql.VARBINARY(CONTEXT_ID_BIN_MAX_LENGTH))
+        return dialect.type_descriptor(LargeBinary())
+
+    def process_bind_param(self, value: str | None, dialect: Dialect) -> bytes | None:
+        """Convert a context id to bytes."""
+        return context_id_to_bytes(value)
+
+    def process_result_value(self, value: bytes | None, dialect: Dialect) -> str | None:
+        """Convert bytes back to a context id."""
+        return bytes_to_context_id(value)
+
+
+class UserIDBinary(ContextIDBinary):
+    """Store context user ids as bytes, uuids only take 16 bytes this way."""
+
+    cache_ok = True
+
+    def process_bind_param(self, value: str | None, dialect: Dialect) -> bytes | None:
+        """Convert a user id to bytes."""
+        return user_id_to_bytes(value)
+
+    def process_result_value(self, value: bytes | None, dialect: Dialect) -> str | None:
+        """Convert bytes back to a user id."""
+        return bytes_to_user_id(value)
+
+
 class JSONLiteral(JSON):  # type: ignore[misc]
     """Teach SA how to literalize json."""
 
@@ -146,27 +217,38 @@ class Events(Base):  # type: ignore[misc,valid-type]
     __table_args__ = (
         # Used for fetching events at a specific time
         # see logbook
-        Index("ix_events_event_type_time_fired", "event_type", "time_fired"),
+        Index(EVENT_TYPE_ID_TIME_FIRED_INDEX, "event_type_id", "time_fired"),
+        Index(EVENTS_CONTEXT_ID_BIN_INDEX, "context_id_bin"),
         {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
     )
     __tablename__ = TABLE_EVENTS
     event_id = Column(Integer, Identity(), primary_key=True)
-    event_type = Column(String(MAX_LENGTH_EVENT_EVENT_TYPE))
+    event_type = Column(
+        String(MAX_LENGTH_EVENT_EVENT_TYPE)
+    )  # no longer used once migrated
     event_data = Column(Text().with_variant(mysql.LONGTEXT, "mysql"))
     origin = Column(String(MAX_LENGTH_EVENT_ORIGIN))  # no longer used for new rows
     origin_idx = Column(SmallInteger)
     time_fired = Column(DATETIME_TYPE, index=True)
-    context_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID), index=True)
+    # The legacy context columns are no longer used
+    # once the normalized ids migration is complete
+    context_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID))
     context_user_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID))
     context_parent_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID))
     data_id = Column(Integer, ForeignKey("event_data.data_id"), index=True)
+    context_id_bin = Column(ContextIDBinary())
+    context_user_id_bin = Column(UserIDBinary())
+    context_parent_id_bin = Column(ContextIDBinary())
+    event_type_id = Column(Integer, ForeignKey("event_types.event_type_id"))
     event_data_rel = relationship("EventData")
+    event_type_rel = relationship("EventTypes")
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
         return (
             f"<recorder.Events("
             f"id={self.event_id}, type='{self.event_type}', "
+            f"event_type_id={self.event_type_id}, "
             f"origin_idx='{self.origin_idx}', time_fired='{self.time_fired}'"
             f", data_id={self.data_id})>"
         )
@@ -174,26 +256,41 @@ class Events(Base):  # type: ignore[misc,valid-type]
     @staticmethod
     def from_event(event: Event) -> Events:
         """Create an event database object from a native event."""
-        return Events(
-            event_type=event.event_type,
-            event_data=None,
-            origin_idx=EVENT_ORIGIN_TO_IDX.get(event.origin),
-            time_fired=event.time_fired,
-            context_id=event.context.id,
-            context_user_id=event.context.user_id,
-            context_parent_id=event.context.parent_id,
-        )
+        return Events(**Events.row_from_event(event))
+
+    @staticmethod
+    def row_from_event(event: Event) -> dict[str, Any]:
+        """Create an events table row from a native event.
+
+        Every row has the same keys so rows can be inserted with executemany.
+        """
+        context = event.context
+        return {
+            "event_type": event.event_type,
+            "event_data": None,
+            "origin_idx": EVENT_ORIGIN_TO_IDX.get(event.origin),
+            "time_fired": event.time_fired,
+            "context_id": context.id,
+            "context_user_id": context.user_id,
+            "context_parent_id": context.parent_id,
+            "context_id_bin": context.id,
+            "context_user_id_bin": context.user_id,
+            "context_parent_id_bin": context.parent_id,
+            "data_id": None,
+            "event_type_id": None,
+        }
 
     def to_native(self, validate_entity_id: bool = True) -> Event | None:
         """Convert to a native HA Event."""
         context = Context(
-            id=self.context_id,
-            user_id=self.context_user_id,
-            parent_id=self.context_parent_id,
+            id=self.context_id_bin or self.context_id,
+            user_id=self.context_user_id_bin or self.context_user_id,
+            parent_id=self.context_parent_id_bin or self.context_parent_id,
         )
+        event_type = self.event_type or self.event_type_rel.event_type
         try:
             return Event(
-                self.event_type,
+                event_type,
                 json_loads(self.event_data) if self.event_data else {},
                 EventOrigin(self.origin)
                 if self.origin
@@ -207,6 +304,25 @@ class Events(Base):  # type: ignore[misc,valid-type]
             return None
 
 
+class EventTypes(Base):  # type: ignore[misc,valid-type]
+    """Event type history."""
+
+    __table_args__ = (
+        {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+    __tablename__ = TABLE_EVENT_TYPES
+    event_type_id = Column(Integer, Identity(), primary_key=True)
+    event_type = Column(String(MAX_LENGTH_EVENT_EVENT_TYPE), index=True, unique=True)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.EventTypes("
+            f"id={self.event_type_id}, event_type='{self.event_type}'"
+            f")>"
+        )
+
+
 class EventData(Base):  # type: ignore[misc,valid-type]
     """Event data history."""
 
@@ -261,12 +377,15 @@ class States(Base):  # type: ignore[misc,valid-type]
     __table_args__ = (
         # Used for fetching the state of entities at a specific time
         # (get_states in history.py)
-        Index(ENTITY_ID_LAST_UPDATED_INDEX, "entity_id", "last_updated"),
+        Index(METADATA_ID_LAST_UPDATED_INDEX, "metadata_id", "last_updated"),
+        Index(STATES_CONTEXT_ID_BIN_INDEX, "context_id_bin"),
         {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
     )
     __tablename__ = TABLE_STATES
     state_id = Column(Integer, Identity(), primary_key=True)
-    entity_id = Column(String(MAX_LENGTH_STATE_ENTITY_ID))
+    entity_id = Column(
+        String(MAX_LENGTH_STATE_ENTITY_ID)
+    )  # no longer used once migrated
     state = Column(String(MAX_LENGTH_STATE_STATE))
     attributes = Column(
         Text().with_variant(mysql.LONGTEXT, "mysql")
@@ -280,18 +399,26 @@ class States(Base):  # type: ignore[misc,valid-type]
     attributes_id = Column(
         Integer, ForeignKey("state_attributes.attributes_id"), index=True
     )
-    context_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID), index=True)
+    # The legacy context columns are no longer used
+    # once the normalized ids migration is complete
+    context_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID))
     context_user_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID))
     context_parent_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID))
     origin_idx = Column(SmallInteger)  # 0 is local, 1 is remote
+    context_id_bin = Column(ContextIDBinary())
+    context_user_id_bin = Column(UserIDBinary())
+    context_parent_id_bin = Column(ContextIDBinary())
+    metadata_id = Column(Integer, ForeignKey("states_meta.metadata_id"))
     old_state = relationship("States", remote_side=[state_id])
     state_attributes = relationship("StateAttributes")
+    states_meta_rel = relationship("StatesMeta")
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
         return (
             f"<recorder.States("
             f"id={self.state_id}, entity_id='{self.entity_id}', "
+            f"metadata_id={self.metadata_id}, "
             f"state='{self.state}', event_id='{self.event_id}', "
             f"last_updated='{self.last_updated.isoformat(sep=' ', timespec='seconds')}', "
             f"old_state_id={self.old_state_id}, attributes_id={self.attributes_id}"
@@ -301,39 +428,53 @@ class States(Base):  # type: ignore[misc,valid-type]
     @staticmethod
     def from_event(event: Event) -> States:
         """Create object from a state_changed event."""
-        entity_id = event.data["entity_id"]
+        return States(**States.row_from_event(event))
+
+    @staticmethod
+    def row_from_event(event: Event) -> dict[str, Any]:
+        """Create a states table row from a state_changed event.
+
+        Every row has the same keys so rows can be inserted with executemany.
+        """
         state: State | None = event.data.get("new_state")
-        dbstate = States(
-            entity_id=entity_id,
-            attributes=None,
-            context_id=event.context.id,
-            context_user_id=event.context.user_id,
-            context_parent_id=event.context.parent_id,
-            origin_idx=EVENT_ORIGIN_TO_IDX.get(event.origin),
-        )
+        context = event.context
+        row: dict[str, Any] = {
+            "entity_id": event.data["entity_id"],
+            "attributes": None,
+            "context_id": context.id,
+            "context_user_id": context.user_id,
+            "context_parent_id": context.parent_id,
+            "context_id_bin": context.id,
+            "context_user_id_bin": context.user_id,
+            "context_parent_id_bin": context.parent_id,
+            "origin_idx": EVENT_ORIGIN_TO_IDX.get(event.origin),
+            "old_state_id": None,
+            "attributes_id": None,
+            "metadata_id": None,
+        }
 
         # None state means the state was removed from the state machine
         if state is None:
-            dbstate.state = ""
-            dbstate.last_updated = event.time_fired
-            dbstate.last_changed = None
-            return dbstate
+            row["state"] = ""
+            row["last_updated"] = event.time_fired
+            row["last_changed"] = None
+            return row
 
-        dbstate.state = state.state
-        dbstate.last_updated = state.last_updated
+        row["state"] = state.state
+        row["last_updated"] = state.last_updated
         if state.last_updated == state.last_changed:
-            dbstate.last_changed = None
+            row["last_changed"] = None
         else:
-            dbstate.last_changed = state.last_changed
+            row["last_changed"] = state.last_changed
 
-        return dbstate
+        return row
 
     def to_native(self, validate_entity_id: bool = True) -> State | None:
         """Convert to an HA state object."""
         context = Context(
-            id=self.context_id,
-            user_id=self.context_user_id,
-            parent_id=self.context_parent_id,
+            id=self.context_id_bin or self.context_id,
+            user_id=self.context_user_id_bin or self.context_user_id,
+            parent_id=self.context_parent_id_bin or self.context_parent_id,
         )
         try:
             attrs = json_loads(self.attributes) if self.attributes else {}
@@ -347,7 +488,7 @@ class States(Base):  # type: ignore[misc,valid-type]
             last_updated = process_timestamp(self.last_updated)
             last_changed = process_timestamp(self.last_changed)
         return State(
-            self.entity_id,
+            self.entity_id or self.states_meta_rel.entity_id,
             self.state,
             # Join the state_attributes table on attributes_id to get the attributes
             # for newer states
@@ -359,6 +500,25 @@ class States(Base):  # type: ignore[misc,valid-type]
         )
 
 
+class StatesMeta(Base):  # type: ignore[misc,valid-type]
+    """Metadata for states."""
+
+    __table_args__ = (
+        {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+    __tablename__ = TABLE_STATES_META
+    metadata_id = Column(Integer, Identity(), primary_key=True)
+    entity_id = Column(String(MAX_LENGTH_STATE_ENTITY_ID), index=True, unique=True)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.StatesMeta("
+            f"id={self.metadata_id}, entity_id='{self.entity_id}'"
+            f")>"
+        )
+
+
 class StateAttributes(Base):  # type: ignore[misc,valid-type]
     """State attribute change history."""
 
@@ -484,6 +644,40 @@ class StatisticsShortTerm(Base, StatisticsBase):  # type: ignore[misc,valid-type
     __tablename__ = TABLE_STATISTICS_SHORT_TERM
 
 
+class StatisticsDaily(Base, StatisticsBase):  # type: ignore[misc,valid-type]
+    """Long term statistics compiled per day in the configured time zone."""
+
+    duration = timedelta(days=1)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_daily_statistic_id_start",
+            "metadata_id",
+            "start",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_DAILY
+
+
+class StatisticsMonthly(Base, StatisticsBase):  # type: ignore[misc,valid-type]
+    """Long term statistics compiled per month in the configured time zone."""
+
+    duration = timedelta(days=31)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_monthly_statistic_id_start",
+            "metadata_id",
+            "start",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_MONTHLY
+
+
 class StatisticsMeta(Base):  # type: ignore[misc,valid-type]
     """Statistics meta data."""
 
@@ -540,8 +734,14 @@ class RecorderRuns(Base):  # type: ignore[misc,valid-type]
 
         assert session is not None, "RecorderRuns need to be persisted"
 
-        query = session.query(distinct(States.entity_id)).filter(
-            States.last_updated >= self.start
+        query = (
+            session.query(
+                func.coalesce(StatesMeta.entity_id, States.entity_id).label("entity_id")
+            )
+            .select_from(States)
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(States.last_updated >= self.start)
+            .distinct()
         )
 
         if point_in_time is not None:
@@ -12,7 +12,7 @@ from homeassistant.const import CONF_DOMAINS, CONF_ENTITIES, CONF_EXCLUDE, CONF_
 from homeassistant.helpers.entityfilter import CONF_ENTITY_GLOBS
 from homeassistant.helpers.typing import ConfigType
 
-from .db_schema import ENTITY_ID_IN_EVENT, OLD_ENTITY_ID_IN_EVENT, States
+from .db_schema import ENTITY_ID_IN_EVENT, OLD_ENTITY_ID_IN_EVENT, States, StatesMeta
 
 DOMAIN = "history"
 HISTORY_FILTERS = "history_filters"
@@ -187,14 +187,18 @@ class Filters:
         # - Otherwise: exclude
         return i_entities
 
-    def states_entity_filter(self) -> ClauseList:
-        """Generate the entity filter query."""
+    def states_entity_filter(self, normalized_ids: bool = False) -> ClauseList:
+        """Generate the entity filter query.
+
+        When normalized_ids is set the query must join the states_meta table.
+        """
 
         def _encoder(data: Any) -> Any:
             """Nothing to encode for states since there is no json."""
             return data
 
-        return self._generate_filter_for_columns((States.entity_id,), _encoder)
+        column = StatesMeta.entity_id if normalized_ids else States.entity_id
+        return self._generate_filter_for_columns((column,), _encoder)
 
     def events_entity_filter(self) -> ClauseList:
         """Generate the entity filter query."""
@@ -1,8 +1,9 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
-from collections import defaultdict
+import asyncio
 from collections.abc import Callable, Iterable, Iterator, MutableMapping
+from dataclasses import dataclass
 from datetime import datetime
 from itertools import groupby
 import logging
@@ -15,17 +16,17 @@ from sqlalchemy.orm.query import Query
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import literal
 from sqlalchemy.sql.lambdas import StatementLambdaElement
-from sqlalchemy.sql.selectable import Subquery
+from sqlalchemy.sql.selectable import Select, Subquery
 
 from homeassistant.components.websocket_api import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import HomeAssistant, State, split_entity_id
+from homeassistant.core import HomeAssistant, State, callback, split_entity_id
 import homeassistant.util.dt as dt_util
 
 from .. import recorder
-from .db_schema import RecorderRuns, StateAttributes, States
+from .db_schema import RecorderRuns, StateAttributes, States, StatesMeta
 from .filters import Filters
 from .models import (
     LazyState,
@@ -41,6 +42,13 @@ _LOGGER = logging.getLogger(__name__)
 STATE_KEY = "state"
 LAST_CHANGED_KEY = "last_changed"
 
+DATA_STATE_CHANGES_BATCH = "recorder_state_changes_batch"
+# How long to collect state changes requests to answer them with one query
+STATE_CHANGES_BATCH_DELAY = 0.05
+
+# Rows read per query when streaming the significant states
+STREAM_CHUNK_SIZE = 1000
+
 SIGNIFICANT_DOMAINS = {
     "climate",
     "device_tracker",
@@ -108,18 +116,59 @@ QUERY_STATES_NO_LAST_CHANGED = [
 ]
 
 
+def _with_states_meta_entity_id(columns: list[Any]) -> list[Any]:
+    """Replace the legacy entity_id column with the one from states_meta."""
+    return [
+        StatesMeta.entity_id if column is States.entity_id else column
+        for column in columns
+    ]
+
+
+QUERY_STATE_NO_ATTR_NORMALIZED = _with_states_meta_entity_id(QUERY_STATE_NO_ATTR)
+QUERY_STATE_NO_ATTR_NO_LAST_CHANGED_NORMALIZED = _with_states_meta_entity_id(
+    QUERY_STATE_NO_ATTR_NO_LAST_CHANGED
+)
+QUERY_STATES_NORMALIZED = _with_states_meta_entity_id(QUERY_STATES)
+QUERY_STATES_NO_LAST_CHANGED_NORMALIZED = _with_states_meta_entity_id(
+    QUERY_STATES_NO_LAST_CHANGED
+)
+
+
 def _schema_version(hass: HomeAssistant) -> int:
     return recorder.get_instance(hass).schema_version
 
 
+def _normalized_ids_active(hass: HomeAssistant) -> bool:
+    return recorder.get_instance(hass).normalized_ids_active
+
+
+def _entity_id_column(normalized_ids: bool) -> Column:
+    """Return the column to filter states by entity_id."""
+    return StatesMeta.entity_id if normalized_ids else States.entity_id
+
+
+def _entity_key_column(normalized_ids: bool) -> Column:
+    """Return the column to group and order states by entity."""
+    return States.metadata_id if normalized_ids else States.entity_id
+
+
 def lambda_stmt_and_join_attributes(
-    schema_version: int, no_attributes: bool, include_last_changed: bool = True
+    schema_version: int,
+    no_attributes: bool,
+    include_last_changed: bool = True,
+    normalized_ids: bool = False,
 ) -> tuple[StatementLambdaElement, bool]:
     """Return the lambda_stmt and if StateAttributes should be joined.
 
     Because these are lambda_stmt the values inside the lambdas need
     to be explicitly written out to avoid caching the wrong values.
     """
+    # Once all rows have been migrated to the normalized ids
+    # the entity_id is only available from the states_meta table
+    if normalized_ids:
+        return _normalized_lambda_stmt_and_join_attributes(
+            no_attributes, include_last_changed
+        )
     # If no_attributes was requested we do the query
     # without the attributes fields and do not join the
     # state_attributes table
@@ -151,6 +200,25 @@ def lambda_stmt_and_join_attributes(
     return lambda_stmt(lambda: select(*QUERY_STATES_NO_LAST_CHANGED)), True
 
 
+def _normalized_lambda_stmt_and_join_attributes(
+    no_attributes: bool, include_last_changed: bool
+) -> tuple[StatementLambdaElement, bool]:
+    """Return the lambda_stmt joining states_meta and if StateAttributes should be joined."""
+    if no_attributes:
+        if include_last_changed:
+            stmt = lambda_stmt(lambda: select(*QUERY_STATE_NO_ATTR_NORMALIZED))
+        else:
+            stmt = lambda_stmt(
+                lambda: select(*QUERY_STATE_NO_ATTR_NO_LAST_CHANGED_NORMALIZED)
+            )
+    elif include_last_changed:
+        stmt = lambda_stmt(lambda: select(*QUERY_STATES_NORMALIZED))
+    else:
+        stmt = lambda_stmt(lambda: select(*QUERY_STATES_NO_LAST_CHANGED_NORMALIZED))
+    stmt += lambda q: q.join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+    return stmt, not no_attributes
+
+
 def get_significant_states(
     hass: HomeAssistant,
     start_time: datetime,
@@ -192,8 +260,21 @@ def _ignore_domains_filter(query: Query) -> Query:
     )
 
 
+def _ignore_domains_normalized_filter(query: Query) -> Query:
+    """Add a filter to ignore domains we do not fetch history for."""
+    return query.filter(
+        and_(
+            *[
+                ~StatesMeta.entity_id.like(entity_domain)
+                for entity_domain in IGNORE_DOMAINS_ENTITY_ID_LIKE
+            ]
+        )
+    )
+
+
 def _significant_states_stmt(
     schema_version: int,
+    normalized_ids: bool,
     start_time: datetime,
     end_time: datetime | None,
     entity_ids: list[str] | None,
@@ -203,8 +284,12 @@ def _significant_states_stmt(
 ) -> StatementLambdaElement:
     """Query the database for significant state changes."""
     stmt, join_attributes = lambda_stmt_and_join_attributes(
-        schema_version, no_attributes, include_last_changed=not significant_changes_only
+        schema_version,
+        no_attributes,
+        include_last_changed=not significant_changes_only,
+        normalized_ids=normalized_ids,
     )
+    entity_id_column = _entity_id_column(normalized_ids)
     if (
         entity_ids
         and len(entity_ids) == 1
@@ -218,7 +303,7 @@ def _significant_states_stmt(
         stmt += lambda q: q.filter(
             or_(
                 *[
-                    States.entity_id.like(entity_domain)
+                    entity_id_column.like(entity_domain)
                     for entity_domain in SIGNIFICANT_DOMAINS_ENTITY_ID_LIKE
                 ],
                 (
@@ -229,13 +314,16 @@ def _significant_states_stmt(
         )
 
     if entity_ids:
-        stmt += lambda q: q.filter(States.entity_id.in_(entity_ids))
+        stmt += lambda q: q.filter(entity_id_column.in_(entity_ids))
     else:
-        stmt += _ignore_domains_filter
+        if normalized_ids:
+            stmt += _ignore_domains_normalized_filter
+        else:
+            stmt += _ignore_domains_filter
         if filters and filters.has_config:
-            entity_filter = filters.states_entity_filter()
+            entity_filter = filters.states_entity_filter(normalized_ids)
             stmt = stmt.add_criteria(
-                lambda q: q.filter(entity_filter), track_on=[filters]
+                lambda q: q.filter(entity_filter), track_on=[filters, normalized_ids]
             )
 
     stmt += lambda q: q.filter(States.last_updated > start_time)
@@ -246,7 +334,7 @@ def _significant_states_stmt(
         stmt += lambda q: q.outerjoin(
             StateAttributes, States.attributes_id == StateAttributes.attributes_id
         )
-    stmt += lambda q: q.order_by(States.entity_id, States.last_updated)
+    stmt += lambda q: q.order_by(entity_id_column, States.last_updated)
     return stmt
 
 
@@ -277,6 +365,7 @@ def get_significant_states_with_session(
     """
     stmt = _significant_states_stmt(
         _schema_version(hass),
+        _normalized_ids_active(hass),
         start_time,
         end_time,
         entity_ids,
@@ -301,6 +390,101 @@ def get_significant_states_with_session(
     )
 
 
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    filters: Filters | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Yield the significant states of each entity during UTC period start_time - end_time.
+
+    Like get_significant_states, but the rows are read in chunks of
+    STREAM_CHUNK_SIZE rows and the states of each entity are yielded as
+    soon as they have been read, so the whole period is never held in
+    memory. Each chunk is read in its own session and the next chunk
+    resumes after the last row read, so no session or cursor is held
+    open while the caller consumes the states.
+    """
+    normalized_ids = _normalized_ids_active(hass)
+    stmt = _significant_states_stmt(
+        _schema_version(hass),
+        normalized_ids,
+        start_time,
+        end_time,
+        entity_ids,
+        filters,
+        significant_changes_only,
+        no_attributes,
+    )
+    with session_scope(hass=hass) as session:
+        initial_states = _get_initial_states(
+            hass,
+            session,
+            start_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            no_attributes,
+        )
+    yield from _sorted_states_to_entity_lists(
+        hass,
+        _stream_rows(hass, stmt, _entity_id_column(normalized_ids)),
+        start_time,
+        entity_ids,
+        initial_states,
+        minimal_response,
+        compressed_state_format,
+    )
+
+
+def _stream_rows(
+    hass: HomeAssistant, stmt: StatementLambdaElement, entity_id_column: Column
+) -> Iterator[Row]:
+    """Read the rows of a significant states query in chunks.
+
+    The rows are ordered by entity_id, last_updated and state_id so the
+    next chunk can resume after the last row of the previous one.
+    """
+    chunk_size = STREAM_CHUNK_SIZE
+    stmt += lambda q: q.add_columns(States.state_id).order_by(States.state_id)
+    first_chunk_stmt = stmt + (lambda q: q.limit(chunk_size))
+    last_row: Row | None = None
+    while True:
+        if last_row is None:
+            chunk_stmt = first_chunk_stmt
+        else:
+            last_entity_id = last_row.entity_id
+            last_updated = last_row.last_updated
+            last_state_id = last_row.state_id
+            chunk_stmt = stmt + (
+                lambda q: q.filter(
+                    (entity_id_column > last_entity_id)
+                    | (
+                        (entity_id_column == last_entity_id)
+                        & (
+                            (States.last_updated > last_updated)
+                            | (
+                                (States.last_updated == last_updated)
+                                & (States.state_id > last_state_id)
+                            )
+                        )
+                    )
+                ).limit(chunk_size)
+            )
+        with session_scope(hass=hass) as session:
+            rows = execute_stmt_lambda_element(session, chunk_stmt)
+        yield from rows
+        if len(rows) < chunk_size:
+            return
+        last_row = rows[-1]
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -332,6 +516,7 @@ def get_full_significant_states_with_session(
 
 def _state_changed_during_period_stmt(
     schema_version: int,
+    normalized_ids: bool,
     start_time: datetime,
     end_time: datetime | None,
     entity_id: str | None,
@@ -340,8 +525,12 @@ def _state_changed_during_period_stmt(
     limit: int | None,
 ) -> StatementLambdaElement:
     stmt, join_attributes = lambda_stmt_and_join_attributes(
-        schema_version, no_attributes, include_last_changed=False
+        schema_version,
+        no_attributes,
+        include_last_changed=False,
+        normalized_ids=normalized_ids,
     )
+    entity_id_column = _entity_id_column(normalized_ids)
     stmt += lambda q: q.filter(
         ((States.last_changed == States.last_updated) | States.last_changed.is_(None))
         & (States.last_updated > start_time)
@@ -349,15 +538,15 @@ def _state_changed_during_period_stmt(
     if end_time:
         stmt += lambda q: q.filter(States.last_updated < end_time)
     if entity_id:
-        stmt += lambda q: q.filter(States.entity_id == entity_id)
+        stmt += lambda q: q.filter(entity_id_column == entity_id)
     if join_attributes:
         stmt += lambda q: q.outerjoin(
             StateAttributes, States.attributes_id == StateAttributes.attributes_id
         )
     if descending:
-        stmt += lambda q: q.order_by(States.entity_id, States.last_updated.desc())
+        stmt += lambda q: q.order_by(entity_id_column, States.last_updated.desc())
     else:
-        stmt += lambda q: q.order_by(States.entity_id, States.last_updated)
+        stmt += lambda q: q.order_by(entity_id_column, States.last_updated)
     if limit:
         stmt += lambda q: q.limit(limit)
     return stmt
@@ -380,6 +569,7 @@ def state_changes_during_period(
     with session_scope(hass=hass) as session:
         stmt = _state_changed_during_period_stmt(
             _schema_version(hass),
+            _normalized_ids_active(hass),
             start_time,
             end_time,
             entity_id,
@@ -403,22 +593,274 @@ def state_changes_during_period(
         )
 
 
+@dataclass
+class StateChangesRequest:
+    """A request for the state changes of a single entity."""
+
+    start_time: datetime
+    end_time: datetime | None
+    entity_id: str
+    no_attributes: bool
+    descending: bool
+    limit: int | None
+    include_start_time_state: bool
+
+    @property
+    def batch_key(self) -> tuple[Any, ...]:
+        """Return the key of the requests that can be answered by one query.
+
+        The states of a batch are selected from the earliest start time to
+        the latest end time and each request picks its own states from them.
+        A limit keeps the first states of each entity, which only cover the
+        states of every request when the other end of the period is shared.
+        """
+        key = (
+            self.no_attributes,
+            self.include_start_time_state,
+            self.descending,
+            bool(self.limit),
+        )
+        if not self.limit:
+            return key
+        if self.descending:
+            return (*key, self.end_time)
+        return (*key, self.start_time, self.end_time)
+
+
+def _state_changes_during_period_batch_stmt(
+    schema_version: int,
+    normalized_ids: bool,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    no_attributes: bool,
+    descending: bool,
+    limit: int | None,
+) -> Select:
+    """Return the statement to select the state changes of many entities."""
+    columns: list[Any]
+    if normalized_ids:
+        columns = (
+            QUERY_STATE_NO_ATTR_NO_LAST_CHANGED_NORMALIZED
+            if no_attributes
+            else QUERY_STATES_NO_LAST_CHANGED_NORMALIZED
+        )
+        join_attributes = not no_attributes
+    elif no_attributes:
+        columns, join_attributes = QUERY_STATE_NO_ATTR_NO_LAST_CHANGED, False
+    elif schema_version < 25:
+        columns, join_attributes = QUERY_STATES_PRE_SCHEMA_25_NO_LAST_CHANGED, False
+    else:
+        columns, join_attributes = QUERY_STATES_NO_LAST_CHANGED, True
+    entity_id_column = _entity_id_column(normalized_ids)
+    stmt = select(*columns)
+    if normalized_ids:
+        stmt = stmt.join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+    stmt = stmt.filter(
+        ((States.last_changed == States.last_updated) | States.last_changed.is_(None))
+        & (States.last_updated > start_time)
+        & entity_id_column.in_(entity_ids)
+    )
+    if end_time:
+        stmt = stmt.filter(States.last_updated < end_time)
+    if join_attributes:
+        stmt = stmt.outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
+    if not limit:
+        return stmt.order_by(
+            entity_id_column,
+            States.last_updated.desc() if descending else States.last_updated,
+        )
+    # Number the states of each entity to keep the first ones of each
+    ranked = stmt.add_columns(
+        func.row_number()
+        .over(
+            partition_by=_entity_key_column(normalized_ids),
+            order_by=States.last_updated.desc() if descending else States.last_updated,
+        )
+        .label("row_number")
+    ).subquery()
+    return (
+        select(ranked)
+        .filter(ranked.c.row_number <= limit)
+        .order_by(
+            ranked.c.entity_id,
+            ranked.c.last_updated.desc() if descending else ranked.c.last_updated,
+        )
+    )
+
+
+def _state_changes_during_period_batch_with_session(
+    hass: HomeAssistant, session: Session, requests: list[StateChangesRequest]
+) -> Iterator[list[State]]:
+    """Yield the states of requests which share a batch key."""
+    request = requests[0]
+    start_time = min(request.start_time for request in requests)
+    end_time = (
+        None
+        if any(request.end_time is None for request in requests)
+        else max(cast(datetime, request.end_time) for request in requests)
+    )
+    limits = [request.limit for request in requests if request.limit]
+    stmt = _state_changes_during_period_batch_stmt(
+        _schema_version(hass),
+        _normalized_ids_active(hass),
+        start_time,
+        end_time,
+        sorted({request.entity_id for request in requests}),
+        request.no_attributes,
+        request.descending,
+        max(limits) if limits else None,
+    )
+    rows_by_entity_id = {
+        entity_id: list(rows)
+        for entity_id, rows in groupby(
+            execute_stmt_lambda_element(
+                session, stmt, start_time, end_time  # type: ignore[arg-type]
+            ),
+            lambda row: row.entity_id,
+        )
+    }
+    for request in requests:
+        rows = [
+            row
+            for row in rows_by_entity_id.get(request.entity_id, ())
+            if (last_updated := process_timestamp(row.last_updated))
+            > request.start_time
+            and (request.end_time is None or last_updated < request.end_time)
+        ]
+        if request.limit:
+            rows = rows[: request.limit]
+        yield cast(
+            list[State],
+            _sorted_states_to_dict(
+                hass,
+                session,
+                rows,
+                request.start_time,
+                [request.entity_id],
+                include_start_time_state=request.include_start_time_state,
+            ).get(request.entity_id, []),
+        )
+
+
+def state_changes_during_period_batch(
+    hass: HomeAssistant, requests: list[StateChangesRequest]
+) -> list[list[State]]:
+    """Return the state changes of each request.
+
+    The requests that share a batch key are answered by one query for all
+    of their entities.
+    """
+    results: list[list[State]] = [[] for _ in requests]
+    batches: dict[tuple[Any, ...], list[int]] = {}
+    for idx, request in enumerate(requests):
+        batches.setdefault(request.batch_key, []).append(idx)
+
+    with session_scope(hass=hass) as session:
+        for indexes in batches.values():
+            for idx, states in zip(
+                indexes,
+                _state_changes_during_period_batch_with_session(
+                    hass, session, [requests[idx] for idx in indexes]
+                ),
+            ):
+                results[idx] = states
+    return results
+
+
+class StateChangesBatch:
+    """Collect state changes requests and answer them in batches."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the state changes batch."""
+        self.hass = hass
+        self._pending: list[
+            tuple[StateChangesRequest, asyncio.Future[list[State]]]
+        ] = []
+
+    @callback
+    def async_add(self, request: StateChangesRequest) -> asyncio.Future[list[State]]:
+        """Add a request to the next batch."""
+        future: asyncio.Future[list[State]] = self.hass.loop.create_future()
+        if not self._pending:
+            self.hass.async_create_task(self._async_run_batch())
+        self._pending.append((request, future))
+        return future
+
+    async def _async_run_batch(self) -> None:
+        """Run the requests that arrived while waiting as one batch."""
+        await asyncio.sleep(STATE_CHANGES_BATCH_DELAY)
+        pending = self._pending
+        self._pending = []
+        try:
+            results = await recorder.get_instance(self.hass).async_add_executor_job(
+                state_changes_during_period_batch,
+                self.hass,
+                [request for request, _ in pending],
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(err)
+            return
+        for (_, future), states in zip(pending, results):
+            if not future.done():
+                future.set_result(states)
+
+
+async def async_state_changes_during_period(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    *,
+    entity_id: str,
+    no_attributes: bool = False,
+    descending: bool = False,
+    limit: int | None = None,
+    include_start_time_state: bool = True,
+) -> list[State]:
+    """Return the states changes of an entity during UTC period start_time - end_time.
+
+    Requests that arrive close together, like the ones of sensors that load
+    their history at startup, are answered with a single query.
+    """
+    if (batch := hass.data.get(DATA_STATE_CHANGES_BATCH)) is None:
+        batch = hass.data[DATA_STATE_CHANGES_BATCH] = StateChangesBatch(hass)
+    return await batch.async_add(
+        StateChangesRequest(
+            start_time,
+            end_time,
+            entity_id.lower(),
+            no_attributes,
+            descending,
+            limit,
+            include_start_time_state,
+        )
+    )
+
+
 def _get_last_state_changes_stmt(
-    schema_version: int, number_of_states: int, entity_id: str | None
+    schema_version: int,
+    normalized_ids: bool,
+    number_of_states: int,
+    entity_id: str | None,
 ) -> StatementLambdaElement:
     stmt, join_attributes = lambda_stmt_and_join_attributes(
-        schema_version, False, include_last_changed=False
+        schema_version, False, include_last_changed=False, normalized_ids=normalized_ids
     )
+    entity_id_column = _entity_id_column(normalized_ids)
     stmt += lambda q: q.filter(
         (States.last_changed == States.last_updated) | States.last_changed.is_(None)
     )
     if entity_id:
-        stmt += lambda q: q.filter(States.entity_id == entity_id)
+        stmt += lambda q: q.filter(entity_id_column == entity_id)
     if join_attributes:
         stmt += lambda q: q.outerjoin(
             StateAttributes, States.attributes_id == StateAttributes.attributes_id
         )
-    stmt += lambda q: q.order_by(States.entity_id, States.last_updated.desc()).limit(
+    stmt += lambda q: q.order_by(entity_id_column, States.last_updated.desc()).limit(
         number_of_states
     )
     return stmt
@@ -434,7 +876,10 @@ def get_last_state_changes(
 
     with session_scope(hass=hass) as session:
         stmt = _get_last_state_changes_stmt(
-            _schema_version(hass), number_of_states, entity_id
+            _schema_version(hass),
+            _normalized_ids_active(hass),
+            number_of_states,
+            entity_id,
         )
         states = list(execute_stmt_lambda_element(session, stmt))
         return cast(
@@ -452,6 +897,7 @@ def get_last_state_changes(
 
 def _get_states_for_entites_stmt(
     schema_version: int,
+    normalized_ids: bool,
     run_start: datetime,
     utc_point_in_time: datetime,
     entity_ids: list[str],
@@ -459,23 +905,47 @@ def _get_states_for_entites_stmt(
 ) -> StatementLambdaElement:
     """Baked query to get states for specific entities."""
     stmt, join_attributes = lambda_stmt_and_join_attributes(
-        schema_version, no_attributes, include_last_changed=True
+        schema_version,
+        no_attributes,
+        include_last_changed=True,
+        normalized_ids=normalized_ids,
     )
     # We got an include-list of entities, accelerate the query by filtering already
     # in the inner query.
-    stmt += lambda q: q.where(
-        States.state_id
-        == (
-            select(func.max(States.state_id).label("max_state_id"))
-            .filter(
-                (States.last_updated >= run_start)
-                & (States.last_updated < utc_point_in_time)
-            )
-            .filter(States.entity_id.in_(entity_ids))
-            .group_by(States.entity_id)
-            .subquery()
-        ).c.max_state_id
-    )
+    if normalized_ids:
+        stmt += lambda q: q.where(
+            States.state_id
+            == (
+                select(func.max(States.state_id).label("max_state_id"))
+                .filter(
+                    (States.last_updated >= run_start)
+                    & (States.last_updated < utc_point_in_time)
+                )
+                .filter(
+                    States.metadata_id.in_(
+                        select(StatesMeta.metadata_id).filter(
+                            StatesMeta.entity_id.in_(entity_ids)
+                        )
+                    )
+                )
+                .group_by(States.metadata_id)
+                .subquery()
+            ).c.max_state_id
+        )
+    else:
+        stmt += lambda q: q.where(
+            States.state_id
+            == (
+                select(func.max(States.state_id).label("max_state_id"))
+                .filter(
+                    (States.last_updated >= run_start)
+                    & (States.last_updated < utc_point_in_time)
+                )
+                .filter(States.entity_id.in_(entity_ids))
+                .group_by(States.entity_id)
+                .subquery()
+            ).c.max_state_id
+        )
     if join_attributes:
         stmt += lambda q: q.outerjoin(
             StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
@@ -484,26 +954,28 @@ def _get_states_for_entites_stmt(
 
 
 def _generate_most_recent_states_by_date(
+    entity_key_column: Column,
     run_start: datetime,
     utc_point_in_time: datetime,
 ) -> Subquery:
     """Generate the sub query for the most recent states by data."""
     return (
         select(
-            States.entity_id.label("max_entity_id"),
+            entity_key_column.label("max_entity_key"),
             func.max(States.last_updated).label("max_last_updated"),
         )
         .filter(
             (States.last_updated >= run_start)
             & (States.last_updated < utc_point_in_time)
         )
-        .group_by(States.entity_id)
+        .group_by(entity_key_column)
         .subquery()
     )
 
 
 def _get_states_for_all_stmt(
     schema_version: int,
+    normalized_ids: bool,
     run_start: datetime,
     utc_point_in_time: datetime,
     filters: Filters | None,
@@ -511,14 +983,18 @@ def _get_states_for_all_stmt(
 ) -> StatementLambdaElement:
     """Baked query to get states for all entities."""
     stmt, join_attributes = lambda_stmt_and_join_attributes(
-        schema_version, no_attributes, include_last_changed=True
+        schema_version,
+        no_attributes,
+        include_last_changed=True,
+        normalized_ids=normalized_ids,
     )
+    entity_key_column = _entity_key_column(normalized_ids)
     # We did not get an include-list of entities, query all states in the inner
     # query, then filter out unwanted domains as well as applying the custom filter.
     # This filtering can't be done in the inner query because the domain column is
     # not indexed and we can't control what's in the custom filter.
     most_recent_states_by_date = _generate_most_recent_states_by_date(
-        run_start, utc_point_in_time
+        entity_key_column, run_start, utc_point_in_time
     )
     stmt += lambda q: q.where(
         States.state_id
@@ -527,19 +1003,26 @@ def _get_states_for_all_stmt(
             .join(
                 most_recent_states_by_date,
                 and_(
-                    States.entity_id == most_recent_states_by_date.c.max_entity_id,
+                    entity_key_column == most_recent_states_by_date.c.max_entity_key,
                     States.last_updated
                     == most_recent_states_by_date.c.max_last_updated,
                 ),
             )
-            .group_by(States.entity_id)
+            .group_by(entity_key_column)
             .subquery()
         ).c.max_state_id,
     )
-    stmt += _ignore_domains_filter
+    if normalized_ids:
+        # Grouping by metadata_id no longer implies the entity_id order
+        stmt += lambda q: q.order_by(StatesMeta.entity_id)
+        stmt += _ignore_domains_normalized_filter
+    else:
+        stmt += _ignore_domains_filter
     if filters and filters.has_config:
-        entity_filter = filters.states_entity_filter()
-        stmt = stmt.add_criteria(lambda q: q.filter(entity_filter), track_on=[filters])
+        entity_filter = filters.states_entity_filter(normalized_ids)
+        stmt = stmt.add_criteria(
+            lambda q: q.filter(entity_filter), track_on=[filters, normalized_ids]
+        )
     if join_attributes:
         stmt += lambda q: q.outerjoin(
             StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
@@ -558,11 +1041,16 @@ def _get_rows_with_session(
 ) -> Iterable[Row]:
     """Return the states at a specific point in time."""
     schema_version = _schema_version(hass)
+    normalized_ids = _normalized_ids_active(hass)
     if entity_ids and len(entity_ids) == 1:
         return execute_stmt_lambda_element(
             session,
             _get_single_entity_states_stmt(
-                schema_version, utc_point_in_time, entity_ids[0], no_attributes
+                schema_version,
+                normalized_ids,
+                utc_point_in_time,
+                entity_ids[0],
+                no_attributes,
             ),
         )
 
@@ -577,11 +1065,21 @@ def _get_rows_with_session(
     # since the last recorder run started.
     if entity_ids:
         stmt = _get_states_for_entites_stmt(
-            schema_version, run.start, utc_point_in_time, entity_ids, no_attributes
+            schema_version,
+            normalized_ids,
+            run.start,
+            utc_point_in_time,
+            entity_ids,
+            no_attributes,
         )
     else:
         stmt = _get_states_for_all_stmt(
-            schema_version, run.start, utc_point_in_time, filters, no_attributes
+            schema_version,
+            normalized_ids,
+            run.start,
+            utc_point_in_time,
+            filters,
+            no_attributes,
         )
 
     return execute_stmt_lambda_element(session, stmt)
@@ -589,6 +1087,7 @@ def _get_rows_with_session(
 
 def _get_single_entity_states_stmt(
     schema_version: int,
+    normalized_ids: bool,
     utc_point_in_time: datetime,
     entity_id: str,
     no_attributes: bool = False,
@@ -596,12 +1095,16 @@ def _get_single_entity_states_stmt(
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
     stmt, join_attributes = lambda_stmt_and_join_attributes(
-        schema_version, no_attributes, include_last_changed=True
+        schema_version,
+        no_attributes,
+        include_last_changed=True,
+        normalized_ids=normalized_ids,
     )
+    entity_id_column = _entity_id_column(normalized_ids)
     stmt += (
         lambda q: q.filter(
             States.last_updated < utc_point_in_time,
-            States.entity_id == entity_id,
+            entity_id_column == entity_id,
         )
         .order_by(States.last_updated.desc())
         .limit(1)
@@ -636,26 +1139,46 @@ def _sorted_states_to_dict(
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
     """
-    if compressed_state_format:
-        state_class = row_to_compressed_state
-        _process_timestamp: Callable[
-            [datetime], float | str
-        ] = process_datetime_to_timestamp
-        attr_time = COMPRESSED_STATE_LAST_UPDATED
-        attr_state = COMPRESSED_STATE_STATE
-    else:
-        state_class = LazyState  # type: ignore[assignment]
-        _process_timestamp = process_timestamp_to_utc_isoformat
-        attr_time = LAST_CHANGED_KEY
-        attr_state = STATE_KEY
-
-    result: dict[str, list[State | dict[str, Any]]] = defaultdict(list)
+    result: dict[str, list[State | dict[str, Any]]] = {}
     # Set all entity IDs to empty lists in result set to maintain the order
     if entity_ids is not None:
         for ent_id in entity_ids:
             result[ent_id] = []
 
-    # Get the states at the start time
+    initial_states = _get_initial_states(
+        hass,
+        session,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        no_attributes,
+    )
+    for ent_id, ent_results in _sorted_states_to_entity_lists(
+        hass,
+        states,
+        start_time,
+        entity_ids,
+        initial_states,
+        minimal_response,
+        compressed_state_format,
+    ):
+        result[ent_id] = ent_results
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+def _get_initial_states(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    entity_ids: list[str] | None,
+    filters: Filters | None,
+    include_start_time_state: bool,
+    no_attributes: bool,
+) -> dict[str, Row]:
+    """Get the states at the start time."""
     timer_start = time.perf_counter()
     initial_states: dict[str, Row] = {}
     if include_start_time_state:
@@ -673,7 +1196,39 @@ def _sorted_states_to_dict(
 
     if _LOGGER.isEnabledFor(logging.DEBUG):
         elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("getting %d first datapoints took %fs", len(result), elapsed)
+        _LOGGER.debug(
+            "getting %d first datapoints took %fs", len(initial_states), elapsed
+        )
+    return initial_states
+
+
+def _sorted_states_to_entity_lists(
+    hass: HomeAssistant,
+    states: Iterable[Row],
+    start_time: datetime,
+    entity_ids: list[str] | None,
+    initial_states: dict[str, Row],
+    minimal_response: bool = False,
+    compressed_state_format: bool = False,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Convert SQL results into the list of states of each entity.
+
+    The list of each entity is yielded as soon as all its states have
+    been read, entities without states are not yielded. The entries of
+    initial_states are consumed.
+    """
+    if compressed_state_format:
+        state_class = row_to_compressed_state
+        _process_timestamp: Callable[
+            [datetime], float | str
+        ] = process_datetime_to_timestamp
+        attr_time = COMPRESSED_STATE_LAST_UPDATED
+        attr_state = COMPRESSED_STATE_STATE
+    else:
+        state_class = LazyState  # type: ignore[assignment]
+        _process_timestamp = process_timestamp_to_utc_isoformat
+        attr_time = LAST_CHANGED_KEY
+        attr_state = STATE_KEY
 
     if entity_ids and len(entity_ids) == 1:
         states_iter: Iterable[tuple[str | Column, Iterator[States]]] = (
@@ -686,13 +1241,15 @@ def _sorted_states_to_dict(
     for ent_id, group in states_iter:
         attr_cache: dict[str, dict[str, Any]] = {}
         prev_state: Column | str
-        ent_results = result[ent_id]
+        ent_results: list[State | dict[str, Any]] = []
         if row := initial_states.pop(ent_id, None):
             prev_state = row.state
             ent_results.append(state_class(row, attr_cache, start_time))
 
         if not minimal_response or split_entity_id(ent_id)[0] in NEED_ATTRIBUTE_DOMAINS:
             ent_results.extend(state_class(db_state, attr_cache) for db_state in group)
+            if ent_results:
+                yield ent_id, ent_results
             continue
 
         # With minimal response we only provide a native
@@ -724,10 +1281,9 @@ def _sorted_states_to_dict(
             )
             prev_state = state
 
+        yield ent_id, ent_results
+
     # If there are no states beyond the initial state,
     # the state a was never popped from initial_states
     for ent_id, row in initial_states.items():
-        result[ent_id].append(state_class(row, {}, start_time))
-
-    # Filter out the empty lists if some states had 0 results.
-    return {key: val for key, val in result.items() if val}
+        yield ent_id, [state_class(row, {}, start_time)]
@@ -0,0 +1,111 @@
+"""Helpers for the recorder caches of shared attributes and event data ids."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, MutableMapping
+from dataclasses import dataclass
+
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from .const import MAX_ROWS_TO_PURGE
+
+# About 1% false positives with 10 bits per hash and 7 probes
+BLOOM_FILTER_BITS_PER_HASH = 10
+BLOOM_FILTER_PROBES = 7
+# Leave room for the hashes added after startup
+BLOOM_FILTER_MIN_CAPACITY = 2**16
+BLOOM_FILTER_GROWTH_FACTOR = 2
+
+_GOLDEN_RATIO_32 = 0x9E3779B1
+_UINT32_MASK = 0xFFFFFFFF
+
+
+@dataclass
+class IDCacheStats:
+    """Lookup counters of an id cache."""
+
+    hits: int = 0
+    misses: int = 0
+    skipped_db_lookups: int = 0
+
+    @property
+    def hit_rate(self) -> float | None:
+        """Return the percentage of lookups found in the cache."""
+        if not (lookups := self.hits + self.misses):
+            return None
+        return self.hits / lookups * 100
+
+
+class HashBloomFilter:
+    """A bloom filter of the 32 bit hashes stored in a table.
+
+    A hash that is not in the filter is not in the table, so the
+    database lookup for it can be skipped. Hashes are never removed
+    since a stale hash only costs a lookup.
+    """
+
+    __slots__ = ("_bits", "_size")
+
+    def __init__(self, expected_hashes: int) -> None:
+        """Initialize the filter for the expected number of hashes."""
+        capacity = max(
+            expected_hashes * BLOOM_FILTER_GROWTH_FACTOR, BLOOM_FILTER_MIN_CAPACITY
+        )
+        self._size = capacity * BLOOM_FILTER_BITS_PER_HASH
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def _positions(self, hash_: int) -> list[int]:
+        """Return the bit positions of a hash with double hashing."""
+        step = ((hash_ * _GOLDEN_RATIO_32) & _UINT32_MASK) | 1
+        size = self._size
+        return [(hash_ + probe * step) % size for probe in range(BLOOM_FILTER_PROBES)]
+
+    def add(self, hash_: int) -> None:
+        """Add a hash to the filter."""
+        bits = self._bits
+        for position in self._positions(hash_):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, hash_: int) -> bool:
+        """Return if the hash may be in the table."""
+        bits = self._bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(hash_)
+        )
+
+
+def seed_id_cache(
+    session: Session,
+    cache: MutableMapping[str, int],
+    size: int,
+    recent_ids: Iterable[int],
+    find_shared_by_ids: Callable[[list[int]], StatementLambdaElement],
+) -> None:
+    """Seed an id cache with the most recently used ids.
+
+    The ids are loaded least recent first so the most recent ones are
+    the last to be evicted. Ids that are already cached are kept as is.
+    """
+    ids: list[int] = list(dict.fromkeys(recent_ids))[:size]
+    shared_by_id: dict[int, str] = {}
+    for start in range(0, len(ids), MAX_ROWS_TO_PURGE):
+        chunk = ids[start : start + MAX_ROWS_TO_PURGE]
+        for shared, id_ in session.execute(find_shared_by_ids(chunk)):
+            shared_by_id[id_] = shared
+    for id_ in reversed(ids):
+        if (shared := shared_by_id.get(id_)) is not None and shared not in cache:
+            cache[shared] = id_
+
+
+def load_hash_bloom_filter(
+    session: Session,
+    max_id_stmt: StatementLambdaElement,
+    hashes_stmt: StatementLambdaElement,
+) -> HashBloomFilter:
+    """Load the hashes of a table into a bloom filter."""
+    bloom_filter = HashBloomFilter(session.execute(max_id_stmt).scalar() or 0)
+    for hash_ in session.execute(hashes_stmt).scalars():
+        if hash_ is not None:
+            bloom_filter.add(hash_)
+    return bloom_filter
@@ -1,9 +1,11 @@
 """Schema migration helpers."""
+from __future__ import annotations
+
 from collections.abc import Callable, Iterable
 import contextlib
 from datetime import timedelta
 import logging
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 import sqlalchemy
 from sqlalchemy import ForeignKeyConstraint, MetaData, Table, func, text
@@ -21,18 +23,36 @@ from sqlalchemy.sql.expression import true
 
 from homeassistant.core import HomeAssistant
 
-from .const import SupportedDialect
+from .const import MAX_ROWS_TO_MIGRATE, SupportedDialect
 from .db_schema import (
+    CONTEXT_ID_BIN_MAX_LENGTH,
+    LEGACY_ID_INDEXES,
     SCHEMA_VERSION,
     TABLE_STATES,
     Base,
+    Events,
+    EventTypes,
     SchemaChanges,
+    States,
+    StatesMeta,
     Statistics,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
 )
 from .models import process_timestamp
+from .queries import (
+    clear_legacy_id_columns_from_events,
+    clear_legacy_id_columns_from_states,
+    find_event_type_ids,
+    find_events_to_migrate_ids,
+    find_events_with_legacy_id_columns,
+    find_states_metadata_ids,
+    find_states_to_migrate_ids,
+    find_states_with_legacy_id_columns,
+)
 from .statistics import (
     delete_statistics_duplicates,
     delete_statistics_meta_duplicates,
@@ -40,6 +60,9 @@ from .statistics import (
 )
 from .util import session_scope
 
+if TYPE_CHECKING:
+    from .core import Recorder
+
 LIVE_MIGRATION_MIN_SCHEMA_VERSION = 0
 
 _LOGGER = logging.getLogger(__name__)
@@ -427,6 +450,12 @@ def _apply_update(  # noqa: C901
     """Perform operations to bring schema up to date."""
     dialect = engine.dialect.name
     big_int = "INTEGER(20)" if dialect == SupportedDialect.MYSQL else "INTEGER"
+    if dialect == SupportedDialect.MYSQL:
+        context_bin_type = f"VARBINARY({CONTEXT_ID_BIN_MAX_LENGTH})"
+    elif dialect == SupportedDialect.POSTGRESQL:
+        context_bin_type = "BYTEA"
+    else:
+        context_bin_type = "BLOB"
 
     if new_version == 1:
         _create_index(session_maker, "events", "ix_events_time_fired")
@@ -766,6 +795,29 @@ def _apply_update(  # noqa: C901
                     },
                     synchronize_session=False,
                 )
+    elif new_version == 31:
+        # The ids and binary context ids of the existing rows are filled in
+        # by NormalizedIDsMigrationTask after the schema migration is done
+        context_columns = [
+            f"context_id_bin {context_bin_type}",
+            f"context_user_id_bin {context_bin_type}",
+            f"context_parent_id_bin {context_bin_type}",
+        ]
+        _add_columns(
+            session_maker, "events", [f"event_type_id {big_int}", *context_columns]
+        )
+        _add_columns(
+            session_maker, "states", [f"metadata_id {big_int}", *context_columns]
+        )
+        _create_index(session_maker, "events", "ix_events_event_type_id_time_fired")
+        _create_index(session_maker, "events", "ix_events_context_id_bin")
+        _create_index(session_maker, "states", "ix_states_metadata_id_last_updated")
+        _create_index(session_maker, "states", "ix_states_context_id_bin")
+    elif new_version == 32:
+        # The existing hourly statistics are compiled into the new tables
+        # by PeriodStatisticsBackfillTask after the schema migration is done
+        StatisticsDaily.__table__.create(engine, checkfirst=True)
+        StatisticsMonthly.__table__.create(engine, checkfirst=True)
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
@@ -793,3 +845,144 @@ def _inspect_schema_version(session: Session) -> int:
     current_version = SchemaChanges(schema_version=0)
     session.add(current_version)
     return cast(int, current_version.schema_version)
+
+
+def normalized_ids_need_migration(session: Session) -> bool:
+    """Check if there are events or states without normalized ids."""
+    return bool(
+        session.execute(find_events_to_migrate_ids()).first()
+        or session.execute(find_states_to_migrate_ids()).first()
+    )
+
+
+def migrate_normalized_ids(instance: Recorder) -> bool:
+    """Migrate a batch of events and states to the normalized ids.
+
+    The legacy columns are left in place so the database can still be read
+    while the migration is in progress. They are cleared by
+    cleanup_legacy_id_columns once the readers have switched over.
+
+    Returns True if all rows have been migrated.
+    """
+    _LOGGER.debug("Migrating a batch of events and states to normalized ids")
+    with session_scope(session=instance.get_session()) as session:
+        if events := session.execute(find_events_to_migrate_ids()).all():
+            event_type_ids = _get_or_create_event_type_ids(
+                session, {event.event_type for event in events}
+            )
+            session.bulk_update_mappings(
+                Events,
+                [
+                    {
+                        "event_id": event.event_id,
+                        "event_type_id": event_type_ids[event.event_type],
+                        "context_id_bin": event.context_id,
+                        "context_user_id_bin": event.context_user_id,
+                        "context_parent_id_bin": event.context_parent_id,
+                    }
+                    for event in events
+                ],
+            )
+        if states := session.execute(find_states_to_migrate_ids()).all():
+            metadata_ids = _get_or_create_states_metadata_ids(
+                session, {state.entity_id for state in states}
+            )
+            session.bulk_update_mappings(
+                States,
+                [
+                    {
+                        "state_id": state.state_id,
+                        "metadata_id": metadata_ids[state.entity_id],
+                        "context_id_bin": state.context_id,
+                        "context_user_id_bin": state.context_user_id,
+                        "context_parent_id_bin": state.context_parent_id,
+                    }
+                    for state in states
+                ],
+            )
+    return len(events) < MAX_ROWS_TO_MIGRATE and len(states) < MAX_ROWS_TO_MIGRATE
+
+
+def _find_legacy_id_indexes(session: Session) -> list[tuple[str, str]]:
+    """Return the table and name of the legacy id indexes that still exist."""
+    inspector = sqlalchemy.inspect(session.connection())
+    return [
+        (table, index["name"])
+        for table, index_names in LEGACY_ID_INDEXES.items()
+        for index in inspector.get_indexes(table)
+        if index["name"] in index_names
+    ]
+
+
+def legacy_id_indexes_exist(session: Session) -> bool:
+    """Check if the indexes on the legacy id columns are still there."""
+    return bool(_find_legacy_id_indexes(session))
+
+
+def cleanup_legacy_id_columns(instance: Recorder) -> bool:
+    """Clear a batch of the legacy columns that were replaced by normalized ids.
+
+    The legacy indexes are used to find the rows to clear, so they are
+    only dropped once every row has been cleared.
+
+    Returns True if there is nothing left to clear.
+    """
+    _LOGGER.debug("Clearing a batch of legacy event and state columns")
+    with session_scope(session=instance.get_session()) as session:
+        event_ids = [
+            event_id
+            for (event_id,) in session.execute(find_events_with_legacy_id_columns())
+        ]
+        if event_ids:
+            session.execute(clear_legacy_id_columns_from_events(event_ids))
+        state_ids = [
+            state_id
+            for (state_id,) in session.execute(find_states_with_legacy_id_columns())
+        ]
+        if state_ids:
+            session.execute(clear_legacy_id_columns_from_states(state_ids))
+    if len(event_ids) == MAX_ROWS_TO_MIGRATE or len(state_ids) == MAX_ROWS_TO_MIGRATE:
+        return False
+    with session_scope(session=instance.get_session()) as session:
+        legacy_indexes = _find_legacy_id_indexes(session)
+    for table, index_name in legacy_indexes:
+        _drop_index(instance.get_session, table, index_name)
+    return True
+
+
+def _get_or_create_event_type_ids(
+    session: Session, event_types: set[str]
+) -> dict[str, int]:
+    """Return the event_type_ids for event_types, creating missing ones."""
+    event_type_ids: dict[str, int] = dict(
+        session.execute(find_event_type_ids(event_types)).all()
+    )
+    if missing := [
+        EventTypes(event_type=event_type)
+        for event_type in event_types
+        if event_type not in event_type_ids
+    ]:
+        session.add_all(missing)
+        session.flush()
+        for db_event_type in missing:
+            event_type_ids[db_event_type.event_type] = db_event_type.event_type_id
+    return event_type_ids
+
+
+def _get_or_create_states_metadata_ids(
+    session: Session, entity_ids: set[str]
+) -> dict[str, int]:
+    """Return the metadata_ids for entity_ids, creating missing ones."""
+    metadata_ids: dict[str, int] = dict(
+        session.execute(find_states_metadata_ids(entity_ids)).all()
+    )
+    if missing := [
+        StatesMeta(entity_id=entity_id)
+        for entity_id in entity_ids
+        if entity_id not in metadata_ids
+    ]:
+        session.add_all(missing)
+        session.flush()
+        for db_states_meta in missing:
+            metadata_ids[db_states_meta.entity_id] = db_states_meta.metadata_id
+    return metadata_ids
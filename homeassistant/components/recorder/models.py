@@ -1,6 +1,8 @@
 """Models for Recorder."""
 from __future__ import annotations
 
+from collections.abc import Callable
+from contextlib import suppress
 from datetime import datetime
 import logging
 from typing import Any, TypedDict, overload
@@ -16,6 +18,7 @@ from homeassistant.components.websocket_api import (
 from homeassistant.core import Context, State
 from homeassistant.helpers.json import json_loads
 import homeassistant.util.dt as dt_util
+from homeassistant.util.ulid import bytes_to_ulid, ulid_to_bytes
 
 # pylint: disable=invalid-name
 
@@ -121,6 +124,63 @@ def process_datetime_to_timestamp(ts: datetime) -> float:
     return ts.timestamp()
 
 
+def _compact_id_to_bytes(
+    value: str | None,
+    to_bytes: Callable[[str], bytes],
+    from_bytes: Callable[[bytes], str],
+) -> bytes | None:
+    """Convert an id to bytes, using the 16 byte compact form when it round trips.
+
+    Any other id is stored utf-8 encoded. Encoded ids that happen to be 16
+    bytes long are padded with a NUL byte so they can not be mistaken for
+    the compact form. NUL characters can not be stored in the legacy string
+    columns either, so the padding is never ambiguous.
+    """
+    if value is None:
+        return None
+    with suppress(ValueError):
+        compact = to_bytes(value)
+        if len(compact) == 16 and from_bytes(compact) == value:
+            return compact
+    encoded = value.encode("utf-8")
+    if len(encoded) == 16:
+        return encoded + b"\x00"
+    return encoded
+
+
+def _bytes_to_compact_id(
+    value: bytes | None, from_bytes: Callable[[bytes], str]
+) -> str | None:
+    """Convert bytes created by _compact_id_to_bytes back to an id."""
+    if value is None:
+        return None
+    if len(value) == 16:
+        return from_bytes(value)
+    if len(value) == 17 and value[16] == 0:
+        return value[:16].decode("utf-8")
+    return value.decode("utf-8")
+
+
+def context_id_to_bytes(context_id: str | None) -> bytes | None:
+    """Convert a context id or context parent id to bytes for storage."""
+    return _compact_id_to_bytes(context_id, ulid_to_bytes, bytes_to_ulid)
+
+
+def bytes_to_context_id(context_id_bytes: bytes | None) -> str | None:
+    """Convert stored bytes back to a context id or context parent id."""
+    return _bytes_to_compact_id(context_id_bytes, bytes_to_ulid)
+
+
+def user_id_to_bytes(user_id: str | None) -> bytes | None:
+    """Convert a context user id to bytes for storage."""
+    return _compact_id_to_bytes(user_id, bytes.fromhex, bytes.hex)
+
+
+def bytes_to_user_id(user_id_bytes: bytes | None) -> str | None:
+    """Convert stored bytes back to a context user id."""
+    return _bytes_to_compact_id(user_id_bytes, bytes.hex)
+
+
 class LazyState(State):
     """A lazy version of core State."""
 
@@ -9,12 +9,13 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.expression import distinct
 
 from homeassistant.const import EVENT_STATE_CHANGED
 
 from .const import MAX_ROWS_TO_PURGE, SupportedDialect
-from .db_schema import Events, StateAttributes, States
+from .db_schema import Events, EventTypes, StateAttributes, States, StatesMeta
 from .queries import (
     attributes_ids_exist_in_states,
     attributes_ids_exist_in_states_sqlite,
@@ -460,9 +461,7 @@ def _evict_purged_states_from_old_states_cache(
     # Make a map from old_state_id to entity_id
     old_states = instance._old_states  # pylint: disable=protected-access
     old_state_reversed = {
-        old_state.state_id: entity_id
-        for entity_id, old_state in old_states.items()
-        if old_state.state_id
+        old_state_id: entity_id for entity_id, old_state_id in old_states.items()
     }
 
     # Evict any purged state from the old states cache
@@ -571,6 +570,9 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
     _LOGGER.debug("Cleanup filtered data")
     using_sqlite = instance.dialect_name == SupportedDialect.SQLITE
 
+    if instance.normalized_ids_active:
+        return _purge_filtered_normalized_data(instance, session, using_sqlite)
+
     # Check if excluded entity_ids are in database
     excluded_entity_ids: list[str] = [
         entity_id
@@ -578,7 +580,9 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
         if not instance.entity_filter(entity_id)
     ]
     if len(excluded_entity_ids) > 0:
-        _purge_filtered_states(instance, session, excluded_entity_ids, using_sqlite)
+        _purge_filtered_states(
+            instance, session, States.entity_id.in_(excluded_entity_ids), using_sqlite
+        )
         return False
 
     # Check if excluded event_types are in database
@@ -588,7 +592,56 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
         if event_type in instance.exclude_t
     ]
     if len(excluded_event_types) > 0:
-        _purge_filtered_events(instance, session, excluded_event_types)
+        _purge_filtered_events(
+            instance,
+            session,
+            Events.event_type.in_(excluded_event_types),
+            excluded_event_types,
+        )
+        return False
+
+    return True
+
+
+def _purge_filtered_normalized_data(
+    instance: Recorder, session: Session, using_sqlite: bool
+) -> bool:
+    """Remove filtered states and events once the ids have been normalized.
+
+    The states_meta and event_types tables are scanned instead of
+    a distinct over the states and events tables. Since the lookup rows
+    are kept after the states or events are gone, the filter is
+    finished when there are no matching rows left.
+    """
+    excluded_metadata_ids: list[int] = [
+        metadata_id
+        for (metadata_id, entity_id) in session.query(
+            StatesMeta.metadata_id, StatesMeta.entity_id
+        ).all()
+        if not instance.entity_filter(entity_id)
+    ]
+    if excluded_metadata_ids and _purge_filtered_states(
+        instance,
+        session,
+        States.metadata_id.in_(excluded_metadata_ids),
+        using_sqlite,
+    ):
+        return False
+
+    excluded_event_types: list[str] = []
+    excluded_event_type_ids: list[int] = []
+    for event_type_id, event_type in session.query(
+        EventTypes.event_type_id, EventTypes.event_type
+    ).all():
+        if event_type in instance.exclude_t:
+            excluded_event_types.append(event_type)
+            excluded_event_type_ids.append(event_type_id)
+    if excluded_event_type_ids and _purge_filtered_events(
+        instance,
+        session,
+        Events.event_type_id.in_(excluded_event_type_ids),
+        excluded_event_types,
+    ):
         return False
 
     return True
@@ -597,21 +650,24 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
 def _purge_filtered_states(
     instance: Recorder,
     session: Session,
-    excluded_entity_ids: list[str],
+    states_filter: ColumnElement,
     using_sqlite: bool,
-) -> None:
-    """Remove filtered states and linked events."""
+) -> bool:
+    """Remove filtered states and linked events.
+
+    Returns True if any states were removed.
+    """
     state_ids: list[int]
     attributes_ids: list[int]
     event_ids: list[int]
-    state_ids, attributes_ids, event_ids = zip(
-        *(
-            session.query(States.state_id, States.attributes_id, States.event_id)
-            .filter(States.entity_id.in_(excluded_entity_ids))
-            .limit(MAX_ROWS_TO_PURGE)
-            .all()
-        )
-    )
+    if not (
+        rows := session.query(States.state_id, States.attributes_id, States.event_id)
+        .filter(states_filter)
+        .limit(MAX_ROWS_TO_PURGE)
+        .all()
+    ):
+        return False
+    state_ids, attributes_ids, event_ids = zip(*rows)
     event_ids = [id_ for id_ in event_ids if id_ is not None]
     _LOGGER.debug(
         "Selected %s state_ids to remove that should be filtered", len(state_ids)
@@ -622,21 +678,28 @@ def _purge_filtered_states(
         session, {id_ for id_ in attributes_ids if id_ is not None}, using_sqlite
     )
     _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
+    return True
 
 
 def _purge_filtered_events(
-    instance: Recorder, session: Session, excluded_event_types: list[str]
-) -> None:
-    """Remove filtered events and linked states."""
+    instance: Recorder,
+    session: Session,
+    events_filter: ColumnElement,
+    excluded_event_types: list[str],
+) -> bool:
+    """Remove filtered events and linked states.
+
+    Returns True if any events were removed.
+    """
     using_sqlite = instance.dialect_name == SupportedDialect.SQLITE
-    event_ids, data_ids = zip(
-        *(
-            session.query(Events.event_id, Events.data_id)
-            .filter(Events.event_type.in_(excluded_event_types))
-            .limit(MAX_ROWS_TO_PURGE)
-            .all()
-        )
-    )
+    if not (
+        rows := session.query(Events.event_id, Events.data_id)
+        .filter(events_filter)
+        .limit(MAX_ROWS_TO_PURGE)
+        .all()
+    ):
+        return False
+    event_ids, data_ids = zip(*rows)
     _LOGGER.debug(
         "Selected %s event_ids to remove that should be filtered", len(event_ids)
     )
@@ -652,7 +715,8 @@ def _purge_filtered_events(
         _purge_batch_data_ids(instance, session, unused_data_ids_set)
     if EVENT_STATE_CHANGED in excluded_event_types:
         session.query(StateAttributes).delete(synchronize_session=False)
-        instance._state_attributes_ids = {}  # pylint: disable=protected-access
+        instance._state_attributes_ids.clear()  # pylint: disable=protected-access
+    return True
 
 
 @retryable_database_job("purge")
@@ -660,6 +724,26 @@ def purge_entity_data(instance: Recorder, entity_filter: Callable[[str], bool])
     """Purge states and events of specified entities."""
     using_sqlite = instance.dialect_name == SupportedDialect.SQLITE
     with session_scope(session=instance.get_session()) as session:
+        if instance.normalized_ids_active:
+            selected_metadata_ids: list[int] = [
+                metadata_id
+                for (metadata_id, entity_id) in session.query(
+                    StatesMeta.metadata_id, StatesMeta.entity_id
+                ).all()
+                if entity_filter(entity_id)
+            ]
+            _LOGGER.debug("Purging entity data for %s", selected_metadata_ids)
+            # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
+            if selected_metadata_ids and _purge_filtered_states(
+                instance,
+                session,
+                States.metadata_id.in_(selected_metadata_ids),
+                using_sqlite,
+            ):
+                _LOGGER.debug("Purging entity data hasn't fully completed yet")
+                return False
+            return True
+
         selected_entity_ids: list[str] = [
             entity_id
             for (entity_id,) in session.query(distinct(States.entity_id)).all()
@@ -668,7 +752,12 @@ def purge_entity_data(instance: Recorder, entity_filter: Callable[[str], bool])
         _LOGGER.debug("Purging entity data for %s", selected_entity_ids)
         if len(selected_entity_ids) > 0:
             # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
-            _purge_filtered_states(instance, session, selected_entity_ids, using_sqlite)
+            _purge_filtered_states(
+                instance,
+                session,
+                States.entity_id.in_(selected_entity_ids),
+                using_sqlite,
+            )
             _LOGGER.debug("Purging entity data hasn't fully completed yet")
             return False
 
@@ -8,13 +8,15 @@ from sqlalchemy import delete, distinct, func, lambda_stmt, select, union_all, u
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
-from .const import MAX_ROWS_TO_PURGE
+from .const import MAX_ROWS_TO_MIGRATE, MAX_ROWS_TO_PURGE
 from .db_schema import (
     EventData,
     Events,
+    EventTypes,
     RecorderRuns,
     StateAttributes,
     States,
+    StatesMeta,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -40,6 +42,123 @@ def find_shared_data_id(attr_hash: int, shared_data: str) -> StatementLambdaElem
     )
 
 
+def find_event_type_id(event_type: str) -> StatementLambdaElement:
+    """Find an event_type_id by event_type."""
+    return lambda_stmt(
+        lambda: select(EventTypes.event_type_id).filter(
+            EventTypes.event_type == event_type
+        )
+    )
+
+
+def find_states_metadata_id(entity_id: str) -> StatementLambdaElement:
+    """Find a metadata_id by entity_id."""
+    return lambda_stmt(
+        lambda: select(StatesMeta.metadata_id).filter(StatesMeta.entity_id == entity_id)
+    )
+
+
+def find_event_type_ids(event_types: Iterable[str]) -> StatementLambdaElement:
+    """Find event_type_ids for a list of event_types."""
+    return lambda_stmt(
+        lambda: select(EventTypes.event_type, EventTypes.event_type_id).filter(
+            EventTypes.event_type.in_(event_types)
+        )
+    )
+
+
+def find_states_metadata_ids(entity_ids: Iterable[str]) -> StatementLambdaElement:
+    """Find metadata_ids for a list of entity_ids."""
+    return lambda_stmt(
+        lambda: select(StatesMeta.entity_id, StatesMeta.metadata_id).filter(
+            StatesMeta.entity_id.in_(entity_ids)
+        )
+    )
+
+
+def find_max_state_id() -> StatementLambdaElement:
+    """Find the highest state_id."""
+    return lambda_stmt(lambda: select(func.max(States.state_id)))
+
+
+def find_entity_ids_inserted_after(state_id: int) -> StatementLambdaElement:
+    """Find the entity_id and state_id of states inserted after state_id."""
+    return lambda_stmt(
+        lambda: select(States.entity_id, States.state_id).filter(
+            States.state_id > state_id
+        )
+    )
+
+
+def find_metadata_ids_inserted_after(state_id: int) -> StatementLambdaElement:
+    """Find the metadata_id and state_id of states inserted after state_id."""
+    return lambda_stmt(
+        lambda: select(States.metadata_id, States.state_id).filter(
+            States.state_id > state_id
+        )
+    )
+
+
+def find_recent_attributes_ids(limit: int) -> StatementLambdaElement:
+    """Find the attributes_ids of the most recent states."""
+    return lambda_stmt(
+        lambda: select(States.attributes_id)
+        .filter(States.attributes_id.isnot(None))
+        .order_by(States.state_id.desc())
+        .limit(limit)
+    )
+
+
+def find_recent_data_ids(limit: int) -> StatementLambdaElement:
+    """Find the data_ids of the most recent events."""
+    return lambda_stmt(
+        lambda: select(Events.data_id)
+        .filter(Events.data_id.isnot(None))
+        .order_by(Events.event_id.desc())
+        .limit(limit)
+    )
+
+
+def find_shared_attributes_by_ids(
+    attributes_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Find the shared_attrs and attributes_id for a list of attributes_ids."""
+    return lambda_stmt(
+        lambda: select(
+            StateAttributes.shared_attrs, StateAttributes.attributes_id
+        ).filter(StateAttributes.attributes_id.in_(attributes_ids))
+    )
+
+
+def find_shared_data_by_ids(data_ids: Iterable[int]) -> StatementLambdaElement:
+    """Find the shared_data and data_id for a list of data_ids."""
+    return lambda_stmt(
+        lambda: select(EventData.shared_data, EventData.data_id).filter(
+            EventData.data_id.in_(data_ids)
+        )
+    )
+
+
+def find_max_attributes_id() -> StatementLambdaElement:
+    """Find the highest attributes_id."""
+    return lambda_stmt(lambda: select(func.max(StateAttributes.attributes_id)))
+
+
+def find_max_data_id() -> StatementLambdaElement:
+    """Find the highest data_id."""
+    return lambda_stmt(lambda: select(func.max(EventData.data_id)))
+
+
+def find_state_attributes_hashes() -> StatementLambdaElement:
+    """Find the hashes of all state attributes."""
+    return lambda_stmt(lambda: select(StateAttributes.hash))
+
+
+def find_event_data_hashes() -> StatementLambdaElement:
+    """Find the hashes of all event data."""
+    return lambda_stmt(lambda: select(EventData.hash))
+
+
 def _state_attrs_exist(attr: int | None) -> Select:
     """Check if a state attributes id exists in the states table."""
     return select(func.min(States.attributes_id)).where(States.attributes_id == attr)
@@ -640,3 +759,89 @@ def find_legacy_event_state_and_attributes_and_data_ids_to_purge(
 def find_legacy_row() -> StatementLambdaElement:
     """Check if there are still states in the table with an event_id."""
     return lambda_stmt(lambda: select(func.max(States.event_id)))
+
+
+def find_events_to_migrate_ids() -> StatementLambdaElement:
+    """Find events that do not have an event_type_id yet."""
+    return lambda_stmt(
+        lambda: select(
+            Events.event_id,
+            Events.event_type,
+            Events.context_id,
+            Events.context_user_id,
+            Events.context_parent_id,
+        )
+        .filter(Events.event_type_id.is_(None))
+        .filter(Events.event_type.is_not(None))
+        .limit(MAX_ROWS_TO_MIGRATE)
+    )
+
+
+def find_states_to_migrate_ids() -> StatementLambdaElement:
+    """Find states that do not have a metadata_id yet."""
+    return lambda_stmt(
+        lambda: select(
+            States.state_id,
+            States.entity_id,
+            States.context_id,
+            States.context_user_id,
+            States.context_parent_id,
+        )
+        .filter(States.metadata_id.is_(None))
+        .filter(States.entity_id.is_not(None))
+        .limit(MAX_ROWS_TO_MIGRATE)
+    )
+
+
+def find_events_with_legacy_id_columns() -> StatementLambdaElement:
+    """Find migrated events that still have the legacy columns set."""
+    return lambda_stmt(
+        lambda: select(Events.event_id)
+        .filter(Events.event_type.is_not(None))
+        .filter(Events.event_type_id.is_not(None))
+        .limit(MAX_ROWS_TO_MIGRATE)
+    )
+
+
+def find_states_with_legacy_id_columns() -> StatementLambdaElement:
+    """Find migrated states that still have the legacy columns set."""
+    return lambda_stmt(
+        lambda: select(States.state_id)
+        .filter(States.entity_id.is_not(None))
+        .filter(States.metadata_id.is_not(None))
+        .limit(MAX_ROWS_TO_MIGRATE)
+    )
+
+
+def clear_legacy_id_columns_from_events(
+    event_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Clear the legacy columns replaced by the normalized ids from events."""
+    return lambda_stmt(
+        lambda: update(Events)
+        .where(Events.event_id.in_(event_ids))
+        .values(
+            event_type=None,
+            context_id=None,
+            context_user_id=None,
+            context_parent_id=None,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def clear_legacy_id_columns_from_states(
+    state_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Clear the legacy columns replaced by the normalized ids from states."""
+    return lambda_stmt(
+        lambda: update(States)
+        .where(States.state_id.in_(state_ids))
+        .values(
+            entity_id=None,
+            context_id=None,
+            context_user_id=None,
+            context_parent_id=None,
+        )
+        .execution_options(synchronize_session=False)
+    )
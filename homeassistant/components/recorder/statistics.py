@@ -20,7 +20,7 @@ from sqlalchemy.exc import SQLAlchemyError, StatementError
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import literal_column, true
 from sqlalchemy.sql.lambdas import StatementLambdaElement
-from sqlalchemy.sql.selectable import Subquery
+from sqlalchemy.sql.selectable import Select, Subquery
 import voluptuous as vol
 
 from homeassistant.const import (
@@ -44,8 +44,21 @@ import homeassistant.util.temperature as temperature_util
 from homeassistant.util.unit_system import UnitSystem
 import homeassistant.util.volume as volume_util
 
-from .const import DOMAIN, MAX_ROWS_TO_PURGE, SupportedDialect
-from .db_schema import Statistics, StatisticsMeta, StatisticsRuns, StatisticsShortTerm
+from .const import (
+    DOMAIN,
+    EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
+    EVENT_RECORDER_STATISTICS_UPDATED,
+    MAX_ROWS_TO_PURGE,
+    SupportedDialect,
+)
+from .db_schema import (
+    Statistics,
+    StatisticsDaily,
+    StatisticsMeta,
+    StatisticsMonthly,
+    StatisticsRuns,
+    StatisticsShortTerm,
+)
 from .models import (
     StatisticData,
     StatisticMetaData,
@@ -86,6 +99,28 @@ QUERY_STATISTICS_SHORT_TERM = [
     StatisticsShortTerm.sum,
 ]
 
+QUERY_STATISTICS_DAILY = [
+    StatisticsDaily.metadata_id,
+    StatisticsDaily.start,
+    StatisticsDaily.mean,
+    StatisticsDaily.min,
+    StatisticsDaily.max,
+    StatisticsDaily.last_reset,
+    StatisticsDaily.state,
+    StatisticsDaily.sum,
+]
+
+QUERY_STATISTICS_MONTHLY = [
+    StatisticsMonthly.metadata_id,
+    StatisticsMonthly.start,
+    StatisticsMonthly.mean,
+    StatisticsMonthly.min,
+    StatisticsMonthly.max,
+    StatisticsMonthly.last_reset,
+    StatisticsMonthly.state,
+    StatisticsMonthly.sum,
+]
+
 QUERY_STATISTICS_SUMMARY_MEAN = [
     StatisticsShortTerm.metadata_id,
     func.avg(StatisticsShortTerm.mean),
@@ -114,6 +149,27 @@ QUERY_STATISTICS_SUMMARY_SUM_LEGACY = [
     StatisticsShortTerm.sum,
 ]
 
+QUERY_STATISTICS_PERIOD_SUMMARY_MEAN = [
+    Statistics.metadata_id,
+    func.avg(Statistics.mean),
+    func.min(Statistics.min),
+    func.max(Statistics.max),
+]
+
+QUERY_STATISTICS_PERIOD_SUMMARY_SUM = [
+    Statistics.metadata_id,
+    Statistics.start,
+    Statistics.last_reset,
+    Statistics.state,
+    Statistics.sum,
+    func.row_number()
+    .over(
+        partition_by=Statistics.metadata_id,
+        order_by=Statistics.start.desc(),
+    )
+    .label("rownum"),
+]
+
 QUERY_STATISTIC_META = [
     StatisticsMeta.id,
     StatisticsMeta.statistic_id,
@@ -189,6 +245,10 @@ DISPLAY_UNIT_TO_STATISTIC_UNIT_CONVERSIONS: dict[
 
 _LOGGER = logging.getLogger(__name__)
 
+# The number of periods compiled by each daily and monthly statistics backfill task
+PERIOD_STATISTICS_BACKFILL_DAYS = 31
+PERIOD_STATISTICS_BACKFILL_MONTHS = 12
+
 
 @dataclasses.dataclass
 class PlatformCompiledStatistics:
@@ -598,6 +658,198 @@ def compile_hourly_statistics(
     for metadata_id, stat in summary.items():
         session.add(Statistics.from_stats(metadata_id, stat))
 
+    # Keep the daily and monthly statistics of the hour up to date
+    if summary:
+        _compile_period_statistics_for_hours(
+            instance, session, [start_time], list(summary)
+        )
+
+
+def _compile_period_statistics_summary_mean_stmt(
+    start_time: datetime, end_time: datetime, metadata_ids: list[int] | None
+) -> StatementLambdaElement:
+    """Generate the summary mean statement for daily or monthly statistics."""
+    stmt = lambda_stmt(
+        lambda: select(*QUERY_STATISTICS_PERIOD_SUMMARY_MEAN)
+        .filter(Statistics.start >= start_time)
+        .filter(Statistics.start < end_time)
+    )
+    if metadata_ids:
+        stmt += lambda q: q.filter(Statistics.metadata_id.in_(metadata_ids))
+    stmt += lambda q: q.group_by(Statistics.metadata_id).order_by(
+        Statistics.metadata_id
+    )
+    return stmt
+
+
+def _compile_period_statistics_summary_sum_stmt(
+    start_time: datetime, end_time: datetime, metadata_ids: list[int] | None
+) -> Select:
+    """Generate the summary sum statement for daily or monthly statistics."""
+    subquery = (
+        select(*QUERY_STATISTICS_PERIOD_SUMMARY_SUM)
+        .filter(Statistics.start >= start_time)
+        .filter(Statistics.start < end_time)
+    )
+    if metadata_ids:
+        subquery = subquery.filter(Statistics.metadata_id.in_(metadata_ids))
+    summary = subquery.subquery()
+    return select(summary).filter(summary.c.rownum == 1).order_by(summary.c.metadata_id)
+
+
+def _compile_period_statistics(
+    session: Session,
+    table: type[StatisticsDaily | StatisticsMonthly],
+    start_time: datetime,
+    end_time: datetime,
+    metadata_ids: list[int] | None = None,
+) -> None:
+    """Compile daily or monthly statistics.
+
+    This will summarize hourly statistics for one period the same way
+    hourly statistics summarize 5-minute statistics. The period is
+    replaced, so it can be compiled again when the hourly statistics
+    change.
+    """
+    summary: dict[int, StatisticData] = {}
+    stmt = _compile_period_statistics_summary_mean_stmt(
+        start_time, end_time, metadata_ids
+    )
+    for metadata_id, _mean, _min, _max in execute_stmt_lambda_element(session, stmt):
+        summary[metadata_id] = {
+            "start": start_time,
+            "mean": _mean,
+            "min": _min,
+            "max": _max,
+        }
+
+    sum_stmt = _compile_period_statistics_summary_sum_stmt(
+        start_time, end_time, metadata_ids
+    )
+    for metadata_id, _, last_reset, state, _sum, _ in session.execute(sum_stmt):
+        summary.setdefault(metadata_id, {"start": start_time}).update(
+            {
+                "last_reset": process_timestamp(last_reset),
+                "state": state,
+                "sum": _sum,
+            }
+        )
+
+    query = session.query(table).filter(table.start == start_time)
+    if metadata_ids:
+        query = query.filter(table.metadata_id.in_(metadata_ids))
+    query.delete(synchronize_session=False)
+    for metadata_id, stat in summary.items():
+        session.add(table.from_stats(metadata_id, stat))
+
+
+def _period_statistics_tables() -> tuple[
+    tuple[
+        type[StatisticsDaily | StatisticsMonthly],
+        Callable[[datetime], tuple[datetime, datetime]],
+    ],
+    ...,
+]:
+    """Return the compiled period tables with their period boundaries."""
+    return ((StatisticsDaily, day_start_end), (StatisticsMonthly, month_start_end))
+
+
+def _compile_period_statistics_for_hours(
+    instance: Recorder,
+    session: Session,
+    hours: Iterable[datetime],
+    metadata_ids: list[int],
+) -> None:
+    """Compile the daily and monthly statistics of the periods the hours are in.
+
+    Until the backfill is done only the periods it has already passed are
+    compiled, the older periods are left to the backfill.
+    """
+    session.flush()
+    for table, period_start_end in _period_statistics_tables():
+        oldest_compiled: datetime | None = None
+        if not instance.period_statistics_active:
+            if not (oldest := session.query(func.min(table.start)).scalar()):
+                continue
+            oldest_compiled = process_timestamp(oldest)
+        for start, end in sorted({period_start_end(hour) for hour in hours}):
+            if oldest_compiled is None or start >= oldest_compiled:
+                _compile_period_statistics(session, table, start, end, metadata_ids)
+
+
+def _clear_period_statistics_of_other_time_zone(session: Session) -> None:
+    """Clear the daily and monthly statistics if the time zone has changed."""
+    for table, period_start_end in _period_statistics_tables():
+        oldest, newest = session.query(
+            func.min(table.start), func.max(table.start)
+        ).one()
+        if oldest is None:
+            continue
+        oldest = process_timestamp(oldest)
+        newest = process_timestamp(newest)
+        # Periods compiled before and after the change are not aligned alike
+        if (
+            period_start_end(oldest)[0] == oldest
+            and period_start_end(newest)[0] == newest
+        ):
+            continue
+        _LOGGER.info(
+            "The time zone has changed, compiling daily and monthly statistics again"
+        )
+        session.query(StatisticsDaily).delete(synchronize_session=False)
+        session.query(StatisticsMonthly).delete(synchronize_session=False)
+        return
+
+
+def _backfill_period_statistics(
+    session: Session,
+    table: type[StatisticsDaily | StatisticsMonthly],
+    period_start_end: Callable[[datetime], tuple[datetime, datetime]],
+    max_periods: int,
+) -> bool:
+    """Compile the periods before the oldest compiled period.
+
+    Returns True if there are no hourly statistics left before it.
+    """
+    if oldest := session.query(func.min(table.start)).scalar():
+        before: datetime | None = process_timestamp(oldest)
+    else:
+        before = None
+    for _ in range(max_periods):
+        query = session.query(func.max(Statistics.start))
+        if before is not None:
+            query = query.filter(Statistics.start < before)
+        if not (newest_hour := query.scalar()):
+            return True
+        # Periods without hourly statistics are skipped
+        start, end = period_start_end(process_timestamp(newest_hour))
+        _compile_period_statistics(session, table, start, end)
+        before = start
+    return False
+
+
+@retryable_database_job("backfill period statistics")
+def backfill_period_statistics(instance: Recorder) -> bool:
+    """Compile a batch of daily and monthly statistics from hourly statistics.
+
+    The batches work backwards from the oldest compiled period, newer
+    periods are compiled along with the hourly statistics.
+
+    Returns True if all periods are compiled.
+    """
+    with session_scope(session=instance.get_session()) as session:
+        _clear_period_statistics_of_other_time_zone(session)
+        days_done = _backfill_period_statistics(
+            session, StatisticsDaily, day_start_end, PERIOD_STATISTICS_BACKFILL_DAYS
+        )
+        months_done = _backfill_period_statistics(
+            session,
+            StatisticsMonthly,
+            month_start_end,
+            PERIOD_STATISTICS_BACKFILL_MONTHS,
+        )
+    return days_done and months_done
+
 
 @retryable_database_job("statistics")
 def compile_statistics(instance: Recorder, start: datetime) -> bool:
@@ -656,12 +908,15 @@ def compile_statistics(instance: Recorder, start: datetime) -> bool:
 
         session.add(StatisticsRuns(start=start))
 
+    if start.minute == 55:
+        instance.hass.bus.fire(EVENT_RECORDER_HOURLY_STATISTICS_GENERATED)
+
     return True
 
 
 def _adjust_sum_statistics(
     session: Session,
-    table: type[Statistics | StatisticsShortTerm],
+    table: type[Statistics | StatisticsShortTerm | StatisticsDaily | StatisticsMonthly],
     metadata_id: int,
     start_time: datetime,
     adj: float,
@@ -936,7 +1191,11 @@ def _reduce_statistics(
     period_start_end: Callable[[datetime], tuple[datetime, datetime]],
     period: timedelta,
 ) -> dict[str, list[dict[str, Any]]]:
-    """Reduce hourly statistics to daily or monthly statistics."""
+    """Reduce hourly statistics to daily or monthly statistics.
+
+    The start, end and last_reset of the reduced statistics are datetimes,
+    they are formatted by the caller.
+    """
     result: dict[str, list[dict[str, Any]]] = defaultdict(list)
     for statistic_id, stat_list in stats.items():
         max_values: list[float] = []
@@ -954,8 +1213,8 @@ def _reduce_statistics(
                 result[statistic_id].append(
                     {
                         "statistic_id": statistic_id,
-                        "start": start.isoformat(),
-                        "end": end.isoformat(),
+                        "start": start,
+                        "end": end,
                         "mean": mean(mean_values) if mean_values else None,
                         "min": min(min_values) if min_values else None,
                         "max": max(max_values) if max_values else None,
@@ -1072,6 +1331,53 @@ def _statistics_during_period_stmt_short_term(
     return stmt
 
 
+def _period_statistics_during_period_stmt(
+    table: type[StatisticsDaily | StatisticsMonthly],
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata_ids: list[int] | None,
+) -> StatementLambdaElement:
+    """Prepare a database query for daily or monthly statistics during a given period.
+
+    This prepares a lambda_stmt query, so we don't insert the parameters yet.
+    """
+    columns = (
+        QUERY_STATISTICS_DAILY if table == StatisticsDaily else QUERY_STATISTICS_MONTHLY
+    )
+    stmt = lambda_stmt(
+        lambda: select(*columns).filter(table.start >= start_time), track_on=[table]
+    )
+    if end_time is not None:
+        stmt += lambda q: q.filter(table.start < end_time)
+    if metadata_ids:
+        stmt += lambda q: q.filter(table.metadata_id.in_(metadata_ids))
+    stmt += lambda q: q.order_by(table.metadata_id, table.start)
+    return stmt
+
+
+def _period_statistics_table(
+    hass: HomeAssistant,
+    period: Literal["5minute", "day", "hour", "month"],
+    start_time: datetime,
+    end_time: datetime | None,
+) -> type[StatisticsDaily | StatisticsMonthly] | None:
+    """Return the table with the compiled statistics of the period.
+
+    The compiled statistics can be used once they have been backfilled and
+    when the requested time span starts and ends on period boundaries,
+    otherwise the hourly statistics need to be reduced.
+    """
+    if period not in ("day", "month"):
+        return None
+    if not get_instance(hass).period_statistics_active:
+        return None
+    table, period_start_end = _period_statistics_tables()[period == "month"]
+    for time in (start_time, end_time):
+        if time is not None and period_start_end(time)[0] != time:
+            return None
+    return table
+
+
 def statistics_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -1085,6 +1391,39 @@ def statistics_during_period(
     If end_time is omitted, returns statistics newer than or equal to start_time.
     If statistic_ids is omitted, returns statistics for all statistics ids.
     """
+    return _statistics_during_period(
+        hass, start_time, end_time, statistic_ids, period, start_time_as_datetime
+    )
+
+
+def compact_statistics_during_period(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    statistic_ids: list[str] | None = None,
+    period: Literal["5minute", "day", "hour", "month"] = "hour",
+) -> dict[str, dict[str, list[Any]]]:
+    """Return statistics during UTC period start_time - end_time as columns.
+
+    Like statistics_during_period, but each statistic is returned as a dict
+    of parallel lists instead of a list of dicts, and start, end and
+    last_reset are returned as UNIX timestamps.
+    """
+    return _statistics_during_period(
+        hass, start_time, end_time, statistic_ids, period, compact=True
+    )
+
+
+def _statistics_during_period(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: list[str] | None,
+    period: Literal["5minute", "day", "hour", "month"],
+    start_time_as_datetime: bool = False,
+    compact: bool = False,
+) -> dict[str, Any]:
+    """Return statistics during UTC period start_time - end_time for the statistic_ids."""
     metadata = None
     with session_scope(hass=hass) as session:
         # Fetch metadata for the given (or all) statistic_ids
@@ -1096,11 +1435,20 @@ def statistics_during_period(
         if statistic_ids is not None:
             metadata_ids = [metadata_id for metadata_id, _ in metadata.values()]
 
+        table: type[
+            Statistics | StatisticsShortTerm | StatisticsDaily | StatisticsMonthly
+        ]
+        period_table = _period_statistics_table(hass, period, start_time, end_time)
         if period == "5minute":
             table = StatisticsShortTerm
             stmt = _statistics_during_period_stmt_short_term(
                 start_time, end_time, metadata_ids
             )
+        elif period_table:
+            table = period_table
+            stmt = _period_statistics_during_period_stmt(
+                table, start_time, end_time, metadata_ids
+            )
         else:
             table = Statistics
             stmt = _statistics_during_period_stmt(start_time, end_time, metadata_ids)
@@ -1109,7 +1457,7 @@ def statistics_during_period(
         if not stats:
             return {}
         # Return statistics combined with metadata
-        if period not in ("day", "month"):
+        if period_table or period not in ("day", "month"):
             return _sorted_statistics_to_dict(
                 hass,
                 session,
@@ -1120,16 +1468,36 @@ def statistics_during_period(
                 table,
                 start_time,
                 start_time_as_datetime,
+                compact,
             )
 
         result = _sorted_statistics_to_dict(
-            hass, session, stats, statistic_ids, metadata, True, table, start_time, True
+            hass,
+            session,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            start_time,
+            start_time_as_datetime=True,
+            last_reset_as_datetime=True,
         )
 
         if period == "day":
-            return _reduce_statistics_per_day(result)
+            result = _reduce_statistics_per_day(result)
+        else:
+            result = _reduce_statistics_per_month(result)
 
-        return _reduce_statistics_per_month(result)
+        if compact:
+            return {
+                statistic_id: _reduced_statistics_to_columns(stat_list)
+                for statistic_id, stat_list in result.items()
+            }
+        return {
+            statistic_id: _reduced_statistics_to_isoformat(stat_list)
+            for statistic_id, stat_list in result.items()
+        }
 
 
 def _get_last_statistics_stmt(
@@ -1282,13 +1650,17 @@ def get_latest_short_term_statistics(
 def _statistics_at_time(
     session: Session,
     metadata_ids: set[int],
-    table: type[Statistics | StatisticsShortTerm],
+    table: type[Statistics | StatisticsShortTerm | StatisticsDaily | StatisticsMonthly],
     start_time: datetime,
 ) -> list | None:
     """Return last known statistics, earlier than start_time, for the metadata_ids."""
     # Fetch metadata for the given (or all) statistic_ids
     if table == StatisticsShortTerm:
         base_query = QUERY_STATISTICS_SHORT_TERM
+    elif table == StatisticsDaily:
+        base_query = QUERY_STATISTICS_DAILY
+    elif table == StatisticsMonthly:
+        base_query = QUERY_STATISTICS_MONTHLY
     else:
         base_query = QUERY_STATISTICS
 
@@ -1318,12 +1690,23 @@ def _sorted_statistics_to_dict(
     statistic_ids: list[str] | None,
     _metadata: dict[str, tuple[int, StatisticMetaData]],
     convert_units: bool,
-    table: type[Statistics | StatisticsShortTerm],
+    table: type[Statistics | StatisticsShortTerm | StatisticsDaily | StatisticsMonthly],
     start_time: datetime | None,
     start_time_as_datetime: bool = False,
-) -> dict[str, list[dict]]:
-    """Convert SQL results into JSON friendly data structure."""
+    compact: bool = False,
+    last_reset_as_datetime: bool = False,
+) -> dict[str, Any]:
+    """Convert SQL results into JSON friendly data structure.
+
+    If compact is set, the statistics are returned as columns instead of rows.
+    """
     result: dict = defaultdict(list)
+    # Days and months do not have a fixed duration
+    period_start_end: Callable[[datetime], tuple[datetime, datetime]] | None = None
+    if table == StatisticsDaily:
+        period_start_end = day_start_end
+    elif table == StatisticsMonthly:
+        period_start_end = month_start_end
     units = hass.config.units
     metadata = dict(_metadata.values())
     need_stat_at_start_time: set[int] = set()
@@ -1364,10 +1747,21 @@ def _sorted_statistics_to_dict(
             )
         else:
             convert = no_conversion
+        if compact:
+            result[meta_id] = _statistics_to_columns(
+                list(chain(stats_at_start_time.get(meta_id, ()), group)),
+                period_start_end,
+                table.duration,
+                _column_conversion(convert, state_unit, units),
+            )
+            continue
         ent_results = result[meta_id]
         for db_state in chain(stats_at_start_time.get(meta_id, ()), group):
             start = process_timestamp(db_state.start)
-            end = start + table.duration
+            if period_start_end:
+                end = period_start_end(start)[1]
+            else:
+                end = start + table.duration
             ent_results.append(
                 {
                     "statistic_id": statistic_id,
@@ -1376,9 +1770,9 @@ def _sorted_statistics_to_dict(
                     "mean": convert(db_state.mean, state_unit, units),
                     "min": convert(db_state.min, state_unit, units),
                     "max": convert(db_state.max, state_unit, units),
-                    "last_reset": process_timestamp_to_utc_isoformat(
-                        db_state.last_reset
-                    ),
+                    "last_reset": process_timestamp(db_state.last_reset)
+                    if last_reset_as_datetime
+                    else process_timestamp_to_utc_isoformat(db_state.last_reset),
                     "state": convert(db_state.state, state_unit, units),
                     "sum": convert(db_state.sum, state_unit, units),
                 }
@@ -1388,6 +1782,88 @@ def _sorted_statistics_to_dict(
     return {metadata[key]["statistic_id"]: val for key, val in result.items() if val}
 
 
+def _column_conversion(
+    convert: Callable[[Any, Any, Any], float | None],
+    state_unit: str | None,
+    units: UnitSystem,
+) -> Callable[[list[float | None]], list[float | None]]:
+    """Return a function which converts a column of statistics values.
+
+    The unit conversions are linear, the factor and the offset are only
+    calculated once instead of converting value by value.
+    """
+    offset = convert(0.0, state_unit, units)
+    factor = convert(1.0, state_unit, units)
+    if offset is None or factor is None or (offset == 0 and factor == 1):
+        return lambda column: column
+    factor -= offset
+    return lambda column: [
+        None if value is None else value * factor + offset for value in column
+    ]
+
+
+def _statistics_to_columns(
+    rows: list[Row],
+    period_start_end: Callable[[datetime], tuple[datetime, datetime]] | None,
+    duration: timedelta,
+    convert_column: Callable[[list[float | None]], list[float | None]],
+) -> dict[str, list[Any]]:
+    """Convert statistics rows of one statistic into columns."""
+    starts = [process_timestamp(row.start) for row in rows]
+    start_timestamps = [start.timestamp() for start in starts]
+    if period_start_end:
+        end_timestamps = [period_start_end(start)[1].timestamp() for start in starts]
+    else:
+        seconds = duration.total_seconds()
+        end_timestamps = [start + seconds for start in start_timestamps]
+    return {
+        "start": start_timestamps,
+        "end": end_timestamps,
+        "mean": convert_column([row.mean for row in rows]),
+        "min": convert_column([row.min for row in rows]),
+        "max": convert_column([row.max for row in rows]),
+        "last_reset": [
+            None
+            if row.last_reset is None
+            else process_timestamp(row.last_reset).timestamp()
+            for row in rows
+        ],
+        "state": convert_column([row.state for row in rows]),
+        "sum": convert_column([row.sum for row in rows]),
+    }
+
+
+def _reduced_statistics_to_columns(
+    stat_list: list[dict[str, Any]]
+) -> dict[str, list[Any]]:
+    """Convert daily or monthly statistics of one statistic into columns."""
+    return {
+        "start": [stat["start"].timestamp() for stat in stat_list],
+        "end": [stat["end"].timestamp() for stat in stat_list],
+        "mean": [stat["mean"] for stat in stat_list],
+        "min": [stat["min"] for stat in stat_list],
+        "max": [stat["max"] for stat in stat_list],
+        "last_reset": [
+            None if stat["last_reset"] is None else stat["last_reset"].timestamp()
+            for stat in stat_list
+        ],
+        "state": [stat["state"] for stat in stat_list],
+        "sum": [stat["sum"] for stat in stat_list],
+    }
+
+
+def _reduced_statistics_to_isoformat(
+    stat_list: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Format the times of daily or monthly statistics of one statistic."""
+    for stat in stat_list:
+        stat["start"] = stat["start"].isoformat()
+        stat["end"] = stat["end"].isoformat()
+        if stat["last_reset"] is not None:
+            stat["last_reset"] = stat["last_reset"].isoformat()
+    return stat_list
+
+
 def validate_statistics(hass: HomeAssistant) -> dict[str, list[ValidationIssue]]:
     """Validate statistics."""
     platform_validation: dict[str, list[ValidationIssue]] = {}
@@ -1539,14 +2015,18 @@ def import_statistics(
             instance.hass, session, statistic_ids=[metadata["statistic_id"]]
         )
         metadata_id = _update_or_add_metadata(session, metadata, old_metadata_dict)
+        hours: list[datetime] = []
         for stat in statistics:
+            hours.append(stat["start"])
             if stat_id := _statistics_exists(
                 session, Statistics, metadata_id, stat["start"]
             ):
                 _update_statistics(session, Statistics, stat_id, stat)
             else:
                 _insert_statistics(session, Statistics, metadata_id, stat)
+        _compile_period_statistics_for_hours(instance, session, hours, [metadata_id])
 
+    instance.hass.bus.fire(EVENT_RECORDER_STATISTICS_UPDATED)
     return True
 
 
@@ -1588,4 +2068,22 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        # The period of the adjusted hour is compiled again, the sum
+        # of the periods after it is adjusted like the hourly statistics
+        _compile_period_statistics_for_hours(
+            instance,
+            session,
+            [start_time.replace(minute=0)],
+            [metadata[statistic_id][0]],
+        )
+        for table, period_start_end in _period_statistics_tables():
+            _adjust_sum_statistics(
+                session,
+                table,
+                metadata[statistic_id][0],
+                period_start_end(start_time)[1],
+                sum_adjustment,
+            )
+
+    instance.hass.bus.fire(EVENT_RECORDER_STATISTICS_UPDATED)
     return True
@@ -10,6 +10,7 @@ from homeassistant.core import HomeAssistant, callback
 from .. import get_instance
 from ..const import SupportedDialect
 from ..core import Recorder
+from ..id_cache import IDCacheStats
 from ..util import session_scope
 from .mysql import db_size_bytes as mysql_db_size_bytes
 from .postgresql import db_size_bytes as postgresql_db_size_bytes
@@ -54,6 +55,24 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+def _format_hit_rate(stats: IDCacheStats) -> str:
+    """Format the hit rate of an id cache."""
+    if (hit_rate := stats.hit_rate) is None:
+        return "n/a"
+    return f"{hit_rate:.1f} %"
+
+
+@callback
+def _async_get_id_cache_info(instance: Recorder) -> dict[str, Any]:
+    """Get the hit rates of the shared attributes and event data id caches."""
+    return {
+        "state_attributes_cache_hit_rate": _format_hit_rate(
+            instance.state_attributes_cache_stats
+        ),
+        "event_data_cache_hit_rate": _format_hit_rate(instance.event_data_cache_stats),
+    }
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -61,6 +80,7 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     run_history = instance.run_history
     database_name = urlparse(instance.db_url).path.lstrip("/")
     db_engine_info = _async_get_db_engine_info(instance)
+    id_cache_info = _async_get_id_cache_info(instance)
     db_stats: dict[str, Any] = {}
 
     if instance.async_db_ready.done():
@@ -71,4 +91,4 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": run_history.first.start,
             "current_recorder_run": run_history.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return db_runs | db_stats | db_engine_info | id_cache_info
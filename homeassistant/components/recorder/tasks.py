@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING, Any
 from homeassistant.core import Event
 from homeassistant.helpers.typing import UndefinedType
 
-from . import purge, statistics
+from . import migration, purge, statistics
 from .const import DOMAIN, EXCLUDE_ATTRIBUTES
 from .models import StatisticData, StatisticMetaData
 from .util import periodic_db_cleanups
@@ -163,6 +163,56 @@ class AdjustStatisticsTask(RecorderTask):
         )
 
 
+@dataclass
+class NormalizedIDsMigrationTask(RecorderTask):
+    """An object to insert into the recorder queue to migrate to normalized ids."""
+
+    def run(self, instance: Recorder) -> None:
+        """Run normalized ids migration task."""
+        if not migration.migrate_normalized_ids(instance):
+            # Schedule a new migration task if this one didn't finish
+            instance.queue_task(NormalizedIDsMigrationTask())
+            return
+        # All rows have ids now, switch the readers and writers over
+        # and clear the legacy columns that are no longer needed
+        instance.normalized_ids_active = True
+        instance.queue_task(LegacyIDColumnsCleanupTask())
+
+
+@dataclass
+class LegacyIDColumnsCleanupTask(RecorderTask):
+    """An object to insert into the recorder queue to clear legacy id columns."""
+
+    def run(self, instance: Recorder) -> None:
+        """Run legacy id columns cleanup task."""
+        if not migration.cleanup_legacy_id_columns(instance):
+            # Schedule a new cleanup task if this one didn't finish
+            instance.queue_task(LegacyIDColumnsCleanupTask())
+
+
+@dataclass
+class WarmUpIDCachesTask(RecorderTask):
+    """An object to insert into the recorder queue to warm up the id caches."""
+
+    def run(self, instance: Recorder) -> None:
+        """Run id caches warm up task."""
+        instance._warm_up_id_caches()  # pylint: disable=[protected-access]
+
+
+@dataclass
+class PeriodStatisticsBackfillTask(RecorderTask):
+    """An object to insert into the recorder queue to backfill period statistics."""
+
+    def run(self, instance: Recorder) -> None:
+        """Run period statistics backfill task."""
+        if not statistics.backfill_period_statistics(instance):
+            # Schedule a new backfill task if this one didn't finish
+            instance.queue_task(PeriodStatisticsBackfillTask())
+            return
+        # The daily and monthly statistics are complete, switch the readers over
+        instance.period_statistics_active = True
+
+
 @dataclass
 class WaitTask(RecorderTask):
     """An object to insert into the recorder queue to tell it set the _queue_watch event."""
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime as dt
 import logging
-from typing import Literal
+from typing import Any, Literal
 
 import voluptuous as vol
 
@@ -18,6 +18,7 @@ from .const import MAX_QUEUE_BACKLOG
 from .statistics import (
     async_add_external_statistics,
     async_import_statistics,
+    compact_statistics_during_period,
     list_statistic_ids,
     statistics_during_period,
     validate_statistics,
@@ -50,14 +51,19 @@ def _ws_get_statistics_during_period(
     end_time: dt | None = None,
     statistic_ids: list[str] | None = None,
     period: Literal["5minute", "day", "hour", "month"] = "hour",
+    compact: bool = False,
 ) -> str:
     """Fetch statistics and convert them to json in the executor."""
-    return JSON_DUMP(
-        messages.result_message(
-            msg_id,
-            statistics_during_period(hass, start_time, end_time, statistic_ids, period),
+    result: dict[str, Any]
+    if compact:
+        result = compact_statistics_during_period(
+            hass, start_time, end_time, statistic_ids, period
         )
-    )
+    else:
+        result = statistics_during_period(
+            hass, start_time, end_time, statistic_ids, period
+        )
+    return JSON_DUMP(messages.result_message(msg_id, result))
 
 
 async def ws_handle_get_statistics_during_period(
@@ -91,6 +97,7 @@ async def ws_handle_get_statistics_during_period(
             end_time,
             msg.get("statistic_ids"),
             msg.get("period"),
+            msg.get("compact", False),
         )
     )
 
@@ -102,6 +109,7 @@ async def ws_handle_get_statistics_during_period(
         vol.Optional("end_time"): str,
         vol.Optional("statistic_ids"): [str],
         vol.Required("period"): vol.Any("5minute", "hour", "day", "month"),
+        vol.Optional("compact"): bool,
     }
 )
 @websocket_api.async_response
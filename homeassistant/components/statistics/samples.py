@@ -0,0 +1,220 @@
+"""Sample buffer with incrementally maintained aggregates for the statistics sensor."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+import math
+from typing import Literal
+
+
+class SampleBuffer:
+    """Buffer of samples that keeps its aggregates up to date.
+
+    Samples are added at the end and removed from the start, either because
+    the buffer is full or because they are too old. The aggregates are updated
+    on every change so reading them does not depend on the number of samples.
+    """
+
+    def __init__(self, max_size: int, keep_sorted: bool = False) -> None:
+        """Initialize the sample buffer."""
+        self.max_size = max_size
+        self.states: deque[float | bool] = deque()
+        self.ages: deque[datetime] = deque()
+        # Sequence number of the oldest sample, to find samples by position
+        self._first_seq = 0
+        self._next_seq = 0
+        # Monotonic deques of (sequence number, value) for the min and max
+        self._max_candidates: deque[tuple[int, float | bool]] = deque()
+        self._min_candidates: deque[tuple[int, float | bool]] = deque()
+        # Sorted values for the median and the quantiles, only if needed
+        self._sorted: list[float | bool] | None = [] if keep_sorted else None
+        self._removed_since_resync = 0
+        self._reset_sums()
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.states)
+
+    def _reset_sums(self) -> None:
+        """Reset the running sums."""
+        self.total: float = 0
+        self._mean: float = 0
+        self._m2: float = 0
+        self.abs_change_total: float = 0
+        self.linear_area: float = 0
+        self.step_area: float = 0
+
+    def _resync_sums(self) -> None:
+        """Recompute the running sums to drop accumulated rounding errors."""
+        self._reset_sums()
+        states = self.states
+        ages = self.ages
+        count = 0
+        for i, value in enumerate(states):
+            count += 1
+            self.total += value
+            delta = value - self._mean
+            self._mean += delta / count
+            self._m2 += delta * (value - self._mean)
+            if i > 0:
+                self._add_segment(states[i - 1], ages[i - 1], value, ages[i])
+        self._removed_since_resync = 0
+
+    def _add_segment(
+        self,
+        value: float | bool,
+        age: datetime,
+        next_value: float | bool,
+        next_age: datetime,
+    ) -> None:
+        """Add the segment between two consecutive samples to the sums."""
+        seconds = (next_age - age).total_seconds()
+        self.abs_change_total += abs(next_value - value)
+        self.linear_area += 0.5 * (next_value + value) * seconds
+        self.step_area += value * seconds
+
+    def _remove_segment(
+        self,
+        value: float | bool,
+        age: datetime,
+        next_value: float | bool,
+        next_age: datetime,
+    ) -> None:
+        """Remove the segment between two consecutive samples from the sums."""
+        seconds = (next_age - age).total_seconds()
+        self.abs_change_total -= abs(next_value - value)
+        self.linear_area -= 0.5 * (next_value + value) * seconds
+        self.step_area -= value * seconds
+
+    def append(self, value: float | bool, age: datetime) -> None:
+        """Add a sample, removing the oldest one if the buffer is full."""
+        if len(self.states) >= self.max_size:
+            self.popleft()
+
+        if self.states:
+            self._add_segment(self.states[-1], self.ages[-1], value, age)
+        self.states.append(value)
+        self.ages.append(age)
+
+        self.total += value
+        delta = value - self._mean
+        self._mean += delta / len(self.states)
+        self._m2 += delta * (value - self._mean)
+
+        seq = self._next_seq
+        self._next_seq += 1
+        # Keep the oldest of equal values in front, like list.index would find
+        while self._max_candidates and self._max_candidates[-1][1] < value:
+            self._max_candidates.pop()
+        self._max_candidates.append((seq, value))
+        while self._min_candidates and self._min_candidates[-1][1] > value:
+            self._min_candidates.pop()
+        self._min_candidates.append((seq, value))
+
+        if self._sorted is not None:
+            insort(self._sorted, value)
+
+    def popleft(self) -> None:
+        """Remove the oldest sample."""
+        value = self.states.popleft()
+        age = self.ages.popleft()
+        seq = self._first_seq
+        self._first_seq += 1
+
+        if not self.states:
+            self._reset_sums()
+            self._removed_since_resync = 0
+        else:
+            self._remove_segment(value, age, self.states[0], self.ages[0])
+            self.total -= value
+            delta = value - self._mean
+            self._mean -= delta / len(self.states)
+            self._m2 -= delta * (value - self._mean)
+            # Resync once per buffer length of removals, which keeps the
+            # amortized cost constant while bounding the rounding errors
+            self._removed_since_resync += 1
+            if self._removed_since_resync >= self.max_size:
+                self._resync_sums()
+
+        if self._max_candidates[0][0] == seq:
+            self._max_candidates.popleft()
+        if self._min_candidates[0][0] == seq:
+            self._min_candidates.popleft()
+
+        if self._sorted is not None:
+            del self._sorted[bisect_left(self._sorted, value)]
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the samples."""
+        return self.total / len(self.states)
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, requires at least two samples."""
+        return max(self._m2, 0) / (len(self.states) - 1)
+
+    @property
+    def standard_deviation(self) -> float:
+        """Return the sample standard deviation, requires at least two samples."""
+        return math.sqrt(self.variance)
+
+    @property
+    def value_max(self) -> float | bool:
+        """Return the largest value."""
+        return self._max_candidates[0][1]
+
+    @property
+    def value_min(self) -> float | bool:
+        """Return the smallest value."""
+        return self._min_candidates[0][1]
+
+    @property
+    def datetime_value_max(self) -> datetime:
+        """Return the age of the oldest sample with the largest value."""
+        return self.ages[self._max_candidates[0][0] - self._first_seq]
+
+    @property
+    def datetime_value_min(self) -> datetime:
+        """Return the age of the oldest sample with the smallest value."""
+        return self.ages[self._min_candidates[0][0] - self._first_seq]
+
+    @property
+    def median(self) -> float | bool:
+        """Return the median, like statistics.median."""
+        assert self._sorted is not None
+        values = self._sorted
+        middle = len(values) // 2
+        if len(values) % 2:
+            return values[middle]
+        return (values[middle - 1] + values[middle]) / 2
+
+    def quantiles(
+        self, intervals: int, method: Literal["exclusive", "inclusive"]
+    ) -> list[float]:
+        """Return the cut points, like statistics.quantiles.
+
+        Requires more samples than intervals.
+        """
+        assert self._sorted is not None
+        values = self._sorted
+        count = len(values)
+        result = []
+        if method == "inclusive":
+            m = count - 1
+            for i in range(1, intervals):
+                j, delta = divmod(i * m, intervals)
+                result.append(
+                    (values[j] * (intervals - delta) + values[j + 1] * delta)
+                    / intervals
+                )
+            return result
+        m = count + 1
+        for i in range(1, intervals):
+            j = min(max(i * m // intervals, 1), count - 1)
+            delta = i * m - j * intervals
+            result.append(
+                (values[j - 1] * (intervals - delta) + values[j] * delta) / intervals
+            )
+        return result
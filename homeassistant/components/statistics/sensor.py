@@ -1,18 +1,16 @@
 """Support for statistics for sensor values."""
 from __future__ import annotations
 
-from collections import deque
 from collections.abc import Callable
 import contextlib
 from datetime import datetime, timedelta
 import logging
-import statistics
 from typing import Any, Literal, cast
 
 import voluptuous as vol
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
-from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder import history
 from homeassistant.components.sensor import (
     PLATFORM_SCHEMA,
     SensorDeviceClass,
@@ -48,6 +46,7 @@ from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, StateTyp
 from homeassistant.util import dt as dt_util
 
 from . import DOMAIN, PLATFORMS
+from .samples import SampleBuffer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -296,8 +295,12 @@ class StatisticsSensor(SensorEntity):
         self._value: StateType | datetime = None
         self._unit_of_measurement: str | None = None
         self._available: bool = False
-        self.states: deque[float | bool] = deque(maxlen=self._samples_max_buffer_size)
-        self.ages: deque[datetime] = deque(maxlen=self._samples_max_buffer_size)
+        self._samples = SampleBuffer(
+            self._samples_max_buffer_size,
+            keep_sorted=state_characteristic in (STAT_MEDIAN, STAT_QUANTILES),
+        )
+        self.states = self._samples.states
+        self.ages = self._samples.ages
         self.attributes: dict[str, StateType] = {
             STAT_AGE_COVERAGE_RATIO: None,
             STAT_BUFFER_USAGE_RATIO: None,
@@ -357,10 +360,10 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                value: float | bool = new_state.state == "on"
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
+                value = float(new_state.state)
+            self._samples.append(value, new_state.last_updated)
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -455,8 +458,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._samples.popleft()
 
     def _next_to_purge_timestamp(self) -> datetime | None:
         """Find the timestamp when the next purge would occur."""
@@ -497,10 +499,20 @@ class StatisticsSensor(SensorEntity):
                 self.hass, _scheduled_update, next_to_purge_timestamp
             )
 
-    def _fetch_states_from_database(self) -> list[State]:
-        """Fetch the states from the database."""
+    async def _initialize_from_database(self) -> None:
+        """Initialize the list of states from the database.
+
+        The query will get the list of states in DESCENDING order so that we
+        can limit the result to self._sample_size. Afterwards reverse the
+        list so that we get it in the right order again.
+
+        If MaxAge is provided then query will restrict to entries younger then
+        current datetime - MaxAge.
+
+        The states are loaded in a batch with the other sensors that load
+        their history at the same time.
+        """
         _LOGGER.debug("%s: initializing values from the database", self.entity_id)
-        lower_entity_id = self._source_entity_id.lower()
         if self._samples_max_age is not None:
             start_date = (
                 dt_util.utcnow() - self._samples_max_age - timedelta(microseconds=1)
@@ -513,27 +525,13 @@ class StatisticsSensor(SensorEntity):
         else:
             start_date = datetime.fromtimestamp(0, tz=dt_util.UTC)
             _LOGGER.debug("%s: retrieving all records", self.entity_id)
-        return history.state_changes_during_period(
+        if states := await history.async_state_changes_during_period(
             self.hass,
             start_date,
-            entity_id=lower_entity_id,
+            entity_id=self._source_entity_id,
             descending=True,
             limit=self._samples_max_buffer_size,
             include_start_time_state=False,
-        ).get(lower_entity_id, [])
-
-    async def _initialize_from_database(self) -> None:
-        """Initialize the list of states from the database.
-
-        The query will get the list of states in DESCENDING order so that we
-        can limit the result to self._sample_size. Afterwards reverse the
-        list so that we get it in the right order again.
-
-        If MaxAge is provided then query will restrict to entries younger then
-        current datetime - MaxAge.
-        """
-        if states := await get_instance(self.hass).async_add_executor_job(
-            self._fetch_states_from_database
         ):
             for state in reversed(states):
                 self._add_state_to_queue(state)
@@ -576,27 +574,14 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_average_linear(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    0.5
-                    * (self.states[i] + self.states[i - 1])
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+            return self._samples.linear_area / age_range_seconds
         return None
 
     def _stat_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    self.states[i - 1]
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+            return self._samples.step_area / age_range_seconds
         return None
 
     def _stat_average_timeless(self) -> StateType:
@@ -634,12 +619,12 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_datetime_value_max(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(max(self.states))]
+            return self._samples.datetime_value_max
         return None
 
     def _stat_datetime_value_min(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(min(self.states))]
+            return self._samples.datetime_value_min
         return None
 
     def _stat_distance_95_percent_of_values(self) -> StateType:
@@ -654,25 +639,22 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_distance_absolute(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states) - min(self.states)
+            return self._samples.value_max - self._samples.value_min
         return None
 
     def _stat_mean(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.mean(self.states)
+            return self._samples.mean
         return None
 
     def _stat_median(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.median(self.states)
+            return self._samples.median
         return None
 
     def _stat_noisiness(self) -> StateType:
         if len(self.states) >= 2:
-            diff_sum = sum(
-                abs(j - i) for i, j in zip(list(self.states), list(self.states)[1:])
-            )
-            return diff_sum / (len(self.states) - 1)
+            return self._samples.abs_change_total / (len(self.states) - 1)
         return None
 
     def _stat_quantiles(self) -> StateType:
@@ -680,10 +662,8 @@ class StatisticsSensor(SensorEntity):
             return str(
                 [
                     round(quantile, self._precision)
-                    for quantile in statistics.quantiles(
-                        self.states,
-                        n=self._quantile_intervals,
-                        method=self._quantile_method,
+                    for quantile in self._samples.quantiles(
+                        self._quantile_intervals, self._quantile_method
                     )
                 ]
             )
@@ -691,39 +671,36 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_standard_deviation(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.stdev(self.states)
+            return self._samples.standard_deviation
         return None
 
     def _stat_total(self) -> StateType:
         if len(self.states) > 0:
-            return sum(self.states)
+            return self._samples.total
         return None
 
     def _stat_value_max(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states)
+            return self._samples.value_max
         return None
 
     def _stat_value_min(self) -> StateType:
         if len(self.states) > 0:
-            return min(self.states)
+            return self._samples.value_min
         return None
 
     def _stat_variance(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.variance(self.states)
+            return self._samples.variance
         return None
 
     # Statistics for binary sensor
 
     def _stat_binary_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            on_seconds: float = 0
-            for i in range(1, len(self.states)):
-                if self.states[i - 1] is True:
-                    on_seconds += (self.ages[i] - self.ages[i - 1]).total_seconds()
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return 100 / age_range_seconds * on_seconds
+            # The step area of on (True) and off (False) is the time spent on
+            return 100 / age_range_seconds * self._samples.step_area
         return None
 
     def _stat_binary_average_timeless(self) -> StateType:
@@ -733,10 +710,10 @@ class StatisticsSensor(SensorEntity):
         return len(self.states)
 
     def _stat_binary_count_on(self) -> StateType:
-        return self.states.count(True)
+        return int(self._samples.total)
 
     def _stat_binary_count_off(self) -> StateType:
-        return self.states.count(False)
+        return len(self.states) - int(self._samples.total)
 
     def _stat_binary_datetime_newest(self) -> datetime | None:
         return self._stat_datetime_newest()
@@ -746,5 +723,5 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_binary_mean(self) -> StateType:
         if len(self.states) > 0:
-            return 100.0 / len(self.states) * self.states.count(True)
+            return 100.0 / len(self.states) * int(self._samples.total)
         return None
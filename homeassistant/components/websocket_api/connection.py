@@ -43,12 +43,23 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.supported_features: dict[str, float] = {}
+        # Set by the websocket handler, cleared while the client is
+        # behind on reading the pending messages
+        self.writable: asyncio.Event | None = None
         current_connection.set(self)
 
     def context(self, msg: dict[str, Any]) -> Context:
         """Return a context."""
         return Context(user_id=self.user.id)
 
+    async def async_wait_writable(self) -> None:
+        """Wait until the client has caught up with the pending messages.
+
+        Used to apply flow control to responses streamed in many messages.
+        """
+        if self.writable is not None:
+            await self.writable.wait()
+
     @callback
     def send_result(self, msg_id: int, result: Any | None = None) -> None:
         """Send a result message."""
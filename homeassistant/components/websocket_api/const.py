@@ -24,6 +24,8 @@ URL: Final = "/api/websocket"
 PENDING_MSG_PEAK: Final = 512
 PENDING_MSG_PEAK_TIME: Final = 5
 MAX_PENDING_MSG: Final = 2048
+# Streamed responses wait for the client once this many messages are pending
+PENDING_MSG_STREAM_PAUSE: Final = 64
 
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
@@ -26,6 +26,7 @@ from .const import (
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
+    PENDING_MSG_STREAM_PAUSE,
     SIGNAL_WEBSOCKET_CONNECTED,
     SIGNAL_WEBSOCKET_DISCONNECTED,
     URL,
@@ -69,6 +70,8 @@ class WebSocketHandler:
         self.request = request
         self.wsock = web.WebSocketResponse(heartbeat=55)
         self._to_write: asyncio.Queue = asyncio.Queue(maxsize=MAX_PENDING_MSG)
+        self._writable = asyncio.Event()
+        self._writable.set()
         self._handle_task: asyncio.Task | None = None
         self._writer_task: asyncio.Task | None = None
         self._logger = WebSocketAdapter(_WS_LOGGER, {"connid": id(self)})
@@ -96,6 +99,8 @@ class WebSocketHandler:
                     ):
                         logger.debug("Sending %s", message)
                         await wsock.send_str(message)
+                        if to_write.qsize() < PENDING_MSG_STREAM_PAUSE:
+                            self._writable.set()
                         continue
 
                     messages: list[str] = [message]
@@ -109,7 +114,10 @@ class WebSocketHandler:
                     coalesced_messages = "[" + ",".join(messages) + "]"
                     self._logger.debug("Sending %s", coalesced_messages)
                     await self.wsock.send_str(coalesced_messages)
+                    self._writable.set()
         finally:
+            # Do not leave streamed responses waiting for a closed connection
+            self._writable.set()
             # Clean up the peaker checker when we shut down the writer
             if self._peak_checker_unsub is not None:
                 self._peak_checker_unsub()
@@ -135,6 +143,9 @@ class WebSocketHandler:
 
             self._cancel()
 
+        if self._to_write.qsize() >= PENDING_MSG_STREAM_PAUSE:
+            self._writable.clear()
+
         if self._to_write.qsize() < PENDING_MSG_PEAK:
             if self._peak_checker_unsub:
                 self._peak_checker_unsub()
@@ -228,6 +239,7 @@ class WebSocketHandler:
 
             self._logger.debug("Received %s", msg_data)
             self.connection = connection = await auth.async_handle(msg_data)
+            connection.writable = self._writable
             self.hass.data[DATA_CONNECTIONS] = (
                 self.hass.data.get(DATA_CONNECTIONS, 0) + 1
             )
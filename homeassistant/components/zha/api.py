@@ -419,6 +419,8 @@ async def websocket_get_device(
         )
         return
 
+    # Someone is looking at the device, don't leave its refresh for later
+    zha_gateway.refresh_scheduler.async_prioritize(zha_device)
     device_info = zha_device.zha_device_info
     connection.send_result(msg[ID], device_info)
 
@@ -407,6 +407,9 @@ class Strobe(t.enum8):
 STARTUP_FAILURE_DELAY_S = 3
 STARTUP_RETRIES = 3
 
+REFRESH_MAX_CONCURRENT = 4
+REFRESH_BACKGROUND_INTERVAL = 0.5  # seconds between background refreshes
+
 EZSP_OVERWRITE_EUI64 = (
     "i_understand_i_can_update_eui64_only_once_and_i_still_want_to_do_it"
 )
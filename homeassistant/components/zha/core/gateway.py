@@ -21,12 +21,14 @@ import zigpy.group
 from zigpy.types.named import EUI64
 
 from homeassistant import __path__ as HOMEASSISTANT_PATH
+from homeassistant.components import automation, script
 from homeassistant.components.system_log import LogEntry, _figure_out_source
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.start import async_at_start
 from homeassistant.helpers.typing import ConfigType
 
 from . import discovery
@@ -81,6 +83,7 @@ from .const import (
 )
 from .device import DeviceStatus, ZHADevice
 from .group import GroupMember, ZHAGroup
+from .refresh import DeviceRefreshScheduler
 from .registries import GROUP_ENTITY_DOMAINS
 
 if TYPE_CHECKING:
@@ -143,6 +146,7 @@ class ZHAGateway:
         self.config_entry = config_entry
         self._unsubs: list[Callable[[], None]] = []
         self.initialized: bool = False
+        self.refresh_scheduler = DeviceRefreshScheduler(hass)
 
     async def async_initialize(self) -> None:
         """Initialize controller and connect radio."""
@@ -234,19 +238,41 @@ class ZHAGateway:
             *(dev.async_initialize(from_cache=True) for dev in self.devices.values())
         )
 
-        async def fetch_updated_state() -> None:
-            """Fetch updated state for mains powered devices."""
-            _LOGGER.debug("Fetching current state for mains powered devices")
-            await asyncio.gather(
-                *(
-                    dev.async_initialize(from_cache=False)
-                    for dev in self.devices.values()
-                    if dev.is_mains_powered
+        _LOGGER.debug("Scheduling fetching current state for mains powered devices")
+        for dev in self.devices.values():
+            if dev.is_mains_powered:
+                self.refresh_scheduler.async_schedule(dev)
+        # Automations and scripts are only all loaded once Home Assistant
+        # has started, the devices they rely on are refreshed first then
+        self._unsubs.append(
+            async_at_start(self._hass, self._async_prioritize_referenced_devices)
+        )
+
+    @callback
+    def _async_prioritize_referenced_devices(self, hass: HomeAssistant) -> None:
+        """Refresh the queued devices automations and scripts use first."""
+        referenced_devices, referenced_entities = self._async_get_referenced_ids()
+        for dev in self.devices.values():
+            if dev.device_id in referenced_devices or any(
+                entry.entity_id in referenced_entities
+                for entry in er.async_entries_for_device(
+                    self.ha_entity_registry, dev.device_id
                 )
-            )
+            ):
+                self.refresh_scheduler.async_prioritize(dev)
 
-        # background the fetching of state for mains powered devices
-        asyncio.create_task(fetch_updated_state())
+    @callback
+    def _async_get_referenced_ids(self) -> tuple[set[str], set[str]]:
+        """Return the ids of the devices and entities automations and scripts use."""
+        devices: set[str] = set()
+        entities: set[str] = set()
+        for entity_id in self._hass.states.async_entity_ids(automation.DOMAIN):
+            devices.update(automation.devices_in_automation(self._hass, entity_id))
+            entities.update(automation.entities_in_automation(self._hass, entity_id))
+        for entity_id in self._hass.states.async_entity_ids(script.DOMAIN):
+            devices.update(script.devices_in_script(self._hass, entity_id))
+            entities.update(script.entities_in_script(self._hass, entity_id))
+        return devices, entities
 
     def device_joined(self, device: zigpy.device.Device) -> None:
         """Handle device joined.
@@ -370,6 +396,7 @@ class ZHAGateway:
         if zha_device is not None:
             device_info = zha_device.zha_device_info
             zha_device.async_cleanup_handles()
+            self.refresh_scheduler.async_discard(zha_device.ieee)
             async_dispatcher_send(self._hass, f"{SIGNAL_REMOVE}_{str(zha_device.ieee)}")
             asyncio.ensure_future(self._async_remove_device(zha_device, entity_refs))
             if device_info is not None:
@@ -681,6 +708,7 @@ class ZHAGateway:
         _LOGGER.debug("Shutting down ZHA ControllerApplication")
         for unsubscribe in self._unsubs:
             unsubscribe()
+        self.refresh_scheduler.async_cancel()
         await self.application_controller.shutdown()
 
     def handle_message(
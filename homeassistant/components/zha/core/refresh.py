@@ -0,0 +1,181 @@
+"""Scheduler for refreshing the state of ZHA devices from the network."""
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from enum import IntEnum
+import heapq
+import itertools
+import logging
+from typing import TYPE_CHECKING, Any
+
+import async_timeout
+from zigpy.types.named import EUI64
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import REFRESH_BACKGROUND_INTERVAL, REFRESH_MAX_CONCURRENT
+
+if TYPE_CHECKING:
+    from .device import ZHADevice
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RefreshPriority(IntEnum):
+    """Priority of a device refresh, lower values are refreshed first."""
+
+    HIGH = 0
+    BACKGROUND = 1
+
+
+class DeviceRefreshScheduler:
+    """Refresh devices from the network with a bounded number of concurrent reads.
+
+    High priority refreshes start as soon as a slot is free. Background
+    refreshes are spread over time, so refreshing a large network does not
+    flood the radio and cause timeouts and retries.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_concurrent: int = REFRESH_MAX_CONCURRENT,
+        background_interval: float = REFRESH_BACKGROUND_INTERVAL,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._max_concurrent = max_concurrent
+        self._background_interval = background_interval
+        self._heap: list[tuple[RefreshPriority, int, EUI64]] = []
+        self._counter = itertools.count()
+        self._queued: dict[EUI64, tuple[RefreshPriority, ZHADevice, float]] = {}
+        self._running: set[EUI64] = set()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._refreshes: set[asyncio.Task[None]] = set()
+        self._next_background = 0.0
+        self.latencies: dict[EUI64, float] = {}
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of devices waiting to be refreshed."""
+        return len(self._queued)
+
+    @callback
+    def async_schedule(
+        self,
+        device: ZHADevice,
+        priority: RefreshPriority = RefreshPriority.BACKGROUND,
+    ) -> None:
+        """Queue a refresh, or raise the priority of a queued refresh."""
+        if (queued := self._queued.get(device.ieee)) is not None:
+            if priority >= queued[0]:
+                return
+            # The old entry is skipped when it comes up
+            queued_at = queued[2]
+        else:
+            queued_at = self._hass.loop.time()
+        self._queued[device.ieee] = (priority, device, queued_at)
+        heapq.heappush(self._heap, (priority, next(self._counter), device.ieee))
+        self._wakeup.set()
+        if self._task is None:
+            # Not tracked by hass, startup must not wait for the refreshes,
+            # async_cancel cancels the run and refresh tasks instead
+            self._task = self._hass.loop.create_task(self._async_run())
+
+    @callback
+    def async_prioritize(self, device: ZHADevice) -> None:
+        """Refresh a queued device as soon as possible."""
+        if device.ieee in self._queued:
+            self.async_schedule(device, RefreshPriority.HIGH)
+
+    @callback
+    def async_discard(self, ieee: EUI64) -> None:
+        """Forget a device that was removed."""
+        self._queued.pop(ieee, None)
+        self.latencies.pop(ieee, None)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the queued refreshes and cancel the running ones."""
+        self._heap.clear()
+        self._queued.clear()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for refresh in self._refreshes:
+            refresh.cancel()
+        self._refreshes.clear()
+
+    @callback
+    def _async_peek(self) -> RefreshPriority | None:
+        """Return the priority of the next refresh, dropping superseded entries."""
+        while self._heap:
+            priority, _, ieee = self._heap[0]
+            if (queued := self._queued.get(ieee)) is not None and queued[0] is priority:
+                return priority
+            heapq.heappop(self._heap)
+        return None
+
+    async def _async_run(self) -> None:
+        """Start the queued refreshes."""
+        slots = asyncio.Semaphore(self._max_concurrent)
+        loop = self._hass.loop
+        try:
+            while self._async_peek() is not None:
+                await slots.acquire()
+                # Wait for the next background slot, unless a high priority
+                # refresh is queued in the meantime
+                while (
+                    self._async_peek() is RefreshPriority.BACKGROUND
+                    and (delay := self._next_background - loop.time()) > 0
+                ):
+                    self._wakeup.clear()
+                    with suppress(asyncio.TimeoutError):
+                        async with async_timeout.timeout(delay):
+                            await self._wakeup.wait()
+                if (priority := self._async_peek()) is None:
+                    slots.release()
+                    break
+                _, _, ieee = heapq.heappop(self._heap)
+                _, device, queued_at = self._queued.pop(ieee)
+                if priority is RefreshPriority.BACKGROUND:
+                    self._next_background = loop.time() + self._background_interval
+                self._running.add(ieee)
+                refresh = loop.create_task(self._async_refresh(device, queued_at))
+                self._refreshes.add(refresh)
+                refresh.add_done_callback(self._refreshes.discard)
+                refresh.add_done_callback(lambda _: slots.release())
+        finally:
+            if self._task is asyncio.current_task():
+                self._task = None
+
+    async def _async_refresh(self, device: ZHADevice, queued_at: float) -> None:
+        """Refresh a device and record how long it took."""
+        loop = self._hass.loop
+        start = loop.time()
+        _LOGGER.debug(
+            "[%s](%s) refreshing after %.1f seconds in the queue",
+            device.nwk,
+            device.name,
+            start - queued_at,
+        )
+        try:
+            await device.async_initialize(from_cache=False)
+        except Exception as exc:  # pylint: disable=broad-except
+            _LOGGER.warning(
+                "[%s](%s) failed to refresh", device.nwk, device.name, exc_info=exc
+            )
+        finally:
+            self._running.discard(device.ieee)
+            self.latencies[device.ieee] = loop.time() - start
+
+    @callback
+    def async_diagnostics(self) -> dict[str, Any]:
+        """Return the state of the scheduler for diagnostics."""
+        return {
+            "queue_depth": self.queue_depth,
+            "running": len(self._running),
+            "max_concurrent": self._max_concurrent,
+        }
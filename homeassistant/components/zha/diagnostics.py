@@ -50,6 +50,7 @@ KEYS_TO_REDACT = {
 
 ATTRIBUTES = "attributes"
 CLUSTER_DETAILS = "cluster_details"
+REFRESH_LATENCY = "refresh_latency"
 UNSUPPORTED_ATTRIBUTES = "unsupported_attributes"
 
 
@@ -78,6 +79,7 @@ async def async_get_config_entry_diagnostics(
             "config": config,
             "config_entry": config_entry.as_dict(),
             "application_state": shallow_asdict(gateway.application_controller.state),
+            "refresh_scheduler": gateway.refresh_scheduler.async_diagnostics(),
             "versions": {
                 "bellows": bellows.__version__,
                 "zigpy": zigpy.__version__,
@@ -97,7 +99,11 @@ async def async_get_device_diagnostics(
 ) -> dict:
     """Return diagnostics for a device."""
     zha_device: ZHADevice = async_get_zha_device(hass, device.id)
+    gateway: ZHAGateway = hass.data[DATA_ZHA][DATA_ZHA_GATEWAY]
     device_info: dict[str, Any] = zha_device.zha_device_info
+    device_info[REFRESH_LATENCY] = gateway.refresh_scheduler.latencies.get(
+        zha_device.ieee
+    )
     device_info[CLUSTER_DETAILS] = get_endpoint_cluster_attr_data(zha_device)
     return async_redact_data(device_info, KEYS_TO_REDACT)
 
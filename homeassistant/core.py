@@ -848,6 +848,11 @@ class EventBus:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJob]] = {}
+        # event_type -> listeners to call with the MATCH_ALL listeners
+        # merged in, compiled on the first fire after the listeners change.
+        # The compiled lists are never mutated, only replaced.
+        self._dispatch: dict[str, list[_FilterableJob]] = {}
+        self._match_all_dispatch: list[_FilterableJob] | None = None
         self._hass = hass
 
     @callback
@@ -893,12 +898,16 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
+        if (listeners := self._dispatch.get(event_type)) is None:
+            listeners = self._async_compile_dispatch(event_type)
 
-        # EVENT_HOMEASSISTANT_CLOSE should go only to this listeners
-        match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+        if (
+            not listeners
+            and (context is None or context.origin_event is not None)
+            and not _LOGGER.isEnabledFor(logging.DEBUG)
+        ):
+            # Nobody would see the event, skip creating it
+            return
 
         event = Event(event_type, event_data, origin, time_fired, context)
         if not event.context.origin_event:
@@ -925,6 +934,43 @@ class EventBus:
             else:
                 self._hass.async_add_hass_job(job, event)
 
+    @callback
+    def _async_compile_dispatch(self, event_type: str) -> list[_FilterableJob]:
+        """Compile the listeners for an event type.
+
+        This method must be run in the event loop.
+        """
+        if (
+            event_type not in self._listeners
+            and event_type != EVENT_HOMEASSISTANT_CLOSE
+        ):
+            # Event types without listeners of their own share the
+            # MATCH_ALL listeners so the dispatch table does not grow
+            # with every event type that is fired
+            if self._match_all_dispatch is None:
+                self._match_all_dispatch = self._listeners.get(MATCH_ALL, []).copy()
+            return self._match_all_dispatch
+
+        listeners = self._listeners.get(event_type, [])
+        # EVENT_HOMEASSISTANT_CLOSE should go only to this listeners
+        if event_type != EVENT_HOMEASSISTANT_CLOSE and (
+            match_all_listeners := self._listeners.get(MATCH_ALL)
+        ):
+            listeners = match_all_listeners + listeners
+        else:
+            listeners = listeners.copy()
+        self._dispatch[event_type] = listeners
+        return listeners
+
+    @callback
+    def _async_invalidate_dispatch(self, event_type: str) -> None:
+        """Drop the compiled listeners affected by a change to event_type."""
+        if event_type == MATCH_ALL:
+            self._dispatch.clear()
+            self._match_all_dispatch = None
+        else:
+            self._dispatch.pop(event_type, None)
+
     def listen(
         self,
         event_type: str,
@@ -981,6 +1027,7 @@ class EventBus:
         self, event_type: str, filterable_job: _FilterableJob
     ) -> CALLBACK_TYPE:
         self._listeners.setdefault(event_type, []).append(filterable_job)
+        self._async_invalidate_dispatch(event_type)
 
         def remove_listener() -> None:
             """Remove the listener."""
@@ -1071,6 +1118,8 @@ class EventBus:
             _LOGGER.exception(
                 "Unable to remove unknown job listener %s", filterable_job
             )
+        else:
+            self._async_invalidate_dispatch(event_type)
 
 
 _StateT = TypeVar("_StateT", bound="State")
@@ -1252,6 +1301,9 @@ class StateMachine:
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: dict[str, State] = {}
+        # domain -> entity_id -> State, kept in sync with _states so that
+        # domain filtered lookups only touch the matching states
+        self._domain_index: dict[str, dict[str, State]] = {}
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
@@ -1275,13 +1327,15 @@ class StateMachine:
             return list(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            if (domain_states := self._domain_index.get(domain_filter.lower())) is None:
+                return []
+            return list(domain_states)
 
-        return [
-            state.entity_id
-            for state in self._states.values()
-            if state.domain in domain_filter
-        ]
+        entity_ids: list[str] = []
+        for domain in self._unique_domains(domain_filter):
+            if (domain_states := self._domain_index.get(domain)) is not None:
+                entity_ids.extend(domain_states)
+        return entity_ids
 
     @callback
     def async_entity_ids_count(
@@ -1297,8 +1351,9 @@ class StateMachine:
         if isinstance(domain_filter, str):
             domain_filter = (domain_filter.lower(),)
 
-        return len(
-            [None for state in self._states.values() if state.domain in domain_filter]
+        return sum(
+            len(self._domain_index.get(domain, ()))
+            for domain in self._unique_domains(domain_filter)
         )
 
     def all(self, domain_filter: str | Iterable[str] | None = None) -> list[State]:
@@ -1319,11 +1374,22 @@ class StateMachine:
             return list(self._states.values())
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
-
-        return [
-            state for state in self._states.values() if state.domain in domain_filter
-        ]
+            if (domain_states := self._domain_index.get(domain_filter.lower())) is None:
+                return []
+            return list(domain_states.values())
+
+        states: list[State] = []
+        for domain in self._unique_domains(domain_filter):
+            if (domain_states := self._domain_index.get(domain)) is not None:
+                states.extend(domain_states.values())
+        return states
+
+    @staticmethod
+    def _unique_domains(domain_filter: Iterable[str]) -> Iterable[str]:
+        """Return the domains of a filter without duplicates."""
+        if isinstance(domain_filter, (set, frozenset)):
+            return domain_filter
+        return dict.fromkeys(domain_filter)
 
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
@@ -1366,6 +1432,11 @@ class StateMachine:
         if old_state is None:
             return False
 
+        domain_states = self._domain_index[old_state.domain]
+        del domain_states[entity_id]
+        if not domain_states:
+            del self._domain_index[old_state.domain]
+
         old_state.expire()
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
@@ -1472,6 +1543,9 @@ class StateMachine:
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
+        if (domain_states := self._domain_index.get(state.domain)) is None:
+            domain_states = self._domain_index[state.domain] = {}
+        domain_states[entity_id] = state
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
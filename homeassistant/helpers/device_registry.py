@@ -244,10 +244,83 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
         return None
 
 
+def _move_in_index(
+    index: dict[str, dict[str, DeviceEntry]],
+    key: str,
+    old_index_keys: set[str],
+    index_keys: set[str],
+    entry: DeviceEntry | None,
+) -> None:
+    """Move a device from the old to the new keys of an index."""
+    for index_key in old_index_keys - index_keys:
+        entries = index[index_key]
+        del entries[key]
+        if not entries:
+            del index[index_key]
+    if entry is None:
+        return
+    for index_key in index_keys:
+        index.setdefault(index_key, {})[key] = entry
+
+
+class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
+    """Container for active (non-deleted) device registry entries.
+
+    Maintains two more indexes:
+    - area_id -> device_id -> entry
+    - config_entry_id -> device_id -> entry
+    """
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        self._area_id_index: dict[str, dict[str, DeviceEntry]] = {}
+        self._config_entry_id_index: dict[str, dict[str, DeviceEntry]] = {}
+
+    def _reindex_entry(
+        self, key: str, old_entry: DeviceEntry | None, entry: DeviceEntry | None
+    ) -> None:
+        """Move an entry between the area and config entry indexes.
+
+        Entries keep their position in an index if their key is not changed.
+        """
+        old_area_ids = {old_entry.area_id} if old_entry and old_entry.area_id else set()
+        area_ids = {entry.area_id} if entry and entry.area_id else set()
+        _move_in_index(self._area_id_index, key, old_area_ids, area_ids, entry)
+        _move_in_index(
+            self._config_entry_id_index,
+            key,
+            old_entry.config_entries if old_entry else set(),
+            entry.config_entries if entry else set(),
+            entry,
+        )
+
+    def __setitem__(self, key: str, entry: DeviceEntry) -> None:
+        """Add an item."""
+        old_entry = self.data.get(key)
+        super().__setitem__(key, entry)
+        self._reindex_entry(key, old_entry, entry)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an item."""
+        self._reindex_entry(key, self[key], None)
+        super().__delitem__(key)
+
+    def get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
+        """Get devices for area."""
+        return list(self._area_id_index.get(area_id, {}).values())
+
+    def get_devices_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[DeviceEntry]:
+        """Get devices for config entry."""
+        return list(self._config_entry_id_index.get(config_entry_id, {}).values())
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
-    devices: DeviceRegistryItems[DeviceEntry]
+    devices: ActiveDeviceRegistryItems
     deleted_devices: DeviceRegistryItems[DeletedDeviceEntry]
 
     def __init__(self, hass: HomeAssistant) -> None:
@@ -542,7 +615,7 @@ class DeviceRegistry:
 
         data = await self._store.async_load()
 
-        devices: DeviceRegistryItems[DeviceEntry] = DeviceRegistryItems()
+        devices = ActiveDeviceRegistryItems()
         deleted_devices: DeviceRegistryItems[DeletedDeviceEntry] = DeviceRegistryItems()
 
         if data is not None:
@@ -704,7 +777,7 @@ async def async_get_registry(hass: HomeAssistant) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return registry.devices.get_devices_for_area_id(area_id)
 
 
 @callback
@@ -712,11 +785,7 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return registry.devices.get_devices_for_config_entry_id(config_entry_id)
 
 
 @callback
@@ -24,7 +24,7 @@ from homeassistant.loader import async_get_integration, bind_hass
 from homeassistant.setup import async_prepare_setup_platform
 
 from . import config_per_platform, config_validation as cv, discovery, entity, service
-from .entity_platform import EntityPlatform
+from .entity_platform import DATA_DOMAIN_ENTITIES, EntityPlatform
 from .typing import ConfigType, DiscoveryInfoType
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=15)
@@ -79,6 +79,11 @@ class EntityComponent(Generic[_EntityT]):
 
         self.config: ConfigType | None = None
 
+        # The entities of all platforms of this domain, maintained by the platforms
+        self._entities: dict[str, entity.Entity] = hass.data.setdefault(
+            DATA_DOMAIN_ENTITIES, {}
+        ).setdefault(domain, {})
+
         self._platforms: dict[
             str | tuple[str, timedelta | None, str | None], EntityPlatform
         ] = {domain: self._async_init_entity_platform(domain, None)}
@@ -97,11 +102,7 @@ class EntityComponent(Generic[_EntityT]):
 
     def get_entity(self, entity_id: str) -> _EntityT | None:
         """Get an entity."""
-        for platform in self._platforms.values():
-            entity_obj = platform.entities.get(entity_id)
-            if entity_obj is not None:
-                return entity_obj  # type: ignore[return-value]
-        return None
+        return self._entities.get(entity_id)  # type: ignore[return-value]
 
     def setup(self, config: ConfigType) -> None:
         """Set up a full entity component.
@@ -205,7 +206,7 @@ class EntityComponent(Generic[_EntityT]):
         async def handle_service(call: ServiceCall) -> None:
             """Handle the service."""
             await service.entity_service_call(
-                self.hass, self._platforms.values(), func, call, required_features
+                self.hass, self._entities, func, call, required_features
             )
 
         self.hass.services.async_register(self.domain, name, handle_service, schema)
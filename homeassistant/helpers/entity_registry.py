@@ -236,12 +236,24 @@ class EntityRegistryStore(storage.Store):
         return data
 
 
+def _secondary_index_keys(
+    entry: RegistryEntry | None,
+) -> tuple[str | None, str | None, str | None]:
+    """Return the device id, area id and config entry id of an entry."""
+    if entry is None:
+        return (None, None, None)
+    return (entry.device_id, entry.area_id, entry.config_entry_id)
+
+
 class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains two additional indexes:
+    Maintains five additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
+    - device_id -> entity_id -> entry
+    - area_id -> entity_id -> entry
+    - config_entry_id -> entity_id -> entry
     """
 
     def __init__(self) -> None:
@@ -249,22 +261,51 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
+        self._device_id_index: dict[str, dict[str, RegistryEntry]] = {}
+        self._area_id_index: dict[str, dict[str, RegistryEntry]] = {}
+        self._config_entry_id_index: dict[str, dict[str, RegistryEntry]] = {}
+
+    def _reindex_entry(
+        self, key: str, old_entry: RegistryEntry | None, entry: RegistryEntry | None
+    ) -> None:
+        """Move an entry between the device, area and config entry indexes.
+
+        Entries keep their position in an index if their key is not changed.
+        """
+        indexes = (
+            self._device_id_index,
+            self._area_id_index,
+            self._config_entry_id_index,
+        )
+        old_index_keys = _secondary_index_keys(old_entry)
+        for index, old_index_key, index_key in zip(
+            indexes, old_index_keys, _secondary_index_keys(entry)
+        ):
+            if old_index_key is not None and old_index_key != index_key:
+                entries = index[old_index_key]
+                del entries[key]
+                if not entries:
+                    del index[old_index_key]
+            if entry is not None and index_key is not None:
+                index.setdefault(index_key, {})[key] = entry
 
     def __setitem__(self, key: str, entry: RegistryEntry) -> None:
         """Add an item."""
-        if key in self:
-            old_entry = self[key]
+        old_entry = self.data.get(key)
+        if old_entry is not None:
             del self._entry_ids[old_entry.id]
             del self._index[(old_entry.domain, old_entry.platform, old_entry.unique_id)]
         super().__setitem__(key, entry)
         self._entry_ids[entry.id] = entry
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        self._reindex_entry(key, old_entry, entry)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         del self._entry_ids[entry.id]
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        self._reindex_entry(key, entry, None)
         super().__delitem__(key)
 
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
@@ -275,6 +316,20 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         """Get entry from id."""
         return self._entry_ids.get(key)
 
+    def get_entries_for_device_id(self, device_id: str) -> list[RegistryEntry]:
+        """Get entries for device."""
+        return list(self._device_id_index.get(device_id, {}).values())
+
+    def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
+        """Get entries for area."""
+        return list(self._area_id_index.get(area_id, {}).values())
+
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for config entry."""
+        return list(self._config_entry_id_index.get(config_entry_id, {}).values())
+
 
 class EntityRegistry:
     """Class to hold a registry of entities."""
@@ -903,9 +958,8 @@ def async_entries_for_device(
     """Return entries that match a device."""
     return [
         entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
+        for entry in registry.entities.get_entries_for_device_id(device_id)
+        if not entry.disabled_by or include_disabled_entities
     ]
 
 
@@ -914,7 +968,7 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return registry.entities.get_entries_for_area_id(area_id)
 
 
 @callback
@@ -922,11 +976,7 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.entities.get_entries_for_config_entry_id(config_entry_id)
 
 
 @callback
@@ -54,6 +54,8 @@ TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
+DATA_TIMER_WHEEL = "timer_wheel"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -156,6 +158,9 @@ def async_track_state_change(
     being None, async_track_state_change_event should be used instead
     as it is slightly faster.
 
+    Listeners share the indexed dispatcher of async_track_state_change_event,
+    MATCH_ALL listeners are stored under MATCH_ALL in the same index.
+
     Must be run within the event loop.
     """
     if from_state is not None:
@@ -165,65 +170,35 @@ def async_track_state_change(
 
     # Ensure it is a lowercase list with entity ids we want to match on
     if entity_ids == MATCH_ALL:
-        pass
+        entity_ids = (MATCH_ALL,)
     elif isinstance(entity_ids, str):
         entity_ids = (entity_ids.lower(),)
     else:
-        entity_ids = tuple(entity_id.lower() for entity_id in entity_ids)
-
-    job = HassJob(action)
-
-    @callback
-    def state_change_filter(event: Event) -> bool:
-        """Handle specific state changes."""
-        if from_state is not None:
-            if (old_state := event.data.get("old_state")) is not None:
-                old_state = old_state.state
-
-            if not match_from_state(old_state):
-                return False
-
-        if to_state is not None:
-            if (new_state := event.data.get("new_state")) is not None:
-                new_state = new_state.state
-
-            if not match_to_state(new_state):
-                return False
+        entity_ids = tuple(dict.fromkeys(entity_id.lower() for entity_id in entity_ids))
 
-        return True
+    if not entity_ids:
+        return _remove_empty_listener
 
-    @callback
-    def state_change_dispatcher(event: Event) -> None:
-        """Handle specific state changes."""
-        hass.async_run_hass_job(
-            job,
-            event.data["entity_id"],
-            event.data.get("old_state"),
-            event.data["new_state"],
-        )
+    job = HassJob(action)
 
     @callback
     def state_change_listener(event: Event) -> None:
         """Handle specific state changes."""
-        if not state_change_filter(event):
+        new_state: State | None = event.data["new_state"]
+        if to_state is not None and not match_to_state(
+            None if new_state is None else new_state.state
+        ):
             return
 
-        state_change_dispatcher(event)
-
-    if entity_ids != MATCH_ALL:
-        # If we have a list of entity ids we use
-        # async_track_state_change_event to route
-        # by entity_id to avoid iterating though state change
-        # events and creating a jobs where the most
-        # common outcome is to return right away because
-        # the entity_id does not match since usually
-        # only one or two listeners want that specific
-        # entity_id.
-        return async_track_state_change_event(hass, entity_ids, state_change_listener)
-
-    return hass.bus.async_listen(
-        EVENT_STATE_CHANGED, state_change_dispatcher, event_filter=state_change_filter
-    )
+        old_state: State | None = event.data.get("old_state")
+        if from_state is not None and not match_from_state(
+            None if old_state is None else old_state.state
+        ):
+            return
+
+        hass.async_run_hass_job(job, event.data["entity_id"], old_state, new_state)
+
+    return _async_track_state_change_event(hass, entity_ids, state_change_listener)
 
 
 track_state_change = threaded_listener_factory(async_track_state_change)
@@ -267,23 +242,29 @@ def _async_track_state_change_event(
         @callback
         def _async_state_change_filter(event: Event) -> bool:
             """Filter state changes by entity_id."""
-            return event.data.get("entity_id") in entity_callbacks
+            return (
+                event.data.get("entity_id") in entity_callbacks
+                or MATCH_ALL in entity_callbacks
+            )
 
         @callback
         def _async_state_change_dispatcher(event: Event) -> None:
             """Dispatch state changes by entity_id."""
             entity_id = event.data.get("entity_id")
 
-            if entity_id not in entity_callbacks:
-                return
+            # async_track_state_change stores its MATCH_ALL listeners
+            # under MATCH_ALL
+            for key in (entity_id, MATCH_ALL):
+                if key not in entity_callbacks:
+                    continue
 
-            for job in entity_callbacks[entity_id][:]:
-                try:
-                    hass.async_run_hass_job(job, event)
-                except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception(
-                        "Error while processing state change for %s", entity_id
-                    )
+                for job in entity_callbacks[key][:]:
+                    try:
+                        hass.async_run_hass_job(job, event)
+                    except Exception:  # pylint: disable=broad-except
+                        _LOGGER.exception(
+                            "Error while processing state change for %s", entity_id
+                        )
 
         hass.data[TRACK_STATE_CHANGE_LISTENER] = hass.bus.async_listen(
             EVENT_STATE_CHANGED,
@@ -1259,6 +1240,130 @@ def async_track_same_state(
 track_same_state = threaded_listener_factory(async_track_same_state)
 
 
+class _TimerWheelEntry:
+    """A callback scheduled on the timer wheel."""
+
+    __slots__ = ("target", "args")
+
+    def __init__(self, target: Callable[..., None], args: tuple[Any, ...]) -> None:
+        """Initialize the entry."""
+        self.target = target
+        self.args = args
+
+
+class TimerWheel:
+    """Coalesce timers that are due at the same time.
+
+    Timers are bucketed on the exact timestamp they are due at, so no timer
+    fires later than it would on a loop timer of its own. Each bucket is
+    backed by a single loop timer, which runs all callbacks of the bucket in
+    one batch. Time pattern listeners fire on whole seconds and share their
+    buckets, which keeps the loop timer heap and the re-arm churn
+    proportional to the number of distinct due times.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the timer wheel."""
+        self.hass = hass
+        self._buckets: dict[float, dict[_TimerWheelEntry, None]] = {}
+        self._handles: dict[float, asyncio.TimerHandle] = {}
+        self._fired = 0
+        self._batches = 0
+        self._lateness_total = 0.0
+        self._lateness_max = 0.0
+        self._lateness_last = 0.0
+
+    @callback
+    def async_schedule(
+        self, when: float, target: Callable[..., None], *args: Any
+    ) -> CALLBACK_TYPE:
+        """Schedule a callback to be called at a UTC timestamp.
+
+        Returns a function that cancels the callback.
+        """
+        if (bucket := self._buckets.get(when)) is None:
+            bucket = self._buckets[when] = {}
+            self._handles[when] = self.hass.loop.call_later(
+                when - time.time(), self._async_fire, when
+            )
+        entry = _TimerWheelEntry(target, args)
+        bucket[entry] = None
+
+        @callback
+        def cancel() -> None:
+            """Cancel the callback."""
+            if entry not in bucket:
+                return
+            del bucket[entry]
+            if bucket:
+                return
+            # The bucket is empty, drop its loop timer if it is still pending
+            if self._buckets.get(when) is bucket:
+                del self._buckets[when]
+                self._handles.pop(when).cancel()
+
+        return cancel
+
+    @callback
+    def _async_fire(self, when: float) -> None:
+        """Run all callbacks that are due at when."""
+        # Depending on the available clock support (including timer hardware
+        # and the OS kernel) it can happen that we fire a little bit too early
+        # as measured by utcnow(). That is bad when callbacks have assumptions
+        # about the current time. Thus, we rearm the timer for the remaining
+        # time.
+        now = time_tracker_timestamp()
+        if (delta := when - now) > 0:
+            _LOGGER.debug("Called %f seconds too early, rearming", delta)
+            self._handles[when] = self.hass.loop.call_later(
+                delta, self._async_fire, when
+            )
+            return
+
+        bucket = self._buckets.pop(when)
+        del self._handles[when]
+
+        lateness = now - when
+        self._batches += 1
+        self._lateness_last = lateness
+        self._lateness_total += lateness
+        self._lateness_max = max(self._lateness_max, lateness)
+
+        # Callbacks may cancel other callbacks of the bucket while it runs
+        while bucket:
+            entry = next(iter(bucket))
+            del bucket[entry]
+            self._fired += 1
+            try:
+                entry.target(*entry.args)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running timer callback %s", entry.target)
+
+    @callback
+    def async_diagnostics(self) -> dict[str, Any]:
+        """Return diagnostics about the timers."""
+        return {
+            "scheduled": sum(len(bucket) for bucket in self._buckets.values()),
+            "loop_timers": len(self._handles),
+            "fired": self._fired,
+            "batches": self._batches,
+            "coalesced": self._fired - self._batches,
+            "lateness_last": self._lateness_last,
+            "lateness_max": self._lateness_max,
+            "lateness_avg": self._lateness_total / self._batches
+            if self._batches
+            else 0.0,
+        }
+
+
+@callback
+def async_get_timer_wheel(hass: HomeAssistant) -> TimerWheel:
+    """Return the timer wheel of a Home Assistant instance."""
+    if (wheel := hass.data.get(DATA_TIMER_WHEEL)) is None:
+        wheel = hass.data[DATA_TIMER_WHEEL] = TimerWheel(hass)
+    return cast(TimerWheel, wheel)
+
+
 @callback
 @bind_hass
 def async_track_point_in_time(
@@ -1292,40 +1397,15 @@ def async_track_point_in_utc_time(
     """Add a listener that fires once after a specific point in UTC time."""
     # Ensure point_in_time is UTC
     utc_point_in_time = dt_util.as_utc(point_in_time)
-    expected_fire_timestamp = dt_util.utc_to_timestamp(utc_point_in_time)
-
     # Since this is called once, we accept a HassJob so we can avoid
     # having to figure out how to call the action every time its called.
-    cancel_callback: asyncio.TimerHandle | None = None
-
-    @callback
-    def run_action(job: HassJob[[datetime], Coroutine[Any, Any, None] | None]) -> None:
-        """Call the action."""
-        nonlocal cancel_callback
-        # Depending on the available clock support (including timer hardware
-        # and the OS kernel) it can happen that we fire a little bit too early
-        # as measured by utcnow(). That is bad when callbacks have assumptions
-        # about the current time. Thus, we rearm the timer for the remaining
-        # time.
-        if (delta := (expected_fire_timestamp - time_tracker_timestamp())) > 0:
-            _LOGGER.debug("Called %f seconds too early, rearming", delta)
-
-            cancel_callback = hass.loop.call_later(delta, run_action, job)
-            return
-
-        hass.async_run_hass_job(job, utc_point_in_time)
-
     job = action if isinstance(action, HassJob) else HassJob(action)
-    delta = utc_point_in_time.timestamp() - time.time()
-    cancel_callback = hass.loop.call_later(delta, run_action, job)
-
-    @callback
-    def unsub_point_in_time_listener() -> None:
-        """Cancel the call_later."""
-        assert cancel_callback is not None
-        cancel_callback.cancel()
-
-    return unsub_point_in_time_listener
+    return async_get_timer_wheel(hass).async_schedule(
+        dt_util.utc_to_timestamp(utc_point_in_time),
+        hass.async_run_hass_job,
+        job,
+        utc_point_in_time,
+    )
 
 
 track_point_in_utc_time = threaded_listener_factory(async_track_point_in_utc_time)
@@ -7,8 +7,12 @@ from datetime import datetime, timedelta
 import logging
 from typing import Any, TypeVar, cast
 
-from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
+from homeassistant.const import (
+    ATTR_RESTORED,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import Event, HomeAssistant, State, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 
@@ -24,11 +28,16 @@ DATA_RESTORE_STATE_TASK = "restore_state_task"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
+STORAGE_KEY_CHANGES = "core.restore_state_changes"
 STORAGE_VERSION = 1
 
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How long between rewriting all states to disk, in between only the states
+# that changed since the last full dump are saved
+STATE_COMPACT_INTERVAL = timedelta(hours=24)
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -111,15 +120,33 @@ class RestoreStateData:
             _LOGGER.error("Error loading last states", exc_info=exc)
             stored_states = None
 
-        if stored_states is None:
+        try:
+            changed_states = await data.changes_store.async_load()
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error loading last changed states", exc_info=exc)
+            changed_states = None
+
+        if stored_states is None and changed_states is None:
             _LOGGER.debug("Not creating cache - no saved states found")
             data.last_states = {}
         else:
             data.last_states = {
                 item["state"]["entity_id"]: StoredState.from_dict(item)
-                for item in stored_states
+                for item in stored_states or ()
                 if valid_entity_id(item["state"]["entity_id"])
             }
+            # Replay the states that changed since the last full dump, unless
+            # the full dump is newer which happens when we were stopped after
+            # saving it but before clearing the changes.
+            for entity_id, item in (changed_states or {}).items():
+                if not valid_entity_id(entity_id):
+                    continue
+                stored_state = StoredState.from_dict(item)
+                last_state = data.last_states.get(entity_id)
+                if last_state is None or stored_state.last_seen >= last_state.last_seen:
+                    data.last_states[entity_id] = stored_state
+                    # Keep them until they are part of a successful full dump
+                    data.changed_states[entity_id] = item
             _LOGGER.debug("Created cache with %s", list(data.last_states))
 
         async def hass_start(hass: HomeAssistant) -> None:
@@ -142,8 +169,19 @@ class RestoreStateData:
         self.store = Store[list[dict[str, Any]]](
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
+        self.changes_store = Store[dict[str, dict[str, Any]]](
+            hass, STORAGE_VERSION, STORAGE_KEY_CHANGES, encoder=JSONEncoder
+        )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # The stored states that changed since the last full dump
+        self.changed_states: dict[str, dict[str, Any]] = {}
+        # The registered entities whose state changed since it was last saved
+        self._dirty_entity_ids: set[str] = set()
+        # The extra data of the registered entities as it was last saved,
+        # it can change without a state change
+        self._saved_extra_data: dict[str, dict[str, Any] | None] = {}
+        self._last_full_dump: datetime | None = None
 
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
@@ -192,42 +230,127 @@ class RestoreStateData:
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        now = dt_util.utcnow()
+        stored_states = self.async_get_stored_states()
+        stored_state_dicts = [stored_state.as_dict() for stored_state in stored_states]
+        changed_states = self.changed_states
+        dirty_entity_ids = self._dirty_entity_ids
+        self.changed_states = {}
+        self._dirty_entity_ids = set()
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            await self.store.async_save(stored_state_dicts)
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            # Keep the changes around so they are saved with the next dump
+            self.changed_states = {**changed_states, **self.changed_states}
+            self._dirty_entity_ids |= dirty_entity_ids
+            return
+
+        self._last_full_dump = now
+        self._saved_extra_data = {
+            stored_state.state.entity_id: stored_state_dict["extra_data"]
+            for stored_state, stored_state_dict in zip(
+                stored_states, stored_state_dicts
+            )
+            if stored_state.state.entity_id in self.entities
+        }
+        await self._async_save_changed_states()
+
+    async def async_dump_changed_states(self) -> None:
+        """Save the states that changed since they were last saved to storage.
+
+        The extra data of every registered entity is compared with what was
+        last saved since it can change without a state change.
+        """
+        _LOGGER.debug("Dumping changed states")
+        now = dt_util.utcnow()
+        dirty_entity_ids = self._dirty_entity_ids
+        self._dirty_entity_ids = set()
+        for entity_id in sorted(self.entities):
+            extra_data = self.entities[entity_id].extra_restore_state_data
+            extra_data_dict = extra_data.as_dict() if extra_data else None
+            if (
+                entity_id not in dirty_entity_ids
+                and extra_data_dict == self._saved_extra_data.get(entity_id)
+            ):
+                continue
+            state = self.hass.states.get(entity_id)
+            # Ignore all states that are entity registry placeholders
+            if state is None or state.attributes.get(ATTR_RESTORED):
+                continue
+            self.changed_states[entity_id] = {
+                "state": state.as_dict(),
+                "extra_data": extra_data_dict,
+                "last_seen": now,
+            }
+            self._saved_extra_data[entity_id] = extra_data_dict
+        await self._async_save_changed_states()
+
+    async def _async_save_changed_states(self) -> None:
+        """Save the states that changed since the last full dump."""
+        try:
+            await self.changes_store.async_save(dict(self.changed_states))
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving changed states", exc_info=exc)
+
+    @callback
+    def _async_should_compact(self) -> bool:
+        """Return if the next dump should rewrite all states."""
+        if self._last_full_dump is None:
+            return True
+        if dt_util.utcnow() - self._last_full_dump >= STATE_COMPACT_INTERVAL:
+            return True
+        # Once most of the states changed a full dump is cheaper
+        changed = len(self.changed_states.keys() | self._dirty_entity_ids)
+        return changed * 2 > len(self.entities)
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
         """Set up the restore state listeners."""
 
         async def _async_dump_states(*_: Any) -> None:
-            await self.async_dump_states()
+            if self._async_should_compact():
+                await self.async_dump_states()
+            else:
+                await self.async_dump_changed_states()
+
+        async def _async_dump_states_at_stop(*_: Any) -> None:
+            cancel_interval()
+            # Usually only what changed is saved so stopping does not
+            # depend on the number of entities
+            await _async_dump_states()
 
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
         # has started and the old states have been read.
-        self.hass.async_create_task(_async_dump_states())
+        self.hass.async_create_task(self.async_dump_states())
 
         # Dump states periodically
         cancel_interval = async_track_time_interval(
             self.hass, _async_dump_states, STATE_DUMP_INTERVAL
         )
 
-        async def _async_dump_states_at_stop(*_: Any) -> None:
-            cancel_interval()
-            await self.async_dump_states()
-
         # Dump states when stopping hass
         self.hass.bus.async_listen_once(
             EVENT_HOMEASSISTANT_STOP, _async_dump_states_at_stop
         )
 
+        @callback
+        def _async_is_restore_entity(event: Event) -> bool:
+            return event.data["entity_id"] in self.entities
+
+        @callback
+        def _async_state_changed(event: Event) -> None:
+            self._dirty_entity_ids.add(event.data["entity_id"])
+
+        # Track the entities that have to be saved with the next dump
+        self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            _async_state_changed,
+            event_filter=_async_is_restore_entity,
+            run_immediately=True,
+        )
+
     @callback
     def async_restore_entity_added(self, entity: RestoreEntity) -> None:
         """Store this entity's state when hass is shutdown."""
@@ -247,11 +370,13 @@ class RestoreStateData:
         if state is not None:
             state = State.from_dict(_encode_complex(state.as_dict()))
         if state is not None:
-            self.last_states[entity_id] = StoredState(
-                state, extra_data, dt_util.utcnow()
-            )
+            stored_state = StoredState(state, extra_data, dt_util.utcnow())
+            self.last_states[entity_id] = stored_state
+            self.changed_states[entity_id] = stored_state.as_dict()
 
         self.entities.pop(entity_id)
+        self._dirty_entity_ids.discard(entity_id)
+        self._saved_extra_data.pop(entity_id, None)
 
 
 def _encode(value: Any) -> Any:
@@ -533,22 +533,27 @@ def async_set_service_schema(
 @bind_hass
 async def entity_service_call(  # noqa: C901
     hass: HomeAssistant,
-    platforms: Iterable[EntityPlatform],
+    platforms: Iterable[EntityPlatform] | dict[str, Entity],
     func: str | Callable[..., Any],
     call: ServiceCall,
     required_features: Iterable[int] | None = None,
 ) -> None:
     """Handle an entity service call.
 
-    Calls all platforms simultaneously.
+    Calls all platforms simultaneously. The entities can be passed as a dict
+    of entity_id to entity, which allows looking up the targeted entities
+    directly instead of going over all entities of the platforms.
     """
     if call.context.user_id:
         user = await hass.auth.async_get_user(call.context.user_id)
         if user is None:
             raise UnknownUser(context=call.context)
-        entity_perms: None | (
-            Callable[[str, str], bool]
-        ) = user.permissions.check_entity
+        # Skip checking every entity if the user can control all of them
+        entity_perms: None | (Callable[[str, str], bool]) = (
+            None
+            if user.permissions.access_all_entities(POLICY_CONTROL)
+            else user.permissions.check_entity
+        )
     else:
         entity_perms = None
 
@@ -573,17 +578,28 @@ async def entity_service_call(  # noqa: C901
     else:
         data = call
 
-    # Check the permissions
-
     # A list with entities to call the service on.
     entity_candidates: list[Entity] = []
 
-    if entity_perms is None:
-        for platform in platforms:
-            if target_all_entities:
+    if target_all_entities:
+        if isinstance(platforms, dict):
+            entity_candidates.extend(platforms.values())
+        else:
+            for platform in platforms:
                 entity_candidates.extend(platform.entities.values())
-            else:
-                assert all_referenced is not None
+    else:
+        assert all_referenced is not None
+        if isinstance(platforms, dict):
+            # Sorted so the entities are always called in the same order
+            entity_candidates.extend(
+                [
+                    entity
+                    for entity_id in sorted(all_referenced)
+                    if (entity := platforms.get(entity_id)) is not None
+                ]
+            )
+        else:
+            for platform in platforms:
                 entity_candidates.extend(
                     [
                         entity
@@ -592,38 +608,24 @@ async def entity_service_call(  # noqa: C901
                     ]
                 )
 
-    elif target_all_entities:
+    # Check the permissions
+    if entity_perms is not None and target_all_entities:
         # If we target all entities, we will select all entities the user
         # is allowed to control.
-        for platform in platforms:
-            entity_candidates.extend(
-                [
-                    entity
-                    for entity in platform.entities.values()
-                    if entity_perms(entity.entity_id, POLICY_CONTROL)
-                ]
-            )
-
-    else:
-        assert all_referenced is not None
-
-        for platform in platforms:
-            platform_entities = []
-            for entity in platform.entities.values():
-
-                if entity.entity_id not in all_referenced:
-                    continue
-
-                if not entity_perms(entity.entity_id, POLICY_CONTROL):
-                    raise Unauthorized(
-                        context=call.context,
-                        entity_id=entity.entity_id,
-                        permission=POLICY_CONTROL,
-                    )
-
-                platform_entities.append(entity)
+        entity_candidates = [
+            entity
+            for entity in entity_candidates
+            if entity_perms(entity.entity_id, POLICY_CONTROL)
+        ]
 
-            entity_candidates.extend(platform_entities)
+    elif entity_perms is not None:
+        for entity in entity_candidates:
+            if not entity_perms(entity.entity_id, POLICY_CONTROL):
+                raise Unauthorized(
+                    context=call.context,
+                    entity_id=entity.entity_id,
+                    permission=POLICY_CONTROL,
+                )
 
     if not target_all_entities:
         assert referenced is not None
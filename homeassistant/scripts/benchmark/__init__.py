@@ -8,6 +8,8 @@ from collections.abc import Callable
 from contextlib import suppress
 import json
 import logging
+import os
+import tempfile
 from timeit import default_timer as timer
 from typing import TypeVar
 
@@ -120,6 +122,47 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_state_changed_filtered_listeners(hass):
+    """Fire 100k state changed events with 5000 entity filtered listeners."""
+    count = 0
+    events_to_fire = 10**5
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    def _make_filter(entity_id):
+        @core.callback
+        def event_filter(event):
+            """Filter event."""
+            return event.data["entity_id"] == entity_id
+
+        return event_filter
+
+    for idx in range(5000):
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            listener,
+            event_filter=_make_filter(f"light.kitchen{idx}"),
+        )
+
+    event_data = {"entity_id": "light.kitchen0", "old_state": None, "new_state": None}
+
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -224,6 +267,22 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_machine_domain_filter(hass):
+    """Run 100k domain filtered lookups against 6000 states in 30 domains."""
+    for domain_idx in range(30):
+        for idx in range(200):
+            hass.states.async_set(f"domain{domain_idx}.entity{idx}", "on")
+
+    start = timer()
+
+    for _ in range(10**5):
+        hass.states.async_all("domain0")
+        hass.states.async_entity_ids_count("domain1")
+
+    return timer() - start
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -311,6 +370,174 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def recorder_write_states(hass):
+    """Write 100k state changes of 500 entities with the session and bulk paths.
+
+    Uses a temporary SQLite database unless RECORDER_BENCHMARK_DB_URL
+    is set. The tables in that database are dropped and recreated so
+    it must point to a scratch MariaDB or PostgreSQL database.
+    """
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.bulk_insert import (
+        PendingState,
+        insert_pending_states,
+    )
+    from homeassistant.components.recorder.db_schema import Base, States, StatesMeta
+
+    events_to_write = 10**5
+    # 300 state changes per second with the default commit interval
+    commit_size = 300
+    entity_ids = [f"sensor.benchmark{idx}" for idx in range(500)]
+    events = [
+        core.Event(
+            EVENT_STATE_CHANGED,
+            {
+                "entity_id": entity_ids[idx % len(entity_ids)],
+                "old_state": None,
+                "new_state": core.State(entity_ids[idx % len(entity_ids)], str(idx)),
+            },
+        )
+        for idx in range(events_to_write)
+    ]
+
+    def _setup_database(engine):
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            states_meta = [StatesMeta(entity_id=entity_id) for entity_id in entity_ids]
+            session.add_all(states_meta)
+            session.commit()
+            return {meta.entity_id: meta.metadata_id for meta in states_meta}
+
+    def _write_with_session(engine, metadata_ids):
+        old_states = {}
+        with Session(engine) as session:
+            session.expire_on_commit = False
+            for offset in range(0, events_to_write, commit_size):
+                pending_expunge = []
+                for event in events[offset : offset + commit_size]:
+                    entity_id = event.data["entity_id"]
+                    dbstate = States.from_event(event)
+                    dbstate.entity_id = None
+                    dbstate.metadata_id = metadata_ids[entity_id]
+                    if old_state := old_states.pop(entity_id, None):
+                        if old_state.state_id:
+                            dbstate.old_state_id = old_state.state_id
+                        else:
+                            dbstate.old_state = old_state
+                    old_states[entity_id] = dbstate
+                    pending_expunge.append(dbstate)
+                    session.add(dbstate)
+                session.commit()
+                for dbstate in pending_expunge:
+                    if dbstate in session:
+                        session.expunge(dbstate)
+
+    def _write_with_bulk_insert(engine, metadata_ids):
+        old_states = {}
+        with Session(engine) as session:
+            for offset in range(0, events_to_write, commit_size):
+                pending_states = []
+                pending_old_states = {}
+                for event in events[offset : offset + commit_size]:
+                    entity_id = event.data["entity_id"]
+                    row = States.row_from_event(event)
+                    row["entity_id"] = None
+                    row["metadata_id"] = metadata_ids[entity_id]
+                    pending = PendingState(row, pending_old_states.pop(entity_id, None))
+                    if old_state_id := old_states.pop(entity_id, None):
+                        row["old_state_id"] = old_state_id
+                    pending_old_states[entity_id] = pending
+                    pending_states.append(pending)
+                insert_pending_states(session, pending_states, True)
+                session.commit()
+                for entity_id, pending in pending_old_states.items():
+                    old_states[entity_id] = pending.state_id
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_url = os.environ.get(
+            "RECORDER_BENCHMARK_DB_URL", f"sqlite:///{tmpdir}/benchmark.db"
+        )
+        engine = create_engine(db_url)
+        runtimes = {}
+        for name, write in (
+            ("session", _write_with_session),
+            ("bulk insert", _write_with_bulk_insert),
+        ):
+            metadata_ids = _setup_database(engine)
+            start = timer()
+            write(engine, metadata_ids)
+            runtimes[name] = timer() - start
+            print(f"{name}: {events_to_write / runtimes[name]:.0f} events/s")
+        engine.dispose()
+
+    return runtimes["bulk insert"]
+
+
+@benchmark
+async def statistics_sensor_update(hass):
+    """Compare the per update cost of the statistics sensor aggregates.
+
+    Recomputing from all samples with the statistics module is compared with
+    the incrementally maintained sample buffer for growing buffer sizes.
+    """
+    # pylint: disable=import-outside-toplevel
+    from datetime import timedelta
+    import random
+    import statistics
+
+    from homeassistant.components.statistics.samples import SampleBuffer
+    from homeassistant.util import dt as dt_util
+
+    updates = 1000
+    runtime = 0.0
+    for size in (100, 1000, 10000):
+        rng = random.Random(size)
+        now = dt_util.utcnow()
+        samples = [
+            (rng.uniform(0, 100), now + timedelta(seconds=idx))
+            for idx in range(size + updates)
+        ]
+        buffer = SampleBuffer(size, keep_sorted=True)
+        for value, age in samples[:size]:
+            buffer.append(value, age)
+        states = collections.deque((value for value, _ in samples[:size]), maxlen=size)
+
+        start = timer()
+        for value, _ in samples[size:]:
+            states.append(value)
+            statistics.mean(states)
+            statistics.stdev(states)
+            statistics.median(states)
+            statistics.quantiles(states, n=4)
+            max(states)
+            min(states)
+        recompute = (timer() - start) / updates
+
+        start = timer()
+        for value, age in samples[size:]:
+            buffer.append(value, age)
+            _ = buffer.mean
+            _ = buffer.standard_deviation
+            _ = buffer.median
+            buffer.quantiles(4, "exclusive")
+            _ = buffer.value_max
+            _ = buffer.value_min
+        incremental = (timer() - start) / updates
+        runtime += incremental * updates
+
+        print(
+            f"{size} samples: recompute {recompute * 1e6:.1f}µs, "
+            f"incremental {incremental * 1e6:.1f}µs per update"
+        )
+
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
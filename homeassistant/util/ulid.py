@@ -4,6 +4,9 @@ from __future__ import annotations
 from random import getrandbits
 import time
 
+_ENCODE = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_DECODE = {char: idx for idx, char in enumerate(_ENCODE)}
+
 
 def ulid_hex() -> str:
     """Generate a ULID in lowercase hex that will work for a UUID.
@@ -38,13 +41,17 @@ def ulid(timestamp: float | None = None) -> str:
     ulid_bytes = int((timestamp or time.time()) * 1000).to_bytes(
         6, byteorder="big"
     ) + int(getrandbits(80)).to_bytes(10, byteorder="big")
+    return bytes_to_ulid(ulid_bytes)
+
 
+def bytes_to_ulid(ulid_bytes: bytes) -> str:
+    """Convert a 16 byte ulid to its 26 character string form."""
     # This is base32 crockford encoding with the loop unrolled for performance
     #
     # This code is adapted from:
     # https://github.com/ahawker/ulid/blob/06289583e9de4286b4d80b4ad000d137816502ca/ulid/base32.py#L102
     #
-    enc = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+    enc = _ENCODE
     return (
         enc[(ulid_bytes[0] & 224) >> 5]
         + enc[ulid_bytes[0] & 31]
@@ -73,3 +80,22 @@ def ulid(timestamp: float | None = None) -> str:
         + enc[((ulid_bytes[14] & 3) << 3) | ((ulid_bytes[15] & 224) >> 5)]
         + enc[ulid_bytes[15] & 31]
     )
+
+
+def ulid_to_bytes(value: str) -> bytes:
+    """Convert a 26 character ulid string to its 16 byte form.
+
+    Raises ValueError if the value is not a valid ulid.
+    """
+    if len(value) != 26:
+        raise ValueError(f"Invalid ulid: {value}")
+    decode = _DECODE
+    number = 0
+    try:
+        for char in value:
+            number = (number << 5) | decode[char]
+    except KeyError as err:
+        raise ValueError(f"Invalid ulid: {value}") from err
+    if number >> 128:
+        raise ValueError(f"Invalid ulid: {value}")
+    return number.to_bytes(16, byteorder="big")
@@ -5,6 +5,7 @@ import copy
 from http import HTTPStatus
 
 from aiohttp.client_exceptions import ClientResponseError
+import pytest
 
 from homeassistant.components.buienradar.const import CONF_COUNTRY, CONF_DELTA, DOMAIN
 from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE
@@ -68,6 +69,7 @@ async def test_fetching_url_and_caching(aioclient_mock, hass, hass_client):
     assert aioclient_mock.call_count == 1
 
 
+@pytest.mark.usefixtures("disable_camera_snapshot_cache")
 async def test_expire_delta(aioclient_mock, hass, hass_client):
     """Test that the cache expires after delta."""
     aioclient_mock.get(radar_map_url(), text="hello world")
@@ -158,6 +160,7 @@ async def test_failure_response_not_cached(aioclient_mock, hass, hass_client):
     assert aioclient_mock.call_count == 2
 
 
+@pytest.mark.usefixtures("disable_camera_snapshot_cache")
 async def test_last_modified_updates(aioclient_mock, hass, hass_client):
     """Test that it does respect HTTP not modified."""
     # Build Last-Modified header value
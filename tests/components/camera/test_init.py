@@ -210,6 +210,59 @@ async def test_get_image_fails(hass, image_mock_url):
         await camera.async_get_image(hass, "camera.demo_camera")
 
 
+async def test_get_image_coalesced_and_cached(hass, image_mock_url):
+    """Test concurrent requests share a fetch and the image is cached."""
+    release = asyncio.Event()
+
+    async def _camera_image(width=None, height=None):
+        await release.wait()
+        return b"Test"
+
+    with patch("homeassistant.components.camera.SNAPSHOT_CACHE_TTL", 60), patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=_camera_image,
+    ) as mock_camera_image:
+        requests = [
+            hass.async_create_task(camera.async_get_image(hass, "camera.demo_camera"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        images = await asyncio.gather(*requests)
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+
+    assert mock_camera_image.call_count == 1
+    assert [image.content for image in images] == [b"Test"] * 3
+    assert image.content == b"Test"
+
+
+async def test_get_image_scaled_from_cached_frame(hass, image_mock_url):
+    """Test scaled images are made from a fresh frame in the executor."""
+    with patch("homeassistant.components.camera.SNAPSHOT_CACHE_TTL", 60), patch(
+        "homeassistant.components.demo.camera.Path.read_bytes",
+        autospec=True,
+        return_value=b"Valid jpeg",
+    ) as mock_camera, patch(
+        "homeassistant.components.camera.scale_jpeg_camera_image",
+        return_value=EMPTY_8_6_JPEG,
+    ) as mock_scale, patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as mock_executor_job:
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        scaled = await camera.async_get_image(
+            hass, "camera.demo_camera", width=4, height=3
+        )
+        scaled_again = await camera.async_get_image(
+            hass, "camera.demo_camera", width=4, height=3
+        )
+
+    assert mock_camera.call_count == 1
+    assert mock_scale.call_count == 1
+    assert mock_executor_job.call_args_list[-1][0] == (mock_scale, image, 4, 3)
+    assert image.content == b"Valid jpeg"
+    assert scaled.content == scaled_again.content == EMPTY_8_6_JPEG
+
+
 async def test_snapshot_service(hass, mock_camera):
     """Test snapshot service."""
     mopen = mock_open()
@@ -514,6 +567,51 @@ async def test_camera_proxy_stream(hass, mock_camera, hass_client):
         assert response.status == HTTPStatus.BAD_GATEWAY
 
 
+async def test_camera_proxy_still_stream_shared(hass, image_mock_url, hass_client):
+    """Test 50 viewers of a still stream share a single producer."""
+    frame = b"--frameboundary\r\nContent-Type: image/jpg\r\n"
+    frame += b"Content-Length: 6\r\n\r\nframe0\r\n"
+    release = asyncio.Event()
+    images = []
+
+    async def _camera_image(width=None, height=None):
+        if images:
+            await release.wait()
+        images.append(b"frame%d" % len(images))
+        return images[-1]
+
+    client = await hass_client()
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=_camera_image,
+    ):
+        responses = await asyncio.gather(
+            *(
+                client.get("/api/camera_proxy_stream/camera.demo_camera?interval=0.5")
+                for _ in range(50)
+            )
+        )
+        for response in responses:
+            assert response.status == HTTPStatus.OK
+            # The first frame is sent twice
+            assert await response.content.readexactly(2 * len(frame)) == 2 * frame
+
+        hubs = hass.data[camera.DATA_STILL_STREAMS]
+        assert len(hubs) == 1
+        assert len(next(iter(hubs.values())).viewers) == 50
+        assert images == [b"frame0"]
+
+        for response in responses:
+            response.close()
+        # The viewers leave when the next frame can't be written
+        release.set()
+        for _ in range(200):
+            if not hubs:
+                break
+            await asyncio.sleep(0.01)
+        assert not hubs
+
+
 async def test_websocket_web_rtc_offer(
     hass,
     hass_ws_client,
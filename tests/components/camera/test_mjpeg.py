@@ -0,0 +1,55 @@
+"""Test the MJPEG streams of camera stills."""
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+from homeassistant.components.camera.mjpeg import (
+    StillStreamHub,
+    StillStreamViewer,
+    frame_mjpeg_image,
+)
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+
+
+def test_frame_mjpeg_image():
+    """Test framing an image as a multipart chunk."""
+    assert frame_mjpeg_image("image/jpeg", b"frame") == (
+        b"--frameboundary\r\nContent-Type: image/jpeg\r\n"
+        b"Content-Length: 5\r\n\r\nframe\r\n"
+    )
+
+
+async def test_slow_viewer_drops_frames():
+    """Test a viewer that does not keep up only gets the newest frame."""
+    viewer = StillStreamViewer()
+    viewer.async_put(b"1")
+    viewer.async_put(b"2")
+    viewer.async_put(b"3")
+
+    assert viewer.dropped == 2
+    assert await viewer.async_get() == b"3"
+
+    viewer.async_put(b"4")
+    viewer.async_put(None)
+
+    assert viewer.dropped == 3
+    assert await viewer.async_get() is None
+
+
+async def test_hub_stops_with_hass(hass):
+    """Test the producer is cancelled and the viewers end when hass stops."""
+    images = asyncio.Queue()
+    closed = Mock()
+    hub = StillStreamHub(hass, images.get, "image/jpeg", 0, closed)
+    response = Mock(write=AsyncMock())
+
+    stream = asyncio.create_task(hub.async_stream(response))
+    await images.put(b"frame")
+    while response.write.call_count < 2:
+        await asyncio.sleep(0)
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await asyncio.wait_for(stream, 1)
+    await asyncio.sleep(0)
+
+    assert closed.call_count == 1
+    assert hub._producer.cancelled()
@@ -24,6 +24,16 @@ def prevent_io():
         yield
 
 
+@pytest.fixture
+def disable_camera_snapshot_cache():
+    """Fetch a new camera snapshot on every request.
+
+    Used by tests of integrations that check their own image refetch logic.
+    """
+    with patch("homeassistant.components.camera.SNAPSHOT_CACHE_TTL", 0):
+        yield
+
+
 @pytest.fixture
 def entity_registry_enabled_by_default() -> Generator[AsyncMock, None, None]:
     """Test fixture that ensures all entities are enabled in the registry."""
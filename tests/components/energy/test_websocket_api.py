@@ -1,9 +1,15 @@
 """Test the Energy websocket API."""
-from unittest.mock import AsyncMock, Mock
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from homeassistant.components.energy import data, is_configured
+from homeassistant.components.recorder import statistics
+from homeassistant.components.recorder.const import (
+    EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
+)
 from homeassistant.components.recorder.statistics import async_add_external_statistics
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
@@ -1008,3 +1014,292 @@ async def test_fossil_energy_consumption_checks(hass, hass_ws_client):
     assert msg["id"] == 2
     assert not msg["success"]
     assert msg["error"] == {"code": "invalid_end_time", "message": "Invalid end_time"}
+
+
+@pytest.mark.freeze_time("2021-08-01 00:00:00+00:00")
+async def test_energy_statistics(hass, hass_ws_client, recorder_mock):
+    """Test energy/statistics returns period deltas of all configured sources."""
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+
+    manager = await data.async_get_manager(hass)
+    await manager.async_update(
+        {
+            "energy_sources": [
+                {
+                    "type": "grid",
+                    "flow_from": [
+                        {
+                            "stat_energy_from": "test:total_energy_import",
+                            "stat_cost": None,
+                            "entity_energy_from": None,
+                            "entity_energy_price": None,
+                            "number_energy_price": None,
+                        },
+                    ],
+                    "flow_to": [],
+                    "cost_adjustment_day": 0,
+                },
+            ],
+            "device_consumption": [{"stat_consumption": "test:heat_pump"}],
+        }
+    )
+
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 00:00:00"))
+    period2 = dt_util.as_utc(dt_util.parse_datetime("2021-09-30 23:00:00"))
+    period2_day_start = dt_util.as_utc(dt_util.parse_datetime("2021-09-30 00:00:00"))
+    period3 = dt_util.as_utc(dt_util.parse_datetime("2021-10-01 00:00:00"))
+    period4 = dt_util.as_utc(dt_util.parse_datetime("2021-10-15 12:00:00"))
+    period4_day_start = dt_util.as_utc(dt_util.parse_datetime("2021-10-15 00:00:00"))
+
+    def _metadata(statistic_id: str, has_sum: bool) -> dict:
+        return {
+            "has_mean": not has_sum,
+            "has_sum": has_sum,
+            "name": None,
+            "source": "test",
+            "statistic_id": statistic_id,
+            "unit_of_measurement": "kWh" if has_sum else "%",
+        }
+
+    async_add_external_statistics(
+        hass,
+        _metadata("test:total_energy_import", True),
+        [
+            {"start": period, "state": 0, "sum": sum_}
+            for period, sum_ in ((period1, 2), (period2, 3), (period3, 5), (period4, 8))
+        ],
+    )
+    async_add_external_statistics(
+        hass,
+        _metadata("test:heat_pump", True),
+        [
+            {"start": period, "state": 0, "sum": sum_}
+            for period, sum_ in ((period1, 10), (period2, 20), (period4, 40))
+        ],
+    )
+    async_add_external_statistics(
+        hass,
+        _metadata("test:fossil_percentage", False),
+        [
+            {"start": period, "mean": mean}
+            for period, mean in ((period2, 30), (period3, 60), (period4, 90))
+        ],
+    )
+    await async_wait_recording_done(hass)
+
+    # The hour before start_time is the baseline for the first delta
+    start_time = (period1 + timedelta(hours=1)).isoformat()
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "energy/statistics",
+            "start_time": start_time,
+            "co2_statistic_id": "test:fossil_percentage",
+            "period": "hour",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "statistics": {
+            "test:heat_pump": {
+                period2.isoformat(): pytest.approx(10.0),
+                period4.isoformat(): pytest.approx(20.0),
+            },
+            "test:total_energy_import": {
+                period2.isoformat(): pytest.approx(1.0),
+                period3.isoformat(): pytest.approx(2.0),
+                period4.isoformat(): pytest.approx(3.0),
+            },
+        },
+        "fossil_energy_consumption": {
+            period2.isoformat(): pytest.approx(1.0 * 0.3),
+            period3.isoformat(): pytest.approx(2.0 * 0.6),
+            period4.isoformat(): pytest.approx(3.0 * 0.9),
+        },
+    }
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "energy/statistics",
+            "start_time": start_time,
+            "period": "day",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "statistics": {
+            "test:heat_pump": {
+                period2_day_start.isoformat(): pytest.approx(10.0),
+                period4_day_start.isoformat(): pytest.approx(20.0),
+            },
+            "test:total_energy_import": {
+                period2_day_start.isoformat(): pytest.approx(1.0),
+                period3.isoformat(): pytest.approx(2.0),
+                period4_day_start.isoformat(): pytest.approx(3.0),
+            },
+        },
+    }
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "energy/statistics",
+            "start_time": start_time,
+            "end_time": period4.isoformat(),
+            "period": "month",
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "statistics": {
+            "test:heat_pump": {period1.isoformat(): pytest.approx(10.0)},
+            "test:total_energy_import": {
+                period1.isoformat(): pytest.approx(1.0),
+                period3.isoformat(): pytest.approx(2.0),
+            },
+        },
+    }
+
+
+@pytest.mark.freeze_time("2021-08-01 00:00:00+00:00")
+async def test_energy_statistics_cached(hass, hass_ws_client, recorder_mock):
+    """Test energy/statistics results are cached until the next hourly compile."""
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+
+    manager = await data.async_get_manager(hass)
+    await manager.async_update(
+        {"device_consumption": [{"stat_consumption": "test:heat_pump"}]}
+    )
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 00:00:00"))
+    period2 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 01:00:00"))
+    period3 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 02:00:00"))
+    metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": None,
+        "source": "test",
+        "state_unit_of_measurement": "kWh",
+        "statistic_id": "test:heat_pump",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        metadata,
+        [{"start": period1, "state": 0, "sum": 1}, {"start": period2, "sum": 3}],
+    )
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    request = {
+        "type": "energy/statistics",
+        "start_time": period2.isoformat(),
+        "period": "hour",
+    }
+    await client.send_json({"id": 1, **request})
+    response = await client.receive_json()
+    assert response["result"] == {
+        "statistics": {"test:heat_pump": {period2.isoformat(): pytest.approx(2.0)}}
+    }
+
+    # Importing statistics drops the cached results
+    async_add_external_statistics(hass, metadata, [{"start": period3, "sum": 6}])
+    await async_wait_recording_done(hass)
+    await hass.async_block_till_done()
+
+    fresh_result = {
+        "statistics": {
+            "test:heat_pump": {
+                period2.isoformat(): pytest.approx(2.0),
+                period3.isoformat(): pytest.approx(3.0),
+            }
+        }
+    }
+    await client.send_json({"id": 2, **request})
+    response = await client.receive_json()
+    assert response["result"] == fresh_result
+
+    with patch(
+        "homeassistant.components.recorder.statistics.statistics_during_period"
+    ) as statistics_during_period:
+        await client.send_json({"id": 3, **request})
+        response = await client.receive_json()
+    assert response["result"] == fresh_result
+    assert not statistics_during_period.called
+
+    hass.bus.async_fire(EVENT_RECORDER_HOURLY_STATISTICS_GENERATED)
+    await hass.async_block_till_done()
+    assert hass.data["energy"]["statistics_cache"] == {}
+
+
+@pytest.mark.freeze_time("2021-08-01 00:00:00+00:00")
+async def test_energy_statistics_not_cached_when_cleared_during_query(
+    hass, hass_ws_client, recorder_mock
+):
+    """Test a result read before the statistics changed is not cached."""
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+
+    manager = await data.async_get_manager(hass)
+    await manager.async_update(
+        {"device_consumption": [{"stat_consumption": "test:heat_pump"}]}
+    )
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 00:00:00"))
+    period2 = dt_util.as_utc(dt_util.parse_datetime("2021-09-01 01:00:00"))
+    async_add_external_statistics(
+        hass,
+        {
+            "has_mean": False,
+            "has_sum": True,
+            "name": None,
+            "source": "test",
+            "state_unit_of_measurement": "kWh",
+            "statistic_id": "test:heat_pump",
+            "unit_of_measurement": "kWh",
+        },
+        [{"start": period1, "state": 0, "sum": 1}, {"start": period2, "sum": 3}],
+    )
+    await async_wait_recording_done(hass)
+    await hass.async_block_till_done()
+
+    statistics_during_period = statistics.statistics_during_period
+
+    async def _async_clear_cache() -> None:
+        generation = hass.data["energy"]["statistics_cache_generation"]
+        hass.bus.async_fire(EVENT_RECORDER_HOURLY_STATISTICS_GENERATED)
+        while hass.data["energy"]["statistics_cache_generation"] == generation:
+            await asyncio.sleep(0)
+
+    def _statistics_during_period(*args):
+        """Compile an hour of statistics while the query runs."""
+        result = statistics_during_period(*args)
+        asyncio.run_coroutine_threadsafe(_async_clear_cache(), hass.loop).result()
+        return result
+
+    client = await hass_ws_client()
+    with patch(
+        "homeassistant.components.recorder.statistics.statistics_during_period",
+        side_effect=_statistics_during_period,
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "energy/statistics",
+                "start_time": period2.isoformat(),
+                "period": "hour",
+            }
+        )
+        response = await client.receive_json()
+    assert response["result"] == {
+        "statistics": {"test:heat_pump": {period2.isoformat(): pytest.approx(2.0)}}
+    }
+    assert hass.data["energy"]["statistics_cache"] == {}
@@ -29,6 +29,7 @@ from tests.common import AsyncMock, Mock, MockConfigEntry
 
 
 @respx.mock
+@pytest.mark.usefixtures("disable_camera_snapshot_cache")
 async def test_fetching_url(hass, hass_client, fakeimgbytes_png):
     """Test that it fetches the given url."""
     respx.get("http://example.com").respond(stream=fakeimgbytes_png)
@@ -119,6 +120,7 @@ async def test_fetching_url_with_verify_ssl(hass, hass_client, fakeimgbytes_png)
 
 
 @respx.mock
+@pytest.mark.usefixtures("disable_camera_snapshot_cache")
 async def test_limit_refetch(hass, hass_client, fakeimgbytes_png, fakeimgbytes_jpg):
     """Test that it fetches the given url."""
     respx.get("http://example.com/0a").respond(stream=fakeimgbytes_png)
@@ -413,6 +415,7 @@ async def test_camera_content_type(
 
 
 @respx.mock
+@pytest.mark.usefixtures("disable_camera_snapshot_cache")
 async def test_timeout_cancelled(hass, hass_client, fakeimgbytes_png, fakeimgbytes_jpg):
     """Test that timeouts and cancellations return last image."""
 
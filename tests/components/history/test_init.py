@@ -1,5 +1,6 @@
 """The tests the History component."""
 # pylint: disable=protected-access,invalid-name
+import asyncio
 from datetime import timedelta
 from http import HTTPStatus
 import json
@@ -1046,6 +1047,222 @@ async def test_history_during_period(hass, hass_ws_client, recorder_mock):
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_stream(hass, hass_ws_client, recorder_mock):
+    """Test history_during_period streamed entity by entity."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    hass.states.async_set("sensor.two", "on", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "off", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "stream": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["result"] is None
+
+    streamed_states = {}
+    while True:
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert response["type"] == "event"
+        if response["event"].get("done"):
+            break
+        assert len(response["event"]["states"]) == 1
+        streamed_states |= response["event"]["states"]
+
+    assert [state["s"] for state in streamed_states["sensor.one"]] == ["on", "off"]
+    assert [state["s"] for state in streamed_states["sensor.two"]] == ["on"]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "significant_changes_only": False,
+            "no_attributes": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == streamed_states
+
+    future = dt_util.utcnow() + timedelta(hours=10)
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "history/history_during_period",
+            "start_time": future.isoformat(),
+            "stream": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+    response = await client.receive_json()
+    assert response["id"] == 3
+    assert response["event"] == {"done": True}
+
+
+async def test_history_during_period_stream_chunks(hass, hass_ws_client, recorder_mock):
+    """Test streaming resumes each chunk after the last row read."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("1", "2", "3"):
+        hass.states.async_set("sensor.one", state)
+        hass.states.async_set("sensor.two", state)
+        hass.states.async_set("sensor.three", state)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    with patch("homeassistant.components.recorder.history.STREAM_CHUNK_SIZE", 2):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "stream": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        streamed_states = {}
+        while True:
+            response = await client.receive_json()
+            if response["event"].get("done"):
+                break
+            streamed_states |= response["event"]["states"]
+
+    assert list(streamed_states) == ["sensor.one", "sensor.three", "sensor.two"]
+    for entity_id in streamed_states:
+        assert [state["s"] for state in streamed_states[entity_id]] == [
+            "1",
+            "2",
+            "3",
+        ]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "significant_changes_only": False,
+            "no_attributes": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["result"] == streamed_states
+
+
+async def test_history_during_period_stream_client_not_reading(
+    hass, hass_ws_client, recorder_mock
+):
+    """Test history_during_period stops streaming when the client stops reading."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+
+    async def _never_writable(*args):
+        await asyncio.Event().wait()
+
+    with patch.object(history, "STREAM_WRITABLE_TIMEOUT", 0.1), patch(
+        "homeassistant.components.websocket_api.connection.ActiveConnection.async_wait_writable",
+        _never_writable,
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "stream": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+
+    assert response["id"] == 1
+    assert not response["success"]
+    assert response["error"]["code"] == "timeout"
+
+
+async def test_history_during_period_stream_unsubscribe(
+    hass, hass_ws_client, recorder_mock
+):
+    """Test unsubscribing stops waiting for the client to catch up."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    hass.states.async_set("sensor.two", "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    waiting = asyncio.Event()
+
+    async def _never_writable(*args):
+        waiting.set()
+        await asyncio.Event().wait()
+
+    with patch(
+        "homeassistant.components.websocket_api.connection.ActiveConnection.async_wait_writable",
+        _never_writable,
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "stream": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        await waiting.wait()
+        await client.send_json(
+            {"id": 2, "type": "unsubscribe_events", "subscription": 1}
+        )
+        response = await client.receive_json()
+        assert response["id"] == 2
+        assert response["success"]
+        await async_recorder_block_till_done(hass)
+
+    # No further states or done message is sent after unsubscribing
+    await client.send_json({"id": 3, "type": "ping"})
+    response = await client.receive_json()
+    assert response["id"] == 3
+
+
 async def test_history_during_period_impossible_conditions(
     hass, hass_ws_client, recorder_mock
 ):
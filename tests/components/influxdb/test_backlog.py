@@ -0,0 +1,90 @@
+"""The tests for the InfluxDB disk backlog."""
+import time
+
+from homeassistant.components.influxdb.backlog import Backlog
+
+
+def test_backlog_survives_restart(tmp_path):
+    """Test the lines that were not written are loaded again after a restart."""
+    backlog = Backlog(str(tmp_path), 1024 * 1024, 2, 0)
+    backlog.load()
+    backlog.append("a v=1\nb v=2\n", 2)
+    backlog.append("c v=3\n", 1)
+
+    segment_id, lines = backlog.claim()
+    assert lines == "a v=1\nb v=2\n"
+    backlog.release(segment_id, True)
+    backlog.stop()
+    assert backlog.claim() is None
+
+    # A line was only partly written when we stopped
+    with open(tmp_path / f"{segment_id + 1:012d}.lp", "a", encoding="utf-8") as file:
+        file.write("d v=")
+
+    backlog = Backlog(str(tmp_path), 1024 * 1024, 2, 0)
+    backlog.load()
+    assert backlog.pending_lines == 1
+    segment_id, lines = backlog.claim()
+    assert lines == "c v=3\n"
+    backlog.release(segment_id, True)
+
+    # New lines go to a new segment
+    backlog.append("e v=5\n", 1)
+    assert backlog.claim()[1] == "e v=5\n"
+
+
+def test_backlog_retries_unwritten_first(tmp_path):
+    """Test a segment that could not be written is claimed again first."""
+    backlog = Backlog(str(tmp_path), 1024 * 1024, 1, 0)
+    backlog.load()
+    backlog.append("a v=1\n", 1)
+    backlog.append("b v=2\n", 1)
+
+    segment_id, lines = backlog.claim()
+    assert lines == "a v=1\n"
+    backlog.release(segment_id, False)
+
+    segment_id, lines = backlog.claim()
+    assert lines == "a v=1\n"
+    backlog.release(segment_id, True)
+    assert backlog.claim()[1] == "b v=2\n"
+
+
+def test_backlog_drops_oldest_when_full(tmp_path):
+    """Test the oldest lines are dropped when the backlog is too large."""
+    backlog = Backlog(str(tmp_path), 20, 1, 0)
+    backlog.load()
+    for idx in range(5):
+        backlog.append(f"m v={idx}\n", 1)
+
+    assert backlog.dropped == 2
+    assert backlog.pending_lines == 3
+    assert len(list(tmp_path.iterdir())) == 3
+    assert backlog.claim()[1] == "m v=2\n"
+
+
+def test_backlog_open_segment_closed_once_aged(tmp_path):
+    """Test a segment that is not full is only claimed once it is old enough."""
+    backlog = Backlog(str(tmp_path), 1024 * 1024, 10, 0.1)
+    backlog.load()
+    start = time.monotonic()
+    backlog.append("a v=1\n", 1)
+
+    assert backlog.claim()[1] == "a v=1\n"
+    assert time.monotonic() - start >= 0.1
+
+
+def test_backlog_wait_empty(tmp_path):
+    """Test waiting for the backlog to be written times out."""
+    backlog = Backlog(str(tmp_path), 1024 * 1024, 10, 3600)
+    backlog.load()
+    assert backlog.wait_empty(0)
+
+    backlog.append("a v=1\n", 1)
+    assert not backlog.wait_empty(0.01)
+
+    # The open segment was closed for the writers
+    segment_id, lines = backlog.claim()
+    assert lines == "a v=1\n"
+    backlog.release(segment_id, True)
+    assert backlog.wait_empty(0)
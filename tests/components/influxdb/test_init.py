@@ -1793,3 +1793,55 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api, get_mock_call",
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_disk_backlog(
+    hass, tmp_path, mock_client, config_ext, get_write_api, get_mock_call
+):
+    """Test the events are written as line protocol through the disk backlog."""
+    hass.config.config_dir = str(tmp_path)
+    config = {"max_backlog_size": 1, "concurrent_writes": 2}
+    config.update(config_ext)
+    handler_method = await _setup(hass, mock_client, config, get_write_api)
+
+    state = MagicMock(
+        state=1,
+        domain="fake",
+        entity_id="entity.id",
+        object_id="entity",
+        attributes={},
+    )
+    event = MagicMock(data={"new_state": state}, time_fired=12345)
+    write_api = get_write_api(mock_client)
+    write_api.side_effect = [IOError("foo"), None]
+
+    # The first write fails, the lines are kept and written on the retry
+    with patch.object(influxdb, "RETRY_DELAY", 0):
+        handler_method(event)
+        hass.data[influxdb.DOMAIN].block_till_done()
+
+    line = "entity.id,domain=fake,entity_id=entity value=1.0 12345"
+    assert write_api.call_count == 2
+    if config_ext == BASE_V1_CONFIG:
+        assert write_api.call_args == call([line], time_precision=None, protocol="line")
+    else:
+        assert write_api.call_args == get_mock_call(f"{line}\n")
+    assert not list((tmp_path / ".storage" / influxdb.BACKLOG_DIR).iterdir())
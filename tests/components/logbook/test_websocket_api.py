@@ -392,6 +392,105 @@ async def test_get_events_invalid_filters(hass, hass_ws_client, recorder_mock):
     assert response["error"]["code"] == "invalid_format"
 
 
+async def test_get_events_paginated(hass, hass_ws_client, recorder_mock):
+    """Test logbook get_events returns pages that follow each other."""
+    now = dt_util.utcnow() - timedelta(minutes=1)
+    await async_setup_component(hass, "logbook", {})
+    await async_recorder_block_till_done(hass)
+
+    for entity_id in ("light.kitchen", "light.hall", "light.porch"):
+        hass.states.async_set(entity_id, STATE_OFF)
+    await hass.async_block_till_done()
+    # The lights change at the same time, so a page ends in the middle
+    # of the rows fired at the time of its cursor
+    with freeze_time(now + timedelta(seconds=1)):
+        for entity_id in ("light.kitchen", "light.hall", "light.porch"):
+            hass.states.async_set(entity_id, STATE_ON)
+        await hass.async_block_till_done()
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.states.async_set("light.hall", STATE_OFF)
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {"id": 1, "type": "logbook/get_events", "start_time": now.isoformat()}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    all_events = response["result"]
+    assert len(all_events) == 5
+
+    events = []
+    cursor = None
+    msg_id = 1
+    while True:
+        msg_id += 1
+        request = {
+            "id": msg_id,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "limit": 2,
+        }
+        if cursor is not None:
+            request["cursor"] = cursor
+        await client.send_json(request)
+        response = await client.receive_json()
+        assert response["success"]
+        page = response["result"]
+        assert len(page["events"]) <= 2
+        events.extend(page["events"])
+        if (cursor := page["cursor"]) is None:
+            break
+
+    assert events == all_events
+
+
+async def test_get_events_paginated_bad_cursor(hass, hass_ws_client, recorder_mock):
+    """Test logbook get_events with an invalid cursor."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "logbook", {})
+    await async_recorder_block_till_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "limit": 2,
+            "cursor": "cats",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_cursor"
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "cursor": f"{now.isoformat()}|s1",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_cursor"
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "logbook/get_events",
+            "start_time": (now + timedelta(hours=10)).isoformat(),
+            "limit": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"events": [], "cursor": None}
+
+
 async def test_get_events_with_device_ids(hass, hass_ws_client, recorder_mock):
     """Test logbook get_events for device ids."""
     now = dt_util.utcnow()
@@ -1657,6 +1756,51 @@ async def test_subscribe_unsubscribe_logbook_stream_entities_past_only(
     assert sum(hass.bus.async_listeners().values()) == init_count
 
 
+@patch("homeassistant.components.logbook.websocket_api.STREAM_CHUNK_SIZE", 2)
+async def test_logbook_stream_delivered_in_chunks(hass, recorder_mock, hass_ws_client):
+    """Test historical events of a logbook stream are delivered in chunks."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await hass.async_block_till_done()
+    hass.states.async_set("light.small", STATE_OFF)
+    for state in (STATE_ON, STATE_OFF, STATE_ON, STATE_OFF, STATE_ON):
+        hass.states.async_set("light.small", state)
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    websocket_client = await hass_ws_client()
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "logbook/event_stream",
+            "start_time": now.isoformat(),
+            "end_time": (dt_util.utcnow() - timedelta(microseconds=1)).isoformat(),
+            "entity_ids": ["light.small"],
+        }
+    )
+
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+
+    states = []
+    for expected_events, partial in ((2, True), (2, True), (1, None)):
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        assert msg["event"].get("partial") is partial
+        assert len(msg["event"]["events"]) == expected_events
+        states.extend(event["state"] for event in msg["event"]["events"])
+
+    assert states == [STATE_ON, STATE_OFF, STATE_ON, STATE_OFF, STATE_ON]
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_big_query(
     hass, recorder_mock, hass_ws_client
@@ -31,6 +31,17 @@ default_config = {
     },
 }
 
+default_inbound_queue = {
+    "depth": 0,
+    "max_depth": 0,
+    "batch_size": 100,
+    "latency": 0.0,
+    "batches": 0,
+    "messages": 0,
+    "last_drain_time": 0.0,
+    "max_drain_time": 0.0,
+}
+
 
 @pytest.fixture(autouse=True)
 def device_tracker_sensor_only():
@@ -60,6 +71,7 @@ async def test_entry_diagnostics(
         "connected": True,
         "devices": [],
         "mqtt_config": default_config,
+        "inbound_queue": default_inbound_queue,
         "mqtt_debug_info": {"entities": [], "triggers": []},
     }
 
@@ -144,6 +156,7 @@ async def test_entry_diagnostics(
         "connected": True,
         "devices": [expected_device],
         "mqtt_config": default_config,
+        "inbound_queue": default_inbound_queue,
         "mqtt_debug_info": expected_debug_info,
     }
 
@@ -153,6 +166,7 @@ async def test_entry_diagnostics(
         "connected": True,
         "device": expected_device,
         "mqtt_config": default_config,
+        "inbound_queue": default_inbound_queue,
         "mqtt_debug_info": expected_debug_info,
     }
 
@@ -267,6 +281,7 @@ async def test_redact_diagnostics(
         "connected": True,
         "devices": [expected_device],
         "mqtt_config": expected_config,
+        "inbound_queue": default_inbound_queue,
         "mqtt_debug_info": expected_debug_info,
     }
 
@@ -276,5 +291,6 @@ async def test_redact_diagnostics(
         "connected": True,
         "device": expected_device,
         "mqtt_config": expected_config,
+        "inbound_queue": default_inbound_queue,
         "mqtt_debug_info": expected_debug_info,
     }
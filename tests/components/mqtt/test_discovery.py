@@ -465,6 +465,44 @@ async def test_rediscover(hass, mqtt_mock_entry_no_yaml_config, caplog):
     assert state is not None
 
 
+@patch("homeassistant.components.mqtt.PLATFORMS", [Platform.BINARY_SENSOR])
+async def test_unchanged_payload_skipped(hass, mqtt_mock_entry_no_yaml_config):
+    """Test an unchanged discovery payload is not parsed again."""
+    await mqtt_mock_entry_no_yaml_config()
+    config = '{ "name": "Beer", "state_topic": "test-topic" }'
+    async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", config)
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.beer") is not None
+
+    with patch(
+        "homeassistant.components.mqtt.discovery.json_loads",
+        wraps=json.loads,
+    ) as mock_json_loads:
+        # Unchanged, like the retained payloads after a reconnect
+        async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", config)
+        await hass.async_block_till_done()
+        assert mock_json_loads.call_count == 0
+
+        # Changed
+        async_fire_mqtt_message(
+            hass,
+            "homeassistant/binary_sensor/bla/config",
+            '{ "name": "Milk", "state_topic": "test-topic" }',
+        )
+        await hass.async_block_till_done()
+        assert mock_json_loads.call_count == 1
+        assert hass.states.get("binary_sensor.beer").name == "Milk"
+
+        # Removed and discovered again with the same payload
+        async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", "")
+        await hass.async_block_till_done()
+        assert hass.states.get("binary_sensor.beer") is None
+        async_fire_mqtt_message(hass, "homeassistant/binary_sensor/bla/config", config)
+        await hass.async_block_till_done()
+        assert mock_json_loads.call_count == 2
+        assert hass.states.get("binary_sensor.beer") is not None
+
+
 @patch("homeassistant.components.mqtt.PLATFORMS", [Platform.BINARY_SENSOR])
 async def test_rapid_rediscover(hass, mqtt_mock_entry_no_yaml_config, caplog):
     """Test immediate rediscover of removed component."""
@@ -1172,6 +1210,8 @@ ABBREVIATIONS_WHITE_LIST = [
     "CONF_DISCOVERY_ID",
     "CONF_DISCOVERY_PREFIX",
     "CONF_EMBEDDED",
+    "CONF_INBOUND_BATCH_SIZE",
+    "CONF_INBOUND_LATENCY",
     "CONF_KEEPALIVE",
     "CONF_TLS_INSECURE",
     "CONF_TLS_VERSION",
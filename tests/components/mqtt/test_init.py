@@ -7,6 +7,7 @@ import json
 import ssl
 from unittest.mock import ANY, AsyncMock, MagicMock, call, mock_open, patch
 
+from paho.mqtt.matcher import MQTTMatcher
 import pytest
 import voluptuous as vol
 import yaml
@@ -1175,6 +1176,47 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert calls[0][0].payload == "test-payload"
 
 
+def test_subscription_trie_matches_like_paho_matcher():
+    """Test the subscription trie matches the same topics as the paho matcher."""
+    filters = [
+        "#",
+        "+",
+        "a",
+        "a/#",
+        "a/+",
+        "a/b",
+        "a/+/c",
+        "a/b/#",
+        "+/b/+",
+        "/+",
+        "$SYS/#",
+        "$SYS/+/b",
+        "+/+/+",
+    ]
+    topics = ["a", "a/b", "a/b/c", "a/c/c", "b/b/b", "/a", "$SYS/a/b", "$SYS", "x"]
+    subscriptions = [
+        mqtt.client.Subscription(topic_filter, ha.HassJob(lambda msg: None))
+        for topic_filter in filters
+    ]
+    trie = mqtt.client.SubscriptionTrie(subscriptions)
+
+    for topic in topics:
+        expected = []
+        for subscription in subscriptions:
+            matcher = MQTTMatcher()
+            matcher[subscription.topic] = True
+            if next(matcher.iter_match(topic), False):
+                expected.append(subscription)
+        assert trie.matching(topic) == expected, topic
+
+    for subscription in subscriptions:
+        trie.remove(subscription)
+    assert len(trie) == 0
+    assert trie.matching("a/b") == []
+    # All levels were pruned
+    assert not trie._root.children
+
+
 async def test_subscribe_special_characters(
     hass, mqtt_mock_entry_no_yaml_config, calls, record_calls
 ):
@@ -1437,6 +1479,34 @@ async def test_handle_message_callback(
     assert "Received message on some-topic: b'test-payload'" in caplog.text
 
 
+async def test_handle_message_callback_batches(
+    hass, mqtt_mock_entry_no_yaml_config, mqtt_client_mock, calls, record_calls
+):
+    """Test the received messages are handled in batches."""
+    mqtt_mock = await mqtt_mock_entry_no_yaml_config()
+    mqtt_client_mock.on_connect(mqtt_client_mock, None, None, 0)
+    await mqtt.async_subscribe(hass, "some-topic/+", record_calls)
+
+    def receive_messages():
+        for idx in range(250):
+            msg = ReceiveMessage(f"some-topic/{idx}", b"test-payload", 0, False)
+            mqtt_client_mock.on_message(mock_mqtt, None, msg)
+
+    await hass.async_add_executor_job(receive_messages)
+    for _ in range(3):
+        await hass.async_block_till_done()
+
+    assert [call[0].topic for call in calls] == [
+        f"some-topic/{idx}" for idx in range(250)
+    ]
+    diagnostics = mqtt_mock.async_inbound_diagnostics()
+    assert diagnostics["depth"] == 0
+    assert diagnostics["messages"] == 250
+    # At most 100 messages are handled per batch
+    assert 3 <= diagnostics["batches"] < 250
+    assert 0 < diagnostics["max_depth"] <= 250
+
+
 async def test_setup_override_configuration(hass, caplog, tmp_path):
     """Test override setup from configuration entry."""
     calls_username_password_set = []
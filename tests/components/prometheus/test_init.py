@@ -71,8 +71,14 @@ class FilterTest:
     should_pass: bool
 
 
+@pytest.fixture(name="collect_on_scrape")
+def collect_on_scrape_fixture():
+    """Collect the metrics when they are scraped or on state changes."""
+    return False
+
+
 @pytest.fixture(name="client")
-async def setup_prometheus_client(hass, hass_client, namespace):
+async def setup_prometheus_client(hass, hass_client, namespace, collect_on_scrape):
     """Initialize an hass_client with Prometheus component."""
     # Reset registry
     prometheus_client.REGISTRY = prometheus_client.CollectorRegistry(auto_describe=True)
@@ -80,7 +86,7 @@ async def setup_prometheus_client(hass, hass_client, namespace):
     prometheus_client.PlatformCollector(registry=prometheus_client.REGISTRY)
     prometheus_client.GCCollector(registry=prometheus_client.REGISTRY)
 
-    config = {}
+    config = {prometheus.CONF_COLLECT_ON_SCRAPE: collect_on_scrape}
     if namespace is not None:
         config[prometheus.CONF_PROM_NAMESPACE] = namespace
     assert await async_setup_component(
@@ -105,6 +111,7 @@ async def generate_latest_metrics(client):
 
 
 @pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_view_empty_namespace(client, sensor_entities):
     """Test prometheus metrics view."""
     body = await generate_latest_metrics(client)
@@ -129,6 +136,7 @@ async def test_view_empty_namespace(client, sensor_entities):
 
 
 @pytest.mark.parametrize("namespace", [None])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_view_default_namespace(client, sensor_entities):
     """Test prometheus metrics view."""
     body = await generate_latest_metrics(client)
@@ -147,6 +155,7 @@ async def test_view_default_namespace(client, sensor_entities):
 
 
 @pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_sensor_unit(client, sensor_entities):
     """Test prometheus metrics for sensors with a unit."""
     body = await generate_latest_metrics(client)
@@ -177,6 +186,7 @@ async def test_sensor_unit(client, sensor_entities):
 
 
 @pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_sensor_without_unit(client, sensor_entities):
     """Test prometheus metrics for sensors without a unit."""
     body = await generate_latest_metrics(client)
@@ -201,6 +211,7 @@ async def test_sensor_without_unit(client, sensor_entities):
 
 
 @pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_sensor_device_class(client, sensor_entities):
     """Test prometheus metrics for sensor with a device_class."""
     body = await generate_latest_metrics(client)
@@ -231,6 +242,7 @@ async def test_sensor_device_class(client, sensor_entities):
 
 
 @pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_input_number(client, input_number_entities):
     """Test prometheus metrics for input_number."""
     body = await generate_latest_metrics(client)
@@ -255,6 +267,7 @@ async def test_input_number(client, input_number_entities):
 
 
 @pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_battery(client, sensor_entities):
     """Test prometheus metrics for battery."""
     body = await generate_latest_metrics(client)
@@ -267,6 +280,7 @@ async def test_battery(client, sensor_entities):
 
 
 @pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_climate(client, climate_entities):
     """Test prometheus metrics for climate entities."""
     body = await generate_latest_metrics(client)
@@ -297,6 +311,7 @@ async def test_climate(client, climate_entities):
 
 
 @pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_humidifier(client, humidifier_entities):
     """Test prometheus metrics for humidifier entities."""
     body = await generate_latest_metrics(client)
@@ -328,6 +343,7 @@ async def test_humidifier(client, humidifier_entities):
 
 
 @pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_attributes(client, switch_entities):
     """Test prometheus metrics for entity attributes."""
     body = await generate_latest_metrics(client)
@@ -358,6 +374,7 @@ async def test_attributes(client, switch_entities):
 
 
 @pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_binary_sensor(client, binary_sensor_entities):
     """Test prometheus metrics for binary_sensor."""
     body = await generate_latest_metrics(client)
@@ -376,6 +393,7 @@ async def test_binary_sensor(client, binary_sensor_entities):
 
 
 @pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_input_boolean(client, input_boolean_entities):
     """Test prometheus metrics for input_boolean."""
     body = await generate_latest_metrics(client)
@@ -394,6 +412,7 @@ async def test_input_boolean(client, input_boolean_entities):
 
 
 @pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_light(client, light_entities):
     """Test prometheus metrics for lights."""
     body = await generate_latest_metrics(client)
@@ -424,6 +443,7 @@ async def test_light(client, light_entities):
 
 
 @pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_lock(client, lock_entities):
     """Test prometheus metrics for lock."""
     body = await generate_latest_metrics(client)
@@ -442,6 +462,7 @@ async def test_lock(client, lock_entities):
 
 
 @pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_counter(client, counter_entities):
     """Test prometheus metrics for counter."""
     body = await generate_latest_metrics(client)
@@ -454,6 +475,31 @@ async def test_counter(client, counter_entities):
 
 
 @pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
+async def test_state_change_counters(hass, client):
+    """Test prometheus counters of state changes and automation triggers."""
+    attributes = {ATTR_FRIENDLY_NAME: "Wake Up"}
+    hass.states.async_set("automation.wake_up", STATE_ON, attributes)
+    hass.states.async_set("automation.wake_up", STATE_OFF, attributes)
+    hass.states.async_set("automation.wake_up", "unavailable", attributes)
+    await hass.async_block_till_done()
+    body = await generate_latest_metrics(client)
+
+    assert (
+        'state_change_total{domain="automation",'
+        'entity="automation.wake_up",'
+        'friendly_name="Wake Up"} 3.0' in body
+    )
+
+    assert (
+        'automation_triggered_count_total{domain="automation",'
+        'entity="automation.wake_up",'
+        'friendly_name="Wake Up"} 2.0' in body
+    )
+
+
+@pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_renaming_entity_name(
     hass, registry, client, sensor_entities, climate_entities
 ):
@@ -573,6 +619,7 @@ async def test_renaming_entity_name(
 
 
 @pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_renaming_entity_id(
     hass, registry, client, sensor_entities, climate_entities
 ):
@@ -649,6 +696,7 @@ async def test_renaming_entity_id(
 
 
 @pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize("collect_on_scrape", [False, True])
 async def test_deleting_entity(
     hass, registry, client, sensor_entities, climate_entities
 ):
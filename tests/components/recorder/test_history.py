@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 # pylint: disable=protected-access,invalid-name
+import asyncio
 from copy import copy
 from datetime import datetime, timedelta
 import json
@@ -655,6 +656,8 @@ async def test_state_changes_during_period_query_during_migration_to_schema_25(
 ):
     """Test we can query data prior to schema 25 and during migration to schema 25."""
     instance = await async_setup_recorder_instance(hass, {})
+    # The rows are added without normalized ids as they would be before migration
+    instance.normalized_ids_active = False
 
     start = dt_util.utcnow()
     point = start + timedelta(seconds=1)
@@ -705,6 +708,8 @@ async def test_get_states_query_during_migration_to_schema_25(
 ):
     """Test we can query data prior to schema 25 and during migration to schema 25."""
     instance = await async_setup_recorder_instance(hass, {})
+    # The rows are added without normalized ids as they would be before migration
+    instance.normalized_ids_active = False
 
     start = dt_util.utcnow()
     point = start + timedelta(seconds=1)
@@ -751,6 +756,8 @@ async def test_get_states_query_during_migration_to_schema_25_multiple_entities(
 ):
     """Test we can query data prior to schema 25 and during migration to schema 25."""
     instance = await async_setup_recorder_instance(hass, {})
+    # The rows are added without normalized ids as they would be before migration
+    instance.normalized_ids_active = False
 
     start = dt_util.utcnow()
     point = start + timedelta(seconds=1)
@@ -904,3 +911,86 @@ def test_state_changes_during_period_multiple_entities_single_test(hass_recorder
     hist = history.state_changes_during_period(hass, start, end, None)
     for entity_id, value in test_entites.items():
         hist[entity_id][0].state == value
+
+
+def test_state_changes_during_period_batch(hass_recorder):
+    """Test a batch of state changes requests matches the single requests."""
+    hass = hass_recorder()
+    entity_ids = ["sensor.one", "sensor.two", "sensor.three"]
+    start = dt_util.utcnow()
+    times = [start + timedelta(seconds=idx) for idx in range(1, 7)]
+
+    for idx, point in enumerate(times):
+        with patch(
+            "homeassistant.components.recorder.core.dt_util.utcnow",
+            return_value=point,
+        ):
+            for entity_id in entity_ids:
+                hass.states.set(entity_id, str(idx), {"idx": idx})
+            wait_recording_done(hass)
+
+    requests = [
+        history.StateChangesRequest(start, None, "sensor.one", False, True, 2, False),
+        history.StateChangesRequest(
+            times[2], None, "sensor.two", False, True, 5, False
+        ),
+        history.StateChangesRequest(
+            times[1], None, "sensor.three", True, False, 3, True
+        ),
+        history.StateChangesRequest(
+            times[0], times[4], "sensor.one", True, False, None, True
+        ),
+        history.StateChangesRequest(
+            times[2], times[5], "sensor.two", True, False, None, True
+        ),
+        history.StateChangesRequest(
+            start, None, "sensor.missing", False, True, 2, False
+        ),
+    ]
+    results = history.state_changes_during_period_batch(hass, requests)
+
+    assert len(results) == len(requests)
+    for request, states in zip(requests, results):
+        expected = history.state_changes_during_period(
+            hass,
+            request.start_time,
+            request.end_time,
+            request.entity_id,
+            no_attributes=request.no_attributes,
+            descending=request.descending,
+            limit=request.limit,
+            include_start_time_state=request.include_start_time_state,
+        ).get(request.entity_id, [])
+        assert states == expected
+    assert [state.state for state in results[0]] == ["5", "4"]
+    assert [state.state for state in results[3]] == ["1", "2", "3"]
+    assert results[5] == []
+
+
+async def test_async_state_changes_during_period(
+    hass: ha.HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test requests arriving together are answered by one batch."""
+    await async_setup_recorder_instance(hass, {})
+    start = dt_util.utcnow()
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        history,
+        "state_changes_during_period_batch",
+        wraps=history.state_changes_during_period_batch,
+    ) as batch_mock:
+        one, two = await asyncio.gather(
+            history.async_state_changes_during_period(
+                hass, start, entity_id="sensor.one", limit=5, descending=True
+            ),
+            history.async_state_changes_during_period(
+                hass, start, entity_id="SENSOR.TWO"
+            ),
+        )
+
+    assert batch_mock.call_count == 1
+    assert [state.state for state in one] == ["1"]
+    assert [state.state for state in two] == ["2"]
@@ -0,0 +1,26 @@
+"""Test the recorder id cache helpers."""
+
+from homeassistant.components.recorder.id_cache import HashBloomFilter, IDCacheStats
+
+
+def test_hash_bloom_filter():
+    """Test the bloom filter has no false negatives."""
+    bloom_filter = HashBloomFilter(1000)
+    hashes = [hash_ * 7919 & 0xFFFFFFFF for hash_ in range(1000)]
+    for hash_ in hashes:
+        bloom_filter.add(hash_)
+
+    assert all(hash_ in bloom_filter for hash_ in hashes)
+    false_positives = sum(
+        hash_ in bloom_filter for hash_ in range(0xF0000000, 0xF0000000 + 10000)
+    )
+    assert false_positives < 100
+
+
+def test_id_cache_stats():
+    """Test the hit rate of the id cache stats."""
+    stats = IDCacheStats()
+    assert stats.hit_rate is None
+    stats.hits = 3
+    stats.misses = 1
+    assert stats.hit_rate == 75
@@ -29,9 +29,11 @@ from homeassistant.components.recorder.db_schema import (
     SCHEMA_VERSION,
     EventData,
     Events,
+    EventTypes,
     RecorderRuns,
     StateAttributes,
     States,
+    StatesMeta,
     StatisticsRuns,
 )
 from homeassistant.components.recorder.models import process_timestamp
@@ -41,6 +43,7 @@ from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
     SERVICE_PURGE_ENTITIES,
 )
+from homeassistant.components.recorder.tasks import WarmUpIDCachesTask
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
@@ -57,6 +60,7 @@ from homeassistant.util import dt as dt_util
 
 from .common import (
     async_block_recorder,
+    async_recorder_block_till_done,
     async_wait_recording_done,
     corrupt_db_file,
     run_information_with_session,
@@ -85,6 +89,7 @@ def _default_recorder(hass):
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_t=[],
         exclude_attributes_by_domain={},
+        attributes_cache_size=2048,
     )
 
 
@@ -244,6 +249,129 @@ async def test_saving_many_states(
         assert db_states[0].event_id is None
 
 
+async def test_saving_many_states_in_one_commit(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test states of the same entity in one commit are linked to their old state."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 1}
+    )
+    for state in ("on", "off", "on"):
+        hass.states.async_set("test.one", state, {"test_attr": 5})
+        hass.states.async_set("test.two", state, {"test_attr": 5})
+    hass.bus.async_fire("test_event", {"test": 1})
+    hass.bus.async_fire("test_event", {"test": 1})
+    # Make sure the events are in the event session before
+    # the commit is triggered or it will be skipped
+    await hass.async_block_till_done()
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        db_states = (
+            session.query(States)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .order_by(States.last_updated)
+        )
+        states_by_entity: dict[str, list[tuple[str, int, int | None]]] = {}
+        for db_state in db_states:
+            states_by_entity.setdefault(db_state.states_meta_rel.entity_id, []).append(
+                (db_state.state, db_state.state_id, db_state.old_state_id)
+            )
+        assert session.query(StateAttributes).count() == 1
+        db_events = (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "test_event")
+            .all()
+        )
+        assert len(db_events) == 2
+        assert db_events[0].data_id == db_events[1].data_id
+        assert db_events[0].event_data_rel.shared_data == '{"test":1}'
+
+    for entity_id in ("test.one", "test.two"):
+        first, second, third = states_by_entity[entity_id]
+        assert (first[0], second[0], third[0]) == ("on", "off", "on")
+        assert first[2] is None
+        assert second[2] == first[1]
+        assert third[2] == second[1]
+        assert instance._old_states[entity_id] == third[1]
+
+    hass.states.async_set("test.one", "off", {"test_attr": 5})
+    await hass.async_block_till_done()
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        last_state = session.query(States).order_by(States.state_id.desc()).first()
+        assert last_state.state == "off"
+        assert last_state.old_state_id == states_by_entity["test.one"][2][1]
+
+
+async def test_warm_up_id_caches(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test the attribute and event data id caches are warmed up from the database."""
+    instance = await async_setup_recorder_instance(hass)
+    hass.states.async_set("test.one", "on", {"test_attr": 1})
+    hass.states.async_set("test.two", "on", {"test_attr": 2})
+    hass.bus.async_fire("test_event", {"test": 1})
+    await async_wait_recording_done(hass)
+
+    # Start over with empty caches as after a restart
+    instance._state_attributes_ids.clear()
+    instance._event_data_ids.clear()
+    instance._state_attributes_hashes = None
+    instance._event_data_hashes = None
+    instance.queue_task(WarmUpIDCachesTask())
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        attributes_ids = {
+            state_attributes.shared_attrs: state_attributes.attributes_id
+            for state_attributes in session.query(StateAttributes)
+        }
+        data_ids = {
+            event_data.shared_data: event_data.data_id
+            for event_data in session.query(EventData)
+        }
+    assert '{"test_attr":1}' in attributes_ids
+    assert '{"test":1}' in data_ids
+    assert dict(instance._state_attributes_ids.items()) == attributes_ids
+    assert dict(instance._event_data_ids.items()) == data_ids
+
+    stats = instance.state_attributes_cache_stats
+    hits, misses, skipped = stats.hits, stats.misses, stats.skipped_db_lookups
+    hass.states.async_set("test.one", "off", {"test_attr": 1})
+    hass.states.async_set("test.three", "on", {"test_attr": 3})
+    await async_wait_recording_done(hass)
+    assert stats.hits == hits + 1
+    assert stats.misses == misses + 1
+    assert stats.skipped_db_lookups == skipped + 1
+    assert stats.hit_rate is not None
+
+    with session_scope(hass=hass) as session:
+        assert (
+            session.query(StateAttributes)
+            .filter(StateAttributes.shared_attrs == '{"test_attr":3}')
+            .count()
+            == 1
+        )
+
+    # Attributes written after the warm up are known to be in the database
+    instance._state_attributes_ids.clear()
+    hass.states.async_set("test.two", "off", {"test_attr": 3})
+    await async_wait_recording_done(hass)
+    assert stats.skipped_db_lookups == skipped + 1
+    with session_scope(hass=hass) as session:
+        assert (
+            session.query(StateAttributes)
+            .filter(StateAttributes.shared_attrs == '{"test_attr":3}')
+            .count()
+            == 1
+        )
+
+
 async def test_saving_state_with_intermixed_time_changes(
     hass: HomeAssistant, recorder_mock
 ):
@@ -277,11 +405,8 @@ def test_saving_state_with_exception(hass, hass_recorder, caplog):
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        if get_instance(hass)._pending_states:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with patch("time.sleep"), patch.object(
         get_instance(hass).event_session,
@@ -315,11 +440,8 @@ def test_saving_state_with_sqlalchemy_exception(hass, hass_recorder, caplog):
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        if get_instance(hass)._pending_states:
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
 
     with patch("time.sleep"), patch.object(
         get_instance(hass).event_session,
@@ -404,7 +526,8 @@ def test_saving_event(hass, hass_recorder):
     with session_scope(hass=hass) as session:
         for select_event, event_data in (
             session.query(Events, EventData)
-            .filter_by(event_type=event_type)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == event_type)
             .outerjoin(EventData, Events.data_id == EventData.data_id)
         ):
             select_event = cast(Events, select_event)
@@ -626,6 +749,51 @@ def test_saving_state_include_domain_glob_exclude_entity(hass_recorder):
     assert _state_with_context(hass, "test.ok").state == "state2"
 
 
+async def test_saving_removed_and_set_again_in_one_commit(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test an entity removed and set again in one commit gets its own rows."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 1}
+    )
+    hass.states.async_set("test.one", "on")
+    hass.states.async_set("test.two", "on")
+    hass.states.async_remove("test.one")
+    hass.states.async_set("test.one", "off")
+    hass.states.async_set("test.one", "on")
+    await hass.async_block_till_done()
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        db_states = (
+            session.query(States)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == "test.one")
+            .order_by(States.last_updated)
+            .all()
+        )
+        assert len({db_state.state_id for db_state in db_states}) == 4
+        first, removed, set_again, last = (
+            (db_state.state, db_state.state_id, db_state.old_state_id)
+            for db_state in db_states
+        )
+
+    assert (first[0], removed[0], set_again[0], last[0]) == ("on", None, "off", "on")
+    assert first[2] is None
+    assert removed[2] == first[1]
+    assert set_again[2] is None
+    assert last[2] == set_again[1]
+    assert instance._old_states["test.one"] == last[1]
+
+    hass.states.async_remove("test.two")
+    await hass.async_block_till_done()
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    assert "test.two" not in instance._old_states
+
+
 def test_saving_state_and_removing_entity(hass, hass_recorder):
     """Test saving the state of a removed entity."""
     hass = hass_recorder()
@@ -639,11 +807,11 @@ def test_saving_state_and_removing_entity(hass, hass_recorder):
     with session_scope(hass=hass) as session:
         states = list(session.query(States))
         assert len(states) == 3
-        assert states[0].entity_id == entity_id
+        assert states[0].states_meta_rel.entity_id == entity_id
         assert states[0].state == STATE_LOCKED
-        assert states[1].entity_id == entity_id
+        assert states[1].states_meta_rel.entity_id == entity_id
         assert states[1].state == STATE_UNLOCKED
-        assert states[2].entity_id == entity_id
+        assert states[2].states_meta_rel.entity_id == entity_id
         assert states[2].state is None
 
 
@@ -1047,10 +1215,10 @@ def test_saving_sets_old_state(hass_recorder):
         states = list(session.query(States))
         assert len(states) == 4
 
-        assert states[0].entity_id == "test.one"
-        assert states[1].entity_id == "test.two"
-        assert states[2].entity_id == "test.one"
-        assert states[3].entity_id == "test.two"
+        assert states[0].states_meta_rel.entity_id == "test.one"
+        assert states[1].states_meta_rel.entity_id == "test.two"
+        assert states[2].states_meta_rel.entity_id == "test.one"
+        assert states[3].states_meta_rel.entity_id == "test.two"
 
         assert states[0].old_state_id is None
         assert states[1].old_state_id is None
@@ -1074,8 +1242,8 @@ def test_saving_state_with_serializable_data(hass_recorder, caplog):
         states = list(session.query(States))
         assert len(states) == 2
 
-        assert states[0].entity_id == "test.two"
-        assert states[1].entity_id == "test.two"
+        assert states[0].states_meta_rel.entity_id == "test.two"
+        assert states[1].states_meta_rel.entity_id == "test.two"
         assert states[0].old_state_id is None
         assert states[1].old_state_id == states[0].state_id
 
@@ -1123,7 +1291,11 @@ def test_service_disable_events_not_recording(hass, hass_recorder):
     event = events[0]
 
     with session_scope(hass=hass) as session:
-        db_events = list(session.query(Events).filter_by(event_type=event_type))
+        db_events = list(
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == event_type)
+        )
         assert len(db_events) == 0
 
     assert hass.services.call(
@@ -1145,7 +1317,8 @@ def test_service_disable_events_not_recording(hass, hass_recorder):
     with session_scope(hass=hass) as session:
         for select_event, event_data in (
             session.query(Events, EventData)
-            .filter_by(event_type=event_type)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == event_type)
             .outerjoin(EventData, Events.data_id == EventData.data_id)
         ):
             select_event = cast(Events, select_event)
@@ -1339,7 +1512,11 @@ def test_entity_id_filter(hass_recorder):
         wait_recording_done(hass)
 
         with session_scope(hass=hass) as session:
-            db_events = list(session.query(Events).filter_by(event_type="hello"))
+            db_events = list(
+                session.query(Events)
+                .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+                .filter(EventTypes.event_type == "hello")
+            )
             assert len(db_events) == idx + 1, data
 
     for data in (
@@ -1350,7 +1527,11 @@ def test_entity_id_filter(hass_recorder):
         wait_recording_done(hass)
 
         with session_scope(hass=hass) as session:
-            db_events = list(session.query(Events).filter_by(event_type="hello"))
+            db_events = list(
+                session.query(Events)
+                .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+                .filter(EventTypes.event_type == "hello")
+            )
             # Keep referring idx + 1, as no new events are being added
             assert len(db_events) == idx + 1, data
 
@@ -1371,7 +1552,11 @@ async def test_database_lock_and_unlock(
 
     def _get_db_events():
         with session_scope(hass=hass) as session:
-            return list(session.query(Events).filter_by(event_type=event_type))
+            return list(
+                session.query(Events)
+                .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+                .filter(EventTypes.event_type == event_type)
+            )
 
     instance = get_instance(hass)
 
@@ -1413,7 +1598,11 @@ async def test_database_lock_and_overflow(
 
     def _get_db_events():
         with session_scope(hass=hass) as session:
-            return list(session.query(Events).filter_by(event_type=event_type))
+            return list(
+                session.query(Events)
+                .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+                .filter(EventTypes.event_type == event_type)
+            )
 
     instance = get_instance(hass)
 
@@ -1530,7 +1719,8 @@ def test_deduplication_event_data_inside_commit_interval(hass_recorder, caplog):
     with session_scope(hass=hass) as session:
         events = list(
             session.query(Events)
-            .filter(Events.event_type == "this_event")
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "this_event")
             .outerjoin(EventData, (Events.data_id == EventData.data_id))
         )
         assert len(events) == 20
@@ -1538,12 +1728,11 @@ def test_deduplication_event_data_inside_commit_interval(hass_recorder, caplog):
         assert all(event.data_id == first_data_id for event in events)
 
 
-# Patch STATE_ATTRIBUTES_ID_CACHE_SIZE since otherwise
-# the CI can fail because the test takes too long to run
-@patch("homeassistant.components.recorder.core.STATE_ATTRIBUTES_ID_CACHE_SIZE", 5)
 def test_deduplication_state_attributes_inside_commit_interval(hass_recorder, caplog):
     """Test deduplication of state attributes inside the commit interval."""
-    hass = hass_recorder()
+    # Use a small cache since otherwise the CI can
+    # fail because the test takes too long to run
+    hass = hass_recorder({"attributes_cache_size": 5})
 
     entity_id = "test.recorder"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
@@ -1565,7 +1754,8 @@ def test_deduplication_state_attributes_inside_commit_interval(hass_recorder, ca
     with session_scope(hass=hass) as session:
         states = list(
             session.query(States)
-            .filter(States.entity_id == entity_id)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == entity_id)
             .outerjoin(
                 StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
             )
@@ -1589,7 +1779,11 @@ async def test_async_block_till_done(hass, async_setup_recorder_instance):
 
     def _fetch_states():
         with session_scope(hass=hass) as session:
-            return list(session.query(States).filter(States.entity_id == entity_id))
+            return list(
+                session.query(States)
+                .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .filter(StatesMeta.entity_id == entity_id)
+            )
 
     await async_block_recorder(hass, 0.1)
     await instance.async_block_till_done()
@@ -24,10 +24,14 @@ from homeassistant.components.recorder import db_schema, migration
 from homeassistant.components.recorder.const import SQLITE_URL_PREFIX
 from homeassistant.components.recorder.db_schema import (
     SCHEMA_VERSION,
+    Events,
+    EventTypes,
     RecorderRuns,
     States,
+    StatesMeta,
 )
 from homeassistant.components.recorder.statistics import get_start_time
+from homeassistant.components.recorder.tasks import NormalizedIDsMigrationTask
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.helpers import recorder as recorder_helper
 from homeassistant.setup import setup_component
@@ -35,7 +39,11 @@ import homeassistant.util.dt as dt_util
 
 from .common import async_wait_recording_done, create_engine_test, wait_recording_done
 
-from tests.common import async_fire_time_changed, get_test_home_assistant
+from tests.common import (
+    SetupRecorderInstanceT,
+    async_fire_time_changed,
+    get_test_home_assistant,
+)
 
 ORIG_TZ = dt_util.DEFAULT_TIME_ZONE
 
@@ -44,7 +52,9 @@ def _get_native_states(hass, entity_id):
     with session_scope(hass=hass) as session:
         return [
             state.to_native()
-            for state in session.query(States).filter(States.entity_id == entity_id)
+            for state in session.query(States)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == entity_id)
         ]
 
 
@@ -413,6 +423,8 @@ def test_set_state_unit(caplog, tmpdir):
     # Create some statistics_meta with schema version 29
     with patch.object(recorder, "db_schema", old_db_schema), patch.object(
         recorder.migration, "SCHEMA_VERSION", old_db_schema.SCHEMA_VERSION
+    ), patch.object(recorder.bulk_insert, "Events", old_db_schema.Events), patch.object(
+        recorder.bulk_insert, "States", old_db_schema.States
     ), patch(
         "homeassistant.components.recorder.core.create_engine", new=_create_engine_29
     ):
@@ -471,6 +483,115 @@ def test_set_state_unit(caplog, tmpdir):
     dt_util.DEFAULT_TIME_ZONE = ORIG_TZ
 
 
+async def test_migrate_to_normalized_ids(
+    hass, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test rows written before schema 31 are migrated to normalized ids."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+    # The rows are added without normalized ids as they would be before migration
+    instance.normalized_ids_active = False
+    now = dt_util.utcnow()
+    context_id = "01ARZ3NDEKTSV4RRFFQ69G5FAV"
+    user_id = "b400facee45711eaa9308bfd3d19e474"
+
+    def _insert_legacy_rows():
+        with session_scope(hass=hass) as session:
+            # The legacy indexes are only left in databases created before 31
+            connection = session.connection()
+            connection.execute(
+                text(
+                    "CREATE INDEX ix_states_entity_id_last_updated"
+                    " ON states (entity_id, last_updated)"
+                )
+            )
+            connection.execute(
+                text("CREATE INDEX ix_events_context_id ON events (context_id)")
+            )
+            session.add(
+                Events(
+                    event_type="legacy_event",
+                    event_data=None,
+                    origin_idx=0,
+                    time_fired=now,
+                    context_id=context_id,
+                    context_user_id=user_id,
+                )
+            )
+            session.add(
+                States(
+                    entity_id="sensor.legacy",
+                    state="on",
+                    last_changed=now,
+                    last_updated=now,
+                    context_id=context_id,
+                    context_user_id=user_id,
+                )
+            )
+
+    await instance.async_add_executor_job(_insert_legacy_rows)
+    with session_scope(hass=hass) as session:
+        assert migration.normalized_ids_need_migration(session)
+        assert migration.legacy_id_indexes_exist(session)
+
+    instance.queue_task(NormalizedIDsMigrationTask())
+    # One wait for the migration and one for the cleanup it schedules
+    await async_wait_recording_done(hass)
+    await async_wait_recording_done(hass)
+    assert instance.normalized_ids_active is True
+    hass.bus.async_fire("new_event")
+    hass.states.async_set("sensor.new", "on")
+    await async_wait_recording_done(hass)
+
+    def _fetch_migrated_rows():
+        with session_scope(hass=hass) as session:
+            assert not migration.normalized_ids_need_migration(session)
+            assert not migration.legacy_id_indexes_exist(session)
+            event = (
+                session.query(Events)
+                .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+                .filter(EventTypes.event_type == "legacy_event")
+                .one()
+            )
+            assert event.event_type is None
+            assert event.context_id is None
+            assert event.context_user_id is None
+            assert event.context_id_bin == context_id
+            assert event.context_user_id_bin == user_id
+            state = (
+                session.query(States)
+                .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .filter(StatesMeta.entity_id == "sensor.legacy")
+                .one()
+            )
+            assert state.entity_id is None
+            assert state.context_id is None
+            assert state.context_user_id is None
+            assert state.context_id_bin == context_id
+            assert state.context_user_id_bin == user_id
+            # New rows only write the normalized ids
+            assert (
+                session.query(Events)
+                .filter(Events.event_type.is_not(None) | Events.context_id.is_not(None))
+                .count()
+                == 0
+            )
+            assert (
+                session.query(States)
+                .filter(States.entity_id.is_not(None) | States.context_id.is_not(None))
+                .count()
+                == 0
+            )
+
+    await instance.async_add_executor_job(_fetch_migrated_rows)
+    states = await instance.async_add_executor_job(
+        _get_native_states, hass, "sensor.legacy"
+    )
+    assert len(states) == 1
+    assert states[0].state == "on"
+    assert states[0].context.id == context_id
+
+
 def test_invalid_update(hass):
     """Test that an invalid new version raises an exception."""
     with pytest.raises(ValueError):
@@ -526,7 +647,9 @@ def test_forgiving_add_index():
     with Session(engine) as session:
         instance = Mock()
         instance.get_session = Mock(return_value=session)
-        migration._create_index(instance.get_session, "states", "ix_states_context_id")
+        migration._create_index(
+            instance.get_session, "states", "ix_states_context_id_bin"
+        )
 
 
 @pytest.mark.parametrize(
@@ -13,9 +13,11 @@ from homeassistant.components.recorder.const import MAX_ROWS_TO_PURGE, Supported
 from homeassistant.components.recorder.db_schema import (
     EventData,
     Events,
+    EventTypes,
     RecorderRuns,
     StateAttributes,
     States,
+    StatesMeta,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -658,6 +660,8 @@ async def test_purge_filtered_states(
     """Test filtered states are purged."""
     config: ConfigType = {"exclude": {"entities": ["sensor.excluded"]}}
     instance = await async_setup_recorder_instance(hass, config)
+    # The rows are added without normalized ids as they would be before migration
+    instance.normalized_ids_active = False
     assert instance.entity_filter("sensor.excluded") is False
 
     def _add_db_entries(hass: HomeAssistant) -> None:
@@ -844,6 +848,8 @@ async def test_purge_filtered_states_to_empty(
     """Test filtered states are purged all the way to an empty db."""
     config: ConfigType = {"exclude": {"entities": ["sensor.excluded"]}}
     instance = await async_setup_recorder_instance(hass, config)
+    # The rows are added without normalized ids as they would be before migration
+    instance.normalized_ids_active = False
     assert instance.entity_filter("sensor.excluded") is False
 
     def _add_db_entries(hass: HomeAssistant) -> None:
@@ -897,6 +903,8 @@ async def test_purge_without_state_attributes_filtered_states_to_empty(
     """Test filtered legacy states without state attributes are purged all the way to an empty db."""
     config: ConfigType = {"exclude": {"entities": ["sensor.old_format"]}}
     instance = await async_setup_recorder_instance(hass, config)
+    # The rows are added without normalized ids as they would be before migration
+    instance.normalized_ids_active = False
     assert instance.entity_filter("sensor.old_format") is False
 
     def _add_db_entries(hass: HomeAssistant) -> None:
@@ -969,7 +977,9 @@ async def test_purge_filtered_events(
 ):
     """Test filtered events are purged."""
     config: ConfigType = {"exclude": {"event_types": ["EVENT_PURGE"]}}
-    await async_setup_recorder_instance(hass, config)
+    instance = await async_setup_recorder_instance(hass, config)
+    # The rows are added without normalized ids as they would be before migration
+    instance.normalized_ids_active = False
 
     def _add_db_entries(hass: HomeAssistant) -> None:
         with session_scope(hass=hass) as session:
@@ -1058,6 +1068,8 @@ async def test_purge_filtered_events_state_changed(
     """Test filtered state_changed events are purged. This should also remove all states."""
     config: ConfigType = {"exclude": {"event_types": [EVENT_STATE_CHANGED]}}
     instance = await async_setup_recorder_instance(hass, config)
+    # The rows are added without normalized ids as they would be before migration
+    instance.normalized_ids_active = False
     # Assert entity_id is NOT excluded
     assert instance.entity_filter("sensor.excluded") is True
 
@@ -1158,7 +1170,9 @@ async def test_purge_entities(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
     """Test purging of specific entities."""
-    await async_setup_recorder_instance(hass)
+    instance = await async_setup_recorder_instance(hass)
+    # The rows are added without normalized ids as they would be before migration
+    instance.normalized_ids_active = False
 
     async def _purge_entities(hass, entity_ids, domains, entity_globs):
         service_data = {
@@ -1283,6 +1297,128 @@ async def test_purge_entities(
         assert states.count() == 0
 
 
+async def test_purge_filtered_states_normalized_ids(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: SetupRecorderInstanceT,
+):
+    """Test filtered states and events are purged by their normalized ids."""
+    config: ConfigType = {
+        "exclude": {"entities": ["sensor.excluded"], "event_types": ["EVENT_PURGE"]}
+    }
+    instance = await async_setup_recorder_instance(hass, config)
+    assert instance.normalized_ids_active is True
+
+    def _add_db_entries(hass: HomeAssistant) -> None:
+        with session_scope(hass=hass) as session:
+            timestamp = dt_util.utcnow() - timedelta(days=1)
+            excluded = StatesMeta(entity_id="sensor.excluded")
+            kept = StatesMeta(entity_id="sensor.kept")
+            event_type = EventTypes(event_type="EVENT_PURGE")
+            session.add_all((excluded, kept, event_type))
+            session.flush()
+            for _ in range(20):
+                session.add(
+                    States(
+                        metadata_id=excluded.metadata_id,
+                        state="purgeme",
+                        last_changed=timestamp,
+                        last_updated=timestamp,
+                    )
+                )
+                session.add(
+                    Events(
+                        event_type_id=event_type.event_type_id,
+                        event_data="{}",
+                        origin_idx=0,
+                        time_fired=timestamp,
+                    )
+                )
+            for _ in range(10):
+                session.add(
+                    States(
+                        metadata_id=kept.metadata_id,
+                        state="keep",
+                        last_changed=timestamp,
+                        last_updated=timestamp,
+                    )
+                )
+
+    await instance.async_add_executor_job(_add_db_entries, hass)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).filter(States.state == "purgeme").count() == 20
+        assert (
+            session.query(Events)
+            .join(EventTypes)
+            .filter(EventTypes.event_type == "EVENT_PURGE")
+            .count()
+            == 20
+        )
+
+    # Normal purge doesn't remove the rows, apply_filter removes them
+    await hass.services.async_call(
+        recorder.DOMAIN, SERVICE_PURGE, {"keep_days": 10, "apply_filter": True}
+    )
+    await async_recorder_block_till_done(hass)
+    await async_wait_purge_done(hass)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).filter(States.state == "purgeme").count() == 0
+        assert session.query(States).filter(States.state == "keep").count() == 10
+        assert (
+            session.query(Events)
+            .join(EventTypes)
+            .filter(EventTypes.event_type == "EVENT_PURGE")
+            .count()
+            == 0
+        )
+        # The lookup rows are kept so the ids stay stable
+        assert (
+            session.query(StatesMeta)
+            .filter(StatesMeta.entity_id == "sensor.excluded")
+            .count()
+            == 1
+        )
+
+
+async def test_purge_entities_normalized_ids(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test purging of specific entities once the ids have been normalized."""
+    instance = await async_setup_recorder_instance(hass)
+    assert instance.normalized_ids_active is True
+
+    for entity_id in ("sensor.purge_entity", "purge_domain.entity", "sensor.keep"):
+        for state in range(5):
+            hass.states.async_set(entity_id, str(state))
+    await async_wait_recording_done(hass)
+
+    def _count_states(entity_id: str) -> int:
+        with session_scope(hass=hass) as session:
+            return (
+                session.query(States)
+                .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .filter(StatesMeta.entity_id == entity_id)
+                .count()
+            )
+
+    assert _count_states("sensor.purge_entity") == 5
+    assert _count_states("purge_domain.entity") == 5
+
+    await hass.services.async_call(
+        recorder.DOMAIN,
+        SERVICE_PURGE_ENTITIES,
+        {"entity_id": "sensor.purge_entity", "domains": "purge_domain"},
+    )
+    await hass.async_block_till_done()
+    await async_recorder_block_till_done(hass)
+    await async_wait_purge_done(hass)
+
+    assert _count_states("sensor.purge_entity") == 0
+    assert _count_states("purge_domain.entity") == 0
+    assert _count_states("sensor.keep") == 5
+
+
 async def _add_test_states(hass: HomeAssistant):
     """Add multiple states to the db for testing."""
     utcnow = dt_util.utcnow()
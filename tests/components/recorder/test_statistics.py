@@ -12,12 +12,23 @@ from sqlalchemy.orm import Session
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import history, statistics
-from homeassistant.components.recorder.const import SQLITE_URL_PREFIX
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
-from homeassistant.components.recorder.models import process_timestamp_to_utc_isoformat
+from homeassistant.components.recorder.const import (
+    EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
+    SQLITE_URL_PREFIX,
+)
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDaily,
+    StatisticsMonthly,
+    StatisticsShortTerm,
+)
+from homeassistant.components.recorder.models import (
+    process_timestamp,
+    process_timestamp_to_utc_isoformat,
+)
 from homeassistant.components.recorder.statistics import (
     async_add_external_statistics,
     async_import_statistics,
+    compact_statistics_during_period,
     delete_statistics_duplicates,
     delete_statistics_meta_duplicates,
     get_last_short_term_statistics,
@@ -27,8 +38,9 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
     statistics_during_period,
 )
+from homeassistant.components.recorder.tasks import PeriodStatisticsBackfillTask
 from homeassistant.components.recorder.util import session_scope
-from homeassistant.const import TEMP_CELSIUS
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE, TEMP_CELSIUS
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import recorder as recorder_helper
@@ -260,6 +272,28 @@ def test_compile_periodic_statistics_exception(
     }
 
 
+def test_hourly_statistics_generated_event(hass_recorder):
+    """Test an event is fired when a full hour of statistics is compiled."""
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.listen(EVENT_RECORDER_HOURLY_STATISTICS_GENERATED, _event_listener)
+
+    hour_start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    do_adhoc_statistics(hass, start=hour_start + timedelta(minutes=50))
+    wait_recording_done(hass)
+    assert len(events) == 0
+
+    do_adhoc_statistics(hass, start=hour_start + timedelta(minutes=55))
+    wait_recording_done(hass)
+    assert len(events) == 1
+
+
 def test_rename_entity(hass_recorder):
     """Test statistics is migrated when entity_id is changed."""
     hass = hass_recorder()
@@ -1031,6 +1065,177 @@ def test_monthly_statistics(hass_recorder, caplog, timezone):
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
 
 
+def _import_hourly_statistics(hass, start, hours):
+    """Import external hourly statistics with a mean and a sum."""
+    external_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "mean": hour % 24,
+            "min": hour % 24 - 1,
+            "max": hour % 24 + 1,
+            "last_reset": None,
+            "state": hour,
+            "sum": hour * 2,
+        }
+        for hour in range(hours)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    wait_recording_done(hass)
+
+
+def _reduced_statistics_during_period(hass, *args, **kwargs):
+    """Return statistics reduced from the hourly statistics."""
+    instance = recorder.get_instance(hass)
+    instance.period_statistics_active = False
+    try:
+        return statistics_during_period(hass, *args, **kwargs)
+    finally:
+        instance.period_statistics_active = True
+
+
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.freeze_time("2021-08-01 00:00:00+00:00")
+def test_period_statistics(hass_recorder, timezone):
+    """Test daily and monthly statistics are compiled with the hourly statistics."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone(timezone))
+
+    hass = hass_recorder()
+    wait_recording_done(hass)
+    assert recorder.get_instance(hass).period_statistics_active
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-09-29 00:00:00"))
+    _import_hourly_statistics(hass, start, 24 * 4)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StatisticsDaily).count() == 4
+        assert session.query(StatisticsMonthly).count() == 2
+
+    for period in ("day", "month"):
+        stats = statistics_during_period(hass, start, period=period)
+        assert stats == _reduced_statistics_during_period(hass, start, period=period)
+
+    oct_start = dt_util.as_utc(dt_util.parse_datetime("2021-10-01 00:00:00"))
+    oct_end = dt_util.as_utc(dt_util.parse_datetime("2021-11-01 00:00:00"))
+    stats = statistics_during_period(hass, start, period="month")
+    assert stats["test:total_energy_import"][1] == {
+        "statistic_id": "test:total_energy_import",
+        "start": oct_start.isoformat(),
+        "end": oct_end.isoformat(),
+        "mean": approx(11.5),
+        "min": approx(-1.0),
+        "max": approx(24.0),
+        "last_reset": None,
+        "state": approx(95.0),
+        "sum": approx(190.0),
+    }
+
+    # Adjusting the sum is reflected in the compiled periods
+    recorder.get_instance(hass).async_adjust_statistics(
+        "test:total_energy_import", oct_start, 10
+    )
+    wait_recording_done(hass)
+    for period in ("day", "month"):
+        stats = statistics_during_period(hass, start, period=period)
+        assert stats == _reduced_statistics_during_period(hass, start, period=period)
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
+@pytest.mark.freeze_time("2021-08-01 00:00:00+00:00")
+def test_backfill_period_statistics(hass_recorder):
+    """Test daily and monthly statistics are backfilled from hourly statistics."""
+    hass = hass_recorder()
+    instance = recorder.get_instance(hass)
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-06-15 00:00:00"))
+    _import_hourly_statistics(hass, start, 24 * 40)
+
+    with session_scope(hass=hass) as session:
+        session.query(StatisticsDaily).delete()
+        session.query(StatisticsMonthly).delete()
+    instance.period_statistics_active = False
+
+    with patch.object(statistics, "PERIOD_STATISTICS_BACKFILL_DAYS", 7):
+        instance.queue_task(PeriodStatisticsBackfillTask())
+        # Each backfill task compiles a week and schedules the next one
+        for _ in range(6):
+            assert not instance.period_statistics_active
+            wait_recording_done(hass)
+    assert instance.period_statistics_active
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StatisticsDaily).count() == 40
+        assert session.query(StatisticsMonthly).count() == 2
+
+    for period in ("day", "month"):
+        stats = statistics_during_period(hass, start, period=period)
+        assert stats == _reduced_statistics_during_period(hass, start, period=period)
+
+
+@pytest.mark.freeze_time("2021-08-01 00:00:00+00:00")
+def test_period_statistics_time_zone_change(hass_recorder, caplog):
+    """Test daily and monthly statistics are compiled again for a new time zone."""
+    hass = hass_recorder()
+    instance = recorder.get_instance(hass)
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-06-15 00:00:00"))
+    _import_hourly_statistics(hass, start, 24 * 3)
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Vienna"))
+    hass.bus.fire(EVENT_CORE_CONFIG_UPDATE, {"time_zone": "Europe/Vienna"})
+    wait_recording_done(hass)
+    assert instance.period_statistics_active
+    assert "The time zone has changed" in caplog.text
+
+    local_start = dt_util.as_utc(dt_util.parse_datetime("2021-06-15 00:00:00"))
+    with session_scope(hass=hass) as session:
+        starts = [
+            process_timestamp(row.start)
+            for row in session.query(StatisticsDaily).order_by(StatisticsDaily.start)
+        ]
+    assert starts[0] == local_start
+
+    for period in ("day", "month"):
+        stats = statistics_during_period(hass, local_start, period=period)
+        assert stats == _reduced_statistics_during_period(
+            hass, local_start, period=period
+        )
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
+@pytest.mark.parametrize("period", ["hour", "day", "month"])
+@pytest.mark.parametrize("period_statistics_active", [True, False])
+@pytest.mark.freeze_time("2021-08-01 00:00:00+00:00")
+def test_compact_statistics_during_period(
+    hass_recorder, period, period_statistics_active
+):
+    """Test compact statistics have the same values as the statistics rows."""
+    hass = hass_recorder()
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-09-29 00:00:00"))
+    _import_hourly_statistics(hass, start, 24 * 4)
+    recorder.get_instance(hass).period_statistics_active = period_statistics_active
+
+    stats = statistics_during_period(hass, start, period=period)
+    compact_stats = compact_statistics_during_period(hass, start, period=period)
+    assert list(compact_stats) == list(stats)
+    rows = stats["test:total_energy_import"]
+    columns = compact_stats["test:total_energy_import"]
+    for key in ("mean", "min", "max", "state", "sum"):
+        assert columns[key] == [approx(row[key]) for row in rows]
+    for key in ("start", "end"):
+        assert columns[key] == [
+            approx(dt_util.parse_datetime(row[key]).timestamp()) for row in rows
+        ]
+    assert columns["last_reset"] == [None] * len(rows)
+
+
 def test_delete_duplicates_no_duplicates(hass_recorder, caplog):
     """Test removal of duplicated statistics."""
     hass = hass_recorder()
@@ -1160,6 +1365,8 @@ def test_delete_metadata_duplicates(caplog, tmpdir):
     # Create some duplicated statistics_meta with schema version 28
     with patch.object(recorder, "db_schema", old_db_schema), patch.object(
         recorder.migration, "SCHEMA_VERSION", old_db_schema.SCHEMA_VERSION
+    ), patch.object(recorder.bulk_insert, "Events", old_db_schema.Events), patch.object(
+        recorder.bulk_insert, "States", old_db_schema.States
     ), patch(
         "homeassistant.components.recorder.core.create_engine", new=_create_engine_28
     ):
@@ -1251,6 +1458,8 @@ def test_delete_metadata_duplicates_many(caplog, tmpdir):
     # Create some duplicated statistics with schema version 28
     with patch.object(recorder, "db_schema", old_db_schema), patch.object(
         recorder.migration, "SCHEMA_VERSION", old_db_schema.SCHEMA_VERSION
+    ), patch.object(recorder.bulk_insert, "Events", old_db_schema.Events), patch.object(
+        recorder.bulk_insert, "States", old_db_schema.States
     ), patch(
         "homeassistant.components.recorder.core.create_engine", new=_create_engine_28
     ):
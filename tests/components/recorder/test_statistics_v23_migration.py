@@ -179,7 +179,11 @@ def test_delete_duplicates(caplog, tmpdir):
     # Create some duplicated statistics with schema version 23
     with patch.object(recorder, "db_schema", old_db_schema), patch.object(
         recorder.migration, "SCHEMA_VERSION", old_db_schema.SCHEMA_VERSION
-    ), patch(CREATE_ENGINE_TARGET, new=_create_engine_test):
+    ), patch.object(recorder.bulk_insert, "Events", old_db_schema.Events), patch.object(
+        recorder.bulk_insert, "States", old_db_schema.States
+    ), patch(
+        CREATE_ENGINE_TARGET, new=_create_engine_test
+    ):
         hass = get_test_home_assistant()
         recorder_helper.async_initialize_recorder(hass)
         setup_component(hass, "recorder", {"recorder": {"db_url": dburl}})
@@ -349,7 +353,11 @@ def test_delete_duplicates_many(caplog, tmpdir):
     # Create some duplicated statistics with schema version 23
     with patch.object(recorder, "db_schema", old_db_schema), patch.object(
         recorder.migration, "SCHEMA_VERSION", old_db_schema.SCHEMA_VERSION
-    ), patch(CREATE_ENGINE_TARGET, new=_create_engine_test):
+    ), patch.object(recorder.bulk_insert, "Events", old_db_schema.Events), patch.object(
+        recorder.bulk_insert, "States", old_db_schema.States
+    ), patch(
+        CREATE_ENGINE_TARGET, new=_create_engine_test
+    ):
         hass = get_test_home_assistant()
         recorder_helper.async_initialize_recorder(hass)
         setup_component(hass, "recorder", {"recorder": {"db_url": dburl}})
@@ -496,7 +504,11 @@ def test_delete_duplicates_non_identical(caplog, tmpdir):
     # Create some duplicated statistics with schema version 23
     with patch.object(recorder, "db_schema", old_db_schema), patch.object(
         recorder.migration, "SCHEMA_VERSION", old_db_schema.SCHEMA_VERSION
-    ), patch(CREATE_ENGINE_TARGET, new=_create_engine_test):
+    ), patch.object(recorder.bulk_insert, "Events", old_db_schema.Events), patch.object(
+        recorder.bulk_insert, "States", old_db_schema.States
+    ), patch(
+        CREATE_ENGINE_TARGET, new=_create_engine_test
+    ):
         hass = get_test_home_assistant()
         recorder_helper.async_initialize_recorder(hass)
         setup_component(hass, "recorder", {"recorder": {"db_url": dburl}})
@@ -598,7 +610,11 @@ def test_delete_duplicates_short_term(caplog, tmpdir):
     # Create some duplicated statistics with schema version 23
     with patch.object(recorder, "db_schema", old_db_schema), patch.object(
         recorder.migration, "SCHEMA_VERSION", old_db_schema.SCHEMA_VERSION
-    ), patch(CREATE_ENGINE_TARGET, new=_create_engine_test):
+    ), patch.object(recorder.bulk_insert, "Events", old_db_schema.Events), patch.object(
+        recorder.bulk_insert, "States", old_db_schema.States
+    ), patch(
+        CREATE_ENGINE_TARGET, new=_create_engine_test
+    ):
         hass = get_test_home_assistant()
         recorder_helper.async_initialize_recorder(hass)
         setup_component(hass, "recorder", {"recorder": {"db_url": dburl}})
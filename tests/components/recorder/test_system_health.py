@@ -6,6 +6,7 @@ import pytest
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.id_cache import IDCacheStats
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 
@@ -26,6 +27,8 @@ async def test_recorder_system_health(hass, recorder_mock):
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "state_attributes_cache_hit_rate": ANY,
+        "event_data_cache_hit_rate": ANY,
     }
 
 
@@ -50,6 +53,8 @@ async def test_recorder_system_health_alternate_dbms(hass, recorder_mock, dialec
         "estimated_db_size": "1.00 MiB",
         "database_engine": dialect_name.value,
         "database_version": ANY,
+        "state_attributes_cache_hit_rate": ANY,
+        "event_data_cache_hit_rate": ANY,
     }
 
 
@@ -81,6 +86,8 @@ async def test_recorder_system_health_db_url_missing_host(
         "estimated_db_size": "1.00 MiB",
         "database_engine": dialect_name.value,
         "database_version": ANY,
+        "state_attributes_cache_hit_rate": ANY,
+        "event_data_cache_hit_rate": ANY,
     }
 
 
@@ -99,4 +106,19 @@ async def test_recorder_system_health_crashed_recorder_runs_table(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "state_attributes_cache_hit_rate": ANY,
+        "event_data_cache_hit_rate": ANY,
     }
+
+
+async def test_recorder_system_health_id_cache_hit_rates(hass, recorder_mock):
+    """Test recorder system health reports the id cache hit rates."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    instance = get_instance(hass)
+    with patch.object(
+        instance, "state_attributes_cache_stats", IDCacheStats(hits=3, misses=1)
+    ), patch.object(instance, "event_data_cache_stats", IDCacheStats()):
+        info = await get_system_health_info(hass, "recorder")
+    assert info["state_attributes_cache_hit_rate"] == "75.0 %"
+    assert info["event_data_cache_hit_rate"] == "n/a"
@@ -735,7 +735,11 @@ def test_execute_stmt_lambda_element(hass_recorder):
     with session_scope(hass=hass) as session:
         # No time window, we always get a list
         stmt = history._get_single_entity_states_stmt(
-            instance.schema_version, dt_util.utcnow(), "sensor.on", False
+            instance.schema_version,
+            instance.normalized_ids_active,
+            dt_util.utcnow(),
+            "sensor.on",
+            False,
         )
         rows = util.execute_stmt_lambda_element(session, stmt)
         assert isinstance(rows, list)
@@ -9,6 +9,7 @@ import pytest
 from pytest import approx
 
 from homeassistant.components import recorder
+from homeassistant.components.recorder.const import EVENT_RECORDER_STATISTICS_UPDATED
 from homeassistant.components.recorder.statistics import (
     async_add_external_statistics,
     get_last_statistics,
@@ -28,7 +29,7 @@ from .common import (
     do_adhoc_statistics,
 )
 
-from tests.common import async_fire_time_changed
+from tests.common import async_capture_events, async_fire_time_changed
 
 POWER_SENSOR_KW_ATTRIBUTES = {
     "device_class": "power",
@@ -133,6 +134,59 @@ async def test_statistics_during_period(
     }
 
 
+@pytest.mark.parametrize(
+    "units, attributes, state, value",
+    [
+        (IMPERIAL_SYSTEM, POWER_SENSOR_KW_ATTRIBUTES, 10, 10),
+        (METRIC_SYSTEM, POWER_SENSOR_KW_ATTRIBUTES, 10, 10),
+        (IMPERIAL_SYSTEM, TEMPERATURE_SENSOR_C_ATTRIBUTES, 10, 10),
+        (METRIC_SYSTEM, TEMPERATURE_SENSOR_C_ATTRIBUTES, 10, 10),
+        (IMPERIAL_SYSTEM, PRESSURE_SENSOR_HPA_ATTRIBUTES, 1000, 1000),
+        (METRIC_SYSTEM, PRESSURE_SENSOR_HPA_ATTRIBUTES, 1000, 1000),
+    ],
+)
+async def test_statistics_during_period_compact(
+    hass, hass_ws_client, recorder_mock, units, attributes, state, value
+):
+    """Test statistics_during_period with compact columns."""
+    now = dt_util.utcnow()
+
+    hass.config.units = units
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", state, attributes=attributes)
+    await async_wait_recording_done(hass)
+
+    do_adhoc_statistics(hass, start=now)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "recorder/statistics_during_period",
+            "start_time": now.isoformat(),
+            "statistic_ids": ["sensor.test"],
+            "period": "5minute",
+            "compact": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "sensor.test": {
+            "start": [approx(now.timestamp())],
+            "end": [approx((now + timedelta(minutes=5)).timestamp())],
+            "mean": [approx(value)],
+            "min": [approx(value)],
+            "max": [approx(value)],
+            "last_reset": [None],
+            "state": [None],
+            "sum": [None],
+        }
+    }
+
+
 @pytest.mark.parametrize(
     "units, attributes, state, value",
     [
@@ -934,6 +988,7 @@ async def test_import_statistics(
 ):
     """Test importing statistics."""
     client = await hass_ws_client()
+    updated_events = async_capture_events(hass, EVENT_RECORDER_STATISTICS_UPDATED)
 
     assert "Compiling statistics for" not in caplog.text
     assert "Statistics already compiled" not in caplog.text
@@ -977,6 +1032,8 @@ async def test_import_statistics(
     assert response["result"] is None
 
     await async_wait_recording_done(hass)
+    await hass.async_block_till_done()
+    assert len(updated_events) == 1
     stats = statistics_during_period(hass, zero, period="hour")
     assert stats == {
         statistic_id: [
@@ -1162,6 +1219,8 @@ async def test_import_statistics(
     assert response["success"]
 
     await async_wait_recording_done(hass)
+    await hass.async_block_till_done()
+    assert len(updated_events) == 4
     stats = statistics_during_period(hass, zero, period="hour")
     assert stats == {
         statistic_id: [
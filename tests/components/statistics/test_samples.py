@@ -0,0 +1,88 @@
+"""The tests for the statistics sample buffer."""
+from datetime import timedelta
+import random
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.samples import SampleBuffer
+from homeassistant.util import dt as dt_util
+
+
+@pytest.mark.parametrize("max_size", [1, 2, 7, 50])
+def test_sample_buffer_matches_full_recompute(max_size):
+    """Test the incremental aggregates match recomputing them from all samples."""
+    rng = random.Random(max_size)
+    buffer = SampleBuffer(max_size, keep_sorted=True)
+    now = dt_util.utcnow()
+
+    for idx in range(500):
+        now += timedelta(seconds=rng.randint(1, 60))
+        # Few distinct values to get ties for the min and max
+        buffer.append(float(rng.randint(-5, 5)) / 4, now)
+        # Drop samples from the start every now and then, like purging by age
+        if idx % 13 == 0 and len(buffer) > 1:
+            buffer.popleft()
+
+        states = list(buffer.states)
+        ages = list(buffer.ages)
+        assert len(buffer) == len(states) <= max_size
+        assert buffer.total == pytest.approx(sum(states))
+        assert buffer.mean == pytest.approx(statistics.mean(states))
+        assert buffer.median == statistics.median(states)
+        assert buffer.value_max == max(states)
+        assert buffer.value_min == min(states)
+        assert buffer.datetime_value_max == ages[states.index(max(states))]
+        assert buffer.datetime_value_min == ages[states.index(min(states))]
+        if len(states) < 2:
+            continue
+        assert buffer.variance == pytest.approx(statistics.variance(states), abs=1e-9)
+        assert buffer.abs_change_total == pytest.approx(
+            sum(abs(j - i) for i, j in zip(states, states[1:]))
+        )
+        assert buffer.step_area == pytest.approx(
+            sum(
+                states[i - 1] * (ages[i] - ages[i - 1]).total_seconds()
+                for i in range(1, len(states))
+            )
+        )
+        assert buffer.linear_area == pytest.approx(
+            sum(
+                0.5
+                * (states[i] + states[i - 1])
+                * (ages[i] - ages[i - 1]).total_seconds()
+                for i in range(1, len(states))
+            )
+        )
+        for intervals in (2, 4, 10):
+            if len(states) <= intervals:
+                continue
+            for method in ("exclusive", "inclusive"):
+                assert buffer.quantiles(intervals, method) == pytest.approx(
+                    statistics.quantiles(states, n=intervals, method=method)
+                )
+
+
+def test_sample_buffer_empties():
+    """Test the buffer can be emptied and refilled."""
+    buffer = SampleBuffer(3)
+    now = dt_util.utcnow()
+    buffer.append(True, now)
+    buffer.append(False, now + timedelta(seconds=10))
+    buffer.append(True, now + timedelta(seconds=30))
+
+    assert buffer.total == 2
+    assert buffer.step_area == 10
+
+    buffer.popleft()
+    buffer.popleft()
+    buffer.popleft()
+
+    assert len(buffer) == 0
+    assert buffer.total == 0
+    assert buffer.step_area == 0
+
+    buffer.append(False, now + timedelta(seconds=40))
+    assert buffer.total == 0
+    assert buffer.value_max is False
+    assert buffer.datetime_value_max == now + timedelta(seconds=40)
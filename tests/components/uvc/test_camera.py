@@ -444,6 +444,7 @@ async def test_login_v31x(hass, mock_remote, camera_v313):
 @pytest.mark.parametrize(
     "error", [OSError, camera.CameraConnectError, camera.CameraAuthError]
 )
+@pytest.mark.usefixtures("disable_camera_snapshot_cache")
 async def test_login_tries_both_addrs_and_caches(hass, mock_remote, camera_v320, error):
     """Test the login tries."""
     responses = [0]
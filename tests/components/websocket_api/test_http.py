@@ -67,6 +67,34 @@ async def test_pending_msg_peak(hass, mock_low_peak, hass_ws_client, caplog):
     assert "Client unable to keep up with pending messages" in caplog.text
 
 
+async def test_pending_msg_stream_pause(hass, hass_ws_client):
+    """Test streamed responses wait for the client to read pending messages."""
+    orig_handler = http.WebSocketHandler
+    instance = None
+
+    def instantiate_handler(*args):
+        nonlocal instance
+        instance = orig_handler(*args)
+        return instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ), patch("homeassistant.components.websocket_api.http.PENDING_MSG_STREAM_PAUSE", 2):
+        websocket_client = await hass_ws_client()
+        connection = instance.connection
+        assert connection.writable.is_set()
+
+        for idx in range(3):
+            instance._send_message({"id": idx, "type": "event"})
+        assert not connection.writable.is_set()
+
+        for idx in range(3):
+            msg = await websocket_client.receive_json()
+            assert msg["id"] == idx
+        await asyncio.wait_for(connection.async_wait_writable(), 1)
+
+
 async def test_non_json_message(hass, websocket_client, caplog):
     """Test trying to serialize non JSON objects."""
     bad_data = object()
@@ -25,6 +25,7 @@ CONFIG_ENTRY_DIAGNOSTICS_KEYS = [
     "config",
     "config_entry",
     "application_state",
+    "refresh_scheduler",
     "versions",
 ]
 
@@ -89,6 +90,7 @@ async def test_diagnostics_for_device(
         hass, hass_client, config_entry, device
     )
     assert diagnostics_data
+    assert "refresh_latency" in diagnostics_data
     device_info: dict = zha_device.zha_device_info
     for key, value in device_info.items():
         assert key in diagnostics_data
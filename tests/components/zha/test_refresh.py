@@ -0,0 +1,127 @@
+"""Test the ZHA device refresh scheduler."""
+import asyncio
+from unittest.mock import MagicMock
+
+from homeassistant.components.zha.core.refresh import (
+    DeviceRefreshScheduler,
+    RefreshPriority,
+)
+
+
+def _mock_device(ieee, refreshed, running):
+    """Return a mock device recording its refreshes."""
+
+    async def _async_initialize(from_cache):
+        assert from_cache is False
+        running.append(ieee)
+        refreshed.append((ieee, len(running)))
+        await asyncio.sleep(0.01)
+        running.remove(ieee)
+
+    device = MagicMock(ieee=ieee, nwk=0x1234)
+    device.name = ieee
+    device.async_initialize = _async_initialize
+    return device
+
+
+async def test_refresh_priority_and_concurrency(hass):
+    """Test referenced devices go first and reads are bounded."""
+    refreshed = []
+    running = []
+    scheduler = DeviceRefreshScheduler(hass, max_concurrent=2, background_interval=0)
+    devices = [_mock_device(f"dev_{idx}", refreshed, running) for idx in range(6)]
+
+    for device in devices[:4]:
+        scheduler.async_schedule(device)
+    for device in devices[4:]:
+        scheduler.async_schedule(device, RefreshPriority.HIGH)
+    scheduler.async_prioritize(devices[3])
+    assert scheduler.async_diagnostics() == {
+        "queue_depth": 6,
+        "running": 0,
+        "max_concurrent": 2,
+    }
+
+    for _ in range(100):
+        if len(refreshed) == 6 and not running:
+            break
+        await asyncio.sleep(0.01)
+
+    assert [ieee for ieee, _ in refreshed] == [
+        "dev_4",
+        "dev_5",
+        "dev_3",
+        "dev_0",
+        "dev_1",
+        "dev_2",
+    ]
+    assert max(concurrent for _, concurrent in refreshed) == 2
+    assert scheduler.queue_depth == 0
+    assert set(scheduler.latencies) == {device.ieee for device in devices}
+
+
+async def test_background_refreshes_are_spread(hass):
+    """Test background refreshes start one interval apart."""
+    refreshed = []
+    scheduler = DeviceRefreshScheduler(hass, max_concurrent=4, background_interval=10)
+    devices = [_mock_device(f"dev_{idx}", refreshed, []) for idx in range(3)]
+
+    for device in devices:
+        scheduler.async_schedule(device)
+    await asyncio.sleep(0.05)
+
+    assert [ieee for ieee, _ in refreshed] == ["dev_0"]
+    assert scheduler.queue_depth == 2
+
+    # A high priority refresh does not wait for the background interval
+    scheduler.async_prioritize(devices[2])
+    await asyncio.sleep(0.05)
+
+    assert [ieee for ieee, _ in refreshed] == ["dev_0", "dev_2"]
+
+    scheduler.async_cancel()
+    assert scheduler.queue_depth == 0
+
+
+async def test_cancel_running_refreshes(hass):
+    """Test cancelling the scheduler cancels the running refreshes."""
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def _async_initialize(from_cache):
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    device = MagicMock(ieee="dev_0", nwk=0x1234)
+    device.name = "dev_0"
+    device.async_initialize = _async_initialize
+    scheduler = DeviceRefreshScheduler(hass, max_concurrent=1, background_interval=0)
+
+    scheduler.async_schedule(device)
+    await asyncio.wait_for(started.wait(), 1)
+    assert scheduler.async_diagnostics()["running"] == 1
+
+    scheduler.async_cancel()
+    await asyncio.wait_for(cancelled.wait(), 1)
+    await asyncio.sleep(0)
+
+    assert scheduler.async_diagnostics()["running"] == 0
+
+
+async def test_refreshes_do_not_block_startup(hass):
+    """Test waiting for the tracked tasks does not wait for the refreshes."""
+    refreshed = []
+    scheduler = DeviceRefreshScheduler(hass, max_concurrent=1, background_interval=10)
+    devices = [_mock_device(f"dev_{idx}", refreshed, []) for idx in range(3)]
+
+    for device in devices:
+        scheduler.async_schedule(device)
+    await asyncio.wait_for(hass.async_block_till_done(), 1)
+
+    assert scheduler.queue_depth == 2
+
+    scheduler.async_cancel()
@@ -1626,3 +1626,33 @@ async def test_only_disable_device_if_all_config_entries_are_disabled(hass, regi
 
     entry1 = registry.async_get(entry1.id)
     assert not entry1.disabled
+
+
+async def test_entries_for_area_and_config_entry(registry):
+    """Test looking up devices by area and config entry follows updates."""
+    entry1 = registry.async_get_or_create(
+        config_entry_id="123",
+        connections={(device_registry.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    entry2 = registry.async_get_or_create(
+        config_entry_id="123",
+        connections={(device_registry.CONNECTION_NETWORK_MAC, "34:56:78:CD:EF:12")},
+    )
+    entry1 = registry.async_update_device(entry1.id, area_id="12345A")
+    entry2 = registry.async_update_device(entry2.id, add_config_entry_id="456")
+
+    assert device_registry.async_entries_for_area(registry, "12345A") == [entry1]
+    assert device_registry.async_entries_for_config_entry(registry, "123") == [
+        entry1,
+        entry2,
+    ]
+    assert device_registry.async_entries_for_config_entry(registry, "456") == [entry2]
+
+    entry1 = registry.async_update_device(entry1.id, area_id=None)
+    entry2 = registry.async_update_device(entry2.id, remove_config_entry_id="123")
+    assert device_registry.async_entries_for_area(registry, "12345A") == []
+    assert device_registry.async_entries_for_config_entry(registry, "123") == [entry1]
+    assert device_registry.async_entries_for_config_entry(registry, "456") == [entry2]
+
+    registry.async_remove_device(entry2.id)
+    assert device_registry.async_entries_for_config_entry(registry, "456") == []
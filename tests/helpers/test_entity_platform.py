@@ -1331,6 +1331,38 @@ async def test_platforms_sharing_services(hass):
     assert entity2 in entities
 
 
+async def test_domain_entities_index(hass):
+    """Test entities are indexed by domain and by domain and platform."""
+    entity_platform1 = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    entity1 = MockEntity(entity_id="mock_integration.entity_1")
+    await entity_platform1.async_add_entities([entity1])
+
+    entity_platform2 = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="other_platform", platform=None
+    )
+    entity2 = MockEntity(entity_id="mock_integration.entity_2")
+    await entity_platform2.async_add_entities([entity2])
+
+    assert entity_platform1.domain_entities is entity_platform2.domain_entities
+    assert entity_platform1.domain_entities == {
+        "mock_integration.entity_1": entity1,
+        "mock_integration.entity_2": entity2,
+    }
+    assert entity_platform1.domain_platform_entities == {
+        "mock_integration.entity_1": entity1
+    }
+    assert entity_platform2.domain_platform_entities == {
+        "mock_integration.entity_2": entity2
+    }
+
+    await entity_platform1.async_remove_entity("mock_integration.entity_1")
+
+    assert entity_platform2.domain_entities == {"mock_integration.entity_2": entity2}
+    assert entity_platform1.domain_platform_entities == {}
+
+
 async def test_invalid_entity_id(hass):
     """Test specifying an invalid entity id."""
     platform = MockEntityPlatform(hass)
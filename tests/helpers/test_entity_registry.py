@@ -1,6 +1,7 @@
 """Tests for the Entity Registry."""
 from unittest.mock import patch
 
+import attr
 import pytest
 import voluptuous as vol
 
@@ -1256,6 +1257,47 @@ def test_entity_registry_items():
     assert entities.get_entry(entry2.id) is None
 
 
+def test_entity_registry_items_secondary_indexes():
+    """Test the EntityRegistryItems device, area and config entry indexes."""
+    entities = er.EntityRegistryItems()
+    assert entities.get_entries_for_device_id("device1") == []
+
+    entry1 = er.RegistryEntry(
+        "test.entity1",
+        "1234",
+        "hue",
+        area_id="area1",
+        config_entry_id="entry1",
+        device_id="device1",
+    )
+    entry2 = er.RegistryEntry(
+        "test.entity2", "2345", "hue", config_entry_id="entry1", device_id="device1"
+    )
+    entities["test.entity1"] = entry1
+    entities["test.entity2"] = entry2
+
+    assert entities.get_entries_for_device_id("device1") == [entry1, entry2]
+    assert entities.get_entries_for_area_id("area1") == [entry1]
+    assert entities.get_entries_for_config_entry_id("entry1") == [entry1, entry2]
+
+    # Updating an entry keeps its position unless the key changes
+    entry1 = entities["test.entity1"] = attr.evolve(
+        entry1, area_id="area2", original_name="Updated"
+    )
+    assert entities.get_entries_for_device_id("device1") == [entry1, entry2]
+    assert entities.get_entries_for_area_id("area1") == []
+    assert entities.get_entries_for_area_id("area2") == [entry1]
+    assert entities.get_entries_for_config_entry_id("entry1") == [entry1, entry2]
+
+    entry2 = entities["test.entity2"] = attr.evolve(entry2, device_id=None)
+    assert entities.get_entries_for_device_id("device1") == [entry1]
+
+    del entities["test.entity1"]
+    assert entities.get_entries_for_device_id("device1") == []
+    assert entities.get_entries_for_area_id("area2") == []
+    assert entities.get_entries_for_config_entry_id("entry1") == [entry2]
+
+
 async def test_disabled_by_str_not_allowed(hass):
     """Test we need to pass disabled by type."""
     reg = er.async_get(hass)
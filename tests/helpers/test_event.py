@@ -17,10 +17,13 @@ from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    TRACK_STATE_CHANGE_CALLBACKS,
+    TRACK_STATE_CHANGE_LISTENER,
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_timer_wheel,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
     async_track_point_in_utc_time,
@@ -91,6 +94,77 @@ async def test_track_point_in_time(hass):
     assert len(runs) == 2
 
 
+async def test_track_point_in_time_coalesced(hass):
+    """Test point in time listeners due at the same time share a loop timer."""
+    wheel = async_get_timer_wheel(hass)
+    point_in_time = dt_util.utcnow() + timedelta(seconds=10)
+    later = point_in_time + timedelta(seconds=10)
+    runs = []
+
+    @callback
+    def cancel_other(now):
+        runs.append("cancel_other")
+        unsub_other()
+
+    async_track_point_in_utc_time(hass, cancel_other, point_in_time)
+    unsub_other = async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append("other")), point_in_time
+    )
+    for idx in range(3):
+        async_track_point_in_utc_time(
+            hass, callback(lambda x, idx=idx: runs.append(idx)), point_in_time
+        )
+    unsub_later = async_track_point_in_utc_time(
+        hass, callback(lambda x: runs.append("later")), later
+    )
+
+    diagnostics = wheel.async_diagnostics()
+    assert diagnostics["scheduled"] == 6
+    assert diagnostics["loop_timers"] == 2
+
+    async_fire_time_changed(hass, point_in_time + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert runs == ["cancel_other", 0, 1, 2]
+
+    diagnostics = wheel.async_diagnostics()
+    assert diagnostics["scheduled"] == 1
+    assert diagnostics["loop_timers"] == 1
+    assert diagnostics["fired"] == 4
+    assert diagnostics["batches"] == 1
+    assert diagnostics["coalesced"] == 3
+    assert diagnostics["lateness_last"] == pytest.approx(1)
+    assert diagnostics["lateness_max"] == pytest.approx(1)
+
+    unsub_later()
+    diagnostics = wheel.async_diagnostics()
+    assert diagnostics["scheduled"] == 0
+    assert diagnostics["loop_timers"] == 0
+
+    async_fire_time_changed(hass, later)
+    await hass.async_block_till_done()
+    assert runs == ["cancel_other", 0, 1, 2]
+
+
+async def test_track_time_pattern_coalesced(hass):
+    """Test time pattern listeners firing on the same second share a loop timer."""
+    wheel = async_get_timer_wheel(hass)
+    runs = []
+    unsubs = [
+        async_track_utc_time_change(
+            hass, callback(lambda x, idx=idx: runs.append(idx)), second=0
+        )
+        for idx in range(3)
+    ]
+
+    diagnostics = wheel.async_diagnostics()
+    assert diagnostics["scheduled"] == 3
+    assert diagnostics["loop_timers"] == 1
+
+    for unsub in unsubs:
+        unsub()
+    assert wheel.async_diagnostics()["loop_timers"] == 0
+
+
 async def test_track_point_in_time_drift_rearm(hass):
     """Test tasks with the time rolling backwards."""
     specific_runs = []
@@ -287,6 +361,61 @@ async def test_track_state_change(hass):
     assert len(wildercard_runs) == 6
 
 
+async def test_track_state_change_from_to_lists(hass):
+    """Test track_state_change with from and to state lists."""
+    runs = []
+    all_runs = []
+
+    @ha.callback
+    def run_callback(entity_id, old_state, new_state):
+        runs.append((entity_id, old_state and old_state.state, new_state.state))
+
+    @ha.callback
+    def all_run_callback(entity_id, old_state, new_state):
+        all_runs.append(entity_id)
+
+    unsub = async_track_state_change(
+        hass,
+        ["light.Bowl", "light.bowl", "light.kitchen"],
+        run_callback,
+        ["off", None],
+        ["on", "dim"],
+    )
+    unsub_all = async_track_state_change(
+        hass, MATCH_ALL, all_run_callback, to_state="on"
+    )
+    assert set(hass.data[TRACK_STATE_CHANGE_CALLBACKS]) == {
+        "light.bowl",
+        "light.kitchen",
+        MATCH_ALL,
+    }
+
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.bowl", "dim")
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.kitchen", "dim")
+    hass.states.async_set("switch.kitchen", "on")
+    hass.states.async_remove("light.kitchen")
+    await hass.async_block_till_done()
+
+    assert runs == [
+        ("light.bowl", None, "on"),
+        ("light.kitchen", "off", "dim"),
+    ]
+    assert all_runs == ["light.bowl", "switch.kitchen"]
+
+    unsub()
+    hass.states.async_set("light.bowl", "off")
+    hass.states.async_set("light.bowl", "on")
+    await hass.async_block_till_done()
+    assert len(runs) == 2
+    assert all_runs == ["light.bowl", "switch.kitchen", "light.bowl"]
+
+    unsub_all()
+    assert not hass.data[TRACK_STATE_CHANGE_CALLBACKS]
+    assert TRACK_STATE_CHANGE_LISTENER not in hass.data
+
+
 async def test_async_track_state_change_filtered(hass):
     """Test async_track_state_change_filtered."""
     single_entity_id_tracker = []
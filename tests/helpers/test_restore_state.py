@@ -1,14 +1,18 @@
 """The tests for the Restore component."""
 from datetime import datetime, timedelta
+import json
 from unittest.mock import patch
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, State
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE_TASK,
     STORAGE_KEY,
+    STORAGE_KEY_CHANGES,
+    RestoredExtraData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -278,6 +282,120 @@ async def test_dump_data(hass):
     assert written_states[1]["state"]["state"] == "off"
 
 
+async def test_dump_changed_states(hass, hass_storage):
+    """Test that only the states that changed since the last dump are saved."""
+
+    class MockRestoreEntity(RestoreEntity):
+        """Restore entity with extra data."""
+
+        extra_data = None
+
+        @property
+        def extra_restore_state_data(self):
+            """Return the extra data."""
+            return self.extra_data
+
+    entities = []
+    for entity_id in ("input_boolean.b0", "input_boolean.b1", "input_boolean.b2"):
+        entity = MockRestoreEntity()
+        entity.hass = hass
+        entity.entity_id = entity_id
+        await entity.async_internal_added_to_hass()
+        hass.states.async_set(entity_id, "on")
+        entities.append(entity)
+
+    data = await RestoreStateData.async_get_instance(hass)
+    await data.async_dump_states()
+
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 3
+    assert hass_storage[STORAGE_KEY_CHANGES]["data"] == {}
+
+    hass.states.async_set("input_boolean.b1", "off")
+    # Setting the same state again does not make it dirty
+    hass.states.async_set("input_boolean.b2", "on")
+
+    # The extra data can change without a state change
+    entities[0].extra_data = RestoredExtraData({"native_value": 5})
+    await data.async_dump_changed_states()
+
+    # The full dump is left alone
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 3
+    changed_states = hass_storage[STORAGE_KEY_CHANGES]["data"]
+    assert list(changed_states) == ["input_boolean.b0", "input_boolean.b1"]
+    assert changed_states["input_boolean.b0"]["extra_data"] == {"native_value": 5}
+    assert changed_states["input_boolean.b1"]["state"]["state"] == "off"
+
+    # Extra data that did not change is not saved again
+    entities[0].extra_data = RestoredExtraData({"native_value": 5})
+    with patch.object(hass.states, "get", wraps=hass.states.get) as mock_get_state:
+        await data.async_dump_changed_states()
+    assert mock_get_state.call_count == 0
+
+    # Changes accumulate until the next full dump
+    await entities[2].async_remove()
+    await data.async_dump_changed_states()
+    assert list(hass_storage[STORAGE_KEY_CHANGES]["data"]) == [
+        "input_boolean.b0",
+        "input_boolean.b1",
+        "input_boolean.b2",
+    ]
+
+    entities[0].extra_data = None
+    await data.async_dump_states()
+    assert hass_storage[STORAGE_KEY_CHANGES]["data"] == {}
+    written_states = {
+        item["state"]["entity_id"]: item for item in hass_storage[STORAGE_KEY]["data"]
+    }
+    assert written_states["input_boolean.b0"]["extra_data"] is None
+    assert written_states["input_boolean.b1"]["state"]["state"] == "off"
+    assert written_states["input_boolean.b2"]["state"]["state"] == "on"
+
+    # Nothing changed since the full dump
+    await data.async_dump_changed_states()
+    assert hass_storage[STORAGE_KEY_CHANGES]["data"] == {}
+
+
+async def test_load_changed_states(hass, hass_storage):
+    """Test that the changed states are replayed over the full dump."""
+    now = dt_util.utcnow()
+    stored_states = [
+        StoredState(State("input_boolean.b0", "on"), None, now),
+        StoredState(State("input_boolean.b1", "on"), None, now),
+    ]
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": json.loads(
+            json.dumps([state.as_dict() for state in stored_states], cls=JSONEncoder)
+        ),
+    }
+    changed_states = [
+        # Newer than the full dump
+        StoredState(State("input_boolean.b0", "off"), None, now + timedelta(1)),
+        # Older than the full dump
+        StoredState(State("input_boolean.b1", "off"), None, now - timedelta(1)),
+        # Not part of the full dump
+        StoredState(State("input_boolean.b2", "off"), None, now),
+    ]
+    hass_storage[STORAGE_KEY_CHANGES] = {
+        "version": 1,
+        "key": STORAGE_KEY_CHANGES,
+        "data": {
+            state.state.entity_id: json.loads(
+                json.dumps(state.as_dict(), cls=JSONEncoder)
+            )
+            for state in changed_states
+        },
+    }
+
+    data = await RestoreStateData.async_get_instance(hass)
+
+    assert data.last_states["input_boolean.b0"].state.state == "off"
+    assert data.last_states["input_boolean.b1"].state.state == "on"
+    assert data.last_states["input_boolean.b2"].state.state == "off"
+    assert list(data.changed_states) == ["input_boolean.b0", "input_boolean.b2"]
+
+
 async def test_dump_error(hass):
     """Test that we cache data."""
     states = [
@@ -634,6 +634,27 @@ async def test_call_with_sync_func(hass, mock_entities):
     assert test_service_mock.call_count == 1
 
 
+async def test_call_with_entities_dict(hass, mock_entities):
+    """Test service calls with a dict of entities are made in a stable order."""
+    test_service_mock = AsyncMock(return_value=None)
+    await service.entity_service_call(
+        hass,
+        mock_entities,
+        test_service_mock,
+        ha.ServiceCall(
+            "test_domain",
+            "test_service",
+            {"entity_id": ["light.living_room", "light.bathroom", "light.kitchen"]},
+        ),
+    )
+
+    assert [call[0][0] for call in test_service_mock.call_args_list] == [
+        mock_entities["light.bathroom"],
+        mock_entities["light.kitchen"],
+        mock_entities["light.living_room"],
+    ]
+
+
 async def test_call_with_sync_attr(hass, mock_entities):
     """Test invoking sync service calls."""
     mock_method = mock_entities["light.kitchen"].sync_method = Mock(return_value=None)
@@ -448,6 +448,39 @@ async def test_eventbus_filtered_listener(hass):
     unsub()
 
 
+async def test_eventbus_listener_changes_during_fire(hass):
+    """Test listeners added or removed while firing apply to the next event."""
+    calls = []
+    unsubs = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener that adds and removes listeners."""
+        calls.append("listener")
+        unsubs.append(hass.bus.async_listen("test", second_listener))
+        unsubs.append(hass.bus.async_listen(MATCH_ALL, second_listener))
+
+    @ha.callback
+    def second_listener(event):
+        """Mock second listener."""
+        calls.append("second")
+
+    unsub = hass.bus.async_listen("test", listener, run_immediately=True)
+    hass.bus.async_fire("test")
+    assert calls == ["listener"]
+
+    unsub()
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == ["listener", "second", "second"]
+
+    for unsub in unsubs:
+        unsub()
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == ["listener", "second", "second"]
+
+
 async def test_eventbus_run_immediately(hass):
     """Test we can call events immediately."""
     calls = []
@@ -1445,6 +1478,36 @@ async def test_async_entity_ids_count(hass):
     assert hass.states.async_entity_ids_count("light") == 3
 
 
+async def test_statemachine_domain_index(hass):
+    """Test domain filtered lookups stay in sync with the state machine."""
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.frog", "on")
+    hass.states.async_set("switch.link", "on")
+
+    assert hass.states.async_entity_ids("LIGHT") == ["light.bowl", "light.frog"]
+    assert hass.states.async_entity_ids(["light", "light"]) == [
+        "light.bowl",
+        "light.frog",
+    ]
+    assert hass.states.async_entity_ids_count(["light", "switch"]) == 3
+
+    hass.states.async_set("light.bowl", "off")
+    assert [state.state for state in hass.states.async_all("light")] == ["off", "on"]
+
+    assert hass.states.async_remove("light.bowl")
+    assert hass.states.async_entity_ids("light") == ["light.frog"]
+    assert hass.states.async_remove("switch.link")
+    assert hass.states.async_entity_ids("switch") == []
+    assert hass.states.async_entity_ids_count("switch") == 0
+    assert hass.states.async_all("switch") == []
+
+    hass.states.async_reserve("switch.reserved")
+    assert hass.states.async_entity_ids("switch") == []
+    hass.states.async_set("switch.reserved", "on")
+    assert hass.states.async_entity_ids("switch") == ["switch.reserved"]
+    assert hass.states.async_entity_ids("vacuum") == []
+
+
 async def test_hassjob_forbid_coroutine():
     """Test hassjob forbids coroutines."""
 
@@ -2,6 +2,8 @@
 
 import uuid
 
+import pytest
+
 import homeassistant.util.ulid as ulid_util
 
 
@@ -14,3 +16,31 @@ async def test_ulid_util_uuid_hex():
 async def test_ulid_util_uuid():
     """Verify we can generate a ulid."""
     assert len(ulid_util.ulid()) == 26
+
+
+async def test_ulid_util_bytes_round_trip():
+    """Verify we can convert a ulid to bytes and back."""
+    ulid = ulid_util.ulid()
+    ulid_bytes = ulid_util.ulid_to_bytes(ulid)
+    assert len(ulid_bytes) == 16
+    assert ulid_util.bytes_to_ulid(ulid_bytes) == ulid
+    timestamp_bytes = ulid_util.ulid_to_bytes(ulid_util.ulid(1677627631.4))[:6]
+    assert int.from_bytes(timestamp_bytes, byteorder="big") == 1677627631400
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "1234",
+        "01GTDGKBCH00GW0X476W5TVAA",
+        "01GTDGKBCH00GW0X476W5TVAAAA",
+        "01gtdgkbch00gw0x476w5tvaaa",
+        "01GTDGKBCH00GW0X476W5TVAAU",
+        "81GTDGKBCH00GW0X476W5TVAAA",
+    ],
+)
+async def test_ulid_util_to_bytes_invalid(value):
+    """Verify invalid ulids are rejected."""
+    with pytest.raises(ValueError):
+        ulid_util.ulid_to_bytes(value)